@@ -2,6 +2,12 @@
 
 import json
 from pathlib import Path
+from typing import Optional
+
+from fileops import kb_lock, write_atomic
+
+# Health checks fail files larger than this instead of reading them.
+DEFAULT_MAX_FILE_BYTES = 1_000_000
 
 
 def read_knowledge_dir(knowledge_base_root: Path) -> str:
@@ -16,10 +22,88 @@ def read_knowledge_dir(knowledge_base_root: Path) -> str:
     return "docs"
 
 
-def write_config(knowledge_base_root: Path, knowledge_dir: str = "docs") -> Path:
-    """Write Dewey configuration to .dewey/config.json."""
+def read_manifest_budget(knowledge_base_root: Path) -> Optional[int]:
+    """Return the tiered-manifest token budget from config, or None (flat manifest)."""
+    config_path = knowledge_base_root / ".dewey" / "config.json"
+    if config_path.exists():
+        try:
+            value = json.loads(config_path.read_text()).get("manifest_token_budget")
+        except (json.JSONDecodeError, OSError):
+            return None
+        if isinstance(value, int) and value > 0:
+            return value
+    return None
+
+
+def read_max_file_bytes(knowledge_base_root: Path) -> Optional[int]:
+    """Return the health-check file size cap from config, or None (no cap).
+
+    ``health_max_file_bytes`` defaults to ``DEFAULT_MAX_FILE_BYTES``; 0
+    turns the cap off.
+    """
+    config_path = knowledge_base_root / ".dewey" / "config.json"
+    if config_path.exists():
+        try:
+            data = json.loads(config_path.read_text())
+        except (json.JSONDecodeError, OSError):
+            return DEFAULT_MAX_FILE_BYTES
+        value = data.get("health_max_file_bytes") if isinstance(data, dict) else None
+        if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+            return value or None
+    return DEFAULT_MAX_FILE_BYTES
+
+
+def read_utilization_settings(knowledge_base_root: Path) -> dict:
+    """Return utilization-logging settings from config, with defaults.
+
+    ``utilization_session_window_seconds`` (default 60; 0 logs every read)
+    collapses repeated reads of a file into one counted event.
+    ``utilization_sample_every`` (default 1, no sampling) records one in N
+    repeat reads of very hot files, each weighted N.
+    """
+    settings = {"session_window_seconds": 60, "sample_every": 1}
+    config_path = knowledge_base_root / ".dewey" / "config.json"
+    if config_path.exists():
+        try:
+            data = json.loads(config_path.read_text())
+        except (json.JSONDecodeError, OSError):
+            return settings
+        if not isinstance(data, dict):
+            return settings
+        window = data.get("utilization_session_window_seconds")
+        if isinstance(window, (int, float)) and window >= 0:
+            settings["session_window_seconds"] = window
+        sample = data.get("utilization_sample_every")
+        if isinstance(sample, int) and sample >= 1:
+            settings["sample_every"] = sample
+    return settings
+
+
+def write_config(
+    knowledge_base_root: Path,
+    knowledge_dir: str = "docs",
+    *,
+    manifest_token_budget: Optional[int] = None,
+) -> Path:
+    """Write Dewey configuration to .dewey/config.json.
+
+    Keys already in the file (such as ``manifest_token_budget``) are kept
+    unless overridden.  The read-merge-write runs under ``kb_lock``.
+    """
     knowledge_dir = knowledge_dir.strip("/") or "docs"
     config_path = knowledge_base_root / ".dewey" / "config.json"
     config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(json.dumps({"knowledge_dir": knowledge_dir}, indent=2) + "\n")
+    with kb_lock(knowledge_base_root):
+        data: dict = {}
+        if config_path.exists():
+            try:
+                data = json.loads(config_path.read_text())
+            except (json.JSONDecodeError, OSError):
+                data = {}
+            if not isinstance(data, dict):
+                data = {}
+        data["knowledge_dir"] = knowledge_dir
+        if manifest_token_budget is not None:
+            data["manifest_token_budget"] = manifest_token_budget
+        write_atomic(config_path, json.dumps(data, indent=2) + "\n")
     return config_path
@@ -1,6 +1,8 @@
 """Create a new topic file (working + reference) inside a domain area.
 
-Only stdlib is used.  Existing files are never overwritten.
+Only stdlib is used.  Existing files are never overwritten: each file is
+created exclusively, so concurrent curators creating the same topic
+cannot clobber each other.
 """
 
 from __future__ import annotations
@@ -8,6 +10,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from config import read_knowledge_dir
+from fileops import create_exclusive
 from templates import (
     _slugify,
     render_topic_md,
@@ -48,14 +51,12 @@ def create_topic(knowledge_base_root: Path, area: str, topic_name: str, relevanc
 
     # Working-knowledge topic file
     topic_path = area_dir / f"{slug}.md"
-    if not topic_path.exists():
-        topic_path.write_text(render_topic_md(topic_name, relevance))
+    if create_exclusive(topic_path, render_topic_md(topic_name, relevance)):
         created.append(str(topic_path.relative_to(knowledge_base_root)))
 
     # Expert-reference companion
     ref_path = area_dir / f"{slug}.ref.md"
-    if not ref_path.exists():
-        ref_path.write_text(render_topic_ref_md(topic_name, relevance))
+    if create_exclusive(ref_path, render_topic_ref_md(topic_name, relevance)):
         created.append(str(ref_path.relative_to(knowledge_base_root)))
 
     # Summary
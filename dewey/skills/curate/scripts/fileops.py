@@ -0,0 +1,124 @@
+"""Concurrency-safe file writes for curate operations.
+
+Several agents may curate one knowledge base at once.  Three primitives
+keep them from corrupting each other's work:
+
+- ``write_atomic`` writes a sibling temp file and renames it over the
+  target.  Readers see the old content or the new content, never a
+  half-written file.
+- ``create_exclusive`` writes a sibling temp file and hard-links it into
+  place.  The link fails if the target exists, so exactly one of several
+  racing creators wins, and the file appears complete or not at all.
+- ``kb_lock`` is an advisory lock (``.dewey/curate.lock``) held around
+  read-modify-write merges of shared files: the managed section of
+  AGENTS.md, the curation plan and ``config.json``.  It is re-entrant
+  within a thread.
+
+Creating topics and proposals takes no lock, so independent curators
+proceed in parallel.
+
+Only stdlib is used.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
+_LOCK_FILE = Path(".dewey") / "curate.lock"
+
+_held = threading.local()
+
+
+def _write_temp(path: Path, text: str) -> Path:
+    """Write *text* to a new temp file next to *path* (same filesystem)."""
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:12]}.tmp")
+    # O_EXCL: never reuse a file another writer owns; 0o666 honours the umask
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(text)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return tmp
+
+
+def write_atomic(path: Path, text: str) -> Path:
+    """Replace *path* with *text* in one rename.
+
+    Returns *path*.
+    """
+    tmp = _write_temp(path, text)
+    try:
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return path
+
+
+def create_exclusive(path: Path, text: str) -> bool:
+    """Create *path* with *text* unless it already exists.
+
+    Returns
+    -------
+    bool
+        True if this call created the file, False if it already existed
+        (including when another writer created it first).
+    """
+    tmp = _write_temp(path, text)
+    try:
+        os.link(tmp, path)
+    except FileExistsError:
+        return False
+    except OSError:
+        # No hard links here (some network and FAT filesystems): fall
+        # back to an exclusive create, which is exclusive but not atomic
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(text)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return True
+
+
+@contextmanager
+def kb_lock(knowledge_base_root: Path) -> Iterator[None]:
+    """Hold the knowledge base's curate lock (re-entrant within a thread)."""
+    lock_path = knowledge_base_root / _LOCK_FILE
+    key = str(lock_path.resolve())
+    depth = getattr(_held, "depth", None)
+    if depth is None:
+        depth = _held.depth = {}
+    if depth.get(key):
+        depth[key] += 1
+        try:
+            yield
+        finally:
+            depth[key] -= 1
+        return
+
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with lock_path.open("a") as fh:
+        if fcntl is not None:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+        depth[key] = 1
+        try:
+            yield
+        finally:
+            depth[key] = 0
+            if fcntl is not None:
+                fcntl.flock(fh, fcntl.LOCK_UN)
@@ -1,15 +1,19 @@
 """Promote a proposal file from _proposals/ to a domain area.
 
 Strips proposal-specific frontmatter (status, proposed_by, rationale)
-before writing to the target area.  Only stdlib is used.
+before writing to the target area.  The proposal is first claimed by an
+atomic rename, so when several agents promote it at once exactly one
+succeeds.  Only stdlib is used.
 """
 
 from __future__ import annotations
 
+import os
 import re
 from pathlib import Path
 
 from config import read_knowledge_dir
+from fileops import write_atomic
 
 
 def _strip_proposal_fields(content: str) -> str:
@@ -75,14 +79,23 @@ def promote_proposal(knowledge_base_root: Path, proposal_name: str, target_area:
             f"Target area directory does not exist: {target_dir}"
         )
 
+    # Claim the proposal; a concurrent promoter that got there first wins
+    claim_path = proposal_path.with_name(f".{proposal_path.name}.{os.getpid()}.promoting")
+    try:
+        os.rename(proposal_path, claim_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Proposal not found: {proposal_path}") from None
+
     # Read, strip proposal fields, write to target
-    content = proposal_path.read_text()
-    cleaned = _strip_proposal_fields(content)
-    target_path = target_dir / f"{proposal_name}.md"
-    target_path.write_text(cleaned)
+    try:
+        cleaned = _strip_proposal_fields(claim_path.read_text())
+        write_atomic(target_dir / f"{proposal_name}.md", cleaned)
+    except BaseException:
+        os.rename(claim_path, proposal_path)
+        raise
 
     # Delete original proposal
-    proposal_path.unlink()
+    claim_path.unlink()
 
     return (
         f"Promoted '{proposal_name}' from _proposals/ to {target_area}/: "
@@ -1,6 +1,7 @@
 """Create a proposal file for a new or revised topic.
 
-Only stdlib is used.  Existing files are never overwritten.
+Only stdlib is used.  Existing files are never overwritten (the proposal
+is created exclusively).
 """
 
 from __future__ import annotations
@@ -8,6 +9,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from config import read_knowledge_dir
+from fileops import create_exclusive
 from templates import (
     _slugify,
     render_proposal_md,
@@ -56,10 +58,7 @@ def create_proposal(
     slug = _slugify(topic_name)
     proposal_path = proposals_dir / f"{slug}.md"
 
-    if not proposal_path.exists():
-        proposal_path.write_text(
-            render_proposal_md(topic_name, relevance, proposed_by, rationale)
-        )
+    if create_exclusive(proposal_path, render_proposal_md(topic_name, relevance, proposed_by, rationale)):
         return f"Proposal created: {knowledge_dir}/_proposals/{slug}.md"
 
     return f"Proposal '{topic_name}' already exists — nothing created."
@@ -2,31 +2,53 @@
 
 Only stdlib is used.  Supports merging knowledge base sections into existing files
 using marker-based managed sections.
+
+Managed files are replaced atomically (``fileops.write_atomic``), files
+that must not be overwritten are created exclusively, and managed-section
+merges run under the knowledge base's curate lock, so concurrent curators
+never see or produce a half-written or lost update.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import re
 import sys
 from pathlib import Path
 
-from config import read_knowledge_dir, write_config
+from config import read_knowledge_dir, read_manifest_budget, write_config
+from fileops import create_exclusive, kb_lock, write_atomic
 from templates import (
+    AREA_MANIFEST_DIR,
+    CONTEXT_PACK_DIR,
+    CONTEXT_PACK_FORMAT,
+    CONTEXT_PACK_SECTIONS,
     MARKER_BEGIN,
     MARKER_END,
     _slugify,
     _today,
+    area_manifest_path,
+    context_pack_path,
+    estimate_tokens,
     render_agents_md,
     render_agents_md_section,
+    render_area_manifest,
+    render_context_pack,
     render_curate_plan,
     render_curation_plan_md,
     render_dewey_rules,
     render_hooks_json,
     render_index_md,
     render_overview_md,
+    render_tiered_agents_md_section,
 )
 
+# utilization.py lives in health/scripts/ — add it to sys.path for cross-skill import.
+_health_scripts = str(Path(__file__).resolve().parent.parent.parent / "health" / "scripts")
+if _health_scripts not in sys.path:
+    sys.path.insert(0, _health_scripts)
+
 
 def _read_topic_metadata(file_path: Path) -> dict:
     """Read a single .md file's depth from frontmatter and title from the first H1.
@@ -126,6 +148,9 @@ def _discover_index_data(knowledge_base_root: Path, knowledge_dir_name: str = "d
     return areas
 
 
+_TOPIC_ROW = re.compile(r"^\| \[(.+?)\]\((.+?)\) \| ?(.*?) ?\|$")
+
+
 def _parse_agents_topics(agents_content: str) -> dict[str, list[dict]]:
     """Extract topic table entries from existing AGENTS.md managed section.
 
@@ -146,7 +171,7 @@ def _parse_agents_topics(agents_content: str) -> dict[str, list[dict]]:
             topics_by_area[current_area] = []
             continue
         if current_area is not None:
-            row_match = re.match(r"^\| \[(.+?)\]\((.+?)\) \| (.+?) \|$", line)
+            row_match = _TOPIC_ROW.match(line)
             if row_match:
                 topics_by_area[current_area].append({
                     "name": row_match.group(1),
@@ -156,6 +181,20 @@ def _parse_agents_topics(agents_content: str) -> dict[str, list[dict]]:
     return topics_by_area
 
 
+def _parse_manifest_rows(text: str) -> list[dict]:
+    """Extract ``{"name", "path", "description"}`` rows from an area sub-manifest."""
+    rows: list[dict] = []
+    for line in text.split("\n"):
+        row_match = _TOPIC_ROW.match(line)
+        if row_match:
+            rows.append({
+                "name": row_match.group(1),
+                "path": row_match.group(2),
+                "description": row_match.group(3),
+            })
+    return rows
+
+
 def _merge_curation_plan(existing_content: str, new_areas: list[dict]) -> str:
     """Merge new area sections into existing curation plan, preserving progress."""
     existing_slugs: set[str] = set()
@@ -304,30 +343,27 @@ def scaffold_knowledge_base(
     for name in domain_areas:
         area_slugs.append({"name": name, "dirname": _slugify(name)})
 
-    # For AGENTS.md we need the slightly richer format (with topics list)
-    # Discover existing topics from current AGENTS.md to preserve on re-init
-    existing_topics: dict[str, list[dict]] = {}
-    agents_path = target_dir / "AGENTS.md"
-    if agents_path.exists():
-        existing_topics = _parse_agents_topics(agents_path.read_text())
-
-    agents_areas: list[dict] = []
-    for name in domain_areas:
-        preserved = existing_topics.get(name, [])
-        agents_areas.append({"name": name, "topics": preserved})
-
     # ------------------------------------------------------------------
     # 3. AGENTS.md (merge-safe)
     # ------------------------------------------------------------------
-    existing_agents = agents_path.read_text() if agents_path.exists() else None
-    agents_section = render_agents_md_section(role_name, agents_areas, knowledge_dir=knowledge_dir)
-    agents_full = render_agents_md(role_name, agents_areas, knowledge_dir=knowledge_dir)
-    agents_new = merge_managed_section(existing_agents, agents_section, agents_full)
-    agents_path.write_text(agents_new)
-    if existing_agents is None:
-        created.append("AGENTS.md")
-    else:
-        created.append("AGENTS.md (merged)")
+    # A tiered manifest is built from the areas on disk, so it is written
+    # after the area directories exist (step 6b).
+    agents_path = target_dir / "AGENTS.md"
+    manifest_budget = read_manifest_budget(target_dir)
+    if manifest_budget is None:
+        with kb_lock(target_dir):
+            existing_agents = agents_path.read_text() if agents_path.exists() else None
+            # For AGENTS.md we need the slightly richer format (with topics list);
+            # existing topics are preserved on re-init
+            existing_topics = _parse_agents_topics(existing_agents) if existing_agents is not None else {}
+            agents_areas = [{"name": name, "topics": existing_topics.get(name, [])} for name in domain_areas]
+            agents_section = render_agents_md_section(role_name, agents_areas, knowledge_dir=knowledge_dir)
+            agents_full = render_agents_md(role_name, agents_areas, knowledge_dir=knowledge_dir)
+            write_atomic(agents_path, merge_managed_section(existing_agents, agents_section, agents_full))
+        if existing_agents is None:
+            created.append("AGENTS.md")
+        else:
+            created.append("AGENTS.md (merged)")
 
     # ------------------------------------------------------------------
     # 4. .claude/rules/dewey-kb.md (Dewey-owned, no merge needed)
@@ -335,9 +371,7 @@ def scaffold_knowledge_base(
     rules_dir = target_dir / ".claude" / "rules"
     rules_dir.mkdir(parents=True, exist_ok=True)
     rules_path = rules_dir / "dewey-kb.md"
-    rules_path.write_text(
-        render_dewey_rules(role_name, area_slugs, knowledge_dir=knowledge_dir)
-    )
+    write_atomic(rules_path, render_dewey_rules(role_name, area_slugs, knowledge_dir=knowledge_dir))
     created.append(".claude/rules/dewey-kb.md")
 
     # ------------------------------------------------------------------
@@ -349,10 +383,7 @@ def scaffold_knowledge_base(
         area_dir.mkdir(parents=True, exist_ok=True)
 
         overview_path = area_dir / "overview.md"
-        if not overview_path.exists():
-            overview_path.write_text(
-                render_overview_md(name, relevance="core", topics=[])
-            )
+        if create_exclusive(overview_path, render_overview_md(name, relevance="core", topics=[])):
             created.append(f"{knowledge_dir}/{slug}/overview.md")
 
     # ------------------------------------------------------------------
@@ -364,17 +395,22 @@ def scaffold_knowledge_base(
     # Fall back to area_slugs if no files on disk yet (fresh scaffold)
     if not index_data:
         index_data = area_slugs
-    index_path.write_text(render_index_md(role_name, index_data))
+    write_atomic(index_path, render_index_md(role_name, index_data))
     created.append(f"{knowledge_dir}/index.md" + (" (updated)" if index_existed else ""))
 
+    # ------------------------------------------------------------------
+    # 6b. Tiered AGENTS.md + per-area sub-manifests
+    # ------------------------------------------------------------------
+    if manifest_budget is not None:
+        created.append(rebuild_manifest(target_dir, role_name=role_name or None))
+
     # ------------------------------------------------------------------
     # 7. .claude/hooks.json (utilization tracking hook)
     # ------------------------------------------------------------------
     hooks_path = target_dir / ".claude" / "hooks.json"
-    if not hooks_path.exists():
-        hooks_path.parent.mkdir(parents=True, exist_ok=True)
-        plugin_root = str(Path(__file__).resolve().parent.parent.parent.parent)
-        hooks_path.write_text(render_hooks_json(plugin_root, str(target_dir)))
+    hooks_path.parent.mkdir(parents=True, exist_ok=True)
+    plugin_root = str(Path(__file__).resolve().parent.parent.parent.parent)
+    if create_exclusive(hooks_path, render_hooks_json(plugin_root, str(target_dir))):
         created.append(".claude/hooks.json")
 
     # ------------------------------------------------------------------
@@ -392,13 +428,13 @@ def scaffold_knowledge_base(
                 })
         if plan_areas:
             plan_path = target_dir / ".dewey" / "curation-plan.md"
-            if plan_path.exists():
-                existing_plan = plan_path.read_text()
-                plan_path.write_text(_merge_curation_plan(existing_plan, plan_areas))
-                created.append(".dewey/curation-plan.md (updated)")
-            else:
-                plan_path.write_text(render_curation_plan_md(plan_areas))
-                created.append(".dewey/curation-plan.md")
+            with kb_lock(target_dir):
+                if plan_path.exists():
+                    write_atomic(plan_path, _merge_curation_plan(plan_path.read_text(), plan_areas))
+                    created.append(".dewey/curation-plan.md (updated)")
+                else:
+                    write_atomic(plan_path, render_curation_plan_md(plan_areas))
+                    created.append(".dewey/curation-plan.md")
 
     # ------------------------------------------------------------------
     # Summary
@@ -454,10 +490,285 @@ def rebuild_index(target_dir: Path) -> str:
 
     index_data = _discover_index_data(target_dir, knowledge_dir_name)
     index_path = knowledge_path / "index.md"
-    index_path.write_text(render_index_md(role_name, index_data))
+    write_atomic(index_path, render_index_md(role_name, index_data))
     return f"{knowledge_dir_name}/index.md"
 
 
+_PACK_HEADER = re.compile(r"^<!-- dewey:context-pack area=\S+ source=([0-9a-f]+) tokens=\d+ -->")
+_ONE_LINER_MAX_CHARS = 200
+
+
+def _pack_body(text: str) -> str:
+    """*text* without frontmatter or HTML comments (template placeholders)."""
+    body = re.sub(r"^---\n.*?\n---\n", "", text, count=1, flags=re.DOTALL)
+    return re.sub(r"<!--.*?-->", "", body, flags=re.DOTALL)
+
+
+def _markdown_sections(text: str) -> tuple[str, list[tuple[str, str]]]:
+    """Split a knowledge file into its H1 title and ``(## heading, text)`` pairs.
+
+    Frontmatter and HTML comments are removed; empty sections are dropped.
+    """
+    body = _pack_body(text)
+    title = ""
+    sections: list[tuple[str, str]] = []
+    heading: str | None = None
+    buffer: list[str] = []
+
+    def flush() -> None:
+        content = "\n".join(buffer).strip()
+        if heading is not None and content:
+            sections.append((heading, content))
+
+    for line in body.split("\n"):
+        if line.startswith("# ") and not title:
+            title = line[2:].strip()
+        elif line.startswith("## "):
+            flush()
+            heading, buffer = line[3:].strip(), []
+        else:
+            buffer.append(line)
+    flush()
+    return title, sections
+
+
+def _reference_one_liner(text: str) -> str:
+    """First prose line of a ``.ref.md`` body, for a pack's quick-reference line."""
+    for line in _pack_body(text).split("\n"):
+        line = line.strip().lstrip("-* ").strip()
+        if not line or line.startswith(("#", "**See also", "|")):
+            continue
+        if len(line) > _ONE_LINER_MAX_CHARS:
+            line = line[:_ONE_LINER_MAX_CHARS - 3].rstrip() + "..."
+        return line
+    return ""
+
+
+def _area_source_hash(area_dir: Path) -> str:
+    """Content hash of every ``.md`` file in *area_dir* (and the pack format)."""
+    digest = hashlib.sha256(CONTEXT_PACK_FORMAT.encode())
+    for md_file in sorted(area_dir.glob("*.md")):
+        digest.update(md_file.name.encode() + b"\0")
+        digest.update(md_file.read_bytes() + b"\0")
+    return digest.hexdigest()[:16]
+
+
+def _area_pack_data(area_dir: Path, knowledge_dir_name: str) -> dict:
+    """Collect the overview, working-topic essentials and ref one-liners of an area."""
+    area: dict = {"name": area_dir.name, "dirname": area_dir.name, "overview": [], "topics": []}
+    overview = area_dir / "overview.md"
+    if overview.is_file():
+        title, sections = _markdown_sections(overview.read_text())
+        area["name"] = title or area_dir.name
+        area["overview"] = sections
+
+    for md_file in sorted(area_dir.glob("*.md")):
+        if md_file.name == "overview.md" or md_file.name.endswith(".ref.md"):
+            continue
+        title, sections = _markdown_sections(md_file.read_text())
+        ref = md_file.with_name(md_file.name[:-3] + ".ref.md")
+        area["topics"].append({
+            "name": title or md_file.stem,
+            "path": f"{knowledge_dir_name}/{area_dir.name}/{md_file.name}",
+            "one_liner": _reference_one_liner(ref.read_text()) if ref.is_file() else "",
+            "sections": [(h, t) for h, t in sections if h in CONTEXT_PACK_SECTIONS],
+        })
+    return area
+
+
+def rebuild_context_packs(target_dir: Path, *, force: bool = False) -> dict:
+    """Compile each area into ``<knowledge_dir>/_packs/<area>.md``.
+
+    A pack holds the area overview, the essential sections of each
+    working-depth topic (``CONTEXT_PACK_SECTIONS``) and a one-line summary
+    from each ``.ref.md``, with frontmatter and HTML comments removed, so an
+    agent can load an area in one read.  Each pack records the content
+    hash of its sources; areas whose hash is unchanged are skipped unless
+    *force* is set.  Packs for areas no longer on disk are removed.
+
+    Parameters
+    ----------
+    target_dir:
+        Root directory containing the knowledge base.
+    force:
+        Rebuild every pack regardless of its recorded hash.
+
+    Returns
+    -------
+    dict
+        ``{"built": [path, ...], "unchanged": [path, ...], "removed": [path, ...]}``
+        with paths relative to *target_dir*.
+    """
+    knowledge_dir_name = read_knowledge_dir(target_dir)
+    knowledge_path = target_dir / knowledge_dir_name
+    pack_dir = knowledge_path / CONTEXT_PACK_DIR
+    result: dict[str, list[str]] = {"built": [], "unchanged": [], "removed": []}
+    if not knowledge_path.is_dir():
+        return result
+
+    area_dirs = [
+        entry for entry in sorted(knowledge_path.iterdir())
+        if entry.is_dir() and not entry.name.startswith(("_", "."))
+    ]
+    for area_dir in area_dirs:
+        rel = context_pack_path(knowledge_dir_name, area_dir.name)
+        pack_path = target_dir / rel
+        source_hash = _area_source_hash(area_dir)
+        if not force and pack_path.is_file():
+            header = _PACK_HEADER.match(pack_path.read_text())
+            if header and header.group(1) == source_hash:
+                result["unchanged"].append(rel)
+                continue
+        pack_dir.mkdir(parents=True, exist_ok=True)
+        pack = render_context_pack(
+            _area_pack_data(area_dir, knowledge_dir_name),
+            knowledge_dir=knowledge_dir_name,
+            source_hash=source_hash,
+        )
+        write_atomic(pack_path, pack)
+        result["built"].append(rel)
+
+    if pack_dir.is_dir():
+        current = {area_dir.name for area_dir in area_dirs}
+        for stale in sorted(pack_dir.glob("*.md")):
+            if stale.stem not in current:
+                stale.unlink(missing_ok=True)
+                result["removed"].append(f"{knowledge_dir_name}/{CONTEXT_PACK_DIR}/{stale.name}")
+    return result
+
+
+def _topic_reads(target_dir: Path) -> dict[str, int]:
+    """Utilization read counts keyed by path relative to the knowledge-base root."""
+    from utilization import read_utilization
+
+    return {path: stats["count"] for path, stats in read_utilization(target_dir).items()}
+
+
+def _manifest_areas(target_dir: Path, knowledge_dir_name: str, agents_text: str) -> list[dict]:
+    """Areas and topics on disk, with manifest descriptions and read counts.
+
+    Topic descriptions are carried over from the current AGENTS.md and area
+    sub-manifests; area headings already used in AGENTS.md are kept.  A
+    topic's ``reads`` count includes reads of its ``.ref.md`` companion.
+    """
+    known: dict[str, dict] = {}
+    headings: dict[str, str] = {}
+    for heading, rows in _parse_agents_topics(agents_text).items():
+        headings.setdefault(_slugify(heading), heading)
+        for row in rows:
+            known[row["path"]] = row
+    manifest_dir = target_dir / knowledge_dir_name / AREA_MANIFEST_DIR
+    if manifest_dir.is_dir():
+        for manifest in sorted(manifest_dir.glob("*.md")):
+            for row in _parse_manifest_rows(manifest.read_text()):
+                known.setdefault(row["path"], row)
+
+    reads = _topic_reads(target_dir)
+    areas: list[dict] = []
+    for area in _discover_index_data(target_dir, knowledge_dir_name):
+        dirname = area["dirname"]
+        if dirname in headings:
+            name = headings[dirname]
+        elif _slugify(area["name"]) == dirname:
+            name = area["name"]
+        else:
+            name = dirname
+        topics: list[dict] = []
+        for topic in area["topics"]:
+            path = f"{knowledge_dir_name}/{dirname}/{topic['filename']}"
+            row = known.get(path, {})
+            ref_path = path[:-3] + ".ref.md"
+            topics.append({
+                "name": row.get("name") or topic["name"],
+                "path": path,
+                "description": row.get("description", ""),
+                "reads": reads.get(path, 0) + reads.get(ref_path, 0),
+            })
+        areas.append({"name": name, "dirname": dirname, "topics": topics})
+    return areas
+
+
+def rebuild_manifest(
+    target_dir: Path,
+    token_budget: int | None = None,
+    *,
+    role_name: str | None = None,
+) -> str:
+    """Regenerate the AGENTS.md manifest from the current filesystem contents.
+
+    With a token budget (argument, or ``manifest_token_budget`` in
+    ``.dewey/config.json``) the manifest is tiered: the managed section
+    lists every area plus the most-read topics that fit the budget, and
+    each area's full topic table is written to
+    ``<knowledge_dir>/_manifests/<area>.md``.  Without one, every topic is
+    listed inline and stale sub-manifests are removed.
+
+    The read-merge-write of AGENTS.md runs under ``fileops.kb_lock``.
+
+    Parameters
+    ----------
+    target_dir:
+        Root directory containing the knowledge base.
+    token_budget:
+        Budget for the AGENTS.md managed section, in estimated tokens.
+        When given, it is saved to config so later rebuilds and
+        ``check_manifest_sync`` use it.
+    role_name:
+        Role for a newly created AGENTS.md (default: read from AGENTS.md).
+
+    Returns
+    -------
+    str
+        Summary of what was written.
+    """
+    knowledge_dir_name = read_knowledge_dir(target_dir)
+    if token_budget is not None:
+        write_config(target_dir, knowledge_dir_name, manifest_token_budget=token_budget)
+    else:
+        token_budget = read_manifest_budget(target_dir)
+
+    with kb_lock(target_dir):
+        agents_path = target_dir / "AGENTS.md"
+        agents_text = agents_path.read_text() if agents_path.exists() else ""
+        if role_name is None:
+            heading_match = re.search(r"^# Role:\s*(.+)$", agents_text, re.MULTILINE)
+            role_name = heading_match.group(1).strip() if heading_match else "Knowledge Base"
+
+        areas = _manifest_areas(target_dir, knowledge_dir_name, agents_text)
+        manifest_dir = target_dir / knowledge_dir_name / AREA_MANIFEST_DIR
+        keep: set[str] = set()
+        if token_budget is not None:
+            section = render_tiered_agents_md_section(
+                role_name, areas, knowledge_dir=knowledge_dir_name, token_budget=token_budget,
+            )
+            manifest_dir.mkdir(parents=True, exist_ok=True)
+            for area in areas:
+                manifest_path = target_dir / area_manifest_path(knowledge_dir_name, area["dirname"])
+                write_atomic(manifest_path, render_area_manifest(area, knowledge_dir=knowledge_dir_name))
+                keep.add(manifest_path.name)
+        else:
+            section = render_agents_md_section(role_name, areas, knowledge_dir=knowledge_dir_name)
+
+        if manifest_dir.is_dir():
+            for stale in manifest_dir.glob("*.md"):
+                if stale.name not in keep:
+                    stale.unlink()
+            if not any(manifest_dir.iterdir()):
+                manifest_dir.rmdir()
+
+        base = agents_text or render_agents_md(role_name, [], knowledge_dir=knowledge_dir_name)
+        write_atomic(agents_path, merge_managed_section(base, section, base))
+
+    if token_budget is None:
+        return "AGENTS.md (full manifest)"
+    listed = len(_parse_manifest_rows(section))
+    total = sum(len(area["topics"]) for area in areas)
+    return (
+        f"AGENTS.md (tiered: {listed} of {total} topics, ~{estimate_tokens(section)} tokens) "
+        f"+ {len(areas)} area manifests in {knowledge_dir_name}/{AREA_MANIFEST_DIR}/"
+    )
+
+
 if __name__ == "__main__":
     import argparse
 
@@ -484,9 +795,38 @@ if __name__ == "__main__":
         action="store_true",
         help="Regenerate index.md from filesystem contents and exit.",
     )
+    parser.add_argument(
+        "--rebuild-manifest",
+        action="store_true",
+        help="Regenerate the AGENTS.md manifest (and area sub-manifests when tiered) and exit.",
+    )
+    parser.add_argument(
+        "--manifest-budget",
+        type=int,
+        default=None,
+        help="Token budget for the AGENTS.md manifest; enables the tiered layout and is saved to config.",
+    )
+    parser.add_argument(
+        "--rebuild-packs",
+        action="store_true",
+        help="Rebuild per-area context packs whose source files changed and exit.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="With --rebuild-packs, rebuild every pack.",
+    )
     args = parser.parse_args()
 
-    if args.rebuild_index:
+    if args.rebuild_packs:
+        packs = rebuild_context_packs(Path(args.target), force=args.force)
+        print(f"Context packs: {len(packs['built'])} built, {len(packs['unchanged'])} unchanged, "
+              f"{len(packs['removed'])} removed")
+        for path in packs["built"]:
+            print(f"  - {path}")
+    elif args.rebuild_manifest or args.manifest_budget is not None:
+        print(f"Rebuilt {rebuild_manifest(Path(args.target), args.manifest_budget)}")
+    elif args.rebuild_index:
         result = rebuild_index(Path(args.target))
         print(f"Rebuilt {result}")
     else:
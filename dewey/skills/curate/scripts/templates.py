@@ -8,6 +8,7 @@ Managed sections are bracketed by MARKER_BEGIN / MARKER_END for safe merging.
 from __future__ import annotations
 
 import json
+import math
 import re
 from datetime import date
 
@@ -20,6 +21,77 @@ MARKER_BEGIN = "<!-- dewey:knowledge-base:begin -->"
 MARKER_END = "<!-- dewey:knowledge-base:end -->"
 
 
+# ---------------------------------------------------------------------------
+# Placeholder comments
+# ---------------------------------------------------------------------------
+
+# Every fill-in placeholder the knowledge-file templates emit, grouped by
+# template.  Health checks flag any of these left in a file, so a template
+# that introduces a new placeholder must list it here.
+PLACEHOLDER_SETS: dict[str, tuple[str, ...]] = {
+    "overview": (
+        "<!-- placeholder -->",
+    ),
+    "sources": (
+        "<!-- Add primary source URL -->",
+        "<!-- Add source title -->",
+    ),
+    "topic": (
+        "<!-- Explain why this topic is important in your domain -->",
+        "<!-- Describe how this topic is applied day-to-day -->",
+        "<!-- Actionable recommendations and best practices -->",
+        "<!-- Common pitfalls, anti-patterns, and mistakes -->",
+        "<!-- Complete during research step: source scoring table and provenance block -->",
+    ),
+    "reference": (
+        "<!-- Quick-reference notes: keep terse and scannable -->",
+    ),
+    "proposal": (
+        "<!-- Links to primary sources, books, talks, and further reading -->",
+    ),
+}
+
+
+# ---------------------------------------------------------------------------
+# Tiered manifests
+# ---------------------------------------------------------------------------
+
+# Per-area sub-manifests live in an underscore directory inside the knowledge
+# directory, which every discovery pass already skips (like _proposals/).
+AREA_MANIFEST_DIR = "_manifests"
+
+_CHARS_PER_TOKEN = 4
+
+
+def area_manifest_path(knowledge_dir: str, dirname: str) -> str:
+    """Path of an area's sub-manifest, relative to the knowledge-base root."""
+    return f"{knowledge_dir}/{AREA_MANIFEST_DIR}/{dirname}.md"
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)."""
+    return math.ceil(len(text) / _CHARS_PER_TOKEN)
+
+
+# ---------------------------------------------------------------------------
+# Context packs
+# ---------------------------------------------------------------------------
+
+# One pre-built file per area that an agent can load in a single read.
+CONTEXT_PACK_DIR = "_packs"
+
+# Bump when the pack layout changes so every pack is rebuilt.
+CONTEXT_PACK_FORMAT = "1"
+
+# Working-depth sections carried into a pack; the rest stay in the topic file.
+CONTEXT_PACK_SECTIONS = ("Key Guidance", "Watch Out For")
+
+
+def context_pack_path(knowledge_dir: str, dirname: str) -> str:
+    """Path of an area's context pack, relative to the knowledge-base root."""
+    return f"{knowledge_dir}/{CONTEXT_PACK_DIR}/{dirname}.md"
+
+
 def _slugify(name: str) -> str:
     """Convert a human-readable name to a filename slug.
 
@@ -63,6 +135,31 @@ def _frontmatter(fields: dict) -> str:
 # Public render functions
 # ---------------------------------------------------------------------------
 
+def _topic_row(topic: dict, area_name: str, knowledge_dir: str) -> str:
+    link = topic.get("path", f"{knowledge_dir}/{_slugify(area_name)}/{_slugify(topic['name'])}.md")
+    return f"| [{topic['name']}]({link}) | {topic['description']} |"
+
+
+def _usage_guidance(knowledge_dir: str, *, tiered: bool = False) -> list[str]:
+    lines = [
+        "## How To Use This Knowledge",
+        f"- Load topic files from `{knowledge_dir}/` when the task relates to that domain area.",
+    ]
+    if tiered:
+        lines.append(
+            "- Only the most-used topics are listed here. Before working in an area, "
+            "load its full topic list (linked under the area heading)."
+        )
+    lines += [
+        "- Use `.ref.md` files for quick lookups; use full topic files for deep context.",
+        "- Cite primary sources from the `sources` frontmatter when making recommendations.",
+        "- Defer to primary sources for detailed reference.",
+        "- Check `.dewey/curation-plan.md` for planned topics and curation priorities.",
+        "- When a conversation touches knowledge areas not covered by existing topics or the plan, suggest adding them.",
+    ]
+    return lines
+
+
 def render_agents_md_section(role_name: str, domain_areas: list[dict], *, knowledge_dir: str = "docs") -> str:
     """Render the dewey-managed section of AGENTS.md (no markers).
 
@@ -81,8 +178,7 @@ def render_agents_md_section(role_name: str, domain_areas: list[dict], *, knowle
             sections.append("| Topic | Description |")
             sections.append("|-------|-------------|")
             for topic in topics:
-                link = topic.get("path", f"{knowledge_dir}/{_slugify(area['name'])}/{_slugify(topic['name'])}.md")
-                sections.append(f"| [{topic['name']}]({link}) | {topic['description']} |")
+                sections.append(_topic_row(topic, area["name"], knowledge_dir))
         sections.append("")
 
     # Remove trailing blank if domain_areas was non-empty
@@ -90,17 +186,127 @@ def render_agents_md_section(role_name: str, domain_areas: list[dict], *, knowle
         sections.pop()
 
     sections.append("")
-    sections.append("## How To Use This Knowledge")
-    sections.append(f"- Load topic files from `{knowledge_dir}/` when the task relates to that domain area.")
-    sections.append("- Use `.ref.md` files for quick lookups; use full topic files for deep context.")
-    sections.append("- Cite primary sources from the `sources` frontmatter when making recommendations.")
-    sections.append("- Defer to primary sources for detailed reference.")
-    sections.append("- Check `.dewey/curation-plan.md` for planned topics and curation priorities.")
-    sections.append("- When a conversation touches knowledge areas not covered by existing topics or the plan, suggest adding them.")
+    sections.extend(_usage_guidance(knowledge_dir))
 
     return "\n".join(sections)
 
 
+def render_tiered_agents_md_section(
+    role_name: str,
+    domain_areas: list[dict],
+    *,
+    knowledge_dir: str = "docs",
+    token_budget: int,
+) -> str:
+    """Render a budgeted AGENTS.md managed section (no markers).
+
+    Every area is listed with a link to its sub-manifest (see
+    ``render_area_manifest``).  Topics are then added, most-read first
+    across all areas, while the section stays within *token_budget*
+    (estimated with ``estimate_tokens``).  Areas and usage guidance are
+    always included, even if they alone exceed the budget.
+
+    Parameters
+    ----------
+    domain_areas:
+        List of ``{"name": ..., "dirname": ..., "topics": [{"name", "path",
+        "description", "reads"}]}``.  ``reads`` (default 0) ranks topics.
+    token_budget:
+        Upper bound for the rendered section, in estimated tokens.
+    """
+    def render(selected: dict[int, list[dict]]) -> str:
+        sections = ["## What You Have Access To"]
+        for i, area in enumerate(domain_areas):
+            manifest = area_manifest_path(knowledge_dir, area["dirname"])
+            count = len(area.get("topics", []))
+            sections.append(f"### {area['name']}")
+            sections.append(f"All {count} topics: [{area['name']} topics]({manifest})")
+            if selected.get(i):
+                sections.append("")
+                sections.append("| Topic | Description |")
+                sections.append("|-------|-------------|")
+                for topic in selected[i]:
+                    sections.append(_topic_row(topic, area["name"], knowledge_dir))
+            sections.append("")
+        sections.extend(_usage_guidance(knowledge_dir, tiered=True))
+        return "\n".join(sections)
+
+    budget_chars = token_budget * _CHARS_PER_TOKEN
+    used = len(render({}))
+    table_header = len("\n| Topic | Description |\n|-------|-------------|")
+
+    ranked = sorted(
+        ((i, j, topic) for i, area in enumerate(domain_areas) for j, topic in enumerate(area.get("topics", []))),
+        key=lambda item: (-item[2].get("reads", 0), item[0], item[1]),
+    )
+    selected: dict[int, list[dict]] = {}
+    for i, _, topic in ranked:
+        cost = len(_topic_row(topic, domain_areas[i]["name"], knowledge_dir)) + 1
+        if i not in selected:
+            cost += table_header
+        if used + cost > budget_chars:
+            continue
+        used += cost
+        selected.setdefault(i, []).append(topic)
+
+    return render(selected)
+
+
+def render_area_manifest(area: dict, *, knowledge_dir: str = "docs") -> str:
+    """Render an area's sub-manifest: the full topic table for one area.
+
+    Sub-manifests are Dewey-owned (no markers) and loaded on demand from
+    the links in a tiered AGENTS.md.  Topics are listed most-read first.
+    """
+    topics = sorted(area.get("topics", []), key=lambda t: -t.get("reads", 0))
+    lines = [
+        f"# {area['name']} Topics",
+        "",
+        f"> Every topic in `{knowledge_dir}/{area['dirname']}/`, most-used first. "
+        "Generated by `scaffold.py --rebuild-manifest`.",
+        "",
+        "| Topic | Description |",
+        "|-------|-------------|",
+    ]
+    lines.extend(_topic_row(topic, area["name"], knowledge_dir) for topic in topics)
+    return "\n".join(lines) + "\n"
+
+
+def render_context_pack(area: dict, *, knowledge_dir: str = "docs", source_hash: str) -> str:
+    """Render an area's context pack: overview, topic essentials, reference one-liners.
+
+    The first line is a ``dewey:context-pack`` comment recording the area,
+    the *source_hash* of the files the pack was built from, and the pack's
+    estimated token count.
+
+    Parameters
+    ----------
+    area:
+        ``{"name": ..., "dirname": ..., "overview": [(heading, text), ...],
+        "topics": [{"name", "path", "one_liner", "sections": [(heading, text), ...]}]}``
+        with frontmatter and HTML comments (placeholders) already removed.
+    source_hash:
+        Content hash of the area's source files.
+    """
+    lines = [f"# {area['name']} -- Context Pack", ""]
+    for heading, text in area.get("overview", []):
+        lines += [f"## {heading}", text, ""]
+    for topic in area.get("topics", []):
+        lines.append(f"## {topic['name']}")
+        lines.append(f"Full topic: `{topic['path']}`")
+        if topic.get("one_liner"):
+            lines.append(f"Quick reference: {topic['one_liner']}")
+        lines.append("")
+        for heading, text in topic.get("sections", []):
+            lines += [f"### {heading}", text, ""]
+    body = "\n".join(lines).rstrip("\n") + "\n"
+    header = (
+        f"<!-- dewey:context-pack area={area['dirname']} source={source_hash} "
+        f"tokens={estimate_tokens(body)} -->"
+    )
+    return header + "\n" + body
+
+
 def render_agents_md(role_name: str, domain_areas: list[dict], *, knowledge_dir: str = "docs") -> str:
     """Render AGENTS.md (persona + manifest).
 
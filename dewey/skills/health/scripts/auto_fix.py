@@ -6,12 +6,17 @@ fixable issues found by Tier 1 validators:
 1. Missing required sections — inserts stub headings with TODO comments
 2. Missing cross-links — adds companion links between working and ref files
 
+Orphaned topics are linked from their most similar topic (see
+``check_link_graph`` candidates), and related topics in other areas are
+cross-linked under "See Also" (see ``similarity.suggest_see_also``).
+
 Only stdlib is used.
 """
 
 from __future__ import annotations
 
 import json
+import os
 import re
 import sys
 from pathlib import Path
@@ -222,6 +227,95 @@ def fix_missing_cross_links(file_path: Path, issues: list[dict]) -> list[dict]:
     return actions
 
 
+def _insert_go_deeper_link(file_path: Path, link: str) -> bool:
+    """Add *link* as the first item under the Go Deeper heading; False if there is none."""
+    lines = file_path.read_text().split("\n")
+    for idx, line in enumerate(lines):
+        if line.startswith("## ") and "go deeper" in line.lower():
+            lines.insert(idx + 1, link)
+            file_path.write_text("\n".join(lines))
+            return True
+    return False
+
+
+def _insert_see_also_link(file_path: Path, link: str) -> None:
+    """Add *link* as the first item under ``## See Also``, appending the section if missing."""
+    lines = file_path.read_text().split("\n")
+    for idx, line in enumerate(lines):
+        if line.startswith("## ") and "see also" in line.lower():
+            lines.insert(idx + 1, link)
+            file_path.write_text("\n".join(lines))
+            return
+    file_path.write_text("\n".join(lines).rstrip("\n") + f"\n\n## See Also\n{link}\n")
+
+
+def _related_link(source: Path, target: Path) -> str:
+    """``- [Name](relative path) -- related topic`` for a link from *source* to *target*."""
+    display_name = target.stem.replace("-", " ").title()
+    rel = Path(os.path.relpath(target, source.parent)).as_posix()
+    return f"- [{display_name}]({rel}) -- related topic"
+
+
+def fix_orphan_links(
+    knowledge_base_root: Path, issues: list[dict], *, knowledge_dir_name: str = "docs",
+) -> list[dict]:
+    """Link each orphaned topic from its best-ranked candidate.
+
+    Uses the ``candidates`` that ``check_link_graph`` attaches to orphan
+    issues and inserts ``- [Name](path) -- related topic`` into the top
+    candidate's Go Deeper section, or under "See Also" (created if
+    needed) when it has none.
+
+    Returns a list of action dicts describing what was changed.
+    """
+    knowledge_dir = knowledge_base_root / knowledge_dir_name
+    actions: list[dict] = []
+    for issue in issues:
+        if not issue.get("candidates"):
+            continue
+        orphan = Path(issue["file"])
+        best = issue["candidates"][0]
+        target = knowledge_dir / best["file"]
+        link = _related_link(target, orphan)
+        if not _insert_go_deeper_link(target, link):
+            _insert_see_also_link(target, link)
+        actions.append({
+            "file": str(target),
+            "action": "inserted_see_also",
+            "detail": f"Linked orphan {orphan.name} (similarity {best['score']})",
+        })
+    return actions
+
+
+def fix_see_also_links(
+    knowledge_base_root: Path, suggestions: list[dict], *, knowledge_dir_name: str = "docs",
+) -> list[dict]:
+    """Add cross-area "See also" links from ``similarity.suggest_see_also``.
+
+    Each suggested topic is linked as ``- [Name](path) -- related topic``
+    under the file's ``## See Also`` section, which is appended when
+    missing.  Topics the file already links to are skipped.
+
+    Returns a list of action dicts describing what was changed.
+    """
+    knowledge_dir = knowledge_base_root / knowledge_dir_name
+    actions: list[dict] = []
+    for entry in suggestions:
+        source = knowledge_dir / entry["file"]
+        for suggestion in entry["suggestions"]:
+            target = knowledge_dir / suggestion["file"]
+            rel = Path(os.path.relpath(target, source.parent)).as_posix()
+            if f"]({rel})" in source.read_text():
+                continue
+            _insert_see_also_link(source, _related_link(source, target))
+            actions.append({
+                "file": str(source),
+                "action": "inserted_see_also",
+                "detail": f"Linked related topic {suggestion['file']} (similarity {suggestion['score']})",
+            })
+    return actions
+
+
 def fix_curation_plan_checkmarks(knowledge_base_root: Path, *, knowledge_dir_name: str = "docs") -> list[dict]:
     """Check off curation plan items when matching files exist on disk.
 
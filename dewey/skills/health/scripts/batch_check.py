@@ -0,0 +1,250 @@
+"""Run health checks across many knowledge bases on one shared process pool.
+
+A monorepo may hold dozens of knowledge bases, each with its own
+``.dewey/config.json``.  Launching ``check_knowledge_base.py`` once per
+root pays interpreter start-up every time and keeps one core busy.
+``run_batch`` instead submits one task per root to a single
+``ProcessPoolExecutor``, largest roots first, and collects a per-root
+report plus an aggregate.
+
+Each task is an ordinary ``run_health_check`` / ``run_tier2_prescreening``
+/ ``run_combined_report`` / ``generate_recommendations`` call on its root,
+so every root keeps its own ``read_knowledge_dir`` setting, history log,
+memo and registry.  A root that raises is reported with its error; the
+rest of the batch still runs.
+
+Only stdlib is used.
+"""
+
+from __future__ import annotations
+
+import glob
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from check_knowledge_base import (
+    _discover_md_files,
+    generate_recommendations,
+    run_combined_report,
+    run_health_check,
+    run_tier2_prescreening,
+)
+from config import read_knowledge_dir
+
+
+def expand_roots(roots: list[str], patterns: list[str]) -> list[Path]:
+    """Return the directories named by *roots* and matched by glob *patterns*.
+
+    Duplicates (after resolving) are dropped; order follows the input,
+    with each pattern's matches sorted.
+    """
+    candidates = [Path(root) for root in roots]
+    for pattern in patterns:
+        candidates.extend(Path(match) for match in sorted(glob.glob(pattern, recursive=True)))
+
+    seen: set[Path] = set()
+    result: list[Path] = []
+    for candidate in candidates:
+        resolved = candidate.resolve()
+        if resolved in seen or not candidate.is_dir():
+            continue
+        seen.add(resolved)
+        result.append(candidate)
+    return result
+
+
+def _root_size(root: Path) -> int:
+    """Number of knowledge files under *root*, used to order submissions."""
+    try:
+        return len(_discover_md_files(root, read_knowledge_dir(root)))
+    except OSError:
+        return 0
+
+
+def check_root(
+    root: Path,
+    *,
+    tier1: bool = True,
+    tier2: bool = False,
+    recommendations: bool = False,
+    tier1_options: Optional[dict] = None,
+    tier2_options: Optional[dict] = None,
+    recommendation_options: Optional[dict] = None,
+) -> dict:
+    """Run the requested checks on one root, the way the single-root CLI does.
+
+    Returns ``{"root": str, "tier1"?: ..., "tier2"?: ..., "recommendations"?: ...}``,
+    or ``{"root": str, "error": str}`` when a check raises.
+    """
+    tier1_options = tier1_options or {}
+    tier2_options = tier2_options or {}
+    result: dict = {"root": str(root)}
+    try:
+        if tier1 and tier2:
+            result.update(run_combined_report(root, **tier1_options, **tier2_options))
+        elif tier1:
+            result["tier1"] = run_health_check(root, **tier1_options)
+        elif tier2:
+            result["tier2"] = run_tier2_prescreening(root, **tier2_options)
+        if recommendations:
+            result["recommendations"] = generate_recommendations(root, **(recommendation_options or {}))
+    except Exception as exc:  # one broken root must not sink the batch
+        return {"root": str(root), "error": f"{type(exc).__name__}: {exc}"}
+    return result
+
+
+def aggregate_reports(reports: list[dict]) -> dict:
+    """Sum per-root summaries into one batch-wide summary."""
+    aggregate: dict = {
+        "roots": len(reports),
+        "roots_failed": sum(1 for report in reports if "error" in report),
+    }
+    tier1 = [r["tier1"]["summary"] for r in reports if "tier1" in r]
+    if tier1:
+        aggregate["tier1"] = {
+            key: sum(summary[key] for summary in tier1)
+            for key in ("total_files", "fail_count", "warn_count")
+        }
+    tier2 = [r["tier2"]["summary"] for r in reports if "tier2" in r]
+    if tier2:
+        trigger_counts: dict[str, int] = {}
+        for summary in tier2:
+            for trigger, count in summary["trigger_counts"].items():
+                trigger_counts[trigger] = trigger_counts.get(trigger, 0) + count
+        aggregate["tier2"] = {
+            "total_files_scanned": sum(s["total_files_scanned"] for s in tier2),
+            "files_with_triggers": sum(s["files_with_triggers"] for s in tier2),
+            "trigger_counts": trigger_counts,
+            "suppressed_by_memo": sum(s["suppressed_by_memo"] for s in tier2),
+        }
+    recs = [r["recommendations"] for r in reports if "recommendations" in r]
+    if recs:
+        aggregate["recommendations"] = {
+            "total": sum(len(rec["recommendations"]) for rec in recs),
+            "roots_skipped": sum(1 for rec in recs if "skipped" in rec),
+        }
+    return aggregate
+
+
+def run_batch(roots: list[Path], *, workers: Optional[int] = None, **check_options) -> dict:
+    """Check every root on one shared process pool.
+
+    Parameters
+    ----------
+    roots:
+        Knowledge-base root directories.
+    workers:
+        Pool size; defaults to ``min(len(roots), os.cpu_count())``.  With
+        ``workers=1`` the roots are checked in-process, which avoids pool
+        start-up for small batches.
+    **check_options:
+        Forwarded to ``check_root``.
+
+    Returns
+    -------
+    dict
+        ``{"reports": [per-root result, ...], "aggregate": {...}}`` with
+        reports in the order of *roots*.
+    """
+    if not roots:
+        return {"reports": [], "aggregate": aggregate_reports([])}
+    workers = workers or min(len(roots), os.cpu_count() or 1)
+
+    if workers == 1:
+        reports = [check_root(root, **check_options) for root in roots]
+    else:
+        # Largest first, so a big root does not start last and stretch the tail
+        order = sorted(range(len(roots)), key=lambda i: -_root_size(roots[i]))
+        results: dict[int, dict] = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(check_root, roots[i], **check_options): i for i in order}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        reports = [results[i] for i in range(len(roots))]
+
+    return {"reports": reports, "aggregate": aggregate_reports(reports)}
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    from tier2_triggers import DEFAULT_EXCERPT_MAX_CHARS
+
+    parser = argparse.ArgumentParser(
+        description="Run health checks across many knowledge bases on one process pool.",
+    )
+    parser.add_argument(
+        "--knowledge-base-root",
+        action="append",
+        default=[],
+        help="Knowledge-base root directory (repeatable).",
+    )
+    parser.add_argument(
+        "--glob",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Glob matching knowledge-base root directories, e.g. 'kbs/*' (repeatable; ** allowed).",
+    )
+    parser.add_argument("--tier2", action="store_true", help="Run Tier 2 pre-screening instead of Tier 1 checks.")
+    parser.add_argument("--both", action="store_true", help="Run both Tier 1 checks and Tier 2 pre-screening.")
+    parser.add_argument(
+        "--recommendations",
+        action="store_true",
+        help="Also generate utilization-driven curation recommendations.",
+    )
+    parser.add_argument("--min-reads", type=int, default=10, help="Recommendation gate (default: 10).")
+    parser.add_argument("--min-days", type=int, default=7, help="Recommendation gate (default: 7).")
+    parser.add_argument(
+        "--window-days", type=int, choices=(0, 7, 30, 90), default=90,
+        help="Recommendation read window in days (default: 90; 0 = all time).",
+    )
+    parser.add_argument("--check-links", action="store_true", help="Check source URL accessibility.")
+    parser.add_argument("--cache-shingles", action="store_true", help="Persist duplicate-detection shingles.")
+    parser.add_argument("--diff", action="store_true", help="Report Tier 1 changes since each root's last snapshot.")
+    parser.add_argument("--fetch-sources", action="store_true", help="Refresh source snapshots before Tier 2.")
+    parser.add_argument("--token-budget", type=int, default=None, help="Pack each Tier 2 queue into batches.")
+    parser.add_argument("--ignore-memo", action="store_true", help="Ignore recorded Tier 2 assessments.")
+    parser.add_argument("--memo-ttl-days", type=int, default=None, help="Re-queue assessments older than this.")
+    parser.add_argument("--excerpts", action="store_true", help="Attach section excerpts to Tier 2 items.")
+    parser.add_argument("--excerpt-max-chars", type=int, default=DEFAULT_EXCERPT_MAX_CHARS)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    args = parser.parse_args()
+    if args.token_budget is not None and args.token_budget <= 0:
+        parser.error(f"--token-budget must be a positive number of tokens, got {args.token_budget}")
+
+    roots = expand_roots(args.knowledge_base_root, args.glob)
+    if not roots:
+        parser.error("no knowledge-base roots given or matched")
+
+    tier2 = args.tier2 or args.both
+    report = run_batch(
+        roots,
+        workers=args.workers,
+        tier1=args.both or not (args.tier2 or args.recommendations),
+        tier2=tier2,
+        recommendations=args.recommendations,
+        tier1_options={
+            "check_links": args.check_links,
+            "diff": args.diff,
+            "cache_shingles": args.cache_shingles,
+        },
+        tier2_options={
+            "fetch_sources": args.fetch_sources,
+            "token_budget": args.token_budget,
+            "use_memo": not args.ignore_memo,
+            "memo_ttl_days": args.memo_ttl_days,
+            "excerpts": args.excerpts,
+            "excerpt_max_chars": args.excerpt_max_chars,
+        },
+        recommendation_options={
+            "min_reads": args.min_reads, "min_days": args.min_days, "window_days": args.window_days or None,
+        },
+    )
+    print(json.dumps(report, indent=2))
@@ -11,59 +11,75 @@ from __future__ import annotations
 
 import json
 import sys
+import time
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
+from typing import IO, Iterator
 
 # config.py lives in curate/scripts/ — add it to sys.path for cross-skill import.
 _curate_scripts = str(Path(__file__).resolve().parent.parent.parent / "curate" / "scripts")
 if _curate_scripts not in sys.path:
     sys.path.insert(0, _curate_scripts)
 
-from config import read_knowledge_dir
-from history import record_snapshot
-from tier2_triggers import (
-    trigger_citation_quality,
-    trigger_concrete_examples,
-    trigger_depth_accuracy,
-    trigger_provenance_completeness,
-    trigger_recommendation_coverage,
-    trigger_source_authority,
-    trigger_source_drift,
-    trigger_source_primacy,
-    trigger_why_quality,
-)
-from auto_fix import fix_curation_plan_checkmarks, fix_missing_cross_links, fix_missing_sections
-from cross_validators import (
-    check_curation_plan_sync,
-    check_duplicate_content,
-    check_link_graph,
-    check_manifest_sync,
-    check_naming_conventions,
-    check_proposal_integrity,
-)
-from utilization import read_utilization
-from validators import (
-    check_citation_grounding,
-    check_coverage,
-    check_cross_references,
-    check_freshness,
-    check_frontmatter,
-    check_go_deeper_links,
-    check_heading_hierarchy,
-    check_index_sync,
-    check_inventory_regression,
-    check_placeholder_comments,
-    check_readability,
-    check_ref_see_also,
-    check_section_completeness,
-    check_section_ordering,
-    check_size_bounds,
-    check_source_accessibility,
-    check_source_diversity,
-    check_source_urls,
-    parse_frontmatter,
+from config import read_knowledge_dir, read_max_file_bytes
+from storage import is_writable, open_knowledge_base
+from validator_registry import (
+    COST_CLASSES,
+    DEFAULT_EXCERPT_MAX_CHARS,
+    SCOPES,
+    VALIDATORS,
+    bind,
+    load,
+    reads_content,
+    required_inputs,
+    select,
+    select_validators,
+    tier1_validators,
+    tier2_triggers,
+    unknown_selectors,
 )
 
+# Everything else -- validators, triggers, history, utilization, auto-fix --
+# is imported inside the functions that use it, so a narrow invocation
+# such as ``--recommendations`` only loads what it runs.
+
+
+def _persist_snapshot(knowledge_base_root: Path, *args, **kwargs) -> None:
+    """``record_snapshot``, skipped for read-only roots (archives)."""
+    from history import record_snapshot
+
+    if is_writable(knowledge_base_root):
+        record_snapshot(knowledge_base_root, *args, **kwargs)
+
+
+def _persist_report(knowledge_base_root: Path, section: str, records: list[dict], summary: dict) -> None:
+    """Cache *section* of the last report, skipped for read-only roots."""
+    from report_cache import save_section
+
+    if is_writable(knowledge_base_root):
+        save_section(
+            knowledge_base_root, section, records, summary,
+            knowledge_dir_name=read_knowledge_dir(knowledge_base_root),
+        )
+
+
+def _report_writer(knowledge_base_root: Path, section: str):
+    """``SectionWriter`` for a streamed *section*; a no-op context for read-only roots."""
+    from report_cache import SectionWriter
+
+    if not is_writable(knowledge_base_root):
+        return nullcontext()
+    return SectionWriter(knowledge_base_root, section, knowledge_dir_name=read_knowledge_dir(knowledge_base_root))
+
+
+def _update_registry(knowledge_base_root: Path, md_files: list[Path]) -> None:
+    """``update_registry``, skipped for read-only roots (archives)."""
+    from source_registry import update_registry
+
+    if is_writable(knowledge_base_root):
+        update_registry(knowledge_base_root, md_files)
+
 
 def _discover_md_files(knowledge_base_root: Path, knowledge_dir_name: str = "docs") -> list[Path]:
     """Return all .md files under the knowledge directory, excluding _proposals/ and index.md."""
@@ -85,6 +101,184 @@ def _discover_md_files(knowledge_base_root: Path, knowledge_dir_name: str = "doc
     return md_files
 
 
+def _iter_tier1_issues(
+    knowledge_base_root: Path,
+    knowledge_dir_name: str,
+    md_files: list[Path],
+    file_list: list[str],
+    *,
+    check_links: bool = False,
+    cache_shingles: bool = False,
+    budget_ms: float | None = None,
+    schedule: dict | None = None,
+    only: tuple[str, ...] = (),
+    skip: tuple[str, ...] = (),
+) -> Iterator[dict]:
+    """Yield Tier 1 issues as each validator produces them.
+
+    Every issue gains ``validator`` and a stable ``fingerprint``.
+
+    *only* / *skip* narrow the run to the matching validators (see
+    ``validator_registry.select``); the chosen validators are listed in
+    ``schedule["selected"]`` and the rest in ``schedule["deselected"]``.  Each file is read once for all selected
+    per-file validators, and not past its frontmatter when none of them
+    needs the body.
+
+    Files over ``health_max_file_bytes`` (config.json) are never read:
+    ``check_file_size`` fails them and every other validator skips them,
+    so a run's memory is bounded by the limit rather than the largest file.
+
+    Without *budget_ms* every validator runs, file by file.  With it,
+    each validator runs over all files in ``tier1_schedule.plan_order``
+    order, and a validator whose estimated cost exceeds the time left is
+    skipped (high-signal validators always run).  When *schedule* is
+    given it is filled with ``{"elapsed_ms": {validator: ms}, "skipped":
+    [validator, ...]}``.
+    """
+    from history import issue_fingerprint
+    from tier1_schedule import HIGH_SIGNAL_VALIDATORS, estimate_ms, load_timings, plan_order
+    from validators import size_limit, within_size_limit
+
+    elapsed = schedule.setdefault("elapsed_ms", {}) if schedule is not None else {}
+    skipped = schedule.setdefault("skipped", []) if schedule is not None else []
+    selected = select_validators(only=only, skip=skip, include_network=check_links)
+    if schedule is not None:
+        schedule["selected"] = selected
+        schedule["deselected"] = [n for n in tier1_validators(include_network=check_links) if n not in selected]
+
+    max_file_bytes = read_max_file_bytes(knowledge_base_root)
+    with size_limit(max_file_bytes):
+        oversized = {md_file for md_file in md_files if not within_size_limit(md_file)}
+
+    def _run(validator, *args, **kwargs) -> Iterator[dict]:
+        name = validator.__name__
+        start = time.perf_counter()
+        with size_limit(max_file_bytes):
+            issues = list(validator(*args, **kwargs))
+        elapsed[name] = elapsed.get(name, 0.0) + (time.perf_counter() - start) * 1000
+        for issue in issues:
+            issue["validator"] = name
+            issue["fingerprint"] = issue_fingerprint(name, issue, knowledge_base_root)
+            yield issue
+
+    context = {
+        "knowledge_base_root": knowledge_base_root,
+        "knowledge_dir_name": knowledge_dir_name,
+        "file_list": file_list,
+        "cache_shingles": cache_shingles,
+    }
+    # Per-file validators take the file first, then any bound arguments
+    per_file = []
+    whole_tree = []
+    for name in selected:
+        args, kwargs = bind(name, context)
+        if VALIDATORS[name]["scope"] == "per-file":
+            per_file.append((load(name), args))
+        else:
+            whole_tree.append((load(name), args, kwargs))
+
+    if budget_ms is None:
+        if per_file:
+            from validators import shared_reads
+
+            per_file_names = [validator.__name__ for validator, _ in per_file]
+            needs_body = bool(required_inputs(per_file_names) & {"body", "stripped_body"})
+            for md_file in md_files:
+                with shared_reads(body=needs_body):
+                    issues = [
+                        issue for validator, extra in per_file
+                        if md_file not in oversized or not reads_content(validator.__name__)
+                        for issue in _run(validator, md_file, *extra)
+                    ]
+                yield from issues
+        for validator, args, kwargs in whole_tree:
+            yield from _run(validator, *args, **kwargs)
+        return
+
+    jobs = {validator.__name__: ("file", validator, extra, None) for validator, extra in per_file}
+    jobs.update({validator.__name__: ("tree", validator, args, kwargs) for validator, args, kwargs in whole_tree})
+    timings = load_timings(knowledge_base_root)
+    deadline = time.perf_counter() + budget_ms / 1000
+    for name in plan_order(list(jobs), len(md_files), timings):
+        remaining_ms = (deadline - time.perf_counter()) * 1000
+        if name not in HIGH_SIGNAL_VALIDATORS and estimate_ms(name, len(md_files), timings) > remaining_ms:
+            skipped.append(name)
+            continue
+        kind, validator, args, kwargs = jobs[name]
+        if kind == "file":
+            for md_file in md_files:
+                if md_file not in oversized or not reads_content(name):
+                    yield from _run(validator, md_file, *args)
+        else:
+            yield from _run(validator, *args, **kwargs)
+
+
+def _record_schedule(
+    knowledge_base_root: Path, schedule: dict, file_count: int, budget_ms: float | None, started: float,
+) -> dict | None:
+    """Store this run's validator timings; return the report's ``schedule`` block.
+
+    Returns *None* for unbudgeted runs, whose reports are unchanged.
+    """
+    from tier1_schedule import record_timings
+
+    if is_writable(knowledge_base_root):
+        record_timings(knowledge_base_root, schedule["elapsed_ms"], file_count)
+    if budget_ms is None:
+        return None
+    return {
+        "budget_ms": budget_ms,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        "skipped": schedule["skipped"],
+    }
+
+
+def _selection_report(schedule: dict) -> dict:
+    """The ``selection`` block of a run narrowed by ``only`` / ``skip``."""
+    return {"validators": schedule["selected"], "deselected": schedule["deselected"]}
+
+
+def _partial_run(schedule: dict) -> tuple[str, ...]:
+    """Validators that did not run: skipped for time or deselected."""
+    return (*schedule["skipped"], *schedule["deselected"])
+
+
+def _new_tally() -> dict:
+    """Running counts for a Tier 1 summary."""
+    return {"fail_count": 0, "warn_count": 0, "files_with_fails": set()}
+
+
+def _tally_issue(tally: dict, issue: dict) -> None:
+    """Add one issue to a running Tier 1 tally."""
+    if issue["severity"] == "fail":
+        tally["fail_count"] += 1
+        tally["files_with_fails"].add(issue.get("file", ""))
+    elif issue["severity"] == "warn":
+        tally["warn_count"] += 1
+
+
+def _tier1_summary(tally: dict, total_files: int) -> dict:
+    """Build the Tier 1 summary dict from a tally."""
+    return {
+        "total_files": total_files,
+        "fail_count": tally["fail_count"],
+        "warn_count": tally["warn_count"],
+        "pass_count": total_files - len(tally["files_with_fails"]),
+    }
+
+
+def _apply_issue_diff(knowledge_base_root: Path, result: dict, skipped: tuple = ()) -> None:
+    """Replace ``result["issues"]`` with the delta against the last snapshot."""
+    from history import diff_issues, read_last_issue_index
+
+    delta = diff_issues(
+        result.pop("issues"), read_last_issue_index(knowledge_base_root), skipped_validators=skipped,
+    )
+    result["diff"] = delta
+    result["summary"]["new_count"] = len(delta["new"])
+    result["summary"]["resolved_count"] = len(delta["resolved"])
+
+
 def run_health_check(
     knowledge_base_root: Path,
     *,
@@ -92,6 +286,11 @@ def run_health_check(
     fix: bool = False,
     dry_run: bool = False,
     check_links: bool = False,
+    diff: bool = False,
+    cache_shingles: bool = False,
+    budget_ms: float | None = None,
+    only: tuple[str, ...] = (),
+    skip: tuple[str, ...] = (),
 ) -> dict:
     """Run all Tier 1 validators and return a structured report.
 
@@ -100,88 +299,86 @@ def run_health_check(
     knowledge_base_root:
         Root directory containing the ``docs/`` folder.
     _persist_history:
-        When *True* (default), automatically persist a history snapshot.
-        Set to *False* when called from ``run_combined_report`` to avoid
+        When *True* (default), automatically persist a history snapshot
+        and cache the issues for ``report_cache.py`` queries.  Set to
+        *False* when called from ``run_combined_report`` to avoid
         duplicate entries.
     fix:
         When *True*, apply conservative auto-fixes for fixable issues.
     dry_run:
         When *True*, report what fixes *would* be applied without writing.
+    diff:
+        When *True*, replace ``"issues"`` with ``"diff"`` -- only the issues
+        that are new, and the fingerprints that were resolved, since the
+        last snapshot that recorded issues.
+    cache_shingles:
+        When *True*, persist duplicate-detection shingles under
+        ``.dewey/health/shingles/`` so unchanged files are not re-tokenized.
+    budget_ms:
+        Time budget in milliseconds.  High-signal validators run first,
+        then the rest cheapest first while their estimated cost (from
+        timings recorded in ``.dewey/health/timings.json``) still fits.
+        A run that skips any validator persists no history snapshot.
+    only, skip:
+        Selectors -- validator names, scopes (``per-file``,
+        ``structural``, ``cross-file``) or cost classes (``cheap``,
+        ``moderate``, ``expensive``, ``network``).  Only validators
+        matching *only* (all when empty) and not matching *skip* run,
+        and only the inputs they need are read.  Like a budgeted run
+        that skips validators, a selective run persists no snapshot.
 
     Returns
     -------
     dict
-        ``{"issues": [...], "summary": {...}}``
+        ``{"issues": [...], "summary": {...}}``.  Every issue carries
+        ``validator`` and a stable ``fingerprint``.
         When *fix* or *dry_run* is set, also includes ``"fixes": [...]``.
+        When *budget_ms* is set, also includes ``"schedule": {"budget_ms",
+        "elapsed_ms", "skipped": [validator, ...]}``.
+        When *only* or *skip* is set, also includes ``"selection":
+        {"validators": [...], "deselected": [...]}``.
     """
     knowledge_dir_name = read_knowledge_dir(knowledge_base_root)
-    all_issues: list[dict] = []
     md_files = _discover_md_files(knowledge_base_root, knowledge_dir_name)
 
     # Compute relative paths for history tracking
     knowledge_dir = knowledge_base_root / knowledge_dir_name
     file_list = [str(f.relative_to(knowledge_dir)) for f in md_files]
 
-    # Per-file validators
-    for md_file in md_files:
-        all_issues.extend(check_frontmatter(md_file))
-        all_issues.extend(check_section_ordering(md_file))
-        all_issues.extend(check_cross_references(md_file, knowledge_base_root))
-        all_issues.extend(check_size_bounds(md_file))
-        all_issues.extend(check_source_urls(md_file))
-        all_issues.extend(check_freshness(md_file))
-        all_issues.extend(check_section_completeness(md_file))
-        all_issues.extend(check_heading_hierarchy(md_file))
-        all_issues.extend(check_go_deeper_links(md_file))
-        all_issues.extend(check_ref_see_also(md_file))
-        all_issues.extend(check_readability(md_file))
-        all_issues.extend(check_placeholder_comments(md_file))
-        all_issues.extend(check_source_diversity(md_file))
-        all_issues.extend(check_citation_grounding(md_file))
-        if check_links:
-            all_issues.extend(check_source_accessibility(md_file))
-
-    # Structural validators (run once)
-    all_issues.extend(check_coverage(knowledge_base_root, knowledge_dir_name=knowledge_dir_name))
-    all_issues.extend(check_index_sync(knowledge_base_root, knowledge_dir_name=knowledge_dir_name))
-    all_issues.extend(check_inventory_regression(knowledge_base_root, file_list))
-
-    # Cross-file consistency validators
-    all_issues.extend(check_manifest_sync(knowledge_base_root, knowledge_dir_name=knowledge_dir_name))
-    all_issues.extend(check_curation_plan_sync(knowledge_base_root, knowledge_dir_name=knowledge_dir_name))
-    all_issues.extend(check_proposal_integrity(knowledge_base_root, knowledge_dir_name=knowledge_dir_name))
-    all_issues.extend(check_link_graph(knowledge_base_root, knowledge_dir_name=knowledge_dir_name))
-    all_issues.extend(check_duplicate_content(knowledge_base_root, knowledge_dir_name=knowledge_dir_name))
-    all_issues.extend(check_naming_conventions(knowledge_base_root, knowledge_dir_name=knowledge_dir_name))
-
-    # Build summary
-    files_with_fails = set()
-    files_with_warns = set()
-    all_mentioned_files = set()
-
+    _update_registry(knowledge_base_root, md_files)
+    started = time.perf_counter()
+    schedule: dict = {}
+    all_issues = list(_iter_tier1_issues(
+        knowledge_base_root, knowledge_dir_name, md_files, file_list,
+        check_links=check_links, cache_shingles=cache_shingles,
+        budget_ms=budget_ms, schedule=schedule, only=only, skip=skip,
+    ))
+    schedule_report = _record_schedule(knowledge_base_root, schedule, len(md_files), budget_ms, started)
+
+    tally = _new_tally()
     for issue in all_issues:
-        f = issue.get("file", "")
-        all_mentioned_files.add(f)
-        if issue["severity"] == "fail":
-            files_with_fails.add(f)
-        elif issue["severity"] == "warn":
-            files_with_warns.add(f)
-
-    fail_count = sum(1 for i in all_issues if i["severity"] == "fail")
-    warn_count = sum(1 for i in all_issues if i["severity"] == "warn")
+        _tally_issue(tally, issue)
 
     result = {
         "issues": all_issues,
-        "summary": {
-            "total_files": len(md_files),
-            "fail_count": fail_count,
-            "warn_count": warn_count,
-            "pass_count": len(md_files) - len(files_with_fails),
-        },
+        "summary": _tier1_summary(tally, len(md_files)),
     }
+    if schedule_report is not None:
+        result["schedule"] = schedule_report
+    if only or skip:
+        result["selection"] = _selection_report(schedule)
+    skipped = _partial_run(schedule)
+    if _persist_history and not skipped:
+        _persist_report(knowledge_base_root, "tier1", all_issues, result["summary"])
 
     # Auto-fix pass
     if fix or dry_run:
+        from auto_fix import (
+            fix_curation_plan_checkmarks, fix_missing_cross_links, fix_missing_sections, fix_orphan_links,
+            fix_see_also_links,
+        )
+        from similarity import suggest_see_also
+
         fixes: list[dict] = []
         for md_file in md_files:
             file_issues = [i for i in all_issues if i.get("file") == str(md_file)]
@@ -225,29 +422,191 @@ def run_health_check(
                 knowledge_base_root, knowledge_dir_name=knowledge_dir_name,
             ))
 
+        # Orphans: link from the most similar topic
+        orphan_issues = [i for i in all_issues if i.get("candidates")]
+        if dry_run:
+            for issue in orphan_issues:
+                fixes.append({
+                    "file": str(knowledge_base_root / knowledge_dir_name / issue["candidates"][0]["file"]),
+                    "action": "would_insert_see_also",
+                    "detail": issue["message"],
+                })
+        elif orphan_issues:
+            fixes.extend(fix_orphan_links(
+                knowledge_base_root, orphan_issues, knowledge_dir_name=knowledge_dir_name,
+            ))
+
+        # Related topics in other areas: cross-link under "See Also"
+        suggestions = suggest_see_also(knowledge_base_root, knowledge_dir_name=knowledge_dir_name)
+        if dry_run:
+            for entry in suggestions:
+                for suggestion in entry["suggestions"]:
+                    fixes.append({
+                        "file": str(knowledge_base_root / knowledge_dir_name / entry["file"]),
+                        "action": "would_insert_see_also",
+                        "detail": f"Related topic {suggestion['file']} (similarity {suggestion['score']})",
+                    })
+        else:
+            fixes.extend(fix_see_also_links(
+                knowledge_base_root, suggestions, knowledge_dir_name=knowledge_dir_name,
+            ))
+
         result["fixes"] = fixes
 
-    if _persist_history:
-        record_snapshot(knowledge_base_root, result["summary"], None, file_list=file_list)
+    if diff:
+        _apply_issue_diff(knowledge_base_root, result, skipped)
+
+    # A partial run's issue index would read as "resolved" next time
+    if _persist_history and not skipped:
+        from history import issue_index
+
+        _persist_snapshot(
+            knowledge_base_root, result["summary"], None,
+            file_list=file_list, issues=issue_index(all_issues),
+        )
     return result
 
 
 _LOW_UTIL_MIN_OVERVIEW_READS = 10
 
-_TIER2_TRIGGERS = [
-    trigger_source_drift,
-    trigger_depth_accuracy,
-    trigger_source_primacy,
-    trigger_why_quality,
-    trigger_concrete_examples,
-    trigger_citation_quality,
-    trigger_source_authority,
-    trigger_provenance_completeness,
-    trigger_recommendation_coverage,
-]
 
+def _refresh_file_sources(knowledge_base_root: Path, md_files: list[Path]) -> None:
+    """Refresh the source snapshots of every URL cited by *md_files*.
+
+    Fetch results are recorded as ``last_check`` in the source registry.
+    """
+    from source_registry import record_source_check
+    from source_snapshots import refresh_sources
+    from tier2_triggers import _extract_source_urls
+    from validators import parse_frontmatter
+
+    urls: list[str] = []
+    for md_file in md_files:
+        urls.extend(_extract_source_urls(parse_frontmatter(md_file)))
+    _update_registry(knowledge_base_root, md_files)
+    record_source_check(knowledge_base_root, refresh_sources(knowledge_base_root, urls))
+
+
+def _iter_tier2_files(
+    knowledge_base_root: Path,
+    md_files: list[Path],
+    *,
+    use_memo: bool = True,
+    memo_ttl_days: int | None = None,
+    excerpts: bool = False,
+    excerpt_max_chars: int = DEFAULT_EXCERPT_MAX_CHARS,
+    triggers: list[str] | None = None,
+) -> Iterator[tuple[list[dict], list[dict], dict]]:
+    """Yield ``(queue_items, suppressed_items, excerpts)`` one file at a time.
+
+    *triggers* (default: all) are run in registry order; each file is
+    read once for all of them, and only up to its frontmatter when none
+    needs the body.  Files over the size limit are skipped (Tier 1's
+    ``check_file_size`` reports them).
+    """
+    from tier2_memo import filter_assessed, read_assessments
+    from tier2_triggers import attach_excerpts
+    from validators import shared_reads, size_limit, within_size_limit
+
+    names = tier2_triggers() if triggers is None else triggers
+    needs_body = excerpts or "body" in required_inputs(names)
+    context = {"knowledge_base_root": knowledge_base_root}
+    bound = [(load(name), *bind(name, context)) for name in names]
+    memo = read_assessments(knowledge_base_root) if use_memo else None
+    max_file_bytes = read_max_file_bytes(knowledge_base_root)
+    for md_file in md_files:
+        with shared_reads(body=needs_body), size_limit(max_file_bytes):
+            if not within_size_limit(md_file):
+                continue
+            items: list[dict] = []
+            for trigger_fn, args, kwargs in bound:
+                items.extend(trigger_fn(md_file, *args, **kwargs))
+
+            suppressed: list[dict] = []
+            if memo:
+                items, suppressed = filter_assessed(
+                    knowledge_base_root, items, ttl_days=memo_ttl_days, memo=memo,
+                    paths={str(md_file): md_file},
+                )
+
+            file_excerpts = (
+                attach_excerpts(items, max_chars=excerpt_max_chars, paths={str(md_file): md_file})
+                if excerpts else {}
+            )
+        yield items, suppressed, file_excerpts
+
+
+def _trigger_selection(triggers: list[str]) -> dict:
+    """The ``selection`` block of a Tier 2 run narrowed by ``only`` / ``skip``."""
+    return {"triggers": triggers, "deselected": [n for n in tier2_triggers() if n not in triggers]}
+
+
+def _new_tier2_tally() -> dict:
+    """Running counts for a Tier 2 summary."""
+    return {"trigger_counts": {}, "files": set()}
+
+
+def _tally_queue_item(tally: dict, item: dict) -> None:
+    """Add one queue item to a running Tier 2 tally."""
+    counts = tally["trigger_counts"]
+    counts[item["trigger"]] = counts.get(item["trigger"], 0) + 1
+    tally["files"].add(item["file"])
+
+
+def _tier2_summary(tally: dict, total_files: int, suppressed_count: int) -> dict:
+    """Build the Tier 2 summary dict from a tally."""
+    return {
+        "total_files_scanned": total_files,
+        "files_with_triggers": len(tally["files"]),
+        "trigger_counts": tally["trigger_counts"],
+        "suppressed_by_memo": suppressed_count,
+    }
+
+
+def _schedule_batches(
+    knowledge_base_root: Path,
+    knowledge_dir_name: str,
+    md_files: list[Path],
+    queue: list[dict],
+    token_budget: int,
+) -> list[dict]:
+    """Pack *queue* into review batches weighted by utilization."""
+    from tier2_batches import group_queue_by_file, schedule_review_batches
+    from utilization import read_utilization
 
-def run_tier2_prescreening(knowledge_base_root: Path, *, _persist_history: bool = True) -> dict:
+    knowledge_dir = knowledge_base_root / knowledge_dir_name
+    utilization = read_utilization(knowledge_base_root)
+    read_counts = {}
+    for md_file in md_files:
+        rel_to_root = f"{knowledge_dir_name}/{md_file.relative_to(knowledge_dir)}"
+        entry = utilization.get(rel_to_root)
+        read_counts[str(md_file)] = entry["count"] if entry else 0
+    paths = {str(md_file): md_file for md_file in md_files}
+    return schedule_review_batches(
+        group_queue_by_file(queue, paths=paths), token_budget=token_budget, read_counts=read_counts,
+    )
+
+
+def _add_batch_summary(summary: dict, batches: list[dict], token_budget: int) -> None:
+    """Record batching totals in a Tier 2 summary."""
+    summary["token_budget"] = token_budget
+    summary["batch_count"] = len(batches)
+    summary["estimated_tokens"] = sum(b["token_estimate"] for b in batches)
+
+
+def run_tier2_prescreening(
+    knowledge_base_root: Path,
+    *,
+    _persist_history: bool = True,
+    fetch_sources: bool = False,
+    token_budget: int | None = None,
+    use_memo: bool = True,
+    memo_ttl_days: int | None = None,
+    excerpts: bool = False,
+    excerpt_max_chars: int = DEFAULT_EXCERPT_MAX_CHARS,
+    only: tuple[str, ...] = (),
+    skip: tuple[str, ...] = (),
+) -> dict:
     """Run all Tier 2 deterministic triggers and return a structured queue.
 
     Parameters
@@ -255,14 +614,45 @@ def run_tier2_prescreening(knowledge_base_root: Path, *, _persist_history: bool
     knowledge_base_root:
         Root directory containing the ``docs/`` folder.
     _persist_history:
-        When *True* (default), automatically persist a history snapshot.
-        Set to *False* when called from ``run_combined_report`` to avoid
+        When *True* (default), automatically persist a history snapshot
+        and cache the queue for ``report_cache.py`` queries.  Set to
+        *False* when called from ``run_combined_report`` to avoid
         duplicate entries.
+    fetch_sources:
+        When *True*, refresh source snapshots in ``.dewey/sources/``
+        (requires network) before running triggers, so ``source_drift``
+        reflects actual source changes.
+    token_budget:
+        When set, also group the queue by file and pack it into review
+        batches under this many estimated tokens, ordered by priority
+        (utilization x staleness x trigger severity).
+    use_memo:
+        When *True* (default), drop queue items whose file content and
+        trigger already have a recorded assessment in
+        ``.dewey/health/tier2-assessments.d/`` (see ``tier2_memo.py``).
+    memo_ttl_days:
+        Re-queue memoized items whose assessment is older than this many
+        days.  *None* (default) trusts assessments indefinitely.
+    excerpts:
+        When *True*, include the section text each trigger needs (with
+        line ranges) so review requires no further file reads.  Excerpts
+        are stored once per file under ``"excerpts"``; each queue item
+        lists the ones it uses in ``excerpt_refs``.
+    excerpt_max_chars:
+        Cap on each excerpt's size; longer sections are cut at a line
+        boundary and marked ``truncated``.
+    only, skip:
+        Trigger selectors, as for ``run_health_check``.  A selective run
+        persists no snapshot.
 
     Returns
     -------
     dict
         ``{"queue": [...], "summary": {...}}``
+        When *token_budget* is set, also includes ``"batches": [...]``.
+        When *excerpts* is set, also includes ``"excerpts": {...}``.
+        When *only* or *skip* is set, also includes ``"selection":
+        {"triggers": [...], "deselected": [...]}``.
     """
     knowledge_dir_name = read_knowledge_dir(knowledge_base_root)
     md_files = _discover_md_files(knowledge_base_root, knowledge_dir_name)
@@ -270,57 +660,117 @@ def run_tier2_prescreening(knowledge_base_root: Path, *, _persist_history: bool
     knowledge_dir = knowledge_base_root / knowledge_dir_name
     file_list = [str(f.relative_to(knowledge_dir)) for f in md_files]
 
-    queue: list[dict] = []
-    trigger_counts: dict[str, int] = {}
-
-    for md_file in md_files:
-        for trigger_fn in _TIER2_TRIGGERS:
-            for item in trigger_fn(md_file):
-                queue.append(item)
-                t = item["trigger"]
-                trigger_counts[t] = trigger_counts.get(t, 0) + 1
+    if fetch_sources:
+        _refresh_file_sources(knowledge_base_root, md_files)
 
-    files_with_triggers = len({item["file"] for item in queue})
+    triggers = select(tier2_triggers(), only=only, skip=skip)
+    queue: list[dict] = []
+    suppressed_count = 0
+    excerpt_map: dict[str, dict] = {}
+    for items, suppressed, file_excerpts in _iter_tier2_files(
+        knowledge_base_root, md_files,
+        use_memo=use_memo, memo_ttl_days=memo_ttl_days,
+        excerpts=excerpts, excerpt_max_chars=excerpt_max_chars, triggers=triggers,
+    ):
+        queue.extend(items)
+        suppressed_count += len(suppressed)
+        excerpt_map.update(file_excerpts)
+
+    tally = _new_tier2_tally()
+    for item in queue:
+        _tally_queue_item(tally, item)
 
     result = {
         "queue": queue,
-        "summary": {
-            "total_files_scanned": len(md_files),
-            "files_with_triggers": files_with_triggers,
-            "trigger_counts": trigger_counts,
-        },
+        "summary": _tier2_summary(tally, len(md_files), suppressed_count),
     }
-    if _persist_history:
-        record_snapshot(knowledge_base_root, None, result["summary"], file_list=file_list)
+
+    if excerpts:
+        result["excerpts"] = excerpt_map
+    if only or skip:
+        result["selection"] = _trigger_selection(triggers)
+
+    if token_budget is not None:
+        batches = _schedule_batches(knowledge_base_root, knowledge_dir_name, md_files, queue, token_budget)
+        result["batches"] = batches
+        _add_batch_summary(result["summary"], batches, token_budget)
+    if _persist_history and not (only or skip):
+        _persist_snapshot(knowledge_base_root, None, result["summary"], file_list=file_list)
+        _persist_report(knowledge_base_root, "tier2", queue, result["summary"])
     return result
 
 
-def run_combined_report(knowledge_base_root: Path) -> dict:
+def run_combined_report(
+    knowledge_base_root: Path,
+    *,
+    fetch_sources: bool = False,
+    token_budget: int | None = None,
+    use_memo: bool = True,
+    memo_ttl_days: int | None = None,
+    excerpts: bool = False,
+    excerpt_max_chars: int = DEFAULT_EXCERPT_MAX_CHARS,
+    check_links: bool = False,
+    diff: bool = False,
+    cache_shingles: bool = False,
+    only: tuple[str, ...] = (),
+    skip: tuple[str, ...] = (),
+) -> dict:
     """Run both Tier 1 checks and Tier 2 pre-screening, returning a combined report.
 
     Parameters
     ----------
     knowledge_base_root:
         Root directory containing the ``docs/`` folder.
+    fetch_sources, token_budget, use_memo, memo_ttl_days, excerpts, excerpt_max_chars:
+        Passed through to ``run_tier2_prescreening``.
+    check_links, diff, cache_shingles:
+        Passed through to ``run_health_check``; *diff* is applied after
+        the combined snapshot's issues are read.
+    only, skip:
+        Selectors applied to both tiers; a selective run persists no snapshot.
 
     Returns
     -------
     dict
         ``{"tier1": <run_health_check result>, "tier2": <run_tier2_prescreening result>}``
     """
+    from history import issue_index
+
     knowledge_dir_name = read_knowledge_dir(knowledge_base_root)
     md_files = _discover_md_files(knowledge_base_root, knowledge_dir_name)
     knowledge_dir = knowledge_base_root / knowledge_dir_name
     file_list = [str(f.relative_to(knowledge_dir)) for f in md_files]
 
     result = {
-        "tier1": run_health_check(knowledge_base_root, _persist_history=False),
-        "tier2": run_tier2_prescreening(knowledge_base_root, _persist_history=False),
+        "tier1": run_health_check(
+            knowledge_base_root, _persist_history=False, check_links=check_links,
+            cache_shingles=cache_shingles, only=only, skip=skip,
+        ),
+        "tier2": run_tier2_prescreening(
+            knowledge_base_root,
+            _persist_history=False,
+            fetch_sources=fetch_sources,
+            token_budget=token_budget,
+            use_memo=use_memo,
+            memo_ttl_days=memo_ttl_days,
+            excerpts=excerpts,
+            excerpt_max_chars=excerpt_max_chars,
+            only=only,
+            skip=skip,
+        ),
     }
-    record_snapshot(
-        knowledge_base_root, result["tier1"]["summary"], result["tier2"]["summary"],
-        file_list=file_list,
-    )
+    issues = issue_index(result["tier1"]["issues"])
+    if not (only or skip):
+        _persist_report(knowledge_base_root, "tier1", result["tier1"]["issues"], result["tier1"]["summary"])
+        _persist_report(knowledge_base_root, "tier2", result["tier2"]["queue"], result["tier2"]["summary"])
+    deselected = tuple(result["tier1"].get("selection", {}).get("deselected", ()))
+    if diff:
+        _apply_issue_diff(knowledge_base_root, result["tier1"], deselected)
+    if not (only or skip):
+        _persist_snapshot(
+            knowledge_base_root, result["tier1"]["summary"], result["tier2"]["summary"],
+            file_list=file_list, issues=issues,
+        )
     return result
 
 
@@ -328,6 +778,7 @@ def generate_recommendations(
     knowledge_base_root: Path,
     min_reads: int = 10,
     min_days: int = 7,
+    window_days: int | None = 90,
 ) -> dict:
     """Generate curation recommendations from utilization and health data.
 
@@ -345,13 +796,26 @@ def generate_recommendations(
     min_days:
         Minimum number of days spanned by utilization data before
         recommendations are generated.  Set to 0 to bypass.
+    window_days:
+        Classify files by reads in the last 7, 30 or 90 days (default 90),
+        so topics that are no longer read stop counting as high-use.
+        *None* uses all-time counts.  Gating always uses all-time data.
 
     Returns
     -------
     dict
         ``{"recommendations": [...], "summary": {...}}``
         or ``{"recommendations": [], "skipped": str}`` if gating fails.
+        Recommendation data carries ``decayed_reads``; the summary carries
+        ``window_days`` and per-area rollups under ``areas``.  Generated
+        recommendations are cached for ``report_cache.py`` queries; a
+        gated run leaves the cached ones in place.
     """
+    from utilization import WINDOWS, read_rollup
+    from validators import check_freshness, parse_frontmatter
+
+    if window_days is not None and window_days not in WINDOWS:
+        raise ValueError(f"window_days must be one of {WINDOWS} or None, got {window_days}")
     knowledge_dir_name = read_knowledge_dir(knowledge_base_root)
     md_files = _discover_md_files(knowledge_base_root, knowledge_dir_name)
     knowledge_dir = knowledge_base_root / knowledge_dir_name
@@ -363,8 +827,10 @@ def generate_recommendations(
         rel_to_root = f"{knowledge_dir_name}/{rel_to_kd}"
         file_paths[rel_to_root] = f
 
-    # Read utilization data
-    utilization = read_utilization(knowledge_base_root)
+    # Read utilization rollups (windowed counts are precomputed)
+    rollup = read_rollup(knowledge_base_root)
+    utilization = rollup["files"]
+    count_key = f"reads_{window_days}d" if window_days is not None else "count"
 
     # --- Gating ---
     total_reads = sum(entry["count"] for entry in utilization.values())
@@ -406,9 +872,14 @@ def generate_recommendations(
 
     # --- Build per-file stats ---
     read_counts = {}
+    all_time = {}
+    decayed = {}
     for rel_path in file_paths:
         entry = utilization.get(rel_path)
-        read_counts[rel_path] = entry["count"] if entry else 0
+        read_counts[rel_path] = entry[count_key] if entry else 0
+        all_time[rel_path] = entry["count"] if entry else 0
+        decayed[rel_path] = entry["decayed_reads"] if entry else 0.0
+    period = f" in the last {window_days} days" if window_days is not None else ""
 
     # Compute median read count
     counts = sorted(read_counts.values())
@@ -471,11 +942,12 @@ def generate_recommendations(
                 "file": rel_path,
                 "recommendation": "stale_high_use",
                 "reason": (
-                    f"Read {read_counts[rel_path]} times but content is stale"
+                    f"Read {read_counts[rel_path]} times{period} but content is stale"
                     " -- prioritize freshening"
                 ),
                 "data": {
                     "read_count": read_counts[rel_path],
+                    "decayed_reads": decayed[rel_path],
                     "depth": depths.get(rel_path, ""),
                     "area": area_name,
                 },
@@ -496,11 +968,12 @@ def generate_recommendations(
                 "file": rel_path,
                 "recommendation": "expand_depth",
                 "reason": (
-                    f"Read {reads} times but only overview depth"
+                    f"Read {reads} times{period} but only overview depth"
                     " -- consider adding working-knowledge file"
                 ),
                 "data": {
                     "read_count": reads,
+                    "decayed_reads": decayed[rel_path],
                     "depth": "overview",
                     "area": area_name,
                 },
@@ -523,12 +996,13 @@ def generate_recommendations(
                     "file": rel_path,
                     "recommendation": "low_utilization",
                     "reason": (
-                        f"Read {info['reads']} times vs {overview_reads}"
+                        f"Read {info['reads']} times{period} vs {overview_reads}"
                         f" for {area_name} overview"
                         " -- consider demoting or merging"
                     ),
                     "data": {
                         "read_count": info["reads"],
+                        "decayed_reads": decayed[rel_path],
                         "overview_reads": overview_reads,
                         "depth": depths.get(rel_path, ""),
                         "area": area_name,
@@ -540,7 +1014,7 @@ def generate_recommendations(
     for rel_path in sorted(file_paths):
         if rel_path in classified:
             continue
-        if read_counts.get(rel_path, 0) == 0:
+        if all_time[rel_path] == 0:
             area_parts = rel_path.split("/")
             area_name = area_parts[1] if len(area_parts) >= 3 else ""
             recommendations.append({
@@ -549,6 +1023,7 @@ def generate_recommendations(
                 "reason": "No reads recorded -- review relevance or discoverability",
                 "data": {
                     "read_count": 0,
+                    "decayed_reads": decayed[rel_path],
                     "depth": depths.get(rel_path, ""),
                     "area": area_name,
                 },
@@ -561,24 +1036,289 @@ def generate_recommendations(
         cat = rec["recommendation"]
         by_category[cat] = by_category.get(cat, 0) + 1
 
-    return {
-        "recommendations": recommendations,
-        "summary": {
-            "total_files": len(file_paths),
-            "files_with_recommendations": len(recommendations),
-            "by_category": by_category,
-        },
+    summary = {
+        "total_files": len(file_paths),
+        "files_with_recommendations": len(recommendations),
+        "by_category": by_category,
+        "window_days": window_days,
+        "areas": rollup["areas"],
     }
+    _persist_report(knowledge_base_root, "recommendations", recommendations, summary)
+    return {"recommendations": recommendations, "summary": summary}
+
+
+# ------------------------------------------------------------------
+# NDJSON streaming output
+# ------------------------------------------------------------------
+
+
+def _emit(out: IO[str], record: str, payload: dict) -> None:
+    """Write one NDJSON record and flush so consumers see it immediately."""
+    out.write(json.dumps({"record": record, **payload}) + "\n")
+    out.flush()
+
+
+def _stream_tier1(
+    knowledge_base_root: Path,
+    out: IO[str],
+    *,
+    check_links: bool = False,
+    diff: bool = False,
+    cache_shingles: bool = False,
+    budget_ms: float | None = None,
+    only: tuple[str, ...] = (),
+    skip: tuple[str, ...] = (),
+    cache=None,
+) -> tuple[dict, dict, list[str]]:
+    """Stream Tier 1 issues; return ``(summary, issue_index, file_list)``.
+
+    With *budget_ms*, the summary carries ``schedule``; with *only* or
+    *skip*, ``selection`` (see ``run_health_check``).  Every issue, new
+    or not, is also added to *cache* (a ``SectionWriter``) when given.
+    """
+    knowledge_dir_name = read_knowledge_dir(knowledge_base_root)
+    md_files = _discover_md_files(knowledge_base_root, knowledge_dir_name)
+    knowledge_dir = knowledge_base_root / knowledge_dir_name
+    file_list = [str(f.relative_to(knowledge_dir)) for f in md_files]
+
+    from history import issue_index, read_last_issue_index
+
+    _update_registry(knowledge_base_root, md_files)
+    baseline = read_last_issue_index(knowledge_base_root) if diff else None
+    previous = baseline["issues"] if baseline else {}
+
+    tally = _new_tally()
+    index: dict[str, list[str]] = {}
+    new_count = 0
+    started = time.perf_counter()
+    schedule: dict = {}
+    for issue in _iter_tier1_issues(
+        knowledge_base_root, knowledge_dir_name, md_files, file_list,
+        check_links=check_links, cache_shingles=cache_shingles,
+        budget_ms=budget_ms, schedule=schedule, only=only, skip=skip,
+    ):
+        _tally_issue(tally, issue)
+        index.update(issue_index([issue]))
+        if cache is not None:
+            cache.add(issue)
+        if diff and issue["fingerprint"] in previous:
+            continue
+        new_count += 1
+        _emit(out, "issue", issue)
+
+    schedule_report = _record_schedule(knowledge_base_root, schedule, len(md_files), budget_ms, started)
+    summary = _tier1_summary(tally, len(md_files))
+    if schedule_report is not None:
+        summary["schedule"] = schedule_report
+    if only or skip:
+        summary["selection"] = _selection_report(schedule)
+    if diff:
+        resolved = 0
+        partial = _partial_run(schedule)
+        for fp, (validator, file) in previous.items():
+            if fp not in index and validator not in partial:
+                resolved += 1
+                _emit(out, "resolved", {"fingerprint": fp, "validator": validator, "file": file})
+        summary["new_count"] = new_count
+        summary["resolved_count"] = resolved
+        summary["baseline"] = baseline["timestamp"] if baseline else None
+    _emit(out, "summary", {"report": "tier1", **summary})
+    return summary, index, file_list
+
+
+def _stream_tier2(
+    knowledge_base_root: Path,
+    out: IO[str],
+    *,
+    fetch_sources: bool = False,
+    token_budget: int | None = None,
+    use_memo: bool = True,
+    memo_ttl_days: int | None = None,
+    excerpts: bool = False,
+    excerpt_max_chars: int = DEFAULT_EXCERPT_MAX_CHARS,
+    only: tuple[str, ...] = (),
+    skip: tuple[str, ...] = (),
+    cache=None,
+) -> tuple[dict, list[str]]:
+    """Stream Tier 2 queue items file by file; return ``(summary, file_list)``.
+
+    With *only* or *skip*, the summary carries ``selection``.  Queue
+    items are also added to *cache* (a ``SectionWriter``) when given.
+    """
+    knowledge_dir_name = read_knowledge_dir(knowledge_base_root)
+    md_files = _discover_md_files(knowledge_base_root, knowledge_dir_name)
+    knowledge_dir = knowledge_base_root / knowledge_dir_name
+    file_list = [str(f.relative_to(knowledge_dir)) for f in md_files]
+
+    if fetch_sources:
+        _refresh_file_sources(knowledge_base_root, md_files)
+
+    triggers = select(tier2_triggers(), only=only, skip=skip)
+    tally = _new_tier2_tally()
+    suppressed_count = 0
+    # Batching needs the whole queue; only then is it kept in memory.
+    queue: list[dict] | None = [] if token_budget is not None else None
+    for items, suppressed, file_excerpts in _iter_tier2_files(
+        knowledge_base_root, md_files,
+        use_memo=use_memo, memo_ttl_days=memo_ttl_days,
+        excerpts=excerpts, excerpt_max_chars=excerpt_max_chars, triggers=triggers,
+    ):
+        suppressed_count += len(suppressed)
+        for name, sections in file_excerpts.items():
+            _emit(out, "excerpts", {"file": name, "excerpts": sections})
+        for item in items:
+            _tally_queue_item(tally, item)
+            _emit(out, "queue_item", item)
+            if cache is not None:
+                cache.add(item)
+        if queue is not None:
+            queue.extend(items)
+
+    summary = _tier2_summary(tally, len(md_files), suppressed_count)
+    if only or skip:
+        summary["selection"] = _trigger_selection(triggers)
+    if queue is not None:
+        batches = _schedule_batches(knowledge_base_root, knowledge_dir_name, md_files, queue, token_budget)
+        for batch in batches:
+            _emit(out, "batch", batch)
+        _add_batch_summary(summary, batches, token_budget)
+    _emit(out, "summary", {"report": "tier2", **summary})
+    return summary, file_list
+
+
+def stream_health_check(
+    knowledge_base_root: Path,
+    out: IO[str],
+    *,
+    check_links: bool = False,
+    diff: bool = False,
+    cache_shingles: bool = False,
+    budget_ms: float | None = None,
+    only: tuple[str, ...] = (),
+    skip: tuple[str, ...] = (),
+) -> dict:
+    """Run Tier 1 validators, writing each issue to *out* as NDJSON.
+
+    Emits one ``{"record": "issue", ...}`` line per issue as validators
+    produce it, then a trailing ``{"record": "summary", "report": "tier1",
+    ...}``.  With *diff*, only new issues are emitted, followed by
+    ``{"record": "resolved", ...}`` lines.  Persists a history snapshot,
+    caches the issues and honours *budget_ms*, *only* and *skip* like
+    ``run_health_check``.
+
+    Returns
+    -------
+    dict
+        The Tier 1 summary.
+    """
+    with _report_writer(knowledge_base_root, "tier1") as cache:
+        summary, index, file_list = _stream_tier1(
+            knowledge_base_root, out, check_links=check_links, diff=diff, cache_shingles=cache_shingles,
+            budget_ms=budget_ms, only=only, skip=skip, cache=cache,
+        )
+        if not summary.get("schedule", {}).get("skipped") and not summary.get("selection", {}).get("deselected"):
+            _persist_snapshot(knowledge_base_root, summary, None, file_list=file_list, issues=index)
+            if cache is not None:
+                cache.commit(summary)
+    return summary
+
+
+def stream_tier2_prescreening(knowledge_base_root: Path, out: IO[str], **options) -> dict:
+    """Run Tier 2 triggers, writing each queue item to *out* as NDJSON.
+
+    Emits, per file, an ``{"record": "excerpts", ...}`` line (when
+    ``excerpts`` is set) followed by ``{"record": "queue_item", ...}``
+    lines, then ``{"record": "batch", ...}`` lines (when ``token_budget``
+    is set) and a trailing ``{"record": "summary", "report": "tier2", ...}``.
+    *options* are the keyword arguments of ``run_tier2_prescreening``.
+
+    Returns
+    -------
+    dict
+        The Tier 2 summary.
+    """
+    with _report_writer(knowledge_base_root, "tier2") as cache:
+        summary, file_list = _stream_tier2(knowledge_base_root, out, cache=cache, **options)
+        if "selection" not in summary:
+            _persist_snapshot(knowledge_base_root, None, summary, file_list=file_list)
+            if cache is not None:
+                cache.commit(summary)
+    return summary
+
+
+def stream_combined_report(
+    knowledge_base_root: Path,
+    out: IO[str],
+    *,
+    check_links: bool = False,
+    diff: bool = False,
+    cache_shingles: bool = False,
+    only: tuple[str, ...] = (),
+    skip: tuple[str, ...] = (),
+    **options,
+) -> dict:
+    """Stream Tier 1 then Tier 2 records; persist one combined snapshot.
+
+    *check_links*, *diff* and *cache_shingles* apply to Tier 1, the
+    remaining *options* to Tier 2.  *only* / *skip* apply to both tiers;
+    a selective run persists no snapshot.
+
+    Returns
+    -------
+    dict
+        ``{"tier1": <summary>, "tier2": <summary>}``
+    """
+    with _report_writer(knowledge_base_root, "tier1") as cache1, _report_writer(knowledge_base_root, "tier2") as cache2:
+        tier1, index, file_list = _stream_tier1(
+            knowledge_base_root, out, check_links=check_links, diff=diff, cache_shingles=cache_shingles,
+            only=only, skip=skip, cache=cache1,
+        )
+        tier2, _ = _stream_tier2(knowledge_base_root, out, only=only, skip=skip, cache=cache2, **options)
+        if not (only or skip):
+            _persist_snapshot(knowledge_base_root, tier1, tier2, file_list=file_list, issues=index)
+            if cache1 is not None:
+                cache1.commit(tier1)
+                cache2.commit(tier2)
+    return {"tier1": tier1, "tier2": tier2}
+
+
+def stream_recommendations(
+    knowledge_base_root: Path,
+    out: IO[str],
+    *,
+    min_reads: int = 10,
+    min_days: int = 7,
+    window_days: int | None = 90,
+) -> dict:
+    """Write curation recommendations to *out* as NDJSON.
+
+    Recommendations are ranked across the whole inventory, so they are
+    computed first (at most one per file) and then emitted as
+    ``{"record": "recommendation", ...}`` lines followed by a
+    ``{"record": "summary", "report": "recommendations", ...}`` line.
+    When gating skips generation, the summary carries ``skipped``.
+    """
+    report = generate_recommendations(
+        knowledge_base_root, min_reads=min_reads, min_days=min_days, window_days=window_days,
+    )
+    for rec in report["recommendations"]:
+        _emit(out, "recommendation", rec)
+    summary = report.get("summary", {"skipped": report.get("skipped")})
+    _emit(out, "summary", {"report": "recommendations", **summary})
+    return summary
 
 
 if __name__ == "__main__":
     import argparse
 
+    from utilization import WINDOWS
+
     parser = argparse.ArgumentParser(description="Run knowledge base health checks.")
     parser.add_argument(
         "--knowledge-base-root",
         required=True,
-        help="Knowledge-base root directory containing the docs/ folder.",
+        help="Knowledge-base root directory containing the docs/ folder, or a .zip/.tar(.gz) "
+        "archive of one (read in place, without extracting).",
     )
     parser.add_argument(
         "--tier2",
@@ -607,11 +1347,98 @@ if __name__ == "__main__":
         default=7,
         help="Minimum days of utilization data before generating recommendations (default: 7).",
     )
+    parser.add_argument(
+        "--window-days",
+        type=int,
+        choices=(0, *WINDOWS),
+        default=90,
+        help="Classify recommendations by reads in this many recent days (default: 90; 0 = all time).",
+    )
     parser.add_argument(
         "--check-links",
         action="store_true",
         help="Check source URL accessibility (requires network).",
     )
+    parser.add_argument(
+        "--cache-shingles",
+        action="store_true",
+        help="Persist duplicate-detection shingles in .dewey/health/shingles/ keyed by content hash.",
+    )
+    parser.add_argument(
+        "--fetch-sources",
+        action="store_true",
+        help="Refresh source snapshots before Tier 2 drift detection (requires network).",
+    )
+    parser.add_argument(
+        "--token-budget",
+        type=int,
+        default=None,
+        help="Group the Tier 2 queue by file and pack it into review batches under this token budget.",
+    )
+    parser.add_argument(
+        "--ignore-memo",
+        action="store_true",
+        help="Queue every Tier 2 trigger, even those already assessed on unchanged content.",
+    )
+    parser.add_argument(
+        "--memo-ttl-days",
+        type=int,
+        default=None,
+        help="Re-queue Tier 2 items whose recorded assessment is older than this many days.",
+    )
+    parser.add_argument(
+        "--excerpts",
+        action="store_true",
+        help="Include the section excerpts each Tier 2 trigger needs, so review needs no file reads.",
+    )
+    parser.add_argument(
+        "--excerpt-max-chars",
+        type=int,
+        default=DEFAULT_EXCERPT_MAX_CHARS,
+        help=f"Maximum characters per excerpt (default: {DEFAULT_EXCERPT_MAX_CHARS}).",
+    )
+    parser.add_argument(
+        "--diff",
+        action="store_true",
+        help="Report only Tier 1 issues that are new or resolved since the last snapshot.",
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="Tier 1 time budget: run high-signal validators first and skip costlier ones that "
+        "would not finish in time (estimates come from recorded timings). Skipped validators "
+        "are listed in the report, and no history snapshot is recorded.",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        default=[],
+        metavar="SELECTOR",
+        help="Run only matching validators and triggers: a name, a scope (per-file, structural, "
+        "cross-file) or a cost class (cheap, moderate, expensive, network). Repeat or "
+        "comma-separate. Only the inputs they need are read (a frontmatter-only selection "
+        "never loads whole bodies). No history snapshot is recorded.",
+    )
+    parser.add_argument(
+        "--skip",
+        action="append",
+        default=[],
+        metavar="SELECTOR",
+        help="Leave out matching validators and triggers (same selectors as --only).",
+    )
+    parser.add_argument(
+        "--rev",
+        metavar="COMMIT",
+        help="Check the knowledge base as of a git commit, read from git objects without a checkout.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("json", "ndjson"),
+        default="json",
+        help="Output format: one pretty-printed JSON document (default), or NDJSON "
+        "records streamed as they are produced, each followed by a summary record.",
+    )
     parser.add_argument(
         "--fix",
         action="store_true",
@@ -624,28 +1451,94 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
-    knowledge_base_path = Path(args.knowledge_base_root)
+    try:
+        knowledge_base_path = open_knowledge_base(args.knowledge_base_root, rev=args.rev)
+    except (OSError, ValueError) as exc:
+        parser.error(str(exc))
+    if not is_writable(knowledge_base_path):
+        source = f"revision {args.rev}" if args.rev else f"archive {args.knowledge_base_root}"
+        for flag, value in (("--fix", args.fix), ("--fetch-sources", args.fetch_sources),
+                            ("--cache-shingles", args.cache_shingles)):
+            if value:
+                parser.error(f"{flag} needs a writable knowledge base; {source} is read-only")
+    if args.token_budget is not None and args.token_budget <= 0:
+        parser.error(f"--token-budget must be a positive number of tokens, got {args.token_budget}")
+    if args.budget_ms is not None and (args.tier2 or args.both or args.recommendations):
+        parser.error("--budget-ms applies to Tier 1 checks alone")
+    only = tuple(sel.strip() for value in args.only for sel in value.split(",") if sel.strip())
+    skip = tuple(sel.strip() for value in args.skip for sel in value.split(",") if sel.strip())
+    unknown = unknown_selectors(only + skip)
+    if unknown:
+        parser.error(f"unknown selector(s) {', '.join(unknown)}; use a validator or trigger name, "
+                     f"a scope ({', '.join(SCOPES)}) or a cost class ({', '.join(COST_CLASSES)})")
+    if (only or skip) and args.recommendations and not (args.tier2 or args.both):
+        parser.error("--only and --skip select validators and triggers, not --recommendations")
+    tier2_options = {
+        "fetch_sources": args.fetch_sources,
+        "token_budget": args.token_budget,
+        "use_memo": not args.ignore_memo,
+        "memo_ttl_days": args.memo_ttl_days,
+        "excerpts": args.excerpts,
+        "excerpt_max_chars": args.excerpt_max_chars,
+        "only": only,
+        "skip": skip,
+    }
 
-    if args.both and args.recommendations:
-        report = run_combined_report(knowledge_base_path)
-        report["recommendations"] = generate_recommendations(
-            knowledge_base_path, min_reads=args.min_reads, min_days=args.min_days,
-        )
-    elif args.both:
-        report = run_combined_report(knowledge_base_path)
-    elif args.tier2 and args.recommendations:
-        report = {
-            "tier2": run_tier2_prescreening(knowledge_base_path),
-            "recommendations": generate_recommendations(
-                knowledge_base_path, min_reads=args.min_reads, min_days=args.min_days,
-            ),
-        }
-    elif args.tier2:
-        report = run_tier2_prescreening(knowledge_base_path)
-    elif args.recommendations:
-        report = generate_recommendations(
-            knowledge_base_path, min_reads=args.min_reads, min_days=args.min_days,
-        )
+    if args.format == "ndjson":
+        if args.fix or args.dry_run:
+            parser.error("--format ndjson cannot be combined with --fix or --dry-run")
+        out = sys.stdout
+        if args.both:
+            stream_combined_report(
+                knowledge_base_path, out, check_links=args.check_links, diff=args.diff,
+                cache_shingles=args.cache_shingles, **tier2_options,
+            )
+        elif args.tier2:
+            stream_tier2_prescreening(knowledge_base_path, out, **tier2_options)
+        elif not args.recommendations:
+            stream_health_check(
+                knowledge_base_path, out, check_links=args.check_links, diff=args.diff,
+                cache_shingles=args.cache_shingles, budget_ms=args.budget_ms, only=only, skip=skip,
+            )
+        if args.recommendations:
+            stream_recommendations(
+                knowledge_base_path, out, min_reads=args.min_reads, min_days=args.min_days,
+                window_days=args.window_days or None,
+            )
     else:
-        report = run_health_check(knowledge_base_path, fix=args.fix, dry_run=args.dry_run, check_links=args.check_links)
-    print(json.dumps(report, indent=2))
+        if args.both and args.recommendations:
+            report = run_combined_report(
+                knowledge_base_path, check_links=args.check_links, diff=args.diff,
+                cache_shingles=args.cache_shingles, **tier2_options,
+            )
+            report["recommendations"] = generate_recommendations(
+                knowledge_base_path, min_reads=args.min_reads, min_days=args.min_days,
+                window_days=args.window_days or None,
+            )
+        elif args.both:
+            report = run_combined_report(
+                knowledge_base_path, check_links=args.check_links, diff=args.diff,
+                cache_shingles=args.cache_shingles, **tier2_options,
+            )
+        elif args.tier2 and args.recommendations:
+            report = {
+                "tier2": run_tier2_prescreening(knowledge_base_path, **tier2_options),
+                "recommendations": generate_recommendations(
+                    knowledge_base_path, min_reads=args.min_reads, min_days=args.min_days,
+                    window_days=args.window_days or None,
+                ),
+            }
+        elif args.tier2:
+            report = run_tier2_prescreening(knowledge_base_path, **tier2_options)
+        elif args.recommendations:
+            report = generate_recommendations(
+                knowledge_base_path, min_reads=args.min_reads, min_days=args.min_days,
+                window_days=args.window_days or None,
+            )
+        else:
+            report = run_health_check(
+                knowledge_base_path, fix=args.fix, dry_run=args.dry_run,
+                check_links=args.check_links, diff=args.diff,
+                cache_shingles=args.cache_shingles, budget_ms=args.budget_ms, only=only, skip=skip,
+            )
+        print(json.dumps(report, indent=2))
@@ -13,8 +13,12 @@ Only stdlib is used.
 from __future__ import annotations
 
 import hashlib
+import heapq
+import math
 import re
 import sys
+from array import array
+from collections import defaultdict
 from datetime import date
 from pathlib import Path
 
@@ -25,18 +29,30 @@ _curate_scripts = str(Path(__file__).resolve().parent.parent.parent / "curate" /
 if _curate_scripts not in sys.path:
     sys.path.insert(0, _curate_scripts)
 
-from templates import MARKER_BEGIN, MARKER_END, _slugify
+from config import read_manifest_budget
+from templates import (
+    AREA_MANIFEST_DIR,
+    MARKER_BEGIN,
+    MARKER_END,
+    _slugify,
+    area_manifest_path,
+    estimate_tokens,
+)
 
 # Same-dir imports
 _scripts_dir = str(Path(__file__).resolve().parent)
 if _scripts_dir not in sys.path:
     sys.path.insert(0, _scripts_dir)
 
+from literal_scan import scan_literals
+from similarity import load_similarity_index
 from validators import (
+    _LINK_RE,
     _WORKING_SECTIONS,
     _body_without_frontmatter,
     _strip_fenced_code_blocks,
     parse_frontmatter,
+    within_size_limit,
 )
 
 
@@ -76,8 +92,11 @@ def _discover_areas_and_topics(knowledge_base_root: Path, knowledge_dir_name: st
 
 def _managed_section(text: str) -> str | None:
     """Extract text between MARKER_BEGIN and MARKER_END, or None."""
-    begin = text.find(MARKER_BEGIN)
-    end = text.find(MARKER_END)
+    positions: dict[str, int] = {}
+    for offset, marker in scan_literals(text, (MARKER_BEGIN, MARKER_END)):
+        positions.setdefault(marker, offset)
+    begin = positions.get(MARKER_BEGIN, -1)
+    end = positions.get(MARKER_END, -1)
     if begin == -1 or end == -1 or end <= begin:
         return None
     return text[begin + len(MARKER_BEGIN):end]
@@ -119,6 +138,18 @@ def _parse_agents_managed(text: str) -> dict[str, list[dict]]:
     return areas
 
 
+def _parse_manifest_table(text: str) -> list[dict]:
+    """Extract ``{"name", "path"}`` topic rows from an area sub-manifest."""
+    rows: list[dict] = []
+    for line in text.split("\n"):
+        if not line.startswith("|"):
+            continue
+        link_match = re.search(r"\[([^\]]+)\]\(([^)]+)\)", line)
+        if link_match:
+            rows.append({"name": link_match.group(1), "path": link_match.group(2)})
+    return rows
+
+
 # ------------------------------------------------------------------
 # dewey-kb.md / legacy CLAUDE.md parser
 # ------------------------------------------------------------------
@@ -216,7 +247,13 @@ def _parse_curation_plan(text: str) -> list[dict]:
 # ------------------------------------------------------------------
 
 def check_manifest_sync(knowledge_base_root: Path, *, knowledge_dir_name: str = "docs") -> list[dict]:
-    """Check AGENTS.md and dewey-kb.md are in sync with files on disk."""
+    """Check AGENTS.md and dewey-kb.md are in sync with files on disk.
+
+    Understands the tiered layout written by ``scaffold --rebuild-manifest``:
+    when an area has a sub-manifest, that file must list every topic in the
+    area, and the AGENTS.md managed section must fit the configured
+    ``manifest_token_budget``.
+    """
     issues: list[dict] = []
     areas_on_disk = _discover_areas_and_topics(knowledge_base_root, knowledge_dir_name)
 
@@ -255,13 +292,22 @@ def check_manifest_sync(knowledge_base_root: Path, *, knowledge_dir_name: str =
                 if matched_area is None:
                     continue  # already warned about missing area
 
-                agents_topic_paths = {e["path"] for e in agents_areas[matched_area]}
+                # Tiered layout: the area's sub-manifest is the full list;
+                # AGENTS.md itself only lists the most-used topics.
+                manifest_rel = area_manifest_path(knowledge_dir_name, area_slug)
+                manifest_path = knowledge_base_root / manifest_rel
+                if manifest_path.exists():
+                    listed_in = manifest_rel
+                    topic_paths = {e["path"] for e in _parse_manifest_table(manifest_path.read_text())}
+                else:
+                    listed_in = "AGENTS.md"
+                    topic_paths = {e["path"] for e in agents_areas[matched_area]}
                 for topic_file in topic_files:
                     rel_path = f"{knowledge_dir_name}/{area_slug}/{topic_file.name}"
-                    if rel_path not in agents_topic_paths:
+                    if rel_path not in topic_paths:
                         issues.append({
                             "file": str(topic_file),
-                            "message": f"Topic not listed in AGENTS.md: {rel_path}",
+                            "message": f"Topic not listed in {listed_in}: {rel_path}",
                             "severity": "warn",
                         })
 
@@ -276,6 +322,46 @@ def check_manifest_sync(knowledge_base_root: Path, *, knowledge_dir_name: str =
                             "severity": "warn",
                         })
 
+            section = _managed_section(agents_text).strip("\n")
+            for link in re.findall(r"\]\(([^)]+)\)", section):
+                if f"/{AREA_MANIFEST_DIR}/" in link and not (knowledge_base_root / link).exists():
+                    issues.append({
+                        "file": str(agents_path),
+                        "message": f"AGENTS.md links to missing area manifest: {link} — run scaffold --rebuild-manifest",
+                        "severity": "warn",
+                    })
+
+            budget = read_manifest_budget(knowledge_base_root)
+            tokens = estimate_tokens(section)
+            if budget is not None and tokens > budget:
+                issues.append({
+                    "file": str(agents_path),
+                    "message": (
+                        f"AGENTS.md manifest is ~{tokens} tokens, over its {budget}-token budget"
+                        " — run scaffold --rebuild-manifest"
+                    ),
+                    "severity": "warn",
+                })
+
+    # --- Area sub-manifests (tiered layout) ---
+    manifest_dir = knowledge_base_root / knowledge_dir_name / AREA_MANIFEST_DIR
+    if manifest_dir.is_dir():
+        for manifest_path in sorted(manifest_dir.glob("*.md")):
+            if manifest_path.stem not in areas_on_disk:
+                issues.append({
+                    "file": str(manifest_path),
+                    "message": f"Area manifest for an area not on disk: {manifest_path.stem}",
+                    "severity": "warn",
+                })
+                continue
+            for entry in _parse_manifest_table(manifest_path.read_text()):
+                if not (knowledge_base_root / entry["path"]).exists():
+                    issues.append({
+                        "file": str(manifest_path),
+                        "message": f"Area manifest references nonexistent file: {entry['path']}",
+                        "severity": "warn",
+                    })
+
     # --- .claude/rules/dewey-kb.md (or legacy CLAUDE.md) ---
     rules_path = knowledge_base_root / ".claude" / "rules" / "dewey-kb.md"
     legacy_claude_path = knowledge_base_root / "CLAUDE.md"
@@ -449,6 +535,8 @@ def check_proposal_integrity(
                 pass
 
         # Check for required working sections
+        if not within_size_limit(pf):
+            continue
         text = pf.read_text()
         body = _body_without_frontmatter(text)
         headings = re.findall(r"^##\s+(.+)$", body, re.MULTILINE)
@@ -465,8 +553,16 @@ def check_proposal_integrity(
     return issues
 
 
+_ORPHAN_CANDIDATES = 3
+
+
 def check_link_graph(knowledge_base_root: Path, *, knowledge_dir_name: str = "docs") -> list[dict]:
-    """Check for orphaned files and overview completeness."""
+    """Check for orphaned files and overview completeness.
+
+    An orphaned working topic's issue carries ``candidates``: up to three
+    ``{"file", "score"}`` topics (relative to the knowledge directory)
+    ranked by TF-IDF similarity -- the likeliest places to link it from.
+    """
     issues: list[dict] = []
     knowledge_dir = knowledge_base_root / knowledge_dir_name
 
@@ -492,9 +588,11 @@ def check_link_graph(knowledge_base_root: Path, *, knowledge_dir_name: str = "do
     # Build directed link graph: file -> set of files it links to
     linked_from: dict[str, set[str]] = {}  # target -> set of sources
     for md_file in all_files:
+        # Oversized files are failed by check_file_size, not read
+        if not within_size_limit(md_file):
+            continue
         text = md_file.read_text()
-        links = re.findall(r"\[([^\]]*)\]\(([^)]+)\)", text)
-        for _link_text, target in links:
+        for _link_text, target in _LINK_RE.findall(text):
             target = target.strip()
             if target.startswith(("http://", "https://", "#", "mailto:")):
                 continue
@@ -509,17 +607,28 @@ def check_link_graph(knowledge_base_root: Path, *, knowledge_dir_name: str = "do
                 linked_from[resolved_key].add(str(md_file))
 
     # Orphan detection
+    similarity = None
     for md_file in all_files:
         if md_file.name in entry_names:
             continue
         file_key = str(md_file.resolve())
         if file_key not in linked_from:
             rel = str(md_file.relative_to(knowledge_dir))
-            issues.append({
+            issue = {
                 "file": str(md_file),
                 "message": f"Orphaned file — not linked from any other file: {rel}",
                 "severity": "warn",
-            })
+            }
+            # Built on the first orphan only; most runs have none
+            if similarity is None:
+                similarity = load_similarity_index(knowledge_base_root, knowledge_dir_name=knowledge_dir_name)
+            key = md_file.relative_to(knowledge_dir).as_posix()
+            if key in similarity:
+                issue["candidates"] = [
+                    {"file": other, "score": score}
+                    for other, score in similarity.neighbours(key, k=_ORPHAN_CANDIDATES)
+                ]
+            issues.append(issue)
 
     # Overview completeness: each overview.md's "How It's Organized" should
     # link to all topic files in that area directory
@@ -548,6 +657,8 @@ def check_link_graph(knowledge_base_root: Path, *, knowledge_dir_name: str = "do
             continue
 
         # Parse overview's "How It's Organized" section
+        if not within_size_limit(overview):
+            continue
         text = overview.read_text()
         body = _body_without_frontmatter(text)
 
@@ -570,7 +681,7 @@ def check_link_graph(knowledge_base_root: Path, *, knowledge_dir_name: str = "do
 
         # Extract linked filenames from the section
         linked_files = set()
-        for _text, target in re.findall(r"\[([^\]]*)\]\(([^)]+)\)", section_text):
+        for _text, target in _LINK_RE.findall(section_text):
             target = target.strip().split("#")[0]
             if target and not target.startswith(("http://", "https://")):
                 linked_files.add(target)
@@ -597,20 +708,133 @@ def _extract_paragraphs(text: str) -> list[str]:
     return [p.strip() for p in paragraphs if len(p.strip()) >= 40]
 
 
-def _word_shingles(text: str, n: int = 5) -> set[tuple]:
-    """Create n-gram tuples as sliding window over words."""
+def _word_shingles(text: str, n: int = 5) -> array:
+    """Hash each n-word sliding window to 64 bits.
+
+    Returns a sorted, de-duplicated ``array('Q')`` -- 8 bytes per shingle
+    instead of a tuple of strings -- ready for ``_jaccard``.
+    """
     words = re.findall(r"[a-z]+", text.lower())
     if len(words) < n:
-        return set()
-    return {tuple(words[i:i + n]) for i in range(len(words) - n + 1)}
+        return array("Q")
+    hashes = {
+        int.from_bytes(
+            hashlib.blake2b(" ".join(words[i:i + n]).encode(), digest_size=8).digest(), "little",
+        )
+        for i in range(len(words) - n + 1)
+    }
+    return array("Q", sorted(hashes))
+
+
+def _jaccard(a: array, b: array) -> float:
+    """Jaccard similarity of two sorted shingle arrays via a merge walk."""
+    if not a and not b:
+        return 0.0
+    i = j = common = 0
+    len_a, len_b = len(a), len(b)
+    while i < len_a and j < len_b:
+        x, y = a[i], b[j]
+        if x == y:
+            common += 1
+            i += 1
+            j += 1
+        elif x < y:
+            i += 1
+        else:
+            j += 1
+    return common / (len_a + len_b - common)
+
+
+def _shared_shingles(shingle_sets: list[array]) -> dict[int, int]:
+    """Document frequency of every shingle found in two or more sets.
+
+    The sets are already sorted, so a streaming merge sees equal hashes
+    next to each other and no count is kept for a shingle unique to one
+    file.  Memory follows the content files share, not the size of the
+    knowledge base.
+    """
+    df: dict[int, int] = {}
+    previous, run = None, 0
+    for shingle in heapq.merge(*shingle_sets):
+        if shingle == previous:
+            run += 1
+            continue
+        if run > 1:
+            df[previous] = run
+        previous, run = shingle, 1
+    if run > 1:
+        df[previous] = run
+    return df
+
+
+def _similarity_candidates(shingle_sets: list[array], threshold: float) -> list[tuple[int, int]]:
+    """Index pairs ``(i, j)``, ``i < j``, whose Jaccard similarity can exceed *threshold*.
+
+    Prefix filtering: order every set's shingles rarest first (by document
+    frequency across all sets).  Two sets with Jaccard >= t must share a
+    shingle within the first ``|x| - ceil(t * |x|) + 1`` of each, so only
+    sets sharing a prefix shingle are candidates.  No qualifying pair is
+    missed, and unrelated files are never compared, which keeps the
+    number of ``_jaccard`` calls proportional to the near-duplicates
+    rather than to the square of the file count.
+
+    Shingles unique to one set sort first and can pair with nothing, so
+    only the shared ones (``_shared_shingles``) are ranked and indexed.
+    """
+    df = _shared_shingles(shingle_sets)
+    postings: dict[int, list[int]] = defaultdict(list)
+    pairs: set[tuple[int, int]] = set()
+    for i, shingles in enumerate(shingle_sets):
+        # Small epsilon: a float rounding up would shorten the prefix
+        prefix = len(shingles) - math.ceil(threshold * len(shingles) - 1e-9) + 1
+        ranked = [(df[shingle], shingle) for shingle in shingles if shingle in df]
+        # Unique shingles fill the start of the prefix
+        keep = prefix - (len(shingles) - len(ranked))
+        if keep <= 0:
+            continue
+        ranked.sort()
+        for _, shingle in ranked[:keep]:
+            for j in postings[shingle]:
+                pairs.add((j, i))
+            postings[shingle].append(i)
+    return sorted(pairs)
 
 
-def _jaccard(a: set, b: set) -> float:
-    """Jaccard similarity: |a & b| / |a | b|."""
-    union = a | b
-    if not union:
-        return 0.0
-    return len(a & b) / len(union)
+_SHINGLE_CACHE_DIR = Path(".dewey") / "health" / "shingles"
+
+
+def _cached_shingles(
+    knowledge_base_root: Path, body: str, n: int = 5, *, seen: set[str] | None = None,
+) -> array:
+    """Return ``_word_shingles(body, n)``, persisted under ``.dewey/health/shingles/``.
+
+    Entries are keyed by a hash of *body* and *n*, so an unchanged file is
+    never re-tokenized.  Keys used are added to *seen* for pruning.
+    """
+    key = f"{hashlib.sha256(body.encode()).hexdigest()[:24]}-{n}"
+    if seen is not None:
+        seen.add(key)
+    cache_file = knowledge_base_root / _SHINGLE_CACHE_DIR / f"{key}.bin"
+    shingles = array("Q")
+    try:
+        shingles.frombytes(cache_file.read_bytes())
+        return shingles
+    except (OSError, ValueError):
+        pass
+    shingles = _word_shingles(body, n)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_bytes(shingles.tobytes())
+    return shingles
+
+
+def _prune_shingle_cache(knowledge_base_root: Path, keep: set[str]) -> None:
+    """Delete cached shingle files whose key is not in *keep*."""
+    cache_dir = knowledge_base_root / _SHINGLE_CACHE_DIR
+    if not cache_dir.is_dir():
+        return
+    for cache_file in cache_dir.glob("*.bin"):
+        if cache_file.stem not in keep:
+            cache_file.unlink(missing_ok=True)
 
 
 def _is_companion_pair(path_a: Path, path_b: Path) -> bool:
@@ -631,8 +855,15 @@ def check_duplicate_content(
     *,
     knowledge_dir_name: str = "docs",
     similarity_threshold: float = 0.4,
+    cache_shingles: bool = False,
 ) -> list[dict]:
-    """Detect duplicate paragraphs and high similarity between files."""
+    """Detect duplicate paragraphs and high similarity between files.
+
+    Only paragraph digests and 64-bit shingle arrays are kept per file.
+    With *cache_shingles*, shingle arrays are persisted under
+    ``.dewey/health/shingles/`` keyed by content hash, and entries for
+    content no longer present are pruned.
+    """
     issues: list[dict] = []
     knowledge_dir = knowledge_base_root / knowledge_dir_name
 
@@ -649,6 +880,9 @@ def check_duplicate_content(
         for md_file in sorted(child.glob("*.md")):
             if md_file.name == "index.md":
                 continue
+            # Oversized files are failed by check_file_size, not read
+            if not within_size_limit(md_file):
+                continue
             all_files.append(md_file)
 
     if len(all_files) < 2:
@@ -656,22 +890,28 @@ def check_duplicate_content(
 
     # Read and process each file
     file_data: dict[Path, dict] = {}
+    cache_keys: set[str] = set()
     for f in all_files:
         text = f.read_text()
         body = _body_without_frontmatter(text)
         body = _strip_fenced_code_blocks(body)
-        paragraphs = _extract_paragraphs(body)
-        shingles = _word_shingles(body)
+        if cache_shingles:
+            shingles = _cached_shingles(knowledge_base_root, body, seen=cache_keys)
+        else:
+            shingles = _word_shingles(body)
         file_data[f] = {
-            "paragraphs": paragraphs,
+            "paragraph_hashes": [
+                hashlib.md5(para.encode()).digest() for para in _extract_paragraphs(body)
+            ],
             "shingles": shingles,
         }
+    if cache_shingles:
+        _prune_shingle_cache(knowledge_base_root, cache_keys)
 
     # Pass 1 — exact paragraph duplicates
-    para_hash_map: dict[str, list[Path]] = {}
+    para_hash_map: dict[bytes, list[Path]] = {}
     for f, data in file_data.items():
-        for para in data["paragraphs"]:
-            h = hashlib.md5(para.encode()).hexdigest()
+        for h in data["paragraph_hashes"]:
             if h not in para_hash_map:
                 para_hash_map[h] = []
             para_hash_map[h].append(f)
@@ -694,28 +934,29 @@ def check_duplicate_content(
                         "severity": "warn",
                     })
 
-    # Pass 2 — cross-file Jaccard similarity
-    for i in range(len(all_files)):
-        for j in range(i + 1, len(all_files)):
-            a, b = all_files[i], all_files[j]
-            if _is_companion_pair(a, b):
-                continue
-            shingles_a = file_data[a]["shingles"]
-            shingles_b = file_data[b]["shingles"]
-            if not shingles_a or not shingles_b:
-                continue
-            sim = _jaccard(shingles_a, shingles_b)
-            if sim > similarity_threshold:
-                rel_a = str(a.relative_to(knowledge_dir))
-                rel_b = str(b.relative_to(knowledge_dir))
-                issues.append({
-                    "file": str(a),
-                    "message": (
-                        f"High similarity ({sim:.0%}) between {rel_a} and {rel_b}"
-                        " — consider deduplicating"
-                    ),
-                    "severity": "warn",
-                })
+    # Pass 2 — cross-file Jaccard similarity, for candidate pairs only
+    shingle_sets = [file_data[f]["shingles"] for f in all_files]
+    for i, j in _similarity_candidates(shingle_sets, similarity_threshold):
+        a, b = all_files[i], all_files[j]
+        if _is_companion_pair(a, b):
+            continue
+        shingles_a, shingles_b = shingle_sets[i], shingle_sets[j]
+        # Jaccard can be at most |smaller| / |larger|; skip hopeless pairs
+        small, large = sorted((len(shingles_a), len(shingles_b)))
+        if small / large <= similarity_threshold:
+            continue
+        sim = _jaccard(shingles_a, shingles_b)
+        if sim > similarity_threshold:
+            rel_a = str(a.relative_to(knowledge_dir))
+            rel_b = str(b.relative_to(knowledge_dir))
+            issues.append({
+                "file": str(a),
+                "message": (
+                    f"High similarity ({sim:.0%}) between {rel_a} and {rel_b}"
+                    " — consider deduplicating"
+                ),
+                "severity": "warn",
+            })
 
     return issues
 
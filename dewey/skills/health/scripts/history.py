@@ -3,16 +3,31 @@
 Persists timestamped snapshots of Tier 1 (and optionally Tier 2) health
 summaries to ``.dewey/history/health-log.jsonl`` inside the knowledge-base root.
 
+Tier 1 snapshots also carry a compact index of issue fingerprints so a
+later run can report only new and resolved issues (``diff_issues``).
+
+Concurrent runs each append to their own shard,
+``.dewey/history/health-log.d/<writer>.jsonl`` (see ``shard_log``);
+readers merge the shards in timestamp order.
+
 Only stdlib is used.
 """
 
 from __future__ import annotations
 
-import json
+import hashlib
+import re
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+_scripts_dir = str(Path(__file__).resolve().parent)
+if _scripts_dir not in sys.path:
+    sys.path.insert(0, _scripts_dir)
+
+from shard_log import append_record, compact_shards, locked, read_records, shard_dir
+from storage import is_writable
 
 _LOG_DIR = Path(".dewey") / "history"
 _LOG_FILE = "health-log.jsonl"
@@ -23,8 +38,11 @@ def record_snapshot(
     tier1_summary: dict,
     tier2_summary: Optional[dict] = None,
     file_list: Optional[list] = None,
+    issues: Optional[dict] = None,
+    *,
+    writer: Optional[str] = None,
 ) -> Path:
-    """Append a timestamped health snapshot to the log file.
+    """Append a timestamped health snapshot to this writer's log shard.
 
     Parameters
     ----------
@@ -38,28 +56,42 @@ def record_snapshot(
     file_list:
         Optional list of knowledge-base file paths (relative to knowledge_base_root)
         discovered during this check run.
+    issues:
+        Optional ``issue_index`` of the Tier 1 issues from this run, used
+        as the baseline for the next ``--diff``.
+    writer:
+        Session id naming the shard (see ``shard_log.writer_id``).
 
     Returns
     -------
     Path
-        Absolute path to the log file.
+        Absolute path to the shard written.
     """
-    log_dir = knowledge_base_root / _LOG_DIR
-    log_dir.mkdir(parents=True, exist_ok=True)
-
-    log_path = log_dir / _LOG_FILE
-
     entry = {
         "timestamp": datetime.now().isoformat(timespec="seconds"),
         "tier1": tier1_summary,
         "tier2": tier2_summary,
         "file_list": file_list or [],
     }
+    if issues is not None:
+        entry["issues"] = issues
+
+    return append_record(knowledge_base_root / _LOG_DIR / _LOG_FILE, entry, writer=writer)
+
 
-    with log_path.open("a") as fh:
-        fh.write(json.dumps(entry) + "\n")
+def _read_snapshots(knowledge_base_root: Path) -> list[dict]:
+    """All snapshots, main log and shards merged, oldest first.
 
-    return log_path
+    Idle shards of on-disk roots are compacted into the main log first.
+    """
+    log_path = knowledge_base_root / _LOG_DIR / _LOG_FILE
+    if is_writable(knowledge_base_root) and shard_dir(log_path).is_dir():
+        with locked(log_path.parent):
+            compact_shards(log_path)
+    entries = read_records(log_path)
+    # Stable sort: same-second snapshots of one writer keep their order
+    entries.sort(key=lambda entry: str(entry.get("timestamp", "")))
+    return entries
 
 
 def read_history(knowledge_base_root: Path, limit: int = 10) -> list[dict]:
@@ -67,13 +99,84 @@ def read_history(knowledge_base_root: Path, limit: int = 10) -> list[dict]:
 
     Returns snapshots in chronological order (oldest first).
     """
-    log_file = knowledge_base_root / ".dewey" / "history" / "health-log.jsonl"
-    if not log_file.exists():
-        return []
+    return _read_snapshots(knowledge_base_root)[-limit:]
+
+
+# ------------------------------------------------------------------
+# Issue fingerprints and diffing
+# ------------------------------------------------------------------
+
+
+def _normalize_message(message: str) -> str:
+    """Collapse whitespace and mask numbers so counts drifting between runs
+    (word counts, ages in days) do not change an issue's identity."""
+    return re.sub(r"\d+(\.\d+)?", "#", " ".join(message.split()))
+
+
+def issue_fingerprint(validator: str, issue: dict, knowledge_base_root: Optional[Path] = None) -> str:
+    """Stable identity for a Tier 1 issue.
+
+    Hashes the validator name, the issue's file (relative to
+    *knowledge_base_root* when possible, so the fingerprint survives a
+    moved checkout), and the normalized message.
+    """
+    file = issue.get("file", "")
+    if knowledge_base_root is not None and file:
+        # String prefix rather than Path.relative_to, so roots inside
+        # archives (storage.KBPath) are handled too
+        root = str(knowledge_base_root).rstrip("/\\")
+        if file.startswith(root) and file[len(root):len(root) + 1] in ("/", "\\"):
+            file = file[len(root) + 1:]
+    key = "\0".join((validator, file, _normalize_message(issue.get("message", ""))))
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+def issue_index(issues: list[dict]) -> dict[str, list[str]]:
+    """Map fingerprint -> ``[validator, file]`` for issues carrying a fingerprint.
+
+    This compact form is what ``record_snapshot`` persists; messages are
+    left out to keep the log small.
+    """
+    return {
+        i["fingerprint"]: [i.get("validator", ""), i.get("file", "")]
+        for i in issues
+        if "fingerprint" in i
+    }
+
+
+def read_last_issue_index(knowledge_base_root: Path) -> Optional[dict]:
+    """Return the most recent snapshot that recorded issue fingerprints.
+
+    Returns ``{"timestamp": str, "issues": {fingerprint: [validator, file]}}``
+    or None when no snapshot has fingerprints yet.
+    """
+    for entry in reversed(_read_snapshots(knowledge_base_root)):
+        if entry.get("issues") is not None:
+            return {"timestamp": entry["timestamp"], "issues": entry["issues"]}
+    return None
+
 
-    lines = log_file.read_text().strip().split("\n")
-    if not lines or lines == [""]:
-        return []
+def diff_issues(issues: list[dict], baseline: Optional[dict], *, skipped_validators: tuple = ()) -> dict:
+    """Compare fingerprinted *issues* against a ``read_last_issue_index`` baseline.
 
-    entries = [json.loads(line) for line in lines]
-    return entries[-limit:]
+    Baseline issues from *skipped_validators* (validators that did not
+    run this time) are never reported as resolved.
+
+    Returns
+    -------
+    dict
+        ``{"baseline": str | None, "new": [issue, ...],
+        "resolved": [{"fingerprint", "validator", "file"}, ...]}``.
+        With no baseline every issue is new.
+    """
+    previous = baseline["issues"] if baseline else {}
+    current = {i["fingerprint"] for i in issues if "fingerprint" in i}
+    return {
+        "baseline": baseline["timestamp"] if baseline else None,
+        "new": [i for i in issues if i.get("fingerprint") not in previous],
+        "resolved": [
+            {"fingerprint": fp, "validator": validator, "file": file}
+            for fp, (validator, file) in previous.items()
+            if fp not in current and validator not in skipped_validators
+        ],
+    }
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 """Claude Code PostToolUse hook entry point for utilization tracking.
 
-Reads tool input JSON from stdin, extracts file_path, and logs
-knowledge base file access via log_if_knowledge_file.
+Reads tool input JSON from stdin, extracts file_path (and session_id,
+which names the session's utilization log shard), and logs knowledge
+base file access via log_if_knowledge_file.
 
 Usage in .claude/hooks.json:
     {
@@ -54,7 +55,7 @@ def main() -> None:
     if not file_path:
         return
 
-    log_if_knowledge_file(Path(args.knowledge_base_root), file_path)
+    log_if_knowledge_file(Path(args.knowledge_base_root), file_path, session_id=tool_input.get("session_id"))
 
 
 if __name__ == "__main__":
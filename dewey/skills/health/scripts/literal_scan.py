@@ -0,0 +1,45 @@
+"""Single-pass multi-literal scanning.
+
+Several checks look for a fixed catalog of literal strings in the same
+text: template placeholders, managed-section markers, provenance markers.
+Rather than one ``in`` / ``find`` pass per literal, ``scan_literals``
+compiles the whole catalog once into a regex alternation and walks the
+text a single time, returning every match with its position.
+
+Matches are leftmost and non-overlapping; at a given position the longest
+literal wins.  That is exact for catalogs like HTML-comment placeholders,
+where no literal can start inside another.
+
+Only stdlib is used.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from typing import Iterable
+
+
+@functools.lru_cache(maxsize=32)
+def _compile(literals: tuple[str, ...]) -> re.Pattern:
+    """Compile *literals* into one alternation, longest first."""
+    ordered = sorted(set(literals), key=len, reverse=True)
+    return re.compile("|".join(re.escape(lit) for lit in ordered))
+
+
+def scan_literals(text: str, literals: Iterable[str]) -> list[tuple[int, str]]:
+    """Return ``[(offset, literal), ...]`` for every literal found in *text*.
+
+    The compiled pattern is cached per catalog, so repeated calls with the
+    same literals (e.g. once per file during a health run) pay the build
+    cost only once.
+    """
+    catalog = tuple(literals)
+    if not catalog:
+        return []
+    return [(m.start(), m.group()) for m in _compile(catalog).finditer(text)]
+
+
+def find_literals(text: str, literals: Iterable[str]) -> set[str]:
+    """Return the set of literals from *literals* that occur in *text*."""
+    return {literal for _, literal in scan_literals(text, literals)}
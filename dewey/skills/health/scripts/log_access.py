@@ -2,7 +2,8 @@
 
 Called by a Claude Code PostToolUse hook on the Read tool.
 Checks if the file is a .md under the knowledge directory and
-logs it via ``record_reference`` if so.
+logs it via ``record_session_reference`` if so, collapsing repeat reads
+within the configured session window.
 
 Only stdlib is used (plus sibling module imports).
 """
@@ -17,11 +18,11 @@ _curate_scripts = str(Path(__file__).resolve().parent.parent.parent / "curate" /
 if _curate_scripts not in sys.path:
     sys.path.insert(0, _curate_scripts)
 
-from config import read_knowledge_dir
-from utilization import record_reference
+from config import read_knowledge_dir, read_utilization_settings
+from utilization import record_session_reference
 
 
-def log_if_knowledge_file(knowledge_base_root: Path, file_path: str) -> bool:
+def log_if_knowledge_file(knowledge_base_root: Path, file_path: str, *, session_id: str | None = None) -> bool:
     """Log a utilization event if *file_path* is a knowledge base topic.
 
     Parameters
@@ -30,6 +31,9 @@ def log_if_knowledge_file(knowledge_base_root: Path, file_path: str) -> bool:
         Root directory of the knowledge base.
     file_path:
         Absolute path to the file that was read.
+    session_id:
+        Agent session id, if the hook input carries one.  Each session
+        logs to its own shard of the utilization log.
 
     Returns
     -------
@@ -57,5 +61,10 @@ def log_if_knowledge_file(knowledge_base_root: Path, file_path: str) -> bool:
         return False
 
     relative_path = f"{knowledge_dir_name}/{rel}"
-    record_reference(knowledge_base_root, relative_path, context="hook")
+    settings = read_utilization_settings(knowledge_base_root)
+    record_session_reference(
+        knowledge_base_root, relative_path, context="hook",
+        window_seconds=settings["session_window_seconds"], sample_every=settings["sample_every"],
+        writer=session_id,
+    )
     return True
@@ -0,0 +1,265 @@
+"""Indexed cache of the last complete health report.
+
+Each complete health run stores what it produced under
+``.dewey/health/last-report/`` inside the knowledge-base root, one
+section per report part::
+
+    tier1.jsonl            one Tier 1 issue per line
+    tier1.index.json       timestamp, summary, line offsets, field index
+    tier2.jsonl            one Tier 2 queue item per line
+    recommendations.jsonl  one curation recommendation per line
+
+A run replaces only the sections it produced, so ``--tier2`` leaves the
+cached Tier 1 issues in place.  The index maps each field value (area,
+file, severity, validator, trigger, recommendation) to record numbers;
+``query_report`` intersects them and reads only the matching lines, so
+narrowing a report to one area costs neither a validation pass nor a
+read of the whole cache.
+
+Records are written as they are produced (``SectionWriter``), so a
+streamed run keeps nothing extra in memory; a section only replaces the
+cached one on ``commit``, under the same advisory lock queries read
+under.  Partial runs (budget-skipped or selective) are not cached, for
+the same reason they record no history snapshot.
+
+Only stdlib is used.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from datetime import datetime
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Iterable, Optional
+
+# Ensure sibling scripts are importable
+_scripts_dir = str(Path(__file__).resolve().parent)
+if _scripts_dir not in sys.path:
+    sys.path.insert(0, _scripts_dir)
+
+from shard_log import locked
+
+_CACHE_DIR = Path(".dewey") / "health" / "last-report"
+
+# Section -> (report key holding its records, indexed fields).
+SECTIONS = {
+    "tier1": ("issues", ("area", "file", "severity", "validator")),
+    "tier2": ("queue", ("area", "file", "trigger")),
+    "recommendations": ("recommendations", ("area", "file", "recommendation")),
+}
+
+
+def _relative(file: str, knowledge_dir: str, knowledge_dir_name: str) -> str:
+    """Path of *file* inside the knowledge directory, as recorded by any report."""
+    for prefix in (knowledge_dir + "/", knowledge_dir_name + "/"):
+        if file.startswith(prefix):
+            return file[len(prefix):]
+    return file
+
+
+class SectionWriter:
+    """Write one cached report section record by record.
+
+    Records go to a temporary file as they are added; ``commit`` swaps
+    it in together with its index, ``discard`` drops it and keeps the
+    previously cached section.  Leaving a ``with`` block without
+    committing discards.
+    """
+
+    def __init__(self, knowledge_base_root: Path, section: str, *, knowledge_dir_name: str = "docs"):
+        if section not in SECTIONS:
+            raise ValueError(f"section must be one of {tuple(SECTIONS)}, got {section!r}")
+        self._dir = knowledge_base_root / _CACHE_DIR
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._section = section
+        self._fields = SECTIONS[section][1]
+        self._knowledge_dir = str(knowledge_base_root / knowledge_dir_name)
+        self._knowledge_dir_name = knowledge_dir_name
+        self._tmp = self._dir / f"{section}.jsonl.{os.getpid()}.tmp"
+        self._fh = self._tmp.open("wb")
+        self._offsets: list[int] = []
+        self._index: dict[str, dict[str, list[int]]] = {field: {} for field in self._fields}
+
+    def __enter__(self) -> SectionWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if not self._fh.closed:
+            self.discard()
+
+    def add(self, record: dict) -> None:
+        """Append *record* and index its fields."""
+        n = len(self._offsets)
+        self._offsets.append(self._fh.tell())
+        self._fh.write(json.dumps(record).encode() + b"\n")
+        rel = _relative(str(record.get("file", "")), self._knowledge_dir, self._knowledge_dir_name)
+        values = {"file": rel, "area": rel.split("/", 1)[0] if "/" in rel else None}
+        for field in self._fields:
+            value = values[field] if field in values else record.get(field)
+            if value is not None:
+                self._index[field].setdefault(str(value), []).append(n)
+
+    def commit(self, summary: dict) -> None:
+        """Replace the cached section with the records added so far."""
+        self._fh.close()
+        index = {
+            "section": self._section,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "summary": summary,
+            "offsets": self._offsets,
+            "index": self._index,
+        }
+        index_tmp = self._dir / f"{self._section}.index.json.{os.getpid()}.tmp"
+        index_tmp.write_text(json.dumps(index))
+        with locked(self._dir):
+            os.replace(self._tmp, self._dir / f"{self._section}.jsonl")
+            os.replace(index_tmp, self._dir / f"{self._section}.index.json")
+
+    def discard(self) -> None:
+        """Drop the records added so far; the cached section is untouched."""
+        self._fh.close()
+        self._tmp.unlink(missing_ok=True)
+
+
+def save_section(
+    knowledge_base_root: Path,
+    section: str,
+    records: Iterable[dict],
+    summary: dict,
+    *,
+    knowledge_dir_name: str = "docs",
+) -> None:
+    """Cache *records* and *summary* as the last report's *section*."""
+    with SectionWriter(knowledge_base_root, section, knowledge_dir_name=knowledge_dir_name) as writer:
+        for record in records:
+            writer.add(record)
+        writer.commit(summary)
+
+
+def _matching(index: dict, filters: dict[str, tuple[str, ...]], file_globs: tuple[str, ...]) -> Optional[list[int]]:
+    """Record numbers matching every filter; None when a filter names an unindexed field."""
+    selected: Optional[set[int]] = None
+    for field, values in filters.items():
+        if not values:
+            continue
+        if field not in index:
+            return None
+        hits = {n for value in values for n in index[field].get(value, ())}
+        selected = hits if selected is None else selected & hits
+    if file_globs:
+        hits = {
+            n for rel, numbers in index["file"].items()
+            if any(fnmatchcase(rel, pattern) for pattern in file_globs)
+            for n in numbers
+        }
+        selected = hits if selected is None else selected & hits
+    return sorted(selected) if selected is not None else None
+
+
+def query_report(
+    knowledge_base_root: Path,
+    *,
+    sections: Iterable[str] = (),
+    area: Iterable[str] = (),
+    file_glob: Iterable[str] = (),
+    severity: Iterable[str] = (),
+    validator: Iterable[str] = (),
+    trigger: Iterable[str] = (),
+) -> dict:
+    """Filter the cached last report without re-running any checks.
+
+    Parameters
+    ----------
+    knowledge_base_root:
+        Root directory containing the knowledge base.
+    sections:
+        Sections to search (``tier1``, ``tier2``, ``recommendations``);
+        all cached sections when empty.
+    area, file_glob, severity, validator, trigger:
+        Filters.  Values of one filter are alternatives; different
+        filters must all match.  *file_glob* patterns match paths
+        relative to the knowledge directory (``area/*.md``).  A section
+        whose records lack a filtered field (``severity`` on the Tier 2
+        queue) is left out of the result.
+
+    Returns
+    -------
+    dict
+        Per matching section, ``{"timestamp", "summary", "total",
+        "count", <records>}`` where ``<records>`` is ``issues``,
+        ``queue`` or ``recommendations``, as in the full report.
+        Sections never cached are absent.
+    """
+    cache_dir = knowledge_base_root / _CACHE_DIR
+    filters = {
+        "area": tuple(area), "severity": tuple(severity),
+        "validator": tuple(validator), "trigger": tuple(trigger),
+    }
+    file_globs = tuple(file_glob)
+    for section in sections:
+        if section not in SECTIONS:
+            raise ValueError(f"section must be one of {tuple(SECTIONS)}, got {section!r}")
+    if not cache_dir.is_dir():
+        return {}
+
+    result: dict = {}
+    with locked(cache_dir):
+        for section in [s for s in SECTIONS if s in sections] or list(SECTIONS):
+            index_path = cache_dir / f"{section}.index.json"
+            if not index_path.is_file():
+                continue
+            cached = json.loads(index_path.read_text())
+            offsets = cached["offsets"]
+            if not any(filters.values()) and not file_globs:
+                numbers = range(len(offsets))
+            else:
+                numbers = _matching(cached["index"], filters, file_globs)
+                if numbers is None:
+                    continue
+            records = []
+            with (cache_dir / f"{section}.jsonl").open("rb") as fh:
+                for n in numbers:
+                    fh.seek(offsets[n])
+                    records.append(json.loads(fh.readline()))
+            result[section] = {
+                "timestamp": cached["timestamp"],
+                "summary": cached["summary"],
+                "total": len(offsets),
+                "count": len(records),
+                SECTIONS[section][0]: records,
+            }
+    return result
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Query the last cached health report without re-running checks.",
+    )
+    parser.add_argument("--knowledge-base-root", required=True, help="Knowledge-base root directory")
+    parser.add_argument(
+        "--section", action="append", default=[], choices=tuple(SECTIONS),
+        help="Report section to search (repeatable; default: all cached sections).",
+    )
+    parser.add_argument("--area", action="append", default=[], help="Area (top-level directory) to keep.")
+    parser.add_argument(
+        "--file", action="append", default=[], metavar="GLOB",
+        help="Glob over file paths relative to the knowledge directory, e.g. 'area/*.md'.",
+    )
+    parser.add_argument("--severity", action="append", default=[], help="Tier 1 severity: fail or warn.")
+    parser.add_argument("--validator", action="append", default=[], help="Tier 1 validator name.")
+    parser.add_argument("--trigger", action="append", default=[], help="Tier 2 trigger, e.g. why_quality.")
+    args = parser.parse_args()
+
+    root = Path(args.knowledge_base_root)
+    if not (root / _CACHE_DIR).is_dir():
+        parser.exit(1, "No cached health report; run check_knowledge_base.py first.\n")
+    report = query_report(
+        root, sections=args.section, area=args.area, file_glob=args.file,
+        severity=args.severity, validator=args.validator, trigger=args.trigger,
+    )
+    print(json.dumps(report, indent=2))
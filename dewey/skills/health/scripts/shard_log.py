@@ -0,0 +1,192 @@
+"""Per-writer JSONL log shards with merge-on-read and compaction.
+
+Several agents and CI jobs may log to one knowledge base at once.  Rather
+than all appending to one shared file, each writer appends to its own
+shard next to the main log::
+
+    .dewey/utilization/log.jsonl            main log (compacted records)
+    .dewey/utilization/log.d/<writer>.jsonl one shard per writer
+
+Every record goes out as a single ``os.write`` on an ``O_APPEND`` file
+descriptor.  Two writes to the same shard therefore never interleave
+within a line, even if two processes share a writer id.  A record larger
+than ``MAX_RECORD_BYTES`` is written under the directory lock instead.
+
+Readers see the main log plus every shard (``read_records``).
+``compact_shards`` moves shards that have been idle for a while into the
+main log, under an advisory lock.  Idle shards only, because a shard in
+use may be written again at any moment -- and since writers never take
+the lock, a shard is first renamed out of their way, so a late record
+starts a fresh shard instead of landing in one about to be deleted.
+
+The writer id is the session id when the caller has one, else
+``$DEWEY_LOG_WRITER``, else host and parent pid.  The parent pid
+identifies one agent session for the short-lived hook processes it
+spawns.
+
+Only stdlib is used.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import socket
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
+MAX_RECORD_BYTES = 1 << 20
+
+# Shards untouched for this long are merged into the main log.
+COMPACT_IDLE_SECONDS = 300
+
+_LOCK_FILE = "log.lock"
+_CLAIMED_SUFFIX = ".compacting"
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+@contextmanager
+def locked(directory: Path, *, lock_file: str = _LOCK_FILE) -> Iterator[None]:
+    """Hold an exclusive advisory lock on *directory*'s logs.
+
+    A different *lock_file* gives an independent lock, e.g. one per
+    writer for state only that writer updates.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    with (directory / lock_file).open("a") as fh:
+        if fcntl is not None:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+def writer_id(session: Optional[str] = None) -> str:
+    """Shard name for this writer (filesystem-safe)."""
+    raw = session or os.environ.get("DEWEY_LOG_WRITER") or f"{socket.gethostname()}-{os.getppid()}"
+    return _UNSAFE_CHARS.sub("_", raw)[:80] or "writer"
+
+
+def shard_dir(log_path: Path) -> Path:
+    """``log.jsonl`` -> ``log.d``."""
+    return log_path.parent / (log_path.stem + ".d")
+
+
+def _append_bytes(path: Path, data: bytes) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def append_record(log_path: Path, record: dict, *, writer: Optional[str] = None) -> Path:
+    """Append *record* as one JSON line to this writer's shard of *log_path*.
+
+    Returns the shard path.
+    """
+    shard = shard_dir(log_path) / f"{writer_id(writer)}.jsonl"
+    data = (json.dumps(record) + "\n").encode()
+    shard.parent.mkdir(parents=True, exist_ok=True)
+    if len(data) <= MAX_RECORD_BYTES:
+        _append_bytes(shard, data)
+    else:
+        with locked(log_path.parent):
+            _append_bytes(shard, data)
+    return shard
+
+
+def log_sources(log_path: Path) -> list[Path]:
+    """The main log (if present) followed by its shards, in name order."""
+    sources = [log_path] if log_path.exists() else []
+    shards = shard_dir(log_path)
+    if shards.is_dir():
+        sources.extend(sorted(p for p in shards.iterdir() if p.suffix == ".jsonl"))
+    return sources
+
+
+def parse_lines(data: bytes) -> Iterator[dict]:
+    """Yield the JSON objects of the complete lines in *data*, skipping bad ones."""
+    for line in data[: data.rfind(b"\n") + 1].decode(errors="replace").splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(record, dict):
+            yield record
+
+
+def read_records(log_path: Path) -> list[dict]:
+    """Every complete record in the main log and its shards.
+
+    Records are grouped by source, main log first.  Callers that need
+    time order sort on their own timestamp field.
+    """
+    records: list[dict] = []
+    for source in log_sources(log_path):
+        records.extend(parse_lines(source.read_bytes()))
+    return records
+
+
+def compact_shards(
+    log_path: Path,
+    *,
+    idle_seconds: float = COMPACT_IDLE_SECONDS,
+    on_compact: Optional[Callable[[Path, bytes], None]] = None,
+) -> list[Path]:
+    """Append idle shards' lines to the main log and delete them.
+
+    Call with the directory lock held, so compactions do not overlap.
+    Writers do not take the lock: each shard is renamed to
+    ``<name>.compacting`` before it is read, so a record appended from
+    then on goes to a new shard.  A torn last line is kept, terminated
+    by a newline (readers skip it like any malformed line); a shard left
+    ``.compacting`` by an interrupted compaction is finished first.
+
+    *on_compact* is called with each shard path and the bytes it added
+    to the main log, before the shard is deleted.  Read-only roots
+    (``storage.KBPath``) are left alone.
+
+    Returns the compacted shard paths.
+    """
+    if not isinstance(log_path, Path):
+        return []
+    shards = shard_dir(log_path)
+    if not shards.is_dir():
+        return []
+    cutoff = time.time() - idle_seconds
+    compacted: list[Path] = []
+    interrupted = [p.with_name(p.name[: -len(_CLAIMED_SUFFIX)]) for p in shards.glob("*" + _CLAIMED_SUFFIX)]
+    for shard in sorted(interrupted) + sorted(shards.glob("*.jsonl")):
+        claimed = shard.with_name(shard.name + _CLAIMED_SUFFIX)
+        try:
+            if not claimed.exists():
+                if shard.stat().st_mtime > cutoff:
+                    continue
+                os.replace(shard, claimed)
+            data = claimed.read_bytes()
+        except FileNotFoundError:
+            continue
+        if data and not data.endswith(b"\n"):
+            data += b"\n"
+        if data:
+            _append_bytes(log_path, data)
+        if on_compact is not None:
+            on_compact(shard, data)
+        claimed.unlink()
+        compacted.append(shard)
+    return compacted
@@ -0,0 +1,283 @@
+"""Sparse TF-IDF similarity between knowledge-base topics.
+
+Suggests related topics for "See also" links and ranks fix candidates
+for orphaned files.  Every working topic (not overviews, not ``.ref.md``
+companions) becomes a sparse TF-IDF vector, normalised to unit length.
+Vectors are indexed by term (an inverted index), so finding a topic's
+neighbours only touches topics that share a term with it.  Terms that
+appear in more than half the topics are left out of the index: they say
+little about relatedness, and they would make every postings list as
+long as the corpus.
+
+Term counts are cached in ``.dewey/health/similarity.json`` keyed by
+content hash.  Only new or changed topics are re-tokenized; topics that
+are gone are dropped.  IDF weights depend on the whole corpus, so they
+and the postings are rebuilt in memory, in one pass over the cached
+counts, whenever the topic set changes.
+
+Only stdlib is used.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+import math
+import re
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+
+_scripts_dir = str(Path(__file__).resolve().parent)
+if _scripts_dir not in sys.path:
+    sys.path.insert(0, _scripts_dir)
+
+from storage import is_writable
+from validators import _LINK_RE, _body_without_frontmatter, _strip_fenced_code_blocks, within_size_limit
+
+_CACHE_PATH = Path(".dewey") / "health" / "similarity.json"
+_CACHE_FORMAT = 1
+
+_MAX_DF_RATIO = 0.5
+DEFAULT_MIN_SCORE = 0.1
+
+_LINK_TARGET_RE = re.compile(r"\]\([^)]*\)")
+_URL_RE = re.compile(r"https?://\S+")
+_WORD_RE = re.compile(r"[a-z][a-z0-9]{2,}")
+_STOPWORDS = frozenset(
+    "about after also and are because been before being but can could does each for from has have"
+    " how into its just may more most must not off only other our out over own same should some"
+    " such than that the their them then there these they this those through too under use used"
+    " uses using very was were what when where which while who why will with would you your".split()
+)
+
+
+def tokenize(text: str) -> Counter:
+    """Term counts of a topic's prose (frontmatter, code, link targets and URLs dropped)."""
+    body = _strip_fenced_code_blocks(_body_without_frontmatter(text))
+    body = _URL_RE.sub(" ", _LINK_TARGET_RE.sub("]", body)).lower()
+    return Counter(word for word in _WORD_RE.findall(body) if word not in _STOPWORDS)
+
+
+class SimilarityIndex:
+    """Unit-length TF-IDF vectors over an inverted index.
+
+    Parameters
+    ----------
+    docs:
+        ``{key: term counts}`` (see ``tokenize``).  Keys are typically
+        paths relative to the knowledge directory.
+    """
+
+    def __init__(self, docs: dict[str, Counter] | None = None):
+        self._counts: dict[str, Counter] = dict(docs or {})
+        self._vectors: dict[str, dict[str, float]] = {}
+        self._postings: dict[str, list[tuple[str, float]]] = {}
+        self._dirty = True
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._counts
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def update(self, key: str, counts: Counter) -> None:
+        """Add or replace one document."""
+        self._counts[key] = counts
+        self._dirty = True
+
+    def remove(self, key: str) -> None:
+        """Drop one document (no-op when absent)."""
+        if self._counts.pop(key, None) is not None:
+            self._dirty = True
+
+    def _rebuild(self) -> None:
+        total = len(self._counts)
+        df: Counter = Counter()
+        for counts in self._counts.values():
+            df.update(counts.keys())
+        max_df = max(2, int(total * _MAX_DF_RATIO))
+        idf = {term: math.log((total + 1) / (n + 1)) + 1 for term, n in df.items() if n <= max_df}
+
+        self._vectors = {}
+        postings: dict[str, list[tuple[str, float]]] = defaultdict(list)
+        for key, counts in self._counts.items():
+            weights = {term: (1 + math.log(n)) * idf[term] for term, n in counts.items() if term in idf}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            vector = {term: w / norm for term, w in weights.items()}
+            self._vectors[key] = vector
+            for term, weight in vector.items():
+                postings[term].append((key, weight))
+        self._postings = dict(postings)
+        self._dirty = False
+
+    def neighbours(
+        self,
+        key: str,
+        k: int = 5,
+        *,
+        min_score: float = DEFAULT_MIN_SCORE,
+        exclude: set[str] | frozenset[str] = frozenset(),
+    ) -> list[tuple[str, float]]:
+        """The *k* documents most similar to *key*, best first.
+
+        Returns ``[(key, cosine), ...]`` with scores of at least
+        *min_score*, leaving out *key* itself and anything in *exclude*.
+        """
+        if self._dirty:
+            self._rebuild()
+        scores: dict[str, float] = defaultdict(float)
+        for term, weight in self._vectors.get(key, {}).items():
+            for other, other_weight in self._postings[term]:
+                scores[other] += weight * other_weight
+        candidates = (
+            (score, other) for other, score in scores.items()
+            if other != key and other not in exclude and score >= min_score
+        )
+        return [(other, round(score, 4)) for score, other in heapq.nlargest(k, candidates)]
+
+
+def _topic_files(knowledge_base_root: Path, knowledge_dir_name: str) -> list[Path]:
+    """Working topics: every ``.md`` outside ``_``-dirs except overviews, indexes and refs.
+
+    Files over the size limit are left out.
+    """
+    knowledge_dir = knowledge_base_root / knowledge_dir_name
+    if not knowledge_dir.is_dir():
+        return []
+    files = []
+    for md_file in sorted(knowledge_dir.rglob("*.md")):
+        if any(part.startswith("_") for part in md_file.relative_to(knowledge_dir).parts):
+            continue
+        if md_file.name in ("overview.md", "index.md") or md_file.name.endswith(".ref.md"):
+            continue
+        if not within_size_limit(md_file):
+            continue
+        files.append(md_file)
+    return files
+
+
+def load_similarity_index(knowledge_base_root: Path, *, knowledge_dir_name: str = "docs") -> SimilarityIndex:
+    """Build the index for every working topic, reusing cached term counts.
+
+    The cache is read and rewritten only for writable (on-disk) roots.
+    """
+    knowledge_dir = knowledge_base_root / knowledge_dir_name
+    persist = is_writable(knowledge_base_root)
+    cached: dict = {}
+    if persist:
+        try:
+            data = json.loads((knowledge_base_root / _CACHE_PATH).read_text())
+            if data.get("format") == _CACHE_FORMAT:
+                cached = data.get("docs", {})
+        except (OSError, json.JSONDecodeError, AttributeError):
+            cached = {}
+
+    docs: dict[str, dict] = {}
+    changed = False
+    for md_file in _topic_files(knowledge_base_root, knowledge_dir_name):
+        key = md_file.relative_to(knowledge_dir).as_posix()
+        text = md_file.read_text()
+        digest = hashlib.sha256(text.encode()).hexdigest()[:24]
+        entry = cached.get(key)
+        if not isinstance(entry, dict) or entry.get("hash") != digest:
+            entry = {"hash": digest, "terms": dict(tokenize(text))}
+            changed = True
+        docs[key] = entry
+    changed = changed or set(docs) != set(cached)
+
+    if persist and changed:
+        cache_file = knowledge_base_root / _CACHE_PATH
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps({"format": _CACHE_FORMAT, "docs": docs}, sort_keys=True))
+
+    return SimilarityIndex({key: Counter(entry["terms"]) for key, entry in docs.items()})
+
+
+def _linked_keys(md_file: Path, knowledge_dir: Path) -> set[str]:
+    """Knowledge-dir-relative keys of the local files *md_file* links to."""
+    keys = set()
+    for _text, target in _LINK_RE.findall(md_file.read_text()):
+        target = re.split(r"[#\s]", target, maxsplit=1)[0]
+        if not target or target.startswith(("http://", "https://", "mailto:")):
+            continue
+        try:
+            keys.add((md_file.parent / target).resolve().relative_to(knowledge_dir.resolve()).as_posix())
+        except ValueError:
+            continue
+    return keys
+
+
+def suggest_see_also(
+    knowledge_base_root: Path,
+    *,
+    knowledge_dir_name: str = "docs",
+    k: int = 3,
+    min_score: float = DEFAULT_MIN_SCORE,
+) -> list[dict]:
+    """Suggest cross-area "See also" links for every working topic.
+
+    Topics in the same area are already connected through the area
+    overview, and topics a file links to already are not suggested again.
+
+    Returns
+    -------
+    list[dict]
+        ``[{"file": key, "suggestions": [{"file": key, "score": float}, ...]}, ...]``
+        for topics with at least one suggestion.
+    """
+    knowledge_dir = knowledge_base_root / knowledge_dir_name
+    index = load_similarity_index(knowledge_base_root, knowledge_dir_name=knowledge_dir_name)
+    files = _topic_files(knowledge_base_root, knowledge_dir_name)
+    keys = [md_file.relative_to(knowledge_dir).as_posix() for md_file in files]
+    by_area: dict[str, set[str]] = defaultdict(set)
+    for key in keys:
+        by_area[key.split("/")[0]].add(key)
+
+    result = []
+    for md_file, key in zip(files, keys):
+        exclude = by_area[key.split("/")[0]] | _linked_keys(md_file, knowledge_dir)
+        neighbours = index.neighbours(key, k=k, min_score=min_score, exclude=exclude)
+        if neighbours:
+            result.append({
+                "file": key,
+                "suggestions": [{"file": other, "score": score} for other, score in neighbours],
+            })
+    return result
+
+
+if __name__ == "__main__":
+    import argparse
+
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "curate" / "scripts"))
+    from config import read_knowledge_dir
+
+    parser = argparse.ArgumentParser(description="Suggest related topics by TF-IDF similarity.")
+    parser.add_argument("--knowledge-base-root", required=True, help="Knowledge-base root directory.")
+    parser.add_argument(
+        "--file",
+        help="Topic path relative to the knowledge directory (e.g. area/topic.md); "
+        "prints its nearest neighbours. Without it, prints cross-area See also suggestions for every topic.",
+    )
+    parser.add_argument("--top-k", type=int, default=3, help="Neighbours per topic (default: 3).")
+    parser.add_argument(
+        "--min-score",
+        type=float,
+        default=DEFAULT_MIN_SCORE,
+        help=f"Minimum cosine similarity (default: {DEFAULT_MIN_SCORE}).",
+    )
+    args = parser.parse_args()
+
+    root = Path(args.knowledge_base_root)
+    kd = read_knowledge_dir(root)
+    if args.file:
+        idx = load_similarity_index(root, knowledge_dir_name=kd)
+        if args.file not in idx:
+            parser.error(f"not a working topic: {args.file}")
+        report = [{"file": other, "score": score} for other, score in idx.neighbours(
+            args.file, k=args.top_k, min_score=args.min_score,
+        )]
+    else:
+        report = suggest_see_also(root, knowledge_dir_name=kd, k=args.top_k, min_score=args.min_score)
+    print(json.dumps(report, indent=2))
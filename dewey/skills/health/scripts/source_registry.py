@@ -0,0 +1,314 @@
+"""Knowledge-base-wide source registry.
+
+Maps each canonical source URL to the files that cite it, its domain, its
+authority class, and the last fetch result.  The registry lives at
+``.dewey/sources/registry.json`` inside the knowledge-base root and is
+updated incrementally: only files whose size or mtime changed since the
+last update have their frontmatter re-parsed.
+
+This module is also the one place that parses frontmatter source entries
+and URLs; validators and triggers use ``frontmatter_source_entries``,
+``url_domain`` and ``classify_domain`` instead of re-parsing with
+``urllib.parse`` per check.  Parsing is memoized per URL.
+
+Only stdlib is used.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import urllib.parse
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+_REGISTRY_PATH = Path(".dewey") / "sources" / "registry.json"
+
+# Query parameters that identify a visitor or campaign, not a document.
+_TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "ref_src"}
+
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+_AUTHORITATIVE_DOMAINS = {
+    "w3.org",
+    "ietf.org",
+    "rfc-editor.org",
+    "python.org",
+    "developer.mozilla.org",
+}
+
+_AUTHORITATIVE_SUFFIXES = (
+    ".gov",
+    ".edu",
+    ".ac.uk",
+)
+
+_COMMUNITY_DOMAINS = {
+    "medium.com",
+    "dev.to",
+    "substack.com",
+    "wordpress.com",
+    "blogspot.com",
+    "stackoverflow.com",
+    "reddit.com",
+    "news.ycombinator.com",
+}
+
+
+# ------------------------------------------------------------------
+# URL helpers
+# ------------------------------------------------------------------
+
+
+def frontmatter_source_entries(fm: dict) -> list[str]:
+    """Return the frontmatter ``sources`` entries as URL strings.
+
+    Handles the structured ``url: https://...`` form and skips template
+    placeholder comments.  Entries are not validated; callers decide what
+    to do with non-http values.
+    """
+    sources = fm.get("sources")
+    if not isinstance(sources, list):
+        return []
+
+    entries: list[str] = []
+    for entry in sources:
+        url = str(entry).strip()
+        if url.startswith("url:"):
+            url = url[4:].strip()
+        if "<!--" in url:
+            continue
+        entries.append(url)
+    return entries
+
+
+@functools.lru_cache(maxsize=4096)
+def url_domain(url: str) -> str:
+    """Lowercased host of *url* without a leading ``www.``; ``""`` if unparseable."""
+    try:
+        netloc = urllib.parse.urlparse(url).netloc.lower()
+    except ValueError:  # e.g. an unbalanced IPv6 bracket
+        return ""
+    if netloc.startswith("www."):
+        netloc = netloc[4:]
+    return netloc
+
+
+@functools.lru_cache(maxsize=4096)
+def canonicalize_url(url: str) -> str:
+    """Normalize *url* so different spellings of one source compare equal.
+
+    Lowercases scheme and host, treats http and https alike, drops
+    ``www.``, default ports, fragments, ``utm_*`` and other tracking
+    parameters, sorts the remaining query, and strips a trailing slash.
+    A URL that cannot be parsed (a malformed port, say) is returned
+    stripped but otherwise as written, so one typo never aborts a run.
+    """
+    try:
+        parsed = urllib.parse.urlsplit(url.strip())
+        port = parsed.port
+    except ValueError:
+        return url.strip()
+    scheme = parsed.scheme.lower()
+    host = (parsed.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if port is not None and str(port) != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+    if scheme in ("http", "https"):
+        scheme = "https"
+
+    query = sorted(
+        (k, v)
+        for k, v in urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    )
+    path = parsed.path.rstrip("/") or ""
+    return urllib.parse.urlunsplit((scheme, host, path, urllib.parse.urlencode(query), ""))
+
+
+def classify_domain(netloc: str) -> str:
+    """Classify a domain as 'authoritative', 'community', or 'other'."""
+    if netloc in _AUTHORITATIVE_DOMAINS:
+        return "authoritative"
+    for suffix in _AUTHORITATIVE_SUFFIXES:
+        if netloc.endswith(suffix):
+            return "authoritative"
+    if netloc in _COMMUNITY_DOMAINS:
+        return "community"
+    return "other"
+
+
+# ------------------------------------------------------------------
+# Registry
+# ------------------------------------------------------------------
+
+
+def load_registry(knowledge_base_root: Path) -> dict:
+    """Return the stored registry, or an empty one.
+
+    Shape::
+
+        {"files": {rel_path: {"mtime_ns": int, "size": int, "sources": [canonical, ...]}},
+         "sources": {canonical: {"url": str, "domain": str, "authority": str,
+                                 "files": [rel_path, ...], "last_check": dict | None}}}
+    """
+    path = knowledge_base_root / _REGISTRY_PATH
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {"files": {}, "sources": {}}
+    data.setdefault("files", {})
+    data.setdefault("sources", {})
+    return data
+
+
+def _save_registry(knowledge_base_root: Path, registry: dict) -> None:
+    path = knowledge_base_root / _REGISTRY_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(registry, indent=2, sort_keys=True) + "\n")
+
+
+def update_registry(knowledge_base_root: Path, md_files: list[Path]) -> dict:
+    """Bring the registry in line with *md_files* and return it.
+
+    Files whose ``(mtime_ns, size)`` match the stored entry are not
+    re-read.  Removed files drop out, and sources no longer cited by any
+    file are removed.  ``last_check`` results survive updates.  The
+    registry is only rewritten when something changed.
+    """
+    from validators import parse_frontmatter
+
+    registry = load_registry(knowledge_base_root)
+    files: dict[str, dict] = registry["files"]
+    changed = False
+
+    current: dict[str, Path] = {}
+    for md_file in md_files:
+        try:
+            rel = str(md_file.relative_to(knowledge_base_root))
+        except ValueError:
+            rel = str(md_file)
+        current[rel] = md_file
+
+    for rel in list(files):
+        if rel not in current:
+            del files[rel]
+            changed = True
+
+    originals: dict[str, str] = {}
+    for rel, md_file in current.items():
+        try:
+            stat = md_file.stat()
+        except OSError:
+            continue
+        entry = files.get(rel)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            continue
+        canonical: list[str] = []
+        for url in frontmatter_source_entries(parse_frontmatter(md_file)):
+            if not url.startswith(("http://", "https://")):
+                continue
+            key = canonicalize_url(url)
+            originals.setdefault(key, url)
+            if key not in canonical:
+                canonical.append(key)
+        files[rel] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sources": canonical}
+        changed = True
+
+    if not changed:
+        return registry
+
+    previous = registry["sources"]
+    sources: dict[str, dict] = {}
+    for rel in sorted(files):
+        for key in files[rel]["sources"]:
+            if key not in sources:
+                old = previous.get(key, {})
+                domain = url_domain(key)
+                sources[key] = {
+                    "url": old.get("url") or originals.get(key, key),
+                    "domain": domain,
+                    "authority": classify_domain(domain),
+                    "files": [],
+                    "last_check": old.get("last_check"),
+                }
+            sources[key]["files"].append(rel)
+    registry["sources"] = sources
+
+    _save_registry(knowledge_base_root, registry)
+    return registry
+
+
+def lookup_source(knowledge_base_root: Path, url: str) -> Optional[dict]:
+    """Return the registry entry for *url* (any spelling), or None."""
+    return load_registry(knowledge_base_root)["sources"].get(canonicalize_url(url))
+
+
+def record_source_check(knowledge_base_root: Path, results: list[dict]) -> None:
+    """Store fetch results (``{"url", "status", ...}``) as ``last_check``.
+
+    URLs not in the registry are ignored.
+    """
+    registry = load_registry(knowledge_base_root)
+    now = datetime.now().isoformat(timespec="seconds")
+    touched = False
+    for result in results:
+        entry = registry["sources"].get(canonicalize_url(result["url"]))
+        if entry is not None:
+            entry["last_check"] = {"status": result["status"], "checked": now}
+            touched = True
+    if touched:
+        _save_registry(knowledge_base_root, registry)
+
+
+def source_diversity_report(registry: dict) -> dict:
+    """Knowledge-base-wide source mix from a registry.
+
+    Returns
+    -------
+    dict
+        ``{"total_sources": int, "by_domain": {domain: count},
+        "by_authority": {class: count}, "shared_sources": [{"url", "files"}, ...]}``
+        where ``by_domain`` is sorted by count (descending) and
+        ``shared_sources`` lists sources cited by more than one file.
+    """
+    by_domain: dict[str, int] = {}
+    by_authority: dict[str, int] = {}
+    shared: list[dict] = []
+    for key, entry in registry["sources"].items():
+        by_domain[entry["domain"]] = by_domain.get(entry["domain"], 0) + 1
+        by_authority[entry["authority"]] = by_authority.get(entry["authority"], 0) + 1
+        if len(entry["files"]) > 1:
+            shared.append({"url": entry["url"], "files": entry["files"]})
+    return {
+        "total_sources": len(registry["sources"]),
+        "by_domain": dict(sorted(by_domain.items(), key=lambda kv: (-kv[1], kv[0]))),
+        "by_authority": by_authority,
+        "shared_sources": sorted(shared, key=lambda s: (-len(s["files"]), s["url"])),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from check_knowledge_base import _discover_md_files, read_knowledge_dir
+
+    parser = argparse.ArgumentParser(description="Maintain and query the knowledge-base source registry.")
+    parser.add_argument("--knowledge-base-root", required=True, help="Knowledge-base root directory")
+    parser.add_argument("--lookup", metavar="URL", help="Report whether URL is already cited, and by which files")
+    parser.add_argument("--report", action="store_true", help="Print a knowledge-base-wide source diversity report")
+    args = parser.parse_args()
+
+    root = Path(args.knowledge_base_root)
+    registry = update_registry(root, _discover_md_files(root, read_knowledge_dir(root)))
+
+    if args.lookup:
+        entry = registry["sources"].get(canonicalize_url(args.lookup))
+        output = {"url": args.lookup, "canonical": canonicalize_url(args.lookup), "entry": entry}
+    elif args.report:
+        output = source_diversity_report(registry)
+    else:
+        output = {"total_sources": len(registry["sources"]), "total_files": len(registry["files"])}
+    print(json.dumps(output, indent=2))
@@ -0,0 +1,213 @@
+"""Offline source snapshot store for drift detection.
+
+Fetches each frontmatter source URL, stores normalized text and a content
+fingerprint under ``.dewey/sources/`` inside the knowledge-base root, and
+refetches with conditional requests (``If-None-Match`` /
+``If-Modified-Since``) so unchanged sources cost a 304 and no body.
+
+``trigger_source_drift`` consults these snapshots: when every source of a
+file has a known fingerprint history, the trigger fires only if a source
+changed after the file's ``last_validated`` date.
+
+Only stdlib is used.  Network access happens only in ``fetch_source`` and
+``refresh_sources``; reading snapshots is offline.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import html
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+_SNAPSHOT_DIR = Path(".dewey") / "sources"
+_USER_AGENT = "dewey-health-check/1.0"
+
+
+# ------------------------------------------------------------------
+# Helpers
+# ------------------------------------------------------------------
+
+
+def _snapshot_key(url: str) -> str:
+    """Stable filename key for *url*."""
+    return hashlib.sha256(url.encode()).hexdigest()[:16]
+
+
+def _normalize_text(raw: str) -> str:
+    """Reduce fetched content to comparable plain text.
+
+    Drops ``<script>``/``<style>`` blocks and HTML comments, strips tags,
+    unescapes entities, and collapses whitespace so cosmetic markup
+    changes do not alter the fingerprint.
+    """
+    text = re.sub(r"<(script|style)\b[^>]*>.*?</\1\s*>", " ", raw, flags=re.DOTALL | re.IGNORECASE)
+    text = re.sub(r"<!--.*?-->", " ", text, flags=re.DOTALL)
+    text = re.sub(r"<[^>]+>", " ", text)
+    text = html.unescape(text)
+    return " ".join(text.split())
+
+
+def _fingerprint(text: str) -> str:
+    """SHA-256 of normalized text."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _now() -> str:
+    """ISO timestamp (seconds precision) for snapshot bookkeeping."""
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def _write_snapshot(knowledge_base_root: Path, url: str, meta: dict, text: Optional[str]) -> None:
+    """Persist snapshot metadata (and normalized text, if given)."""
+    snap_dir = knowledge_base_root / _SNAPSHOT_DIR
+    snap_dir.mkdir(parents=True, exist_ok=True)
+    key = _snapshot_key(url)
+    if text is not None:
+        (snap_dir / f"{key}.txt").write_text(text)
+    (snap_dir / f"{key}.json").write_text(json.dumps(meta, indent=2) + "\n")
+
+
+# ------------------------------------------------------------------
+# Public API
+# ------------------------------------------------------------------
+
+
+def read_source_snapshot(knowledge_base_root: Path, url: str) -> Optional[dict]:
+    """Return stored snapshot metadata for *url*, or None if never fetched.
+
+    Metadata keys: ``url``, ``fingerprint``, ``etag``, ``last_modified``,
+    ``first_fetched``, ``last_fetched``, ``changed`` (timestamp of the
+    most recent fingerprint change, or None), ``status``.
+    """
+    meta_path = knowledge_base_root / _SNAPSHOT_DIR / f"{_snapshot_key(url)}.json"
+    if not meta_path.exists():
+        return None
+    try:
+        return json.loads(meta_path.read_text())
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+def read_source_text(knowledge_base_root: Path, url: str) -> Optional[str]:
+    """Return the stored normalized text for *url*, or None."""
+    text_path = knowledge_base_root / _SNAPSHOT_DIR / f"{_snapshot_key(url)}.txt"
+    if not text_path.exists():
+        return None
+    return text_path.read_text()
+
+
+def fetch_source(knowledge_base_root: Path, url: str, *, timeout: int = 10) -> dict:
+    """Fetch *url* (conditionally, if a snapshot exists) and update its snapshot.
+
+    Returns ``{"url": str, "status": int | str, "changed": bool,
+    "fingerprint": str | None}``.  ``changed`` is True only when a
+    previously stored fingerprint differs from the new one.  Fetch errors
+    leave the stored fingerprint untouched.
+    """
+    import urllib.error
+    import urllib.request
+
+    previous = read_source_snapshot(knowledge_base_root, url)
+
+    req = urllib.request.Request(url, method="GET")
+    req.add_header("User-Agent", _USER_AGENT)
+    if previous:
+        if previous.get("etag"):
+            req.add_header("If-None-Match", previous["etag"])
+        if previous.get("last_modified"):
+            req.add_header("If-Modified-Since", previous["last_modified"])
+
+    now = _now()
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            status = resp.status
+            raw = resp.read()
+            charset = resp.headers.get_content_charset() or "utf-8"
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and previous:
+            previous["last_fetched"] = now
+            previous["status"] = 304
+            _write_snapshot(knowledge_base_root, url, previous, None)
+            return {
+                "url": url,
+                "status": 304,
+                "changed": False,
+                "fingerprint": previous.get("fingerprint"),
+            }
+        status = e.code
+        if previous:
+            previous["status"] = status
+            previous["last_fetched"] = now
+            _write_snapshot(knowledge_base_root, url, previous, None)
+        return {
+            "url": url,
+            "status": status,
+            "changed": False,
+            "fingerprint": previous.get("fingerprint") if previous else None,
+        }
+    except Exception:
+        return {
+            "url": url,
+            "status": "error",
+            "changed": False,
+            "fingerprint": previous.get("fingerprint") if previous else None,
+        }
+
+    text = _normalize_text(raw.decode(charset, errors="replace"))
+    fingerprint = _fingerprint(text)
+    changed = bool(previous and previous.get("fingerprint") and previous["fingerprint"] != fingerprint)
+
+    meta = {
+        "url": url,
+        "fingerprint": fingerprint,
+        "etag": etag,
+        "last_modified": last_modified,
+        "first_fetched": previous.get("first_fetched", now) if previous else now,
+        "last_fetched": now,
+        "changed": now if changed else (previous.get("changed") if previous else None),
+        "status": status,
+    }
+    _write_snapshot(knowledge_base_root, url, meta, text)
+
+    return {"url": url, "status": status, "changed": changed, "fingerprint": fingerprint}
+
+
+def refresh_sources(knowledge_base_root: Path, urls: list[str], *, timeout: int = 10) -> list[dict]:
+    """Fetch every unique URL in *urls* once; return per-URL results."""
+    results: list[dict] = []
+    seen: set[str] = set()
+    for url in urls:
+        if url in seen:
+            continue
+        seen.add(url)
+        results.append(fetch_source(knowledge_base_root, url, timeout=timeout))
+    return results
+
+
+def source_drift_status(knowledge_base_root: Path, url: str, last_validated: str) -> str:
+    """Classify *url* relative to a file's ``last_validated`` date.
+
+    Returns one of:
+
+    - ``"changed"`` -- fingerprint changed after *last_validated*
+    - ``"stable"`` -- first fetched on or before *last_validated* and
+      not changed since
+    - ``"unknown"`` -- no snapshot, or no baseline that predates validation
+    """
+    snap = read_source_snapshot(knowledge_base_root, url)
+    if not snap or not snap.get("fingerprint"):
+        return "unknown"
+    changed = snap.get("changed")
+    if changed and changed[:10] > last_validated:
+        return "changed"
+    first_fetched = snap.get("first_fetched") or ""
+    if first_fetched and first_fetched[:10] <= last_validated:
+        return "stable"
+    return "unknown"
+
@@ -0,0 +1,521 @@
+"""Read-only storage backends for running health checks off the filesystem.
+
+Validators take a ``Path`` and use a small slice of the pathlib API
+(``read_text``, ``open``, ``stat``, ``exists``, ``is_dir``, ``iterdir``, ``glob``, ``rglob``,
+``parent``, ``name``, ``relative_to``, ...).  ``KBPath`` implements that
+slice on top of a ``Storage`` backend, so the same validators run
+unchanged against:
+
+- ``MemoryStorage`` -- a ``{relative_path: text}`` dict (fast test trees)
+- ``ZipStorage`` / ``TarStorage`` -- release archives, read in place
+- ``GitStorage`` -- the tree of any git commit, read from the object
+  database without a checkout
+
+``open_knowledge_base`` turns a CLI argument into a root: a plain
+``Path`` for directories (the default, zero-overhead case) or a
+``KBPath`` for archives and git revisions.  ``KBPath`` trees are read-only; callers use
+``is_writable`` to skip history, registry and cache writes.
+
+Only stdlib is used.
+"""
+
+from __future__ import annotations
+
+import atexit
+import fnmatch
+import io
+import posixpath
+import subprocess
+import tarfile
+import zipfile
+from abc import ABC, abstractmethod
+from pathlib import Path, PurePosixPath
+from typing import IO, Iterator, NamedTuple, Optional, Union
+
+
+# ------------------------------------------------------------------
+# Backends
+# ------------------------------------------------------------------
+
+
+class Storage(ABC):
+    """A read-only tree of files addressed by POSIX paths relative to its root.
+
+    ``""`` is the root directory.  Subclasses implement ``read_bytes``,
+    ``list_dir``, ``exists`` and ``is_dir``, and override ``size`` when
+    they can answer it without reading the file.  Directories on disk
+    need no backend: ``open_knowledge_base`` returns a plain ``Path``.
+    """
+
+    label = ""
+
+    @abstractmethod
+    def read_bytes(self, path: str) -> bytes:
+        """Contents of file *path*."""
+
+    def size(self, path: str) -> int:
+        """Size of file *path* in bytes."""
+        return len(self.read_bytes(path))
+
+    @abstractmethod
+    def list_dir(self, path: str) -> list[str]:
+        """Names of the direct children of directory *path*."""
+
+    @abstractmethod
+    def exists(self, path: str) -> bool:
+        """True if *path* is a file or directory in the tree."""
+
+    @abstractmethod
+    def is_dir(self, path: str) -> bool:
+        """True if *path* is a directory in the tree."""
+
+
+class _IndexedStorage(Storage):
+    """Storage whose full file list is known up front (memory, archives)."""
+
+    def _index(self, names: list[str]) -> None:
+        self._children: dict[str, set[str]] = {"": set()}
+        self._files: set[str] = set()
+        for name in names:
+            name = name.strip("/")
+            if not name:
+                continue
+            self._files.add(name)
+            parent, _, child = name.rpartition("/")
+            while True:
+                self._children.setdefault(parent, set()).add(child)
+                if not parent:
+                    break
+                parent, _, child = parent.rpartition("/")
+        # A name that is also some other entry's parent is a directory
+        self._files -= set(self._children)
+
+    def list_dir(self, path: str) -> list[str]:
+        if path not in self._children:
+            raise NotADirectoryError(f"{self.label}/{path}")
+        return sorted(self._children[path])
+
+    def exists(self, path: str) -> bool:
+        return path in self._files or path in self._children
+
+    def is_dir(self, path: str) -> bool:
+        return path in self._children
+
+
+class MemoryStorage(_IndexedStorage):
+    """Files held in a ``{relative_path: str | bytes}`` dict."""
+
+    label = ":memory:"
+
+    def __init__(self, files: dict[str, Union[str, bytes]]):
+        self._data = {
+            name.strip("/"): content.encode() if isinstance(content, str) else content
+            for name, content in files.items()
+        }
+        self._index(list(self._data))
+
+    def read_bytes(self, path: str) -> bytes:
+        try:
+            return self._data[path]
+        except KeyError:
+            raise FileNotFoundError(f"{self.label}/{path}") from None
+
+
+class ZipStorage(_IndexedStorage):
+    """Members of a zip archive, read without extracting."""
+
+    def __init__(self, archive: Path):
+        self.label = str(archive)
+        self._zip = zipfile.ZipFile(archive)
+        self._members = {
+            info.filename.strip("/"): info for info in self._zip.infolist() if not info.is_dir()
+        }
+        self._index([info.filename for info in self._zip.infolist()])
+
+    def read_bytes(self, path: str) -> bytes:
+        info = self._members.get(path)
+        if info is None:
+            raise FileNotFoundError(f"{self.label}/{path}")
+        return self._zip.read(info)
+
+    def size(self, path: str) -> int:
+        info = self._members.get(path)
+        if info is None:
+            raise FileNotFoundError(f"{self.label}/{path}")
+        return info.file_size
+
+
+class TarStorage(_IndexedStorage):
+    """Regular-file members of a (optionally compressed) tar archive."""
+
+    def __init__(self, archive: Path):
+        self.label = str(archive)
+        self._tar = tarfile.open(archive)
+        members = self._tar.getmembers()
+        self._members = {m.name.strip("/").removeprefix("./"): m for m in members if m.isfile()}
+        self._index([m.name.removeprefix("./") for m in members if m.isfile() or m.isdir()])
+
+    def read_bytes(self, path: str) -> bytes:
+        member = self._members.get(path)
+        if member is None:
+            raise FileNotFoundError(f"{self.label}/{path}")
+        return self._tar.extractfile(member).read()
+
+    def size(self, path: str) -> int:
+        member = self._members.get(path)
+        if member is None:
+            raise FileNotFoundError(f"{self.label}/{path}")
+        return member.size
+
+
+class GitObjectReader:
+    """Reads objects through one long-lived ``git cat-file --batch`` process.
+
+    Every object read is a request/response on the same pipe, so walking
+    a tree costs no process spawns and no worktree I/O.  One reader can
+    serve any number of revisions of its repository.  Sizes come from a
+    second ``--batch-check`` process, started on first use.
+    """
+
+    def __init__(self, repo: Path):
+        self.repo = Path(repo)
+        self._proc = self._spawn("--batch")
+        self._check_proc: Optional[subprocess.Popen] = None
+
+    def _spawn(self, mode: str) -> subprocess.Popen:
+        return subprocess.Popen(
+            ["git", "-C", str(self.repo), "cat-file", mode],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    def read(self, spec: str) -> tuple[str, str, bytes]:
+        """Return ``(oid, type, content)`` for any object name git accepts.
+
+        Raises ``FileNotFoundError`` when *spec* does not name an object.
+        """
+        if "\n" in spec:
+            raise ValueError(f"object name contains a newline: {spec!r}")
+        self._proc.stdin.write(spec.encode() + b"\n")
+        self._proc.stdin.flush()
+        header = self._proc.stdout.readline().decode().split()
+        if len(header) != 3:
+            raise FileNotFoundError(f"{self.repo}: {spec} is not a git object")
+        oid, kind, size = header
+        data = self._proc.stdout.read(int(size))
+        self._proc.stdout.read(1)  # trailing newline
+        return oid, kind, data
+
+    def size(self, spec: str) -> int:
+        """Size in bytes of the object *spec* names, without reading it."""
+        if "\n" in spec:
+            raise ValueError(f"object name contains a newline: {spec!r}")
+        if self._check_proc is None:
+            self._check_proc = self._spawn("--batch-check")
+        self._check_proc.stdin.write(spec.encode() + b"\n")
+        self._check_proc.stdin.flush()
+        header = self._check_proc.stdout.readline().decode().split()
+        if len(header) != 3:
+            raise FileNotFoundError(f"{self.repo}: {spec} is not a git object")
+        return int(header[2])
+
+    def close(self) -> None:
+        for proc in (self._proc, self._check_proc):
+            if proc is not None and proc.poll() is None:
+                proc.stdin.close()
+                proc.wait()
+
+
+_READERS: dict[Path, GitObjectReader] = {}
+
+
+def git_reader(repo: Path) -> GitObjectReader:
+    """Shared ``GitObjectReader`` for *repo* (closed at interpreter exit)."""
+    repo = Path(repo).resolve()
+    if repo not in _READERS:
+        if not _READERS:
+            atexit.register(_close_readers)
+        _READERS[repo] = GitObjectReader(repo)
+    return _READERS[repo]
+
+
+def _close_readers() -> None:
+    for reader in _READERS.values():
+        reader.close()
+    _READERS.clear()
+
+
+class GitStorage(Storage):
+    """The tree of one commit, read lazily through a ``GitObjectReader``.
+
+    Directories are parsed from tree objects on first listing and cached;
+    file contents are read on demand.  The label is the abbreviated
+    commit id, so reports name files as ``<commit>/docs/...``.
+    """
+
+    _DIR_MODE = "40000"
+    _GITLINK_MODE = "160000"
+
+    def __init__(self, reader: GitObjectReader, rev: str):
+        self.reader = reader
+        self.commit, _, _ = reader.read(f"{rev}^{{commit}}")
+        self.label = self.commit[:12]
+        root_tree, _, _ = reader.read(f"{self.commit}^{{tree}}")
+        self._oid_bytes = len(self.commit) // 2  # 20 for SHA-1, 32 for SHA-256
+        self._entries: dict[str, tuple[str, str]] = {"": (self._DIR_MODE, root_tree)}
+        self._listed: dict[str, list[str]] = {}
+
+    def _list(self, path: str) -> list[str]:
+        if path in self._listed:
+            return self._listed[path]
+        mode, oid = self._entry(path)
+        if mode != self._DIR_MODE:
+            raise NotADirectoryError(f"{self.label}/{path}")
+        _, _, data = self.reader.read(oid)
+        names: list[str] = []
+        pos = 0
+        while pos < len(data):
+            space = data.index(b" ", pos)
+            nul = data.index(b"\0", space)
+            child_mode = data[pos:space].decode()
+            name = data[space + 1:nul].decode("utf-8", "surrogateescape")
+            child_oid = data[nul + 1:nul + 1 + self._oid_bytes].hex()
+            pos = nul + 1 + self._oid_bytes
+            if child_mode == self._GITLINK_MODE:
+                continue  # submodule commits are not in this repository
+            self._entries[f"{path}/{name}" if path else name] = (child_mode, child_oid)
+            names.append(name)
+        self._listed[path] = names
+        return names
+
+    def _entry(self, path: str) -> tuple[str, str]:
+        entry = self._entries.get(path)
+        if entry is None:
+            parent, _, name = path.rpartition("/")
+            if self.is_dir(parent) and name in self._list(parent):
+                entry = self._entries[path]
+        if entry is None:
+            raise FileNotFoundError(f"{self.label}/{path}")
+        return entry
+
+    def read_bytes(self, path: str) -> bytes:
+        mode, oid = self._entry(path)
+        if mode == self._DIR_MODE:
+            raise IsADirectoryError(f"{self.label}/{path}")
+        return self.reader.read(oid)[2]
+
+    def size(self, path: str) -> int:
+        mode, oid = self._entry(path)
+        if mode == self._DIR_MODE:
+            raise IsADirectoryError(f"{self.label}/{path}")
+        return self.reader.size(oid)
+
+    def list_dir(self, path: str) -> list[str]:
+        return sorted(self._list(path))
+
+    def exists(self, path: str) -> bool:
+        try:
+            self._entry(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+        return True
+
+    def is_dir(self, path: str) -> bool:
+        try:
+            return self._entry(path)[0] == self._DIR_MODE
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+
+
+# ------------------------------------------------------------------
+# Path facade
+# ------------------------------------------------------------------
+
+
+class KBStat(NamedTuple):
+    """The part of ``os.stat_result`` a ``KBPath`` can report."""
+
+    st_size: int
+
+
+class KBPath:
+    """Path-like handle to a file or directory inside a ``Storage``.
+
+    Supports the subset of ``pathlib.Path`` the health checks use.
+    ``relative_to`` returns a plain ``PurePosixPath``.
+    """
+
+    __slots__ = ("storage", "_path")
+
+    def __init__(self, storage: Storage, path: str = ""):
+        self.storage = storage
+        self._path = path.strip("/")
+
+    # -- pure path operations --------------------------------------
+
+    def __truediv__(self, other) -> "KBPath":
+        joined = posixpath.join(self._path, str(other)) if self._path else str(other)
+        return KBPath(self.storage, joined)
+
+    def __str__(self) -> str:
+        return f"{self.storage.label}/{self._path}" if self._path else self.storage.label
+
+    def __repr__(self) -> str:
+        return f"KBPath({self.storage.label!r}, {self._path!r})"
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, KBPath)
+            and other.storage is self.storage
+            and other._path == self._path
+        )
+
+    def __hash__(self) -> int:
+        return hash((id(self.storage), self._path))
+
+    def __lt__(self, other: "KBPath") -> bool:
+        return self._path < other._path
+
+    @property
+    def name(self) -> str:
+        return self._path.rpartition("/")[2]
+
+    @property
+    def stem(self) -> str:
+        return PurePosixPath(self.name).stem if self.name else ""
+
+    @property
+    def suffix(self) -> str:
+        return PurePosixPath(self.name).suffix if self.name else ""
+
+    @property
+    def parent(self) -> "KBPath":
+        return KBPath(self.storage, self._path.rpartition("/")[0])
+
+    @property
+    def parts(self) -> tuple[str, ...]:
+        return tuple(self._path.split("/")) if self._path else ()
+
+    def relative_to(self, other: "KBPath") -> PurePosixPath:
+        if not isinstance(other, KBPath) or other.storage is not self.storage:
+            raise ValueError(f"{self} is not in the subpath of {other}")
+        if not other._path:
+            return PurePosixPath(self._path)
+        if self._path == other._path:
+            return PurePosixPath(".")
+        if not self._path.startswith(other._path + "/"):
+            raise ValueError(f"{self} is not in the subpath of {other}")
+        return PurePosixPath(self._path[len(other._path) + 1:])
+
+    def resolve(self) -> "KBPath":
+        """Normalize ``.`` and ``..`` lexically (archives have no symlinks)."""
+        normalized = posixpath.normpath("/" + self._path).lstrip("/")
+        return KBPath(self.storage, "" if normalized == "." else normalized)
+
+    # -- I/O -------------------------------------------------------
+
+    def read_bytes(self) -> bytes:
+        return self.storage.read_bytes(self._path)
+
+    def read_text(self, encoding: str = "utf-8", errors: str = "strict") -> str:
+        return self.read_bytes().decode(encoding, errors)
+
+    def open(self, mode: str = "r", encoding: str = "utf-8", errors: str = "strict") -> IO:
+        """Read-only file object over the member's content (``"r"`` or ``"rb"``)."""
+        if mode == "rb":
+            return io.BytesIO(self.read_bytes())
+        if mode != "r":
+            raise ValueError(f"{self} is read-only; cannot open with mode {mode!r}")
+        return io.StringIO(self.read_text(encoding, errors), newline="\n")
+
+    def stat(self) -> KBStat:
+        return KBStat(self.storage.size(self._path))
+
+    def exists(self) -> bool:
+        return self.storage.exists(self._path)
+
+    def is_dir(self) -> bool:
+        return self.storage.is_dir(self._path)
+
+    def is_file(self) -> bool:
+        return self.storage.exists(self._path) and not self.storage.is_dir(self._path)
+
+    def iterdir(self) -> Iterator["KBPath"]:
+        for name in self.storage.list_dir(self._path):
+            yield self / name
+
+    def glob(self, pattern: str) -> Iterator["KBPath"]:
+        """Non-recursive name match among direct children."""
+        if not self.is_dir():
+            return
+        for child in self.iterdir():
+            if fnmatch.fnmatchcase(child.name, pattern):
+                yield child
+
+    def rglob(self, pattern: str) -> Iterator["KBPath"]:
+        """Name match among all descendants."""
+        if not self.is_dir():
+            return
+        for child in self.iterdir():
+            if fnmatch.fnmatchcase(child.name, pattern):
+                yield child
+            if child.is_dir():
+                yield from child.rglob(pattern)
+
+
+# ------------------------------------------------------------------
+# Entry points
+# ------------------------------------------------------------------
+
+_ZIP_SUFFIXES = (".zip",)
+_TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz")
+
+
+def open_knowledge_base(location: Union[str, Path], rev: Optional[str] = None) -> Union[Path, KBPath]:
+    """Return a knowledge-base root for a directory, an archive, or a revision.
+
+    Directories come back as a plain ``Path``.  For ``.zip`` and tar
+    archives, the root is the archive's top level -- or its single
+    top-level directory, when the archive wraps everything in one
+    (``kb-1.4/docs/...``).
+
+    With *rev*, *location* must be a directory inside a git repository;
+    the root is that directory as of commit *rev*, read from git objects
+    through the repository's shared ``git_reader``.
+    """
+    path = Path(location)
+    if rev is not None:
+        return _open_revision(path, rev)
+    name = path.name.lower()
+    if name.endswith(_ZIP_SUFFIXES):
+        storage: Storage = ZipStorage(path)
+    elif name.endswith(_TAR_SUFFIXES):
+        storage = TarStorage(path)
+    else:
+        return path
+
+    root = KBPath(storage)
+    top = storage.list_dir("")
+    if len(top) == 1 and storage.is_dir(top[0]):
+        root = root / top[0]
+    return root
+
+
+def _open_revision(path: Path, rev: str) -> KBPath:
+    try:
+        toplevel, prefix = subprocess.run(
+            ["git", "-C", str(path), "rev-parse", "--show-toplevel", "--show-prefix"],
+            capture_output=True, text=True, check=True,
+        ).stdout.split("\n")[:2]
+    except (OSError, subprocess.CalledProcessError) as exc:
+        raise ValueError(f"{path} is not inside a git repository") from exc
+    storage = GitStorage(git_reader(Path(toplevel)), rev)
+    root = KBPath(storage, prefix)
+    if not root.is_dir():
+        raise FileNotFoundError(f"{prefix or '.'} does not exist at {rev}")
+    return root
+
+
+def is_writable(knowledge_base_root) -> bool:
+    """True when *knowledge_base_root* is on the local filesystem."""
+    return isinstance(knowledge_base_root, Path)
@@ -0,0 +1,106 @@
+"""Cost model and ordering for time-budgeted Tier 1 runs.
+
+Every Tier 1 run records how long each validator took, per knowledge
+file, in ``.dewey/health/timings.json`` (an exponentially weighted
+average, so estimates follow the knowledge base as it grows).  The file
+is rewritten atomically, and only when an average moved by more than
+``_REWRITE_THRESHOLD``, so routine runs leave it alone.  A run
+with a time budget uses those estimates to order validators -- the
+high-signal ones first, then the rest cheapest first -- and to skip any
+whose estimate no longer fits in the time left.
+
+Before anything has been recorded, ``_DEFAULT_MS_PER_FILE`` supplies
+priors for the known-expensive validators.
+
+Only stdlib is used.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+_TIMINGS_PATH = Path(".dewey") / "health" / "timings.json"
+
+# Weight of the newest run in the moving average.
+_EWMA_ALPHA = 0.3
+
+# Relative change in any stored average that warrants rewriting the file.
+_REWRITE_THRESHOLD = 0.1
+
+# Cheap checks that catch the most common authoring mistakes (and the size
+# check that reports files too large to validate); a budgeted run always
+# starts with these and never skips them.
+HIGH_SIGNAL_VALIDATORS = ("check_file_size", "check_frontmatter", "check_source_urls", "check_cross_references")
+
+_DEFAULT_MS_PER_FILE = {
+    "check_readability": 2.0,
+    "check_duplicate_content": 3.0,
+    "check_link_graph": 1.0,
+    "check_citation_grounding": 1.0,
+    "check_source_accessibility": 500.0,
+}
+_FALLBACK_MS_PER_FILE = 0.2
+
+
+def load_timings(knowledge_base_root: Path) -> dict[str, float]:
+    """Return recorded ``{validator: ms_per_file}`` (empty if none or unreadable)."""
+    try:
+        data = json.loads((knowledge_base_root / _TIMINGS_PATH).read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    validators = data.get("validators", {}) if isinstance(data, dict) else {}
+    return {
+        name: float(entry["ms_per_file"])
+        for name, entry in validators.items()
+        if isinstance(entry, dict) and isinstance(entry.get("ms_per_file"), (int, float))
+    }
+
+
+def record_timings(knowledge_base_root: Path, elapsed_ms: dict[str, float], file_count: int) -> bool:
+    """Fold one run's ``{validator: total_ms}`` into the stored averages.
+
+    Returns whether the file was rewritten: it is left untouched unless a
+    validator is new or its average moved by more than
+    ``_REWRITE_THRESHOLD``.
+    """
+    if not elapsed_ms:
+        return False
+    timings = load_timings(knowledge_base_root)
+    per_file = max(file_count, 1)
+    changed = False
+    for name, total in elapsed_ms.items():
+        sample = total / per_file
+        previous = timings.get(name)
+        timings[name] = sample if previous is None else _EWMA_ALPHA * sample + (1 - _EWMA_ALPHA) * previous
+        if previous is None or abs(timings[name] - previous) > _REWRITE_THRESHOLD * previous:
+            changed = True
+    if not changed:
+        return False
+
+    path = knowledge_base_root / _TIMINGS_PATH
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"validators": {name: {"ms_per_file": round(ms, 4)} for name, ms in sorted(timings.items())}}
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(data, indent=2) + "\n")
+    os.replace(tmp, path)
+    return True
+
+
+def estimate_ms(validator: str, file_count: int, timings: dict[str, float]) -> float:
+    """Expected run time of *validator* over *file_count* files."""
+    ms_per_file = timings.get(validator, _DEFAULT_MS_PER_FILE.get(validator, _FALLBACK_MS_PER_FILE))
+    return ms_per_file * max(file_count, 1)
+
+
+def plan_order(validators: list[str], file_count: int, timings: dict[str, float]) -> list[str]:
+    """Order *validators* for a budgeted run.
+
+    High-signal validators come first in their given order; the rest
+    follow by estimated cost, cheapest first (ties keep their given order).
+    """
+    first = [name for name in validators if name in HIGH_SIGNAL_VALIDATORS]
+    rest = [name for name in validators if name not in HIGH_SIGNAL_VALIDATORS]
+    rest.sort(key=lambda name: estimate_ms(name, file_count, timings))
+    return first + rest
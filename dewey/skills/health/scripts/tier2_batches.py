@@ -0,0 +1,167 @@
+"""Token-budgeted batching of the Tier 2 review queue.
+
+``run_tier2_prescreening`` emits one queue item per trigger firing, so a
+single file can appear up to nine times.  This module groups those items
+by file, estimates the token cost of reviewing each item (from file and
+section sizes), and packs the per-file groups into review batches that fit
+a token budget, highest priority first.
+
+Priority is ``(1 + reads) * (1 + age_days / 90) * severity`` where
+*severity* is the sum of ``TRIGGER_SEVERITY`` over the file's triggers.
+
+Only stdlib is used.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+from tier2_triggers import TRIGGER_SECTIONS
+from validators import _body_without_frontmatter, _extract_section, parse_frontmatter
+
+DEFAULT_TOKEN_BUDGET = 60000
+
+# Rough size of one token in characters for English markdown.
+_CHARS_PER_TOKEN = 4
+
+# Fixed cost per queue item: item JSON, calibration anchor, and verdict.
+_ITEM_OVERHEAD_TOKENS = 150
+
+TRIGGER_SEVERITY: dict[str, int] = {
+    "source_drift": 3,
+    "depth_accuracy": 2,
+    "source_primacy": 2,
+    "why_quality": 2,
+    "concrete_examples": 2,
+    "citation_quality": 1,
+    "source_authority": 2,
+    "provenance_completeness": 1,
+    "recommendation_coverage": 1,
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count for *text*."""
+    return math.ceil(len(text) / _CHARS_PER_TOKEN)
+
+
+def _age_days(fm: dict) -> int:
+    """Days since ``last_validated``; 0 when missing or invalid."""
+    try:
+        return max((date.today() - date.fromisoformat(str(fm.get("last_validated")))).days, 0)
+    except ValueError:
+        return 0
+
+
+def _item_tokens(trigger: str, text: str, body: str) -> int:
+    """Estimate review tokens for one trigger on a file."""
+    sections = TRIGGER_SECTIONS.get(trigger)
+    if sections is None:
+        content_tokens = estimate_tokens(text)
+    elif not sections:
+        content_tokens = estimate_tokens(text) - estimate_tokens(body)
+    else:
+        content_tokens = sum(estimate_tokens(_extract_section(body, s) or "") for s in sections)
+    return max(content_tokens, 0) + _ITEM_OVERHEAD_TOKENS
+
+
+def group_queue_by_file(queue: list[dict], *, paths: Optional[dict[str, Path]] = None) -> list[dict]:
+    """Group Tier 2 queue items by file with token estimates.
+
+    Returns a list (in first-seen order) of::
+
+        {"file": str, "items": [...], "file_tokens": int,
+         "token_estimate": int, "age_days": int, "severity": int}
+
+    Each item gains a ``token_estimate`` -- the cost of reviewing it on
+    its own.  The group's ``token_estimate`` loads the file once and adds
+    per-item overhead, which is what a batched review actually costs.
+    *paths* maps queue ``file`` values to path objects for knowledge bases
+    not on the local filesystem (see ``storage.py``).
+    """
+    paths = paths or {}
+    groups: dict[str, dict] = {}
+    for item in queue:
+        name = item["file"]
+        if name not in groups:
+            groups[name] = {"file": name, "items": []}
+        groups[name]["items"].append(item)
+
+    for name, group in groups.items():
+        path = paths.get(name) or Path(name)
+        try:
+            text = path.read_text()
+        except OSError:
+            text = ""
+        body = _body_without_frontmatter(text)
+        fm = parse_frontmatter(path) if text else {}
+
+        for item in group["items"]:
+            item["token_estimate"] = _item_tokens(item["trigger"], text, body)
+
+        group["file_tokens"] = estimate_tokens(text)
+        group["token_estimate"] = group["file_tokens"] + _ITEM_OVERHEAD_TOKENS * len(group["items"])
+        group["age_days"] = _age_days(fm)
+        group["severity"] = sum(TRIGGER_SEVERITY.get(i["trigger"], 1) for i in group["items"])
+
+    return list(groups.values())
+
+
+def _priority(group: dict, read_count: int) -> float:
+    """Utilization x staleness x trigger severity."""
+    return (1 + read_count) * (1 + group["age_days"] / 90) * group["severity"]
+
+
+def schedule_review_batches(
+    groups: list[dict],
+    *,
+    token_budget: int = DEFAULT_TOKEN_BUDGET,
+    read_counts: Optional[dict[str, int]] = None,
+) -> list[dict]:
+    """Pack per-file groups into review batches under *token_budget*.
+
+    Groups are ordered by priority (highest first) and placed first-fit
+    into the earliest batch with room, so high-priority files land in
+    early batches.  A group larger than the budget gets a batch of its
+    own with ``over_budget: True``.
+
+    Parameters
+    ----------
+    groups:
+        Output of ``group_queue_by_file``.
+    token_budget:
+        Maximum estimated tokens per batch.
+    read_counts:
+        Optional mapping of queue ``file`` value to utilization read count.
+
+    Returns
+    -------
+    list[dict]
+        ``[{"batch": int, "token_estimate": int, "over_budget": bool,
+        "files": [group, ...]}, ...]`` where each group carries an added
+        ``priority`` float.
+    """
+    read_counts = read_counts or {}
+    for group in groups:
+        group["priority"] = round(_priority(group, read_counts.get(group["file"], 0)), 3)
+
+    ordered = sorted(groups, key=lambda g: (-g["priority"], g["file"]))
+
+    batches: list[dict] = []
+    for group in ordered:
+        cost = group["token_estimate"]
+        if cost > token_budget:
+            batches.append({"token_estimate": cost, "over_budget": True, "files": [group]})
+            continue
+        for batch in batches:
+            if not batch["over_budget"] and batch["token_estimate"] + cost <= token_budget:
+                batch["files"].append(group)
+                batch["token_estimate"] += cost
+                break
+        else:
+            batches.append({"token_estimate": cost, "over_budget": False, "files": [group]})
+
+    return [{"batch": idx, **batch} for idx, batch in enumerate(batches, start=1)]
@@ -0,0 +1,194 @@
+"""Content-hash memo of Tier 2 assessments.
+
+Records the outcome of each Tier 2 LLM assessment to
+``.dewey/health/tier2-assessments.jsonl`` inside the knowledge-base root,
+keyed by file content hash and trigger name.  ``run_tier2_prescreening``
+uses the memo to suppress queue items whose file and trigger were already
+assessed and have not changed since -- the answer cannot have changed.
+
+For ``source_drift`` the hash also covers the stored fingerprints of the
+file's sources (see ``source_snapshots.py``), so a source change re-queues
+the file even when the file itself is untouched.
+
+Concurrent reviewers each append to their own shard,
+``.dewey/health/tier2-assessments.d/<writer>.jsonl`` (see ``shard_log``);
+readers merge the shards and the latest assessment wins.
+
+Only stdlib is used.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+# Ensure sibling scripts are importable
+_scripts_dir = str(Path(__file__).resolve().parent)
+if _scripts_dir not in sys.path:
+    sys.path.insert(0, _scripts_dir)
+
+from shard_log import append_record, compact_shards, locked, read_records, shard_dir
+from storage import is_writable
+
+_MEMO_DIR = Path(".dewey") / "health"
+_MEMO_FILE = "tier2-assessments.jsonl"
+
+VERDICTS = ("ok", "flag")
+
+
+def _source_fingerprints(knowledge_base_root: Path, file_path: Path) -> list[str]:
+    """Stored fingerprints of *file_path*'s frontmatter sources (may be empty)."""
+    from source_snapshots import read_source_snapshot
+    from tier2_triggers import _extract_source_urls
+    from validators import parse_frontmatter
+
+    fingerprints: list[str] = []
+    for url in _extract_source_urls(parse_frontmatter(file_path)):
+        snap = read_source_snapshot(knowledge_base_root, url)
+        fingerprints.append(f"{url}={snap.get('fingerprint') if snap else ''}")
+    return sorted(fingerprints)
+
+
+def assessment_hash(knowledge_base_root: Path, file_path: Path, trigger: str) -> str:
+    """Hash identifying the inputs a Tier 2 assessment of *trigger* depended on."""
+    digest = hashlib.sha256(file_path.read_bytes())
+    if trigger == "source_drift":
+        for fp in _source_fingerprints(knowledge_base_root, file_path):
+            digest.update(b"\0" + fp.encode())
+    return digest.hexdigest()
+
+
+def record_assessment(
+    knowledge_base_root: Path,
+    file_path: Path,
+    trigger: str,
+    verdict: str,
+    note: str = "",
+    *,
+    writer: Optional[str] = None,
+) -> Path:
+    """Append a Tier 2 assessment outcome to this writer's memo shard.
+
+    Parameters
+    ----------
+    knowledge_base_root:
+        Root directory of the knowledge base.
+    file_path:
+        The assessed knowledge file.
+    trigger:
+        Trigger name (e.g. ``"why_quality"``).
+    verdict:
+        ``"ok"`` or ``"flag"``.
+    note:
+        Optional free-form reasoning from the reviewer.
+    writer:
+        Session id naming the shard (see ``shard_log.writer_id``).
+
+    Returns
+    -------
+    Path
+        Absolute path to the shard written.
+    """
+    if verdict not in VERDICTS:
+        raise ValueError(f"verdict must be one of {VERDICTS}, got {verdict!r}")
+
+    entry = {
+        "hash": assessment_hash(knowledge_base_root, file_path, trigger),
+        "trigger": trigger,
+        "file": str(file_path),
+        "verdict": verdict,
+        "note": note,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+    }
+    return append_record(knowledge_base_root / _MEMO_DIR / _MEMO_FILE, entry, writer=writer)
+
+
+def read_assessments(knowledge_base_root: Path) -> dict[tuple[str, str], dict]:
+    """Return the latest assessment per ``(hash, trigger)``.
+
+    Idle shards of on-disk roots are compacted into the main memo first.
+    Records missing a field the memo is keyed or filtered on are skipped.
+    """
+    memo_path = knowledge_base_root / _MEMO_DIR / _MEMO_FILE
+    if is_writable(knowledge_base_root) and shard_dir(memo_path).is_dir():
+        with locked(memo_path.parent):
+            compact_shards(memo_path)
+    entries = [
+        entry for entry in read_records(memo_path)
+        if all(isinstance(entry.get(key), str) for key in ("hash", "trigger", "verdict", "timestamp"))
+    ]
+    # Stable sort: same-second assessments of one writer keep their order
+    entries.sort(key=lambda entry: entry["timestamp"])
+    return {(entry["hash"], entry["trigger"]): entry for entry in entries}
+
+
+def filter_assessed(
+    knowledge_base_root: Path,
+    queue: list[dict],
+    *,
+    ttl_days: Optional[int] = None,
+    memo: Optional[dict[tuple[str, str], dict]] = None,
+    paths: Optional[dict[str, Path]] = None,
+) -> tuple[list[dict], list[dict]]:
+    """Split *queue* into ``(pending, suppressed)`` using the memo.
+
+    An item is suppressed when an assessment exists for the same content
+    hash and trigger, and (if *ttl_days* is set) that assessment is no
+    older than *ttl_days*.  Suppressed items gain a ``memo`` key with the
+    recorded verdict and timestamp.
+
+    Pass a preloaded *memo* (from ``read_assessments``) when filtering a
+    queue piecemeal, to avoid re-reading the memo file per call.  *paths*
+    maps queue ``file`` values to path objects for knowledge bases not on
+    the local filesystem (see ``storage.py``).
+    """
+    paths = paths or {}
+    if memo is None:
+        memo = read_assessments(knowledge_base_root)
+    if not memo:
+        return queue, []
+
+    cutoff = None
+    if ttl_days is not None:
+        cutoff = (datetime.now() - timedelta(days=ttl_days)).isoformat(timespec="seconds")
+
+    hashes: dict[tuple[str, str], str] = {}
+    pending: list[dict] = []
+    suppressed: list[dict] = []
+    for item in queue:
+        key = (item["file"], item["trigger"])
+        if key not in hashes:
+            try:
+                file_path = paths.get(item["file"]) or Path(item["file"])
+                hashes[key] = assessment_hash(knowledge_base_root, file_path, item["trigger"])
+            except OSError:
+                hashes[key] = ""
+        entry = memo.get((hashes[key], item["trigger"]))
+        if entry is None or (cutoff is not None and entry["timestamp"] < cutoff):
+            pending.append(item)
+            continue
+        suppressed.append({
+            **item,
+            "memo": {"verdict": entry["verdict"], "assessed": entry["timestamp"]},
+        })
+    return pending, suppressed
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Record a Tier 2 assessment outcome.")
+    parser.add_argument("--knowledge-base-root", required=True, help="Knowledge-base root directory")
+    parser.add_argument("--file", required=True, help="Path to the assessed knowledge file")
+    parser.add_argument("--trigger", required=True, help="Trigger name, e.g. why_quality")
+    parser.add_argument("--verdict", required=True, choices=VERDICTS, help="Assessment outcome")
+    parser.add_argument("--note", default="", help="Optional reasoning")
+    args = parser.parse_args()
+
+    path = record_assessment(
+        Path(args.knowledge_base_root), Path(args.file), args.trigger, args.verdict, args.note,
+    )
+    print(f"Recorded {args.trigger} ({args.verdict}) for {args.file} in {path}")
@@ -8,18 +8,20 @@ Every trigger returns a list of dicts::
 
     {"file": str, "trigger": str, "reason": str, "context": dict}
 
-Only stdlib is used.  No network requests are made.
+Only stdlib is used.  No network requests are made; ``trigger_source_drift``
+reads offline snapshots written by ``source_snapshots.py``.
 """
 
 from __future__ import annotations
 
 import json
 import re
-import urllib.parse
 from datetime import date
 from pathlib import Path
 
-from validators import parse_frontmatter, _body_without_frontmatter, _extract_section
+from source_registry import classify_domain, frontmatter_source_entries, url_domain
+from validator_registry import DEFAULT_EXCERPT_MAX_CHARS
+from validators import parse_frontmatter, _body_without_frontmatter, _external_links, _extract_section, _read_text
 
 # ------------------------------------------------------------------
 # Depth-based expected ranges
@@ -76,19 +78,166 @@ def _compute_prose_ratio(body: str) -> float:
 
 def _extract_source_urls(fm: dict) -> list[str]:
     """Extract URLs from frontmatter sources, handling both bare and structured format."""
-    sources = fm.get("sources")
-    if not isinstance(sources, list):
-        return []
+    return [
+        url for url in frontmatter_source_entries(fm)
+        if url.startswith(("http://", "https://"))
+    ]
 
-    urls: list[str] = []
-    for entry in sources:
-        url = str(entry).strip()
-        # Handle structured format: "url: https://..." from YAML dicts
-        if url.startswith("url:"):
-            url = url[4:].strip()
-        if url.startswith(("http://", "https://")):
-            urls.append(url)
-    return urls
+
+# ------------------------------------------------------------------
+# Review excerpts
+# ------------------------------------------------------------------
+
+# Sections a reviewer needs for each trigger.  ``None`` means the whole
+# body; an empty tuple means the queue item's context (frontmatter-derived)
+# is sufficient -- source_drift compares the frontmatter sources, which
+# its context already lists.
+TRIGGER_SECTIONS: dict[str, tuple[str, ...] | None] = {
+    "source_drift": (),
+    "depth_accuracy": None,
+    "source_primacy": ("Key Guidance", "Watch Out For"),
+    "why_quality": ("Why This Matters",),
+    "concrete_examples": ("In Practice",),
+    "citation_quality": ("Key Guidance", "Watch Out For"),
+    "source_authority": (),
+    "provenance_completeness": ("Source Evaluation",),
+    "recommendation_coverage": ("Key Guidance", "Watch Out For"),
+}
+
+BODY_EXCERPT = "(body)"
+
+
+def _section_line_range(lines: list[str], start: int, heading: str) -> tuple[int, int] | None:
+    """Locate a ``## `` section in *lines* at or after index *start*.
+
+    Mirrors ``_extract_section``: case-insensitive substring match on the
+    heading, content runs to the next ``## `` or EOF.  Returns 0-based
+    ``(first, last_exclusive)`` indices of the section content.
+    """
+    first = None
+    for idx in range(start, len(lines)):
+        line = lines[idx]
+        if line.startswith("## "):
+            if first is not None:
+                return first, idx
+            if heading.lower() in line[3:].strip().lower():
+                first = idx + 1
+    if first is None:
+        return None
+    return first, len(lines)
+
+
+def _bounded_excerpt(lines: list[str], first: int, last: int, max_chars: int) -> dict:
+    """Build an excerpt dict from ``lines[first:last]``, cut at a line boundary."""
+    # Trim trailing blank lines so ranges point at real content
+    while last > first and not lines[last - 1].strip():
+        last -= 1
+    kept: list[str] = []
+    size = 0
+    cut = False
+    for idx in range(first, last):
+        line_len = len(lines[idx]) + 1
+        if kept and size + line_len > max_chars:
+            break
+        # A single over-long line is kept, sliced to the cap
+        cut = cut or len(lines[idx]) > max_chars
+        kept.append(lines[idx][:max_chars])
+        size += line_len
+    end = first + len(kept)
+    return {
+        "lines": [first + 1, max(end, first + 1)],
+        "text": "\n".join(kept),
+        "truncated": cut or end < last,
+    }
+
+
+def extract_excerpts(
+    file_path: Path,
+    sections: tuple[str, ...] | None,
+    max_chars: int = DEFAULT_EXCERPT_MAX_CHARS,
+) -> dict[str, dict]:
+    """Extract bounded excerpts for *sections* of *file_path*.
+
+    Returns ``{name: {"lines": [start, end], "text": str, "truncated": bool}}``
+    with 1-based inclusive file line numbers.  *sections* of ``None``
+    yields a single ``BODY_EXCERPT`` entry covering the body after
+    frontmatter.  ``BODY_EXCERPT`` may also be named alongside sections:
+    the named sections are then extracted only when the body excerpt is
+    truncated, since an untruncated body already contains them.
+    Missing sections are omitted.
+    """
+    lines = _read_text(file_path).split("\n")
+    body_start = 0
+    delimiters = 0
+    for idx, line in enumerate(lines):
+        if line.strip() == "---":
+            delimiters += 1
+            if delimiters == 2:
+                body_start = idx + 1
+                break
+
+    excerpts: dict[str, dict] = {}
+    if sections is None or BODY_EXCERPT in sections:
+        excerpts[BODY_EXCERPT] = _bounded_excerpt(lines, body_start, len(lines), max_chars)
+        if sections is None or not excerpts[BODY_EXCERPT]["truncated"]:
+            return excerpts
+
+    for name in sections:
+        if name == BODY_EXCERPT:
+            continue
+        found = _section_line_range(lines, body_start, name)
+        if found is not None:
+            excerpts[name] = _bounded_excerpt(lines, found[0], found[1], max_chars)
+    return excerpts
+
+
+def attach_excerpts(
+    queue: list[dict],
+    max_chars: int = DEFAULT_EXCERPT_MAX_CHARS,
+    *,
+    paths: dict[str, Path] | None = None,
+) -> dict[str, dict[str, dict]]:
+    """Collect review excerpts for *queue*, deduplicated per file.
+
+    Each queue item gains ``excerpt_refs`` -- the section names it needs
+    -- and the returned mapping ``{file: {section: excerpt}}`` holds each
+    excerpt once, however many triggers on that file refer to it.
+    *paths* maps queue ``file`` values to path objects for knowledge
+    bases not on the local filesystem (see ``storage.py``).
+    """
+    paths = paths or {}
+    wanted: dict[str, list[str]] = {}
+    for item in queue:
+        sections = TRIGGER_SECTIONS.get(item["trigger"], ())
+        current = wanted.setdefault(item["file"], [])
+        for section in (BODY_EXCERPT,) if sections is None else sections:
+            if section not in current:
+                current.append(section)
+
+    excerpts: dict[str, dict[str, dict]] = {}
+    for name, sections in wanted.items():
+        if not sections:
+            continue
+        try:
+            file_excerpts = extract_excerpts(paths.get(name) or Path(name), tuple(sections), max_chars)
+        except OSError:
+            continue
+        if file_excerpts:
+            excerpts[name] = file_excerpts
+
+    for item in queue:
+        available = excerpts.get(item["file"], {})
+        sections = TRIGGER_SECTIONS.get(item["trigger"], ())
+        body = available.get(BODY_EXCERPT)
+        if sections is None:
+            item["excerpt_refs"] = [BODY_EXCERPT] if body else []
+        elif sections and body and not body["truncated"]:
+            # Another trigger needed the whole body, and all of it fit
+            item["excerpt_refs"] = [BODY_EXCERPT]
+        else:
+            item["excerpt_refs"] = [s for s in sections if s in available]
+
+    return excerpts
 
 
 # ------------------------------------------------------------------
@@ -96,8 +245,19 @@ def _extract_source_urls(fm: dict) -> list[str]:
 # ------------------------------------------------------------------
 
 
-def trigger_source_drift(file_path: Path, max_age_days: int = 90) -> list[dict]:
-    """Trigger when ``last_validated`` is missing or older than *max_age_days*.
+def trigger_source_drift(
+    file_path: Path,
+    max_age_days: int = 90,
+    *,
+    knowledge_base_root: Path | None = None,
+) -> list[dict]:
+    """Trigger when sources changed since ``last_validated``, or content is old.
+
+    When *knowledge_base_root* is given and every source URL has a
+    snapshot in ``.dewey/sources/`` (see ``source_snapshots.py``), the
+    trigger fires only if a source fingerprint changed after
+    ``last_validated``.  Otherwise it falls back to the age check: fire
+    when ``last_validated`` is missing or older than *max_age_days*.
 
     Context includes source URLs so the LLM can fetch and compare.
     """
@@ -137,6 +297,34 @@ def trigger_source_drift(file_path: Path, max_age_days: int = 90) -> list[dict]:
         return results
 
     age_days = (date.today() - validated_date).days
+
+    if knowledge_base_root is not None and source_urls:
+        from source_snapshots import source_drift_status
+
+        statuses = {
+            url: source_drift_status(knowledge_base_root, url, validated_date.isoformat())
+            for url in source_urls
+        }
+        changed_urls = [url for url, s in statuses.items() if s == "changed"]
+        if changed_urls:
+            results.append({
+                "file": name,
+                "trigger": "source_drift",
+                "reason": (
+                    f"{len(changed_urls)} source(s) changed since last validation"
+                    f" on {last_validated}"
+                ),
+                "context": {
+                    "last_validated": str(last_validated),
+                    "age_days": age_days,
+                    "source_urls": source_urls,
+                    "changed_sources": changed_urls,
+                },
+            })
+            return results
+        if all(s == "stable" for s in statuses.values()):
+            return results
+
     if age_days > max_age_days:
         results.append({
             "file": name,
@@ -162,7 +350,7 @@ def trigger_depth_accuracy(file_path: Path) -> list[dict]:
     if depth not in DEPTH_WORD_RANGES:
         return results
 
-    text = file_path.read_text()
+    text = _read_text(file_path)
     body = _body_without_frontmatter(text)
     word_count = _count_words(body)
     prose_ratio = _compute_prose_ratio(body)
@@ -213,7 +401,7 @@ def trigger_source_primacy(file_path: Path) -> list[dict]:
     if fm.get("depth") != "working":
         return results
 
-    text = file_path.read_text()
+    text = _read_text(file_path)
     body = _body_without_frontmatter(text)
 
     sections_checked: list[str] = []
@@ -227,11 +415,11 @@ def trigger_source_primacy(file_path: Path) -> list[dict]:
         sections_checked.append(section_name)
 
         # Count recommendation items (list items starting with - or *)
-        items = re.findall(r"^[\s]*[-*]\s+", section, re.MULTILINE)
+        items = re.findall(r"^[ \t]*[-*]\s", section, re.MULTILINE)
         recommendation_count += len(items)
 
         # Count external markdown links
-        links = re.findall(r"\[([^\]]*)\]\((https?://[^)]+)\)", section)
+        links = _external_links(section)
         inline_source_count += len(links)
 
     if not sections_checked or recommendation_count == 0:
@@ -275,7 +463,7 @@ def trigger_why_quality(file_path: Path, min_words: int = 50) -> list[dict]:
     if fm.get("depth") != "working":
         return results
 
-    text = file_path.read_text()
+    text = _read_text(file_path)
     body = _body_without_frontmatter(text)
     section = _extract_section(body, "Why This Matters")
 
@@ -313,7 +501,7 @@ def trigger_concrete_examples(file_path: Path) -> list[dict]:
     if fm.get("depth") != "working":
         return results
 
-    text = file_path.read_text()
+    text = _read_text(file_path)
     body = _body_without_frontmatter(text)
     section = _extract_section(body, "In Practice")
 
@@ -335,7 +523,7 @@ def trigger_concrete_examples(file_path: Path) -> list[dict]:
         return results
 
     has_code_block = "```" in section
-    has_table = bool(re.search(r"^\s*\|", section, re.MULTILINE))
+    has_table = bool(re.search(r"^[ \t]*\|", section, re.MULTILINE))
     has_numeric_example = bool(re.search(r"\d+(\.\d+)?%|\$\d|\d{2,}", section))
     section_word_count = _count_words(section)
 
@@ -371,7 +559,7 @@ def trigger_citation_quality(file_path: Path) -> list[dict]:
     if fm.get("depth") != "working":
         return results
 
-    text = file_path.read_text()
+    text = _read_text(file_path)
     body = _body_without_frontmatter(text)
 
     url_counts: dict[str, int] = {}
@@ -380,8 +568,7 @@ def trigger_citation_quality(file_path: Path) -> list[dict]:
         section = _extract_section(body, section_name)
         if section is None:
             continue
-        links = re.findall(r"\[([^\]]*)\]\((https?://[^)]+)\)", section)
-        for _text, url in links:
+        for _text, url in _external_links(section):
             url_counts[url] = url_counts.get(url, 0) + 1
 
     if not url_counts:
@@ -413,44 +600,6 @@ def trigger_citation_quality(file_path: Path) -> list[dict]:
 # Source quality triggers
 # ------------------------------------------------------------------
 
-_AUTHORITATIVE_DOMAINS = {
-    "w3.org",
-    "ietf.org",
-    "rfc-editor.org",
-    "python.org",
-    "developer.mozilla.org",
-}
-
-_AUTHORITATIVE_SUFFIXES = (
-    ".gov",
-    ".edu",
-    ".ac.uk",
-)
-
-_COMMUNITY_DOMAINS = {
-    "medium.com",
-    "dev.to",
-    "substack.com",
-    "wordpress.com",
-    "blogspot.com",
-    "stackoverflow.com",
-    "reddit.com",
-    "news.ycombinator.com",
-}
-
-
-def _classify_domain(netloc: str) -> str:
-    """Classify a domain as 'authoritative', 'community', or 'other'."""
-    if netloc in _AUTHORITATIVE_DOMAINS:
-        return "authoritative"
-    for suffix in _AUTHORITATIVE_SUFFIXES:
-        if netloc.endswith(suffix):
-            return "authoritative"
-    if netloc in _COMMUNITY_DOMAINS:
-        return "community"
-    return "other"
-
-
 def trigger_source_authority(file_path: Path) -> list[dict]:
     """Trigger when all source URLs are community-tier (no authoritative anchor).
 
@@ -469,10 +618,7 @@ def trigger_source_authority(file_path: Path) -> list[dict]:
 
     classifications: dict[str, str] = {}
     for url in source_urls:
-        netloc = urllib.parse.urlparse(url).netloc
-        if netloc.startswith("www."):
-            netloc = netloc[4:]
-        classifications[url] = _classify_domain(netloc)
+        classifications[url] = classify_domain(url_domain(url))
 
     has_authoritative = any(c == "authoritative" for c in classifications.values())
 
@@ -505,7 +651,7 @@ def trigger_provenance_completeness(file_path: Path) -> list[dict]:
     if fm.get("depth") != "working":
         return results
 
-    text = file_path.read_text()
+    text = _read_text(file_path)
     body = _body_without_frontmatter(text)
     section = _extract_section(body, "Source Evaluation")
 
@@ -593,7 +739,7 @@ def trigger_recommendation_coverage(file_path: Path) -> list[dict]:
     if fm.get("depth") != "working":
         return results
 
-    text = file_path.read_text()
+    text = _read_text(file_path)
     body = _body_without_frontmatter(text)
 
     total_recs = 0
@@ -608,7 +754,7 @@ def trigger_recommendation_coverage(file_path: Path) -> list[dict]:
             # Match list items
             if re.match(r"^\s*[-*]\s+", line):
                 total_recs += 1
-                if re.search(r"\[[^\]]*\]\(https?://[^)]+\)", line):
+                if _external_links(line):
                     cited_recs += 1
 
     if total_recs == 0:
@@ -4,15 +4,47 @@ Records when knowledge-base files are referenced to ``.dewey/utilization/log.jso
 inside the knowledge-base root.  This data feeds into utilization-aware health scoring
 and curation recommendations.
 
+Each writer (agent session or process) appends to its own shard,
+``.dewey/utilization/log.d/<writer>.jsonl``, with one lock-free
+``O_APPEND`` write per event.  Readers merge the shards, and idle shards
+are compacted into ``log.jsonl`` (see ``shard_log``).
+
+Repeated reads of one file within a session window are collapsed into a
+single counted event (see ``record_session_reference``).  Each writer
+keeps its open sessions in its own file under its own lock, so parallel
+sessions never wait on each other.
+
+Reads are served from ``.dewey/utilization/rollup.json``: per-file totals,
+daily counts for the last 90 days and an exponentially decayed score,
+caught up from the log incrementally (see ``read_rollup``).
+
 Only stdlib is used.
 """
 
 from __future__ import annotations
 
 import json
-from datetime import datetime
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Callable
 
+_scripts_dir = str(Path(__file__).resolve().parent)
+if _scripts_dir not in sys.path:
+    sys.path.insert(0, _scripts_dir)
+
+from shard_log import (
+    COMPACT_IDLE_SECONDS,
+    append_record,
+    compact_shards,
+    locked,
+    log_sources,
+    parse_lines,
+    writer_id,
+)
 
 _LOG_DIR = Path(".dewey") / "utilization"
 _LOG_FILE = "log.jsonl"
@@ -22,8 +54,10 @@ def record_reference(
     knowledge_base_root: Path,
     file_path: str,
     context: str = "user",
+    *,
+    writer: str | None = None,
 ) -> Path:
-    """Append a reference entry to the utilization log.
+    """Append a reference entry to this writer's utilization log shard.
 
     Parameters
     ----------
@@ -36,60 +70,414 @@ def record_reference(
     context:
         Free-form label describing *how* the file was referenced.
         Defaults to ``"user"``.
+    writer:
+        Session id naming the shard.  Defaults to
+        ``shard_log.writer_id()``: ``$DEWEY_LOG_WRITER``, else host and
+        parent process id.
 
     Returns
     -------
     Path
-        Absolute path to the log file.
+        Absolute path to the shard written.
     """
-    log_dir = knowledge_base_root / _LOG_DIR
-    log_dir.mkdir(parents=True, exist_ok=True)
-
-    log_path = log_dir / _LOG_FILE
-
     entry = {
         "file": file_path,
         "timestamp": datetime.now().isoformat(timespec="seconds"),
         "context": context,
     }
+    return append_record(knowledge_base_root / _LOG_DIR / _LOG_FILE, entry, writer=writer)
+
+
+_SESSION_DIR = "sessions.d"
+
+# Repeat reads in one session before ``sample_every`` kicks in.
+_HOT_SESSION_READS = 20
+
+
+def _valid_session(session: object) -> bool:
+    """True if *session* has every field ``record_session_reference`` reads."""
+    if not isinstance(session, dict):
+        return False
+    try:
+        datetime.fromisoformat(session["start"])
+        for key in ("first", "last"):
+            if session[key] is not None:
+                datetime.fromisoformat(session[key])
+    except (KeyError, TypeError, ValueError):
+        return False
+    return (
+        isinstance(session.get("count"), int)
+        and isinstance(session.get("context"), str)
+        and (session["count"] == 0 or session["first"] is not None and session["last"] is not None)
+    )
+
+
+def _load_sessions(path: Path) -> dict:
+    """One writer's open sessions, ``{file: session}``; malformed entries are dropped."""
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {fp: session for fp, session in data.items() if _valid_session(session)}
+
+
+def _repeat_entry(file_path: str, session: dict) -> dict:
+    """The counted log entry for a session's repeat reads."""
+    return {
+        "file": file_path,
+        "timestamp": session["first"],
+        "last": session["last"],
+        "count": session["count"],
+        "context": session["context"],
+    }
+
+
+def record_session_reference(
+    knowledge_base_root: Path,
+    file_path: str,
+    *,
+    context: str = "hook",
+    window_seconds: float = 60,
+    sample_every: int = 1,
+    now: datetime | None = None,
+    rng: Callable[[], float] = random.random,
+    writer: str | None = None,
+) -> None:
+    """Record a read, collapsing repeats within a session window.
+
+    The first read of *file_path* is appended to the log right away.
+    Repeat reads within *window_seconds* of it are counted in the
+    writer's own ``.dewey/utilization/sessions.d/<writer>.json``, so
+    only one agent's re-reads collapse -- another session reading the
+    same file starts its own -- and concurrent sessions share no lock.
+    When the session expires (checked on the writer's every call), they
+    are appended as one entry carrying ``count`` and ``last``; a writer
+    that stops reading is flushed by ``read_rollup`` once idle.
+    ``read_rollup`` adds pending repeats, so reported counts stay exact.
+    The session file is rewritten before its flushed repeats are logged,
+    so a concurrent ``read_rollup`` may miss a repeat entry for a moment
+    but never counts it both as pending and as logged.
+
+    With *sample_every* N > 1, once a session has ``_HOT_SESSION_READS``
+    repeats, each further read is recorded with probability 1/N and a
+    weight of N, which keeps the count unbiased.
+
+    A *window_seconds* of 0 appends every read (``record_reference``).
+    Log entries go to *writer*'s shard.
+    """
+    if window_seconds <= 0:
+        record_reference(knowledge_base_root, file_path, context=context, writer=writer)
+        return
+    now = now or datetime.now()
+    ts = now.isoformat(timespec="seconds")
+    log_dir = knowledge_base_root / _LOG_DIR
+    session_dir = log_dir / _SESSION_DIR
+    writer = writer_id(writer)
+    session_path = session_dir / f"{writer}.json"
+
+    with locked(session_dir, lock_file=f"{writer}.lock"):
+        sessions = _load_sessions(session_path)
+        current = sessions.get(file_path)
+        lines: list[dict] = []
+        if (
+            current is not None
+            and current.get("context") == context
+            and _days_between(current["start"], ts) * 86400 <= window_seconds
+        ):
+            weight = 1
+            if sample_every > 1 and current["count"] >= _HOT_SESSION_READS:
+                if rng() >= 1 / sample_every:
+                    return
+                weight = sample_every
+            current["first"] = current["first"] or ts
+            current["last"] = ts
+            current["count"] += weight
+        else:
+            sessions[file_path] = {"start": ts, "first": None, "last": None, "count": 0, "context": context}
+            lines.append({"file": file_path, "timestamp": ts, "context": context})
+            if current is not None and current["count"]:
+                lines.insert(0, _repeat_entry(file_path, current))
+
+        for other, session in list(sessions.items()):
+            if other != file_path and _days_between(session["start"], ts) * 86400 > window_seconds:
+                del sessions[other]
+                if session["count"]:
+                    lines.append(_repeat_entry(other, session))
+
+        tmp = session_path.with_name(session_path.name + ".tmp")
+        tmp.write_text(json.dumps(sessions))
+        os.replace(tmp, session_path)
+        for line in lines:
+            append_record(log_dir / _LOG_FILE, line, writer=writer)
+
+
+def _flush_idle_sessions(log_dir: Path, idle_seconds: float = COMPACT_IDLE_SECONDS) -> None:
+    """Log the pending repeats of writers idle for *idle_seconds*.
+
+    A writer flushes its own expired sessions on its next read; one that
+    never reads again would otherwise keep them pending forever.
+    """
+    session_dir = log_dir / _SESSION_DIR
+    if not session_dir.is_dir():
+        return
+    cutoff = time.time() - idle_seconds
+
+    def _idle(path: Path) -> bool:
+        try:
+            return path.stat().st_mtime <= cutoff
+        except FileNotFoundError:
+            return False
+
+    # Active writers are skipped without waiting on their lock
+    for path in [p for p in sorted(session_dir.glob("*.json")) if _idle(p)]:
+        with locked(session_dir, lock_file=f"{path.stem}.lock"):
+            if not _idle(path):
+                continue
+            sessions = _load_sessions(path)
+            path.unlink()
+            for fp, session in sessions.items():
+                if session["count"]:
+                    append_record(log_dir / _LOG_FILE, _repeat_entry(fp, session), writer=path.stem)
+
+
+def _fold_pending_sessions(log_dir: Path, files: dict) -> None:
+    """Add repeat reads still pending in open sessions to *files* (not persisted)."""
+    session_dir = log_dir / _SESSION_DIR
+    for path in sorted(session_dir.glob("*.json")) if session_dir.is_dir() else ():
+        for fp, session in _load_sessions(path).items():
+            if session["count"]:
+                _fold_event(files, fp, session["first"], session["count"], session["last"])
+
+
+_ROLLUP_FILE = "rollup.json"
+_ROLLUP_FORMAT = 2
+
+# Bytes of each log source remembered to detect a replaced file.
+_HEAD_BYTES = 128
+
+# Rolling windows reported per file and per area, in days.  Daily counts
+# older than the longest window are pruned, so a file's rollup stays
+# bounded however long the log grows.
+WINDOWS = (7, 30, 90)
 
-    with log_path.open("a") as fh:
-        fh.write(json.dumps(entry) + "\n")
+# Half-life of the exponentially decayed read score.
+DECAY_HALF_LIFE_DAYS = 30.0
 
-    return log_path
+
+def _decay(score: float, days: float) -> float:
+    return score * 0.5 ** (days / DECAY_HALF_LIFE_DAYS)
+
+
+def _days_between(earlier: str, later: str) -> float:
+    delta = datetime.fromisoformat(later) - datetime.fromisoformat(earlier)
+    return delta.total_seconds() / 86400
+
+
+def _fold_event(files: dict, fp: str, ts: str, count: int = 1, last: str | None = None) -> None:
+    """Add *count* reads of *fp*, starting at *ts*, to the per-file rollup state."""
+    last = last or ts
+    entry = files.get(fp)
+    if entry is None:
+        entry = files[fp] = {"count": 0, "first": ts, "last": last, "days": {}, "decay": 0.0, "decay_at": ts}
+    entry["count"] += count
+    entry["first"] = min(entry["first"], ts)
+    entry["last"] = max(entry["last"], last)
+    day = ts[:10]
+    entry["days"][day] = entry["days"].get(day, 0) + count
+    if ts >= entry["decay_at"]:
+        entry["decay"] = _decay(entry["decay"], _days_between(entry["decay_at"], ts)) + count
+        entry["decay_at"] = ts
+    else:
+        entry["decay"] += _decay(float(count), _days_between(ts, entry["decay_at"]))
+
+
+def _empty_rollup() -> dict:
+    return {"sources": {}, "files": {}}
+
+
+def _load_rollup(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return _empty_rollup()
+    if not isinstance(data, dict) or data.get("format") != _ROLLUP_FORMAT:
+        return _empty_rollup()
+    return data
+
+
+def _fold_lines(files: dict, data: bytes) -> None:
+    """Fold the complete, well-formed log lines in *data* into *files*."""
+    for entry in parse_lines(data):
+        try:
+            fp, ts = entry["file"], entry["timestamp"]
+            count, last = int(entry.get("count", 1)), entry.get("last")
+            datetime.fromisoformat(ts)
+            if last is not None:
+                datetime.fromisoformat(last)
+        except (KeyError, TypeError, ValueError):
+            continue
+        _fold_event(files, fp, ts, count, last)
+
+
+def _fold_sources(log_dir: Path, state: dict) -> bool:
+    """Fold every log source past its recorded offset; True if anything was read.
+
+    Offsets and the first ``_HEAD_BYTES`` consumed are kept per source
+    (main log and each shard).  If any source was truncated, replaced or
+    removed behind our back, every source is re-read from the start.
+    """
+    sources = {path.relative_to(log_dir).as_posix(): path for path in log_sources(log_dir / _LOG_FILE)}
+    marks = state["sources"]
+    heads = {}
+    for name, path in sources.items():
+        with path.open("rb") as fh:
+            heads[name] = fh.read(_HEAD_BYTES).decode("latin-1")
+    if set(marks) - set(sources) or any(
+        sources[name].stat().st_size < mark["offset"] or not heads[name].startswith(mark["head"])
+        for name, mark in marks.items()
+    ):
+        state.update(_empty_rollup())
+        marks = state["sources"]
+
+    changed = False
+    for name, path in sources.items():
+        offset = marks.get(name, {}).get("offset", 0)
+        with path.open("rb") as fh:
+            fh.seek(offset)
+            data = fh.read()
+        # A trailing partial line is still being appended; leave it for next time
+        tail = data.rfind(b"\n") + 1
+        if tail:
+            _fold_lines(state["files"], data[:tail])
+            offset += tail
+            marks[name] = {"offset": offset, "head": heads[name][:offset]}
+            changed = True
+    return changed
+
+
+def _prune(files: dict, now: datetime) -> bool:
+    """Drop day buckets older than the longest window; True if any were."""
+    horizon = (now - timedelta(days=max(WINDOWS) - 1)).date().isoformat()
+    pruned = False
+    for entry in files.values():
+        stale = [day for day in entry["days"] if day < horizon]
+        for day in stale:
+            del entry["days"][day]
+        pruned = pruned or bool(stale)
+    return pruned
+
+
+def _catch_up(knowledge_base_root: Path, now: datetime) -> dict:
+    """Fold log lines appended since the last call into the stored rollup.
+
+    Pending repeats of idle writers are logged first.  Only complete
+    lines past each source's recorded byte offset are read.  Idle shards
+    are then compacted into the main log; their lines were
+    already folded, so the main log's offset moves past them.  The rollup
+    is persisted, under the log lock, for on-disk roots only.
+
+    The returned state also counts repeats pending in open sessions.
+    They are read after the log, still under the log lock, so no other
+    reader's idle flush can move them into the log in between.
+    """
+    from storage import is_writable
+
+    log_dir = knowledge_base_root / _LOG_DIR
+    if not (is_writable(knowledge_base_root) and log_dir.is_dir()):
+        state = _empty_rollup()
+        for source in log_sources(log_dir / _LOG_FILE):
+            _fold_lines(state["files"], source.read_bytes())
+        _prune(state["files"], now)
+        _fold_pending_sessions(log_dir, state["files"])
+        return state
+
+    log_path = log_dir / _LOG_FILE
+    rollup_path = log_dir / _ROLLUP_FILE
+    with locked(log_dir):
+        _flush_idle_sessions(log_dir)
+        state = _load_rollup(rollup_path)
+        changed = _fold_sources(log_dir, state)
+
+        def _fold_rest(shard: Path, data: bytes) -> None:
+            mark = state["sources"].pop(shard.relative_to(log_dir).as_posix(), {"offset": 0})
+            _fold_lines(state["files"], data[mark["offset"]:])
+
+        if compact_shards(log_path, on_compact=_fold_rest) and log_path.exists():
+            with log_path.open("rb") as fh:
+                head = fh.read(_HEAD_BYTES).decode("latin-1")
+            state["sources"][_LOG_FILE] = {"offset": log_path.stat().st_size, "head": head}
+            changed = True
+        changed = _prune(state["files"], now) or changed
+
+        if changed:
+            tmp = rollup_path.with_name(rollup_path.name + ".tmp")
+            tmp.write_text(json.dumps({"format": _ROLLUP_FORMAT, **state}))
+            os.replace(tmp, rollup_path)
+        _fold_pending_sessions(log_dir, state["files"])
+    return state
+
+
+def _area_of(file_path: str) -> str | None:
+    """``docs/<area>/<file>.md`` -> ``<area>``; None for files outside an area."""
+    parts = file_path.split("/")
+    return parts[1] if len(parts) >= 3 else None
+
+
+def read_rollup(knowledge_base_root: Path, *, now: datetime | None = None) -> dict:
+    """Windowed and decayed read counts per file and per area.
+
+    Maintained incrementally in ``.dewey/utilization/rollup.json``: each
+    call folds only the log lines appended since the previous call, so
+    the cost of a query grows with the number of files, not of events.
+
+    Returns
+    -------
+    dict
+        ``{"files": {path: stats}, "areas": {area: stats}}`` where file
+        stats are ``{"count", "first_referenced", "last_referenced",
+        "reads_7d", "reads_30d", "reads_90d", "decayed_reads"}`` and area
+        stats carry the same counts summed over the area's files.
+        ``decayed_reads`` halves every ``DECAY_HALF_LIFE_DAYS``.
+    """
+    now = now or datetime.now()
+    state = _catch_up(knowledge_base_root, now)
+    today = now.date()
+    starts = {days: (today - timedelta(days=days - 1)).isoformat() for days in WINDOWS}
+    now_ts = now.isoformat(timespec="seconds")
+
+    files: dict[str, dict] = {}
+    areas: dict[str, dict] = {}
+    for fp, entry in state["files"].items():
+        stats = {
+            "count": entry["count"],
+            "first_referenced": entry["first"],
+            "last_referenced": entry["last"],
+        }
+        for days, start in starts.items():
+            stats[f"reads_{days}d"] = sum(n for day, n in entry["days"].items() if day >= start)
+        age = _days_between(entry["decay_at"], now_ts)
+        stats["decayed_reads"] = round(_decay(entry["decay"], max(age, 0.0)), 4)
+        files[fp] = stats
+
+        area = _area_of(fp)
+        if area is not None:
+            totals = areas.setdefault(area, dict.fromkeys(
+                ["count", *(f"reads_{days}d" for days in WINDOWS), "decayed_reads"], 0,
+            ))
+            for key in totals:
+                totals[key] += stats[key]
+    for totals in areas.values():
+        totals["decayed_reads"] = round(totals["decayed_reads"], 4)
+    return {"files": files, "areas": areas}
 
 
 def read_utilization(knowledge_base_root: Path) -> dict[str, dict]:
     """Read utilization stats per file.
 
     Returns mapping of file path to
-    {"count": int, "first_referenced": str, "last_referenced": str}.
+    {"count": int, "first_referenced": str, "last_referenced": str},
+    plus the windowed counts of ``read_rollup``.
     """
-    log_file = knowledge_base_root / ".dewey" / "utilization" / "log.jsonl"
-    if not log_file.exists():
-        return {}
-
-    lines = log_file.read_text().strip().split("\n")
-    if not lines or lines == [""]:
-        return {}
-
-    stats: dict[str, dict] = {}
-    for line in lines:
-        entry = json.loads(line)
-        fp = entry["file"]
-        ts = entry["timestamp"]
-
-        if fp not in stats:
-            stats[fp] = {
-                "count": 0,
-                "first_referenced": ts,
-                "last_referenced": ts,
-            }
-
-        stats[fp]["count"] += 1
-        if ts < stats[fp]["first_referenced"]:
-            stats[fp]["first_referenced"] = ts
-        if ts > stats[fp]["last_referenced"]:
-            stats[fp]["last_referenced"] = ts
-
-    return stats
+    return read_rollup(knowledge_base_root)["files"]
@@ -0,0 +1,263 @@
+"""Registry of Tier 1 validators and Tier 2 triggers, imported on demand.
+
+Each entry declares where its function lives and what it needs, so the
+runner can decide what to run without importing anything:
+
+- ``scope`` -- ``per-file`` (called once per knowledge file),
+  ``structural`` (checks the directory layout) or ``cross-file``
+  (compares files against each other or against AGENTS.md / the plan)
+- ``cost`` -- ``cheap``, ``moderate``, ``expensive`` or ``network``;
+  ``network`` entries are opt-in (``--check-links``)
+- ``inputs`` -- the derived data the function reads: ``size`` (from
+  ``stat``), ``frontmatter``, ``body``, ``stripped_body`` (body with
+  code and inline formatting removed), ``shingles``, ``link_graph``,
+  ``tree`` (directory listing), ``history``, ``agents_md``,
+  ``curation_plan``, ``network``.  Files over the size limit reach only
+  per-file validators whose sole input is ``size``
+- ``args`` / ``kwargs`` -- names from the run context passed after the
+  file (per-file) or as the whole argument list (structural, cross-file)
+
+``select`` narrows a run with ``--only`` / ``--skip`` selectors, each a
+validator or trigger name, a scope or a cost class.  ``required_inputs``
+tells the runner what the selection reads, so a frontmatter-only audit
+never loads whole bodies.  ``load`` imports a validator's module the
+first time it is selected, so a narrow invocation never pays for
+modules it does not use.
+
+Only stdlib is used.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Callable
+
+SCOPES = ("per-file", "structural", "cross-file")
+COST_CLASSES = ("cheap", "moderate", "expensive", "network")
+
+# Default cap on each Tier 2 excerpt; here so callers need not import the triggers.
+DEFAULT_EXCERPT_MAX_CHARS = 4000
+
+# Tier 1, in run order.
+VALIDATORS: dict[str, dict] = {
+    "check_file_size": {
+        "module": "validators", "scope": "per-file", "cost": "cheap",
+        "inputs": ("size",),
+    },
+    "check_frontmatter": {
+        "module": "validators", "scope": "per-file", "cost": "cheap",
+        "inputs": ("frontmatter",),
+    },
+    "check_section_ordering": {
+        "module": "validators", "scope": "per-file", "cost": "cheap",
+        "inputs": ("frontmatter", "body"),
+    },
+    "check_cross_references": {
+        "module": "validators", "scope": "per-file", "cost": "cheap",
+        "inputs": ("body",), "args": ("knowledge_base_root",),
+    },
+    "check_size_bounds": {
+        "module": "validators", "scope": "per-file", "cost": "cheap",
+        "inputs": ("frontmatter", "body"),
+    },
+    "check_source_urls": {
+        "module": "validators", "scope": "per-file", "cost": "cheap",
+        "inputs": ("frontmatter",),
+    },
+    "check_freshness": {
+        "module": "validators", "scope": "per-file", "cost": "cheap",
+        "inputs": ("frontmatter",),
+    },
+    "check_section_completeness": {
+        "module": "validators", "scope": "per-file", "cost": "cheap",
+        "inputs": ("frontmatter", "body"),
+    },
+    "check_heading_hierarchy": {
+        "module": "validators", "scope": "per-file", "cost": "cheap",
+        "inputs": ("body",),
+    },
+    "check_go_deeper_links": {
+        "module": "validators", "scope": "per-file", "cost": "cheap",
+        "inputs": ("frontmatter", "body"),
+    },
+    "check_ref_see_also": {
+        "module": "validators", "scope": "per-file", "cost": "cheap",
+        "inputs": ("body",),
+    },
+    "check_readability": {
+        "module": "validators", "scope": "per-file", "cost": "moderate",
+        "inputs": ("frontmatter", "stripped_body"),
+    },
+    "check_placeholder_comments": {
+        "module": "validators", "scope": "per-file", "cost": "cheap",
+        "inputs": ("body",),
+    },
+    "check_source_diversity": {
+        "module": "validators", "scope": "per-file", "cost": "cheap",
+        "inputs": ("frontmatter",),
+    },
+    "check_citation_grounding": {
+        "module": "validators", "scope": "per-file", "cost": "moderate",
+        "inputs": ("frontmatter", "body"),
+    },
+    "check_source_accessibility": {
+        "module": "validators", "scope": "per-file", "cost": "network",
+        "inputs": ("frontmatter", "network"),
+    },
+    "check_coverage": {
+        "module": "validators", "scope": "structural", "cost": "cheap",
+        "inputs": ("tree",), "args": ("knowledge_base_root",), "kwargs": ("knowledge_dir_name",),
+    },
+    "check_index_sync": {
+        "module": "validators", "scope": "structural", "cost": "cheap",
+        "inputs": ("tree",), "args": ("knowledge_base_root",), "kwargs": ("knowledge_dir_name",),
+    },
+    "check_inventory_regression": {
+        "module": "validators", "scope": "structural", "cost": "cheap",
+        "inputs": ("history",), "args": ("knowledge_base_root", "file_list"),
+    },
+    "check_manifest_sync": {
+        "module": "cross_validators", "scope": "cross-file", "cost": "moderate",
+        "inputs": ("frontmatter", "agents_md"), "args": ("knowledge_base_root",), "kwargs": ("knowledge_dir_name",),
+    },
+    "check_curation_plan_sync": {
+        "module": "cross_validators", "scope": "cross-file", "cost": "cheap",
+        "inputs": ("tree", "curation_plan"), "args": ("knowledge_base_root",), "kwargs": ("knowledge_dir_name",),
+    },
+    "check_proposal_integrity": {
+        "module": "cross_validators", "scope": "cross-file", "cost": "cheap",
+        "inputs": ("frontmatter",), "args": ("knowledge_base_root",), "kwargs": ("knowledge_dir_name",),
+    },
+    "check_link_graph": {
+        "module": "cross_validators", "scope": "cross-file", "cost": "expensive",
+        "inputs": ("link_graph",), "args": ("knowledge_base_root",), "kwargs": ("knowledge_dir_name",),
+    },
+    "check_duplicate_content": {
+        "module": "cross_validators", "scope": "cross-file", "cost": "expensive",
+        "inputs": ("body", "shingles"), "args": ("knowledge_base_root",),
+        "kwargs": ("knowledge_dir_name", "cache_shingles"),
+    },
+    "check_naming_conventions": {
+        "module": "cross_validators", "scope": "cross-file", "cost": "cheap",
+        "inputs": ("tree",), "args": ("knowledge_base_root",), "kwargs": ("knowledge_dir_name",),
+    },
+}
+
+# Tier 2, in run order.  All are per-file.
+TRIGGERS: dict[str, dict] = {
+    "trigger_source_drift": {
+        "module": "tier2_triggers", "scope": "per-file", "cost": "cheap",
+        "inputs": ("frontmatter",), "kwargs": ("knowledge_base_root",),
+    },
+    "trigger_depth_accuracy": {
+        "module": "tier2_triggers", "scope": "per-file", "cost": "cheap",
+        "inputs": ("frontmatter", "body"),
+    },
+    "trigger_source_primacy": {
+        "module": "tier2_triggers", "scope": "per-file", "cost": "cheap",
+        "inputs": ("frontmatter", "body"),
+    },
+    "trigger_why_quality": {
+        "module": "tier2_triggers", "scope": "per-file", "cost": "cheap",
+        "inputs": ("frontmatter", "body"),
+    },
+    "trigger_concrete_examples": {
+        "module": "tier2_triggers", "scope": "per-file", "cost": "cheap",
+        "inputs": ("frontmatter", "body"),
+    },
+    "trigger_citation_quality": {
+        "module": "tier2_triggers", "scope": "per-file", "cost": "cheap",
+        "inputs": ("frontmatter", "body"),
+    },
+    "trigger_source_authority": {
+        "module": "tier2_triggers", "scope": "per-file", "cost": "cheap",
+        "inputs": ("frontmatter",),
+    },
+    "trigger_provenance_completeness": {
+        "module": "tier2_triggers", "scope": "per-file", "cost": "cheap",
+        "inputs": ("frontmatter", "body"),
+    },
+    "trigger_recommendation_coverage": {
+        "module": "tier2_triggers", "scope": "per-file", "cost": "cheap",
+        "inputs": ("frontmatter", "body"),
+    },
+}
+
+
+def _spec(name: str) -> dict:
+    """The registry entry for *name* (a validator or a trigger)."""
+    spec = VALIDATORS.get(name) or TRIGGERS.get(name)
+    if spec is None:
+        raise KeyError(f"Unknown validator or trigger: {name}")
+    return spec
+
+
+def tier1_validators(*, include_network: bool = False) -> list[str]:
+    """Tier 1 validator names in run order; ``network`` ones only on request."""
+    return [
+        name for name, spec in VALIDATORS.items()
+        if include_network or spec["cost"] != "network"
+    ]
+
+
+def tier2_triggers() -> list[str]:
+    """Tier 2 trigger names in run order."""
+    return list(TRIGGERS)
+
+
+def _matches(name: str, selector: str) -> bool:
+    spec = _spec(name)
+    return selector in (name, spec["scope"], spec["cost"])
+
+
+def unknown_selectors(selectors) -> list[str]:
+    """Selectors that name no validator, trigger, scope or cost class."""
+    known = {*VALIDATORS, *TRIGGERS, *SCOPES, *COST_CLASSES}
+    return [selector for selector in selectors if selector not in known]
+
+
+def select(names: list[str], *, only=(), skip=()) -> list[str]:
+    """*names* matching any *only* selector (all when empty) and no *skip* selector."""
+    return [
+        name for name in names
+        if (not only or any(_matches(name, sel) for sel in only))
+        and not any(_matches(name, sel) for sel in skip)
+    ]
+
+
+def select_validators(*, only=(), skip=(), include_network: bool = False) -> list[str]:
+    """Tier 1 validators for a run, in run order.
+
+    ``network`` validators join when *include_network* is set or when
+    *only* names one of them (or the ``network`` class) explicitly.
+    """
+    include_network = include_network or any(
+        sel == "network" or VALIDATORS.get(sel, {}).get("cost") == "network" for sel in only
+    )
+    return select(tier1_validators(include_network=include_network), only=only, skip=skip)
+
+
+def required_inputs(names: list[str]) -> set[str]:
+    """Union of the ``inputs`` declared by *names*."""
+    return {item for name in names for item in _spec(name)["inputs"]}
+
+
+def reads_content(name: str) -> bool:
+    """Whether *name* reads the file, rather than only its size."""
+    return tuple(_spec(name)["inputs"]) != ("size",)
+
+
+def load(name: str) -> Callable[..., list[dict]]:
+    """Import and return the function registered as *name*."""
+    return getattr(importlib.import_module(_spec(name)["module"]), name)
+
+
+def bind(name: str, context: dict) -> tuple[tuple, dict]:
+    """``(args, kwargs)`` for calling *name*, drawn from the run *context*.
+
+    For per-file entries the args follow the file path.
+    """
+    spec = _spec(name)
+    args = tuple(context[key] for key in spec.get("args", ()))
+    kwargs = {key: context[key] for key in spec.get("kwargs", ())}
+    return args, kwargs
@@ -11,9 +11,21 @@ from __future__ import annotations
 
 import hashlib
 import re
-import urllib.parse
+import sys
+from contextlib import contextmanager
 from datetime import date
 from pathlib import Path
+from typing import Iterator
+
+# templates.py lives in curate/scripts/ — add it to sys.path for cross-skill import.
+_curate_scripts = str(Path(__file__).resolve().parent.parent.parent / "curate" / "scripts")
+if _curate_scripts not in sys.path:
+    sys.path.insert(0, _curate_scripts)
+
+from config import DEFAULT_MAX_FILE_BYTES
+from literal_scan import find_literals
+from source_registry import frontmatter_source_entries, url_domain
+from templates import PLACEHOLDER_SETS
 
 # ------------------------------------------------------------------
 # Shared helpers
@@ -85,30 +97,168 @@ def _extract_section(body: str, heading: str) -> str | None:
 
 def _strip_fenced_code_blocks(text: str) -> str:
     """Replace fenced code block content with blank lines (preserves line count)."""
-    lines = text.split("\n")
-    result: list[str] = []
+    return "\n".join(_unfenced_lines(text.split("\n")))
+
+
+def _unfenced_lines(lines) -> Iterator[str]:
+    """*lines* with fence markers and fenced content blanked."""
     in_fence = False
     for line in lines:
         stripped = line.strip()
         if stripped.startswith("```"):
             in_fence = not in_fence
-            result.append("")
+            yield ""
         elif in_fence:
-            result.append("")
+            yield ""
         else:
-            result.append(line)
-    return "\n".join(result)
+            yield line
 
 
-def parse_frontmatter(file_path: Path) -> dict:
-    """Parse YAML-like frontmatter between ``---`` delimiters.
+# Link and image syntax ``[text](target)``.  The text excludes ``[`` and the
+# target excludes ``(`` (one balanced pair allowed, as in Wikipedia URLs)
+# and newlines, so every match attempt stops at the next bracket: matching
+# stays linear on pathological input such as thousands of unclosed ``[``.
+_LINK_RE = re.compile(r"\[([^\[\]]*)\]\(((?:[^()\n]|\([^()\n]*\))+)\)")
 
-    Returns a dict with simple ``key: value`` pairs.  List values
-    (``sources``) are collected from subsequent ``  - item`` lines.
-    No third-party YAML library is required.
+
+def _external_links(text: str) -> list[tuple[str, str]]:
+    """``(link_text, url)`` for every ``[text](http...)`` link in *text*."""
+    return [
+        (label, target) for label, target in _LINK_RE.findall(text)
+        if target.startswith(("http://", "https://"))
+    ]
+
+
+# ------------------------------------------------------------------
+# File size limit
+# ------------------------------------------------------------------
+
+# Files larger than this are not read: ``check_file_size`` fails them and
+# the runner keeps them from every other validator.  ``size_limit``
+# overrides it for a run (``health_max_file_bytes`` in config.json).
+_max_file_bytes: int | None = DEFAULT_MAX_FILE_BYTES
+
+
+@contextmanager
+def size_limit(max_bytes: int | None) -> Iterator[None]:
+    """Use *max_bytes* as the file size limit inside the block (*None*: no limit)."""
+    global _max_file_bytes
+    previous = _max_file_bytes
+    _max_file_bytes = max_bytes
+    try:
+        yield
+    finally:
+        _max_file_bytes = previous
+
+
+def within_size_limit(file_path: Path) -> bool:
+    """Whether *file_path* is small enough for validators to read."""
+    return _max_file_bytes is None or file_path.stat().st_size <= _max_file_bytes
+
+
+# ------------------------------------------------------------------
+# Shared reads
+# ------------------------------------------------------------------
+
+# Set inside ``shared_reads``: {"body": bool, "text": {...}, "frontmatter": {...}}
+_shared: dict | None = None
+
+
+@contextmanager
+def shared_reads(*, body: bool = True) -> Iterator[None]:
+    """Let validators called inside the block share file reads.
+
+    Each file's text and frontmatter are computed once and reused.  Pass
+    ``body=False`` when no selected validator reads past the frontmatter,
+    so ``parse_frontmatter`` keeps streaming each file only up to its
+    closing ``---`` (as it does outside the block) instead of loading
+    the whole file for later validators.
     """
-    text = file_path.read_text()
-    lines = text.split("\n")
+    global _shared
+    previous = _shared
+    _shared = {"body": body, "text": {}, "frontmatter": {}}
+    try:
+        yield
+    finally:
+        _shared = previous
+
+
+def _read_text(file_path: Path) -> str:
+    """``file_path.read_text()``, shared within ``shared_reads``."""
+    if _shared is None:
+        return file_path.read_text()
+    key = str(file_path)
+    if key not in _shared["text"]:
+        _shared["text"][key] = file_path.read_text()
+    return _shared["text"][key]
+
+
+def _text_in_memory(file_path: Path) -> bool:
+    """Whether *file_path*'s whole text is (or will be) loaded anyway."""
+    return _shared is not None and (_shared["body"] or str(file_path) in _shared["text"])
+
+
+def _iter_lines(file_path: Path) -> Iterator[str]:
+    """The file's lines without line endings, streamed unless already in memory."""
+    if _text_in_memory(file_path):
+        yield from _read_text(file_path).splitlines()
+        return
+    with file_path.open() as fh:
+        for line in fh:
+            yield line.rstrip("\n")
+
+
+def _body_lines(file_path: Path) -> Iterator[str]:
+    """Lines of ``_body_without_frontmatter``, streamed like ``_iter_lines``."""
+    held: list[str] = []
+    delimiters = 0
+    for line in _iter_lines(file_path):
+        if delimiters == 2:
+            yield line
+            continue
+        held.append(line)
+        if line.strip() == "---":
+            delimiters += 1
+            if delimiters == 2:
+                held = []
+    # Without both delimiters the whole text is body
+    yield from held
+
+
+def _h2_headings(file_path: Path) -> list[str]:
+    """Text of every ``## `` heading line, frontmatter included."""
+    headings = []
+    for line in _iter_lines(file_path):
+        match = re.match(r"^##\s+(.+)$", line)
+        if match:
+            headings.append(match.group(1))
+    return headings
+
+
+def _frontmatter_lines(file_path: Path) -> list[str] | None:
+    """Lines between the first two ``---`` lines, or *None* without both.
+
+    Reads the whole text when it is (or will be) needed anyway; otherwise
+    streams the file and stops at the closing delimiter, or gives up
+    once it has read more than the file size limit.
+    """
+    if _text_in_memory(file_path):
+        lines = _read_text(file_path).split("\n")
+    else:
+        lines = []
+        with file_path.open() as fh:
+            delimiters = 0
+            consumed = 0
+            for line in fh:
+                consumed += len(line)
+                if _max_file_bytes is not None and consumed > _max_file_bytes:
+                    return None
+                line = line.rstrip("\n")
+                lines.append(line)
+                if line.strip() == "---":
+                    delimiters += 1
+                    if delimiters == 2:
+                        break
 
     # Find the two --- delimiters
     delimiter_indices: list[int] = []
@@ -119,10 +269,29 @@ def parse_frontmatter(file_path: Path) -> dict:
                 break
 
     if len(delimiter_indices) < 2:
-        return {}
+        return None
+    return lines[delimiter_indices[0] + 1 : delimiter_indices[1]]
+
+
+def parse_frontmatter(file_path: Path) -> dict:
+    """Parse YAML-like frontmatter between ``---`` delimiters.
 
-    fm_lines = lines[delimiter_indices[0] + 1 : delimiter_indices[1]]
+    Returns a dict with simple ``key: value`` pairs.  List values
+    (``sources``) are collected from subsequent ``  - item`` lines.
+    No third-party YAML library is required.
+    """
+    if _shared is not None and str(file_path) in _shared["frontmatter"]:
+        return _shared["frontmatter"][str(file_path)]
 
+    fm_lines = _frontmatter_lines(file_path)
+    result = _parse_frontmatter_lines(fm_lines) if fm_lines is not None else {}
+    if _shared is not None:
+        _shared["frontmatter"][str(file_path)] = result
+    return result
+
+
+def _parse_frontmatter_lines(fm_lines: list[str]) -> dict:
+    """The ``key: value`` / list-item parse behind ``parse_frontmatter``."""
     result: dict = {}
     current_key: str | None = None
 
@@ -156,6 +325,18 @@ def parse_frontmatter(file_path: Path) -> dict:
 # ------------------------------------------------------------------
 
 
+def check_file_size(file_path: Path) -> list[dict]:
+    """Fail files over the size limit, which no other validator reads."""
+    if within_size_limit(file_path):
+        return []
+    size = file_path.stat().st_size
+    return [{
+        "file": str(file_path),
+        "message": f"File is {size} bytes, over the {_max_file_bytes}-byte limit; not validated",
+        "severity": "fail",
+    }]
+
+
 def check_frontmatter(file_path: Path) -> list[dict]:
     """Validate that required frontmatter fields are present and valid."""
     issues: list[dict] = []
@@ -206,8 +387,7 @@ def check_section_ordering(file_path: Path) -> list[dict]:
     if fm.get("depth") != "working":
         return issues
 
-    text = file_path.read_text()
-    headings = re.findall(r"^##\s+(.+)$", text, re.MULTILINE)
+    headings = _h2_headings(file_path)
 
     in_practice_idx: int | None = None
     key_guidance_idx: int | None = None
@@ -232,10 +412,10 @@ def check_cross_references(file_path: Path, knowledge_base_root: Path) -> list[d
     """Check that internal markdown links point to existing files."""
     issues: list[dict] = []
     name = str(file_path)
-    text = file_path.read_text()
+    text = _read_text(file_path)
 
     # Match [text](path) — exclude URLs (http/https), anchors (#), and mailto
-    links = re.findall(r"\[([^\]]*)\]\(([^)]+)\)", text)
+    links = _LINK_RE.findall(text)
     for _link_text, target in links:
         target = target.strip()
         # Skip external URLs, anchors, and mailto
@@ -266,7 +446,7 @@ def check_size_bounds(file_path: Path) -> list[dict]:
     if depth not in _SIZE_BOUNDS:
         return issues
 
-    line_count = len(file_path.read_text().splitlines())
+    line_count = sum(1 for _ in _iter_lines(file_path))
     lo, hi = _SIZE_BOUNDS[depth]
 
     if line_count < lo:
@@ -362,19 +542,8 @@ def check_source_urls(file_path: Path) -> list[dict]:
     issues: list[dict] = []
     name = str(file_path)
     fm = parse_frontmatter(file_path)
-    sources = fm.get("sources")
 
-    if not isinstance(sources, list):
-        return issues
-
-    for entry in sources:
-        url = str(entry).strip()
-        # Handle structured format: "url: https://..." from YAML dicts
-        if url.startswith("url:"):
-            url = url[4:].strip()
-        # Skip placeholder comments
-        if "<!--" in url:
-            continue
+    for url in frontmatter_source_entries(fm):
         if not url.startswith(("http://", "https://")):
             issues.append({
                 "file": name,
@@ -476,7 +645,7 @@ def check_section_completeness(file_path: Path) -> list[dict]:
         expected = _OVERVIEW_SECTIONS
     elif depth == "reference":
         # Reference files just need a non-empty body
-        text = file_path.read_text()
+        text = _read_text(file_path)
         body = _body_without_frontmatter(text).strip()
         if not body:
             issues.append({
@@ -488,8 +657,7 @@ def check_section_completeness(file_path: Path) -> list[dict]:
     else:
         return issues
 
-    text = file_path.read_text()
-    headings = re.findall(r"^##\s+(.+)$", text, re.MULTILINE)
+    headings = _h2_headings(file_path)
     heading_lower = [h.lower() for h in headings]
 
     for section in expected:
@@ -507,13 +675,9 @@ def check_heading_hierarchy(file_path: Path) -> list[dict]:
     """Check heading structure: exactly one H1, no skipped levels."""
     issues: list[dict] = []
     name = str(file_path)
-    text = file_path.read_text()
-    body = _body_without_frontmatter(text)
-    body = _strip_fenced_code_blocks(body)
-
     # Extract heading levels from lines starting with #
     levels: list[int] = []
-    for line in body.split("\n"):
+    for line in _unfenced_lines(_body_lines(file_path)):
         match = re.match(r"^(#{1,6})\s+", line)
         if match:
             levels.append(len(match.group(1)))
@@ -557,7 +721,7 @@ def check_go_deeper_links(file_path: Path) -> list[dict]:
     if fm.get("depth") != "working":
         return issues
 
-    text = file_path.read_text()
+    text = _read_text(file_path)
     body = _body_without_frontmatter(text)
     section = _extract_section(body, "Go Deeper")
 
@@ -594,7 +758,7 @@ def check_ref_see_also(file_path: Path) -> list[dict]:
     if not file_path.name.endswith(".ref.md"):
         return issues
 
-    text = file_path.read_text()
+    text = _read_text(file_path)
     body = _body_without_frontmatter(text)
 
     # Check for "see also" text (case-insensitive)
@@ -650,18 +814,21 @@ def _count_syllables(word: str) -> int:
 def _strip_markdown_formatting(text: str) -> str:
     """Remove markdown inline formatting, keeping plain text.
 
-    Handles images, links, bold, italic, and inline code.
+    Handles images, links, bold, italic, and inline code.  No span may
+    contain its own delimiter, so every substitution is linear in the
+    text; a lazy ``.+?`` would rescan the rest of the line from each
+    unclosed marker.
     """
     # Images: ![alt](url) -> ''
-    text = re.sub(r"!\[[^\]]*\]\([^)]+\)", "", text)
+    text = re.sub("!" + _LINK_RE.pattern, "", text)
     # Links: [text](url) -> text
-    text = re.sub(r"\[([^\]]*)\]\([^)]+\)", r"\1", text)
+    text = _LINK_RE.sub(r"\1", text)
     # Bold: **text** or __text__ -> text
-    text = re.sub(r"\*\*(.+?)\*\*", r"\1", text)
-    text = re.sub(r"__(.+?)__", r"\1", text)
+    text = re.sub(r"\*\*([^*\n]+)\*\*", r"\1", text)
+    text = re.sub(r"__([^_\n]+)__", r"\1", text)
     # Italic: *text* or _text_ -> text
-    text = re.sub(r"\*(.+?)\*", r"\1", text)
-    text = re.sub(r"(?<!\w)_(.+?)_(?!\w)", r"\1", text)
+    text = re.sub(r"\*([^*\n]+)\*", r"\1", text)
+    text = re.sub(r"(?<!\w)_([^_\n]+)_(?!\w)", r"\1", text)
     # Inline code: `code` -> code
     text = re.sub(r"`([^`]+)`", r"\1", text)
     return text
@@ -704,7 +871,7 @@ def check_readability(file_path: Path) -> list[dict]:
     if depth not in _FK_GRADE_BOUNDS:
         return issues
 
-    text = file_path.read_text()
+    text = _read_text(file_path)
     body = _body_without_frontmatter(text)
     body = _strip_fenced_code_blocks(body)
     body = _strip_markdown_formatting(body)
@@ -734,18 +901,9 @@ def check_readability(file_path: Path) -> list[dict]:
 # Source quality validators
 # ------------------------------------------------------------------
 
-_PLACEHOLDER_PATTERNS = [
-    "<!-- placeholder -->",
-    "<!-- Add primary source URL -->",
-    "<!-- Add source title -->",
-    "<!-- Explain why this topic is important in your domain -->",
-    "<!-- Describe how this topic is applied day-to-day -->",
-    "<!-- Actionable recommendations and best practices -->",
-    "<!-- Common pitfalls, anti-patterns, and mistakes -->",
-    "<!-- Complete during research step: source scoring table and provenance block -->",
-    "<!-- Quick-reference notes: keep terse and scannable -->",
-    "<!-- Links to primary sources, books, talks, and further reading -->",
-]
+# Built from the template catalog so new template placeholders are detected
+# without touching this module.
+_PLACEHOLDER_PATTERNS = [p for group in PLACEHOLDER_SETS.values() for p in group]
 
 # Markers to exclude — these are managed-section or provenance markers, not placeholders
 _MANAGED_MARKERS = [
@@ -759,12 +917,10 @@ def check_placeholder_comments(file_path: Path) -> list[dict]:
     """Detect unfilled template placeholders left in a file."""
     issues: list[dict] = []
     name = str(file_path)
-    text = file_path.read_text()
+    text = _read_text(file_path)
 
-    found: list[str] = []
-    for pattern in _PLACEHOLDER_PATTERNS:
-        if pattern in text:
-            found.append(pattern)
+    present = find_literals(text, _PLACEHOLDER_PATTERNS)
+    found = [pattern for pattern in _PLACEHOLDER_PATTERNS if pattern in present]
 
     # Cap at 5 warnings per file
     for placeholder in found[:5]:
@@ -779,22 +935,11 @@ def check_placeholder_comments(file_path: Path) -> list[dict]:
 
 def _extract_source_domains(fm: dict) -> list[str]:
     """Extract normalized domains from frontmatter source URLs."""
-    sources = fm.get("sources")
-    if not isinstance(sources, list):
-        return []
-
     domains: list[str] = []
-    for entry in sources:
-        url = str(entry).strip()
-        if url.startswith("url:"):
-            url = url[4:].strip()
-        if "<!--" in url:
-            continue
+    for url in frontmatter_source_entries(fm):
         if not url.startswith(("http://", "https://")):
             continue
-        netloc = urllib.parse.urlparse(url).netloc
-        if netloc.startswith("www."):
-            netloc = netloc[4:]
+        netloc = url_domain(url)
         if netloc:
             domains.append(netloc)
     return domains
@@ -834,17 +979,15 @@ def check_citation_grounding(file_path: Path) -> list[dict]:
     if not fm_domains:
         return issues
 
-    text = file_path.read_text()
+    text = _read_text(file_path)
     body = _body_without_frontmatter(text)
 
     # Extract inline external URLs: [text](https://...)
-    inline_urls = re.findall(r"\[[^\]]*\]\((https?://[^)]+)\)", body)
+    inline_urls = [url for _text, url in _external_links(body)]
 
     count = 0
     for url in inline_urls:
-        netloc = urllib.parse.urlparse(url).netloc
-        if netloc.startswith("www."):
-            netloc = netloc[4:]
+        netloc = url_domain(url)
         if netloc not in fm_domains:
             issues.append({
                 "file": name,
@@ -870,17 +1013,8 @@ def check_source_accessibility(file_path: Path, *, timeout: int = 10) -> list[di
     issues: list[dict] = []
     name = str(file_path)
     fm = parse_frontmatter(file_path)
-    sources = fm.get("sources")
-
-    if not isinstance(sources, list):
-        return issues
 
-    for entry in sources:
-        url = str(entry).strip()
-        if url.startswith("url:"):
-            url = url[4:].strip()
-        if "<!--" in url:
-            continue
+    for url in frontmatter_source_entries(fm):
         if not url.startswith(("http://", "https://")):
             continue
 
@@ -0,0 +1,110 @@
+"""Memory bounds — one oversized file must not set a run's peak memory.
+
+A knowledge base of ordinary topics gains a multi-megabyte export.  The
+peak traced allocation of a health run must stay within a small
+multiple of the configured ``health_max_file_bytes``, not grow with the
+export.  Likewise, near-duplicate candidate search must not hold more
+than the packed shingle arrays it is given.  ``tracemalloc`` counts
+allocations, so the assertions do not depend on the machine; one
+untraced run first keeps module imports out of the measurement.
+"""
+
+import json
+import random
+import shutil
+import tempfile
+import tracemalloc
+import unittest
+from array import array
+from pathlib import Path
+
+from check_knowledge_base import run_health_check, run_tier2_prescreening
+from cross_validators import _similarity_candidates
+
+_LIMIT = 100_000
+_EXPORT_BYTES = 20_000_000
+
+_TOPIC = """\
+---
+sources:
+  - https://example.com/doc
+last_validated: 2026-01-01
+relevance: core
+depth: working
+---
+
+# Topic {n}
+
+## Why This Matters
+Reason {n}.
+
+## In Practice
+Practice {n}.
+"""
+
+
+def _peak_bytes(fn, *args, **kwargs) -> int:
+    """Peak traced allocation while calling *fn*."""
+    tracemalloc.start()
+    try:
+        fn(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+class TestOversizedFileMemory(unittest.TestCase):
+    """Peak memory follows the size limit, not the largest file."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = Path(tempfile.mkdtemp())
+        area = cls.tmpdir / "docs" / "area"
+        area.mkdir(parents=True)
+        for n in range(20):
+            (area / f"topic-{n}.md").write_text(_TOPIC.format(n=n))
+        line = "[" * 99 + "\n"
+        with (area / "export.md").open("w") as fh:
+            fh.write(_TOPIC.format(n="export"))
+            for _ in range(_EXPORT_BYTES // len(line)):
+                fh.write(line)
+        (cls.tmpdir / ".dewey").mkdir()
+        (cls.tmpdir / ".dewey" / "config.json").write_text(json.dumps({"health_max_file_bytes": _LIMIT}))
+        run_health_check(cls.tmpdir, _persist_history=False)
+        run_tier2_prescreening(cls.tmpdir, excerpts=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmpdir)
+
+    def test_tier1_peak_is_bounded_by_limit(self):
+        peak = _peak_bytes(run_health_check, self.tmpdir, _persist_history=False)
+        self.assertLess(peak, 10 * _LIMIT)
+
+    def test_tier2_peak_is_bounded_by_limit(self):
+        peak = _peak_bytes(run_tier2_prescreening, self.tmpdir, excerpts=True)
+        self.assertLess(peak, 10 * _LIMIT)
+
+
+
+class TestSimilarityCandidateMemory(unittest.TestCase):
+    """Prefix filtering keeps no per-shingle state for unshared content."""
+
+    def test_peak_is_below_packed_shingles(self):
+        rng = random.Random(7)
+        sets = [array("Q", sorted({rng.getrandbits(64) for _ in range(1000)})) for _ in range(60)]
+        sets[1] = array("Q", sorted(set(sets[0][:900]) | {rng.getrandbits(64) for _ in range(100)}))
+        packed = sum(len(shingles) for shingles in sets) * sets[0].itemsize
+        _similarity_candidates(sets[:2], 0.4)
+        tracemalloc.start()
+        try:
+            pairs = _similarity_candidates(sets, 0.4)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(pairs, [(0, 1)])
+        self.assertLess(peak, packed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+"""Algorithmic scaling tests — operation counts must grow near-linearly.
+
+Each operation runs against generated knowledge bases of increasing size
+while file reads, stat calls and Jaccard comparisons are counted.  The
+growth exponent between consecutive sizes, log(ops2 / ops1) / log(n2 / n1),
+must stay within the bound declared in ``BOUNDS``.  Counting operations
+instead of timing them keeps the tests deterministic, and an accidental
+all-pairs loop (exponent 2) fails loudly.
+
+Sizes are 100 and 1,000 files; set ``DEWEY_SCALING_FULL=1`` to add
+5,000 (slow).
+"""
+
+import math
+import os
+import random
+import shutil
+import string
+import tempfile
+import unittest
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import patch
+
+import cross_validators
+from check_knowledge_base import generate_recommendations, run_health_check
+from scaffold import rebuild_index
+
+SIZES = (100, 1000, 5000) if os.environ.get("DEWEY_SCALING_FULL") == "1" else (100, 1000)
+
+# Allowed growth exponent per operation and counter (1 = linear).
+BOUNDS = {
+    "run_health_check": {"reads": 1, "stats": 1, "jaccard": 1},
+    "check_duplicate_content": {"reads": 1, "stats": 1, "jaccard": 1},
+    "check_link_graph": {"reads": 1, "stats": 1},
+    "rebuild_index": {"reads": 1, "stats": 1},
+    "generate_recommendations": {"reads": 1, "stats": 1},
+}
+
+# Slack on the exponent for constant overheads at small sizes.
+_TOLERANCE = 0.15
+
+_TOPICS_PER_AREA = 19
+
+
+def _generate_knowledge_base(root: Path, file_count: int, seed: int = 0) -> None:
+    """Write a knowledge base of about *file_count* topic files.
+
+    Areas hold an overview and ``_TOPICS_PER_AREA`` topics of random
+    prose that link to each other.  Each area has one near-duplicate
+    topic pair, so similarity checks have real work that grows with the
+    knowledge base.  Every topic has a utilization log entry.
+    """
+    rng = random.Random(seed)
+    vocab = ["".join(rng.choices(string.ascii_lowercase, k=7)) for _ in range(5000)]
+    log_lines = []
+    for a in range((file_count + _TOPICS_PER_AREA) // (_TOPICS_PER_AREA + 1)):
+        area = root / "docs" / f"area-{a}"
+        area.mkdir(parents=True)
+        topics = [f"topic-{a}-{t}" for t in range(_TOPICS_PER_AREA)]
+        rows = "\n".join(f"| [{t}]({t}.md) | {rng.choice(vocab)} |" for t in topics)
+        (area / "overview.md").write_text(
+            f"---\nsources:\n  - https://example.com/{a}\nlast_validated: 2026-09-01\n"
+            f"relevance: core\ndepth: overview\n---\n\n# Area {a}\n\n"
+            f"## What This Covers\n\n{' '.join(rng.choices(vocab, k=30))}\n\n"
+            f"## How It's Organized\n\n| Topic | Description |\n|---|---|\n{rows}\n"
+        )
+        shared = rng.choices(vocab, k=60)
+        for i, topic in enumerate(topics):
+            words = shared[:-3] + rng.choices(vocab, k=3) if i < 2 else rng.choices(vocab, k=60)
+            link = rng.choice(topics)
+            (area / f"{topic}.md").write_text(
+                f"---\nsources:\n  - https://example.com/{topic}\nlast_validated: 2026-09-01\n"
+                f"relevance: core\ndepth: working\n---\n\n# {topic}\n\n"
+                f"## Why This Matters\n\n{' '.join(words)} [source](https://example.com/{topic})\n\n"
+                f"## In Practice\n\nSee [{link}]({link}.md).\n\n"
+                f"## Key Guidance\n\n- {rng.choice(vocab)}\n\n## Watch Out For\n\n- {rng.choice(vocab)}\n\n"
+                f"## Go Deeper\n\n- [{link}]({link}.md)\n"
+            )
+            log_lines.append(
+                f'{{"file": "docs/area-{a}/{topic}.md", "timestamp": "2026-10-01T00:00:00", "context": "hook"}}\n'
+            )
+    log_dir = root / ".dewey" / "utilization"
+    log_dir.mkdir(parents=True)
+    (log_dir / "log.jsonl").write_text("".join(log_lines))
+
+
+@contextmanager
+def _counting():
+    """Count file reads, stat calls and Jaccard comparisons inside the block."""
+    counts: Counter = Counter()
+
+    def _wrap(original, key):
+        def counted(*args, **kwargs):
+            counts[key] += 1
+            return original(*args, **kwargs)
+        return counted
+
+    with patch.object(Path, "read_text", _wrap(Path.read_text, "reads")), \
+            patch.object(Path, "read_bytes", _wrap(Path.read_bytes, "reads")), \
+            patch.object(Path, "open", _wrap(Path.open, "reads")), \
+            patch.object(Path, "stat", _wrap(Path.stat, "stats")), \
+            patch.object(cross_validators, "_jaccard", _wrap(cross_validators._jaccard, "jaccard")):
+        yield counts
+
+
+class TestOperationCounts(unittest.TestCase):
+    """Operation counts per validator and curate operation, across sizes."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _measure(self, operation) -> dict[int, Counter]:
+        """Counts for *operation* on a freshly generated knowledge base per size."""
+        measured = {}
+        for size in SIZES:
+            root = self.tmpdir / str(size)
+            _generate_knowledge_base(root, size)
+            with _counting() as counts:
+                operation(root)
+            measured[size] = counts
+        return measured
+
+    def _assert_growth(self, name: str, operation) -> None:
+        measured = self._measure(operation)
+        for counter, bound in BOUNDS[name].items():
+            for small, large in zip(SIZES, SIZES[1:]):
+                before, after = max(measured[small][counter], 1), max(measured[large][counter], 1)
+                exponent = math.log(after / before) / math.log(large / small)
+                with self.subTest(counter=counter, sizes=(small, large)):
+                    self.assertLessEqual(
+                        exponent, bound + _TOLERANCE,
+                        f"{name}: {counter} grew {before} -> {after} (exponent {exponent:.2f}, bound {bound})",
+                    )
+
+    def test_run_health_check(self):
+        self._assert_growth("run_health_check", lambda root: run_health_check(root, _persist_history=False))
+
+    def test_check_duplicate_content(self):
+        self._assert_growth("check_duplicate_content", cross_validators.check_duplicate_content)
+
+    def test_check_link_graph(self):
+        self._assert_growth("check_link_graph", cross_validators.check_link_graph)
+
+    def test_rebuild_index(self):
+        self._assert_growth("rebuild_index", rebuild_index)
+
+    def test_generate_recommendations(self):
+        self._assert_growth("generate_recommendations", generate_recommendations)
+
+    def test_near_duplicates_are_still_found(self):
+        root = self.tmpdir / "kb"
+        _generate_knowledge_base(root, 100)
+        with _counting() as counts:
+            issues = cross_validators.check_duplicate_content(root)
+        similar = [i for i in issues if i["message"].startswith("High similarity")]
+        self.assertEqual(len(similar), 5)
+        self.assertLessEqual(counts["jaccard"], 2 * len(similar))
+
+
+if __name__ == "__main__":
+    unittest.main()
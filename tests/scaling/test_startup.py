@@ -0,0 +1,83 @@
+"""CLI start-up cost — narrow invocations must not import unused validators.
+
+Each case runs ``check_knowledge_base.py`` in a fresh interpreter and
+reads back which modules were loaded and how long the run took.  The
+assertions are on the module set, which is deterministic; the measured
+time appears in failure messages.
+"""
+
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+_SCRIPT = Path(__file__).resolve().parents[2] / "dewey" / "skills" / "health" / "scripts" / "check_knowledge_base.py"
+
+# Runs the CLI as __main__, then reports sys.modules and elapsed time on stderr.
+_WRAPPER = """
+import json, os, runpy, sys, time
+start = time.perf_counter()
+sys.argv = sys.argv[1:]
+script = sys.argv[0]
+sys.path.insert(0, os.path.dirname(script))
+try:
+    runpy.run_path(script, run_name="__main__")
+finally:
+    ms = (time.perf_counter() - start) * 1000
+    print(json.dumps({"modules": sorted(sys.modules), "ms": ms}), file=sys.stderr)
+"""
+
+
+def _run_cli(*cli_args: str) -> tuple[set[str], float]:
+    """``(modules_loaded, elapsed_ms)`` for one CLI run."""
+    proc = subprocess.run(
+        [sys.executable, "-c", _WRAPPER, str(_SCRIPT), *cli_args],
+        capture_output=True, text=True, check=True,
+    )
+    report = json.loads(proc.stderr.strip().splitlines()[-1])
+    return set(report["modules"]), report["ms"]
+
+
+class TestStartupImports(unittest.TestCase):
+    """Which modules each CLI mode loads."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = Path(tempfile.mkdtemp())
+        topic = cls.tmpdir / "docs" / "area" / "topic.md"
+        topic.parent.mkdir(parents=True)
+        topic.write_text("---\nsources:\n  - https://example.com\ndepth: working\n---\n\n# Topic\n")
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmpdir)
+
+    def _assert_not_imported(self, run: tuple[set[str], float], unwanted: set[str]) -> None:
+        modules, ms = run
+        loaded = sorted(unwanted & modules)
+        self.assertEqual(loaded, [], f"unexpected imports {loaded} (run took {ms:.0f} ms)")
+
+    def test_recommendations_skip_validators_and_triggers(self):
+        run = _run_cli("--knowledge-base-root", str(self.tmpdir), "--recommendations")
+        self.assertIn("utilization", run[0])
+        self._assert_not_imported(run, {
+            "cross_validators", "tier2_triggers", "auto_fix", "history",
+            "source_snapshots", "tier2_memo", "tier2_batches", "similarity",
+        })
+
+    def test_tier1_skips_tier2_and_auto_fix(self):
+        run = _run_cli("--knowledge-base-root", str(self.tmpdir))
+        self.assertIn("cross_validators", run[0])
+        self._assert_not_imported(run, {"tier2_triggers", "auto_fix", "tier2_memo", "tier2_batches"})
+
+    def test_tier2_skips_cross_validators(self):
+        run = _run_cli("--knowledge-base-root", str(self.tmpdir), "--tier2")
+        self.assertIn("tier2_triggers", run[0])
+        self._assert_not_imported(run, {"cross_validators", "auto_fix", "similarity"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,7 +6,14 @@ import tempfile
 import unittest
 from pathlib import Path
 
-from config import read_knowledge_dir, write_config
+from config import (
+    DEFAULT_MAX_FILE_BYTES,
+    read_knowledge_dir,
+    read_manifest_budget,
+    read_max_file_bytes,
+    read_utilization_settings,
+    write_config,
+)
 
 
 class TestReadKnowledgeDir(unittest.TestCase):
@@ -93,6 +100,86 @@ class TestWriteConfig(unittest.TestCase):
         data = json.loads((self.tmpdir / ".dewey" / "config.json").read_text())
         self.assertEqual(data["knowledge_dir"], "docs")
 
+    def test_preserves_other_keys(self):
+        """Rewriting knowledge_dir keeps keys like manifest_token_budget."""
+        write_config(self.tmpdir, "docs", manifest_token_budget=1500)
+        write_config(self.tmpdir, "kb")
+        data = json.loads((self.tmpdir / ".dewey" / "config.json").read_text())
+        self.assertEqual(data, {"knowledge_dir": "kb", "manifest_token_budget": 1500})
+
+
+class TestReadManifestBudget(unittest.TestCase):
+    """Tests for read_manifest_budget."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_missing_config_is_flat(self):
+        self.assertIsNone(read_manifest_budget(self.tmpdir))
+
+    def test_roundtrip(self):
+        write_config(self.tmpdir, "docs", manifest_token_budget=2000)
+        self.assertEqual(read_manifest_budget(self.tmpdir), 2000)
+
+    def test_invalid_values_ignored(self):
+        for value in ("2000", 0, -5, None):
+            config = self.tmpdir / ".dewey" / "config.json"
+            config.parent.mkdir(exist_ok=True)
+            config.write_text(json.dumps({"knowledge_dir": "docs", "manifest_token_budget": value}))
+            self.assertIsNone(read_manifest_budget(self.tmpdir))
+
+
+class TestReadUtilizationSettings(unittest.TestCase):
+    """Tests for read_utilization_settings."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.config = self.tmpdir / ".dewey" / "config.json"
+        self.config.parent.mkdir()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_defaults(self):
+        self.assertEqual(read_utilization_settings(self.tmpdir), {"session_window_seconds": 60, "sample_every": 1})
+
+    def test_overrides(self):
+        self.config.write_text(json.dumps({"utilization_session_window_seconds": 0, "utilization_sample_every": 10}))
+        self.assertEqual(read_utilization_settings(self.tmpdir), {"session_window_seconds": 0, "sample_every": 10})
+
+    def test_invalid_values_ignored(self):
+        self.config.write_text(json.dumps({"utilization_session_window_seconds": -1, "utilization_sample_every": 0}))
+        self.assertEqual(read_utilization_settings(self.tmpdir), {"session_window_seconds": 60, "sample_every": 1})
+
+
+class TestReadMaxFileBytes(unittest.TestCase):
+    """Tests for read_max_file_bytes."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.config = self.tmpdir / ".dewey" / "config.json"
+        self.config.parent.mkdir()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_default(self):
+        self.assertEqual(read_max_file_bytes(self.tmpdir), DEFAULT_MAX_FILE_BYTES)
+
+    def test_override_and_zero_disables(self):
+        self.config.write_text(json.dumps({"health_max_file_bytes": 5000}))
+        self.assertEqual(read_max_file_bytes(self.tmpdir), 5000)
+        self.config.write_text(json.dumps({"health_max_file_bytes": 0}))
+        self.assertIsNone(read_max_file_bytes(self.tmpdir))
+
+    def test_invalid_values_ignored(self):
+        for value in ("5000", -1, True, None):
+            self.config.write_text(json.dumps({"health_max_file_bytes": value}))
+            self.assertEqual(read_max_file_bytes(self.tmpdir), DEFAULT_MAX_FILE_BYTES)
+
 
 if __name__ == "__main__":
     unittest.main()
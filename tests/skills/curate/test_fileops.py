@@ -0,0 +1,109 @@
+"""Tests for skills.curate.scripts.fileops — concurrency-safe writes."""
+
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from fileops import create_exclusive, kb_lock, write_atomic
+
+
+def _bump_counter(root: str, times: int) -> None:
+    counter = Path(root) / "counter.json"
+    for _ in range(times):
+        with kb_lock(Path(root)):
+            value = json.loads(counter.read_text())["n"]
+            write_atomic(counter, json.dumps({"n": value + 1}))
+
+
+class TestWriteAtomic(unittest.TestCase):
+    """Tests for write_atomic."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_replaces_content_and_leaves_no_temp_files(self):
+        target = self.tmpdir / "AGENTS.md"
+        target.write_text("old")
+        write_atomic(target, "new")
+        self.assertEqual(target.read_text(), "new")
+        self.assertEqual([p.name for p in self.tmpdir.iterdir()], ["AGENTS.md"])
+
+    def test_new_files_honour_umask(self):
+        old = os.umask(0o022)
+        try:
+            write_atomic(self.tmpdir / "index.md", "x")
+        finally:
+            os.umask(old)
+        self.assertEqual((self.tmpdir / "index.md").stat().st_mode & 0o777, 0o644)
+
+
+class TestCreateExclusive(unittest.TestCase):
+    """Tests for create_exclusive."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_never_overwrites(self):
+        target = self.tmpdir / "topic.md"
+        self.assertTrue(create_exclusive(target, "first"))
+        self.assertFalse(create_exclusive(target, "second"))
+        self.assertEqual(target.read_text(), "first")
+        self.assertEqual([p.name for p in self.tmpdir.iterdir()], ["topic.md"])
+
+    def test_exactly_one_racing_creator_wins(self):
+        target = self.tmpdir / "topic.md"
+        barrier = threading.Barrier(8)
+        results = []
+
+        def _create(n):
+            barrier.wait()
+            results.append(create_exclusive(target, f"writer {n}\n" * 1000))
+
+        threads = [threading.Thread(target=_create, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results.count(True), 1)
+        self.assertEqual(len(set(target.read_text().splitlines())), 1)
+
+
+class TestKbLock(unittest.TestCase):
+    """Tests for kb_lock."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_reentrant(self):
+        with kb_lock(self.tmpdir):
+            with kb_lock(self.tmpdir):
+                pass
+        self.assertTrue((self.tmpdir / ".dewey" / "curate.lock").exists())
+
+    def test_serializes_read_modify_write_across_processes(self):
+        (self.tmpdir / "counter.json").write_text(json.dumps({"n": 0}))
+        ctx = multiprocessing.get_context("spawn" if os.name == "nt" else "fork")
+        procs = [ctx.Process(target=_bump_counter, args=(str(self.tmpdir), 50)) for _ in range(4)]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join(30)
+        self.assertEqual(json.loads((self.tmpdir / "counter.json").read_text())["n"], 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,9 @@ import shutil
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
+import promote
 from promote import promote_proposal
 
 
@@ -76,6 +78,28 @@ class TestPromoteProposal(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             promote_proposal(self.tmpdir, "bid-strategies", "nonexistent-area")
 
+    def test_second_concurrent_promoter_finds_proposal_claimed(self):
+        """Only one of two racing promoters succeeds; the other sees no proposal."""
+        def _race(path, text):
+            # Another agent tries to promote while this one writes its target
+            with self.assertRaises(FileNotFoundError):
+                promote_proposal(self.tmpdir, "bid-strategies", "campaign-management")
+            return real_write(path, text)
+
+        real_write = promote.write_atomic
+        with patch.object(promote, "write_atomic", side_effect=_race):
+            promote_proposal(self.tmpdir, "bid-strategies", "campaign-management")
+        self.assertTrue((self.tmpdir / "docs" / "campaign-management" / "bid-strategies.md").is_file())
+        self.assertEqual(list((self.tmpdir / "docs" / "_proposals").iterdir()), [])
+
+    def test_failed_write_restores_proposal(self):
+        """A promotion that fails midway leaves the proposal in place."""
+        with patch.object(promote, "write_atomic", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                promote_proposal(self.tmpdir, "bid-strategies", "campaign-management")
+        proposals = self.tmpdir / "docs" / "_proposals"
+        self.assertEqual([p.name for p in proposals.iterdir()], ["bid-strategies.md"])
+
 
 if __name__ == "__main__":
     unittest.main()
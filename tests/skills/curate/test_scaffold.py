@@ -12,10 +12,12 @@ from scaffold import (
     _parse_agents_topics,
     _read_topic_metadata,
     merge_managed_section,
+    rebuild_context_packs,
     rebuild_index,
+    rebuild_manifest,
     scaffold_knowledge_base,
 )
-from templates import MARKER_BEGIN, MARKER_END
+from templates import MARKER_BEGIN, MARKER_END, estimate_tokens
 
 
 class TestScaffoldKnowledgeBase(unittest.TestCase):
@@ -681,5 +683,145 @@ class TestRebuildIndex(unittest.TestCase):
         self.assertTrue((self.tmpdir / "docs" / "index.md").exists())
 
 
+class TestRebuildManifest(unittest.TestCase):
+    """Tests for rebuild_manifest (flat and tiered AGENTS.md)."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        scaffold_knowledge_base(self.tmpdir, "Dev", domain_areas=["Testing", "Tooling"])
+        for area, count in (("testing", 20), ("tooling", 5)):
+            for i in range(count):
+                topic = self.tmpdir / "docs" / area / f"topic-{i}.md"
+                topic.write_text(f"---\ndepth: working\n---\n# {area.title()} Topic {i}\n")
+        log = self.tmpdir / ".dewey" / "utilization" / "log.jsonl"
+        entries = ["docs/tooling/topic-3.md"] * 5 + ["docs/tooling/topic-3.ref.md"] * 2 + ["docs/testing/topic-7.md"] * 4
+        log.write_text("".join(
+            json.dumps({"file": f, "timestamp": "2026-01-01T00:00:00", "context": "hook"}) + "\n" for f in entries
+        ))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _agents(self) -> str:
+        return (self.tmpdir / "AGENTS.md").read_text()
+
+    def test_flat_lists_every_topic_from_disk(self):
+        rebuild_manifest(self.tmpdir)
+        self.assertEqual(self._agents().count("| [Testing Topic"), 20)
+        self.assertFalse((self.tmpdir / "docs" / "_manifests").exists())
+
+    def test_tiered_within_budget_with_sub_manifests(self):
+        summary = rebuild_manifest(self.tmpdir, 300)
+        self.assertIn("tiered", summary)
+        agents = self._agents()
+        section = agents[agents.index(MARKER_BEGIN) + len(MARKER_BEGIN):agents.index(MARKER_END)].strip("\n")
+        self.assertLessEqual(estimate_tokens(section), 300)
+        self.assertIn("## Who You Are", agents)
+        self.assertIn("docs/_manifests/testing.md", agents)
+
+        testing = (self.tmpdir / "docs" / "_manifests" / "testing.md").read_text()
+        self.assertEqual(testing.count("| [Testing Topic"), 20)
+        self.assertEqual(json.loads((self.tmpdir / ".dewey" / "config.json").read_text())["manifest_token_budget"], 300)
+
+    def test_tiered_ranks_by_utilization(self):
+        rebuild_manifest(self.tmpdir, 300)
+        agents = self._agents()
+        self.assertIn("[Tooling Topic 3]", agents)
+        self.assertIn("[Testing Topic 7]", agents)
+        self.assertNotIn("[Testing Topic 19]", agents)
+
+    def test_descriptions_survive_rebuilds(self):
+        agents = self._agents().replace(
+            "### Testing\n",
+            "### Testing\n\n| Topic | Description |\n|-------|-------------|\n"
+            "| [Testing Topic 7](docs/testing/topic-7.md) | Flaky test triage |\n",
+        )
+        (self.tmpdir / "AGENTS.md").write_text(agents)
+        rebuild_manifest(self.tmpdir, 300)
+        rebuild_manifest(self.tmpdir)
+        row = "| [Testing Topic 7](docs/testing/topic-7.md) | Flaky test triage |"
+        self.assertIn(row, (self.tmpdir / "docs" / "_manifests" / "testing.md").read_text())
+        self.assertIn(row, self._agents())
+
+    def test_back_to_flat_removes_sub_manifests(self):
+        rebuild_manifest(self.tmpdir, 300)
+        config = self.tmpdir / ".dewey" / "config.json"
+        config.write_text(json.dumps({"knowledge_dir": "docs"}))
+        rebuild_manifest(self.tmpdir)
+        self.assertFalse((self.tmpdir / "docs" / "_manifests").exists())
+
+    def test_rescaffold_keeps_tiered_layout(self):
+        rebuild_manifest(self.tmpdir, 300)
+        scaffold_knowledge_base(self.tmpdir, "Dev", domain_areas=["Testing", "Tooling", "Release"])
+        self.assertTrue((self.tmpdir / "docs" / "_manifests" / "release.md").exists())
+        self.assertNotIn("[Testing Topic 19]", self._agents())
+
+
+class TestRebuildContextPacks(unittest.TestCase):
+    """Tests for rebuild_context_packs."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        scaffold_knowledge_base(self.tmpdir, "Dev", domain_areas=["Testing", "Tooling"])
+        self.area = self.tmpdir / "docs" / "testing"
+        (self.area / "flaky-tests.md").write_text(
+            "---\nsources:\n  - https://example.com\ndepth: working\n---\n"
+            "# Flaky Tests\n\n## Why This Matters\nLong motivation.\n\n"
+            "## Key Guidance\nQuarantine within a day.\n\n"
+            "## Watch Out For\n<!-- Common pitfalls, anti-patterns, and mistakes -->\n\n"
+            "## Go Deeper\n- [Ref](flaky-tests.ref.md)\n"
+        )
+        (self.area / "flaky-tests.ref.md").write_text(
+            "---\ndepth: reference\n---\n# Flaky Tests\n\n- Retry once, then quarantine.\n\n"
+            "**See also:** [Flaky Tests](flaky-tests.md)\n"
+        )
+        self.pack = self.tmpdir / "docs" / "_packs" / "testing.md"
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_builds_one_pack_per_area(self):
+        result = rebuild_context_packs(self.tmpdir)
+        self.assertEqual(result["built"], ["docs/_packs/testing.md", "docs/_packs/tooling.md"])
+        self.assertTrue(self.pack.exists())
+
+    def test_pack_holds_essentials_only(self):
+        rebuild_context_packs(self.tmpdir)
+        pack = self.pack.read_text()
+        self.assertIn("## Flaky Tests", pack)
+        self.assertIn("Full topic: `docs/testing/flaky-tests.md`", pack)
+        self.assertIn("Quick reference: Retry once, then quarantine.", pack)
+        self.assertIn("### Key Guidance\nQuarantine within a day.", pack)
+        self.assertNotIn("Long motivation", pack)
+        self.assertNotIn("Watch Out For", pack)  # placeholder-only section dropped
+        self.assertNotIn("sources:", pack)
+        self.assertEqual(pack.count("<!--"), 1)  # only the pack header
+
+    def test_header_records_hash_and_tokens(self):
+        rebuild_context_packs(self.tmpdir)
+        header, body = self.pack.read_text().split("\n", 1)
+        self.assertRegex(header, r"^<!-- dewey:context-pack area=testing source=[0-9a-f]{16} tokens=\d+ -->$")
+        self.assertIn(f"tokens={estimate_tokens(body)} ", header)
+
+    def test_incremental_rebuilds_only_changed_areas(self):
+        rebuild_context_packs(self.tmpdir)
+        (self.area / "flaky-tests.md").write_text((self.area / "flaky-tests.md").read_text() + "\nMore.\n")
+        result = rebuild_context_packs(self.tmpdir)
+        self.assertEqual(result["built"], ["docs/_packs/testing.md"])
+        self.assertEqual(result["unchanged"], ["docs/_packs/tooling.md"])
+        self.assertEqual(len(rebuild_context_packs(self.tmpdir, force=True)["built"]), 2)
+
+    def test_removed_area_pack_deleted(self):
+        rebuild_context_packs(self.tmpdir)
+        shutil.rmtree(self.tmpdir / "docs" / "tooling")
+        result = rebuild_context_packs(self.tmpdir)
+        self.assertEqual(result["removed"], ["docs/_packs/tooling.md"])
+
+    def test_packs_ignored_by_index(self):
+        rebuild_context_packs(self.tmpdir)
+        rebuild_index(self.tmpdir)
+        self.assertNotIn("_packs", (self.tmpdir / "docs" / "index.md").read_text())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,17 +2,23 @@
 
 import datetime
 import json
+import re
 import unittest
 from unittest.mock import patch
 
 from templates import (
     MARKER_BEGIN,
     MARKER_END,
+    PLACEHOLDER_SETS,
     _slugify,
+    area_manifest_path,
+    estimate_tokens,
     render_agents_md,
     render_agents_md_section,
+    render_area_manifest,
     render_claude_md,
     render_claude_md_section,
+    render_context_pack,
     render_curate_plan,
     render_curation_plan_md,
     render_dewey_rules,
@@ -21,6 +27,7 @@ from templates import (
     render_index_md,
     render_overview_md,
     render_proposal_md,
+    render_tiered_agents_md_section,
     render_topic_md,
     render_topic_ref_md,
 )
@@ -218,6 +225,77 @@ class TestRenderAgentsMdSection(unittest.TestCase):
         self.assertIn("curation-plan.md", result)
 
 
+class TestRenderTieredAgentsMdSection(unittest.TestCase):
+    """Tests for render_tiered_agents_md_section and render_area_manifest."""
+
+    def _domain_areas(self):
+        def topic(area, i, reads):
+            return {
+                "name": f"Topic {area}{i}",
+                "path": f"docs/{area}/topic-{i}.md",
+                "description": f"What topic {i} covers in {area}",
+                "reads": reads,
+            }
+
+        return [
+            {"name": "alpha", "dirname": "alpha", "topics": [topic("alpha", i, i) for i in range(30)]},
+            {"name": "beta", "dirname": "beta", "topics": [topic("beta", i, 100 + i) for i in range(3)]},
+        ]
+
+    def test_fits_budget(self):
+        for budget in (250, 400, 800):
+            result = render_tiered_agents_md_section("Dev", self._domain_areas(), token_budget=budget)
+            self.assertLessEqual(estimate_tokens(result), budget)
+
+    def test_lists_every_area_with_manifest_link(self):
+        result = render_tiered_agents_md_section("Dev", self._domain_areas(), token_budget=1)
+        self.assertIn("### alpha", result)
+        self.assertIn(f"All 30 topics: [alpha topics]({area_manifest_path('docs', 'alpha')})", result)
+        self.assertIn("docs/_manifests/beta.md", result)
+        self.assertIn("## How To Use This Knowledge", result)
+        self.assertNotIn("| [Topic", result)
+
+    def test_most_read_topics_first(self):
+        result = render_tiered_agents_md_section("Dev", self._domain_areas(), token_budget=300)
+        self.assertIn("Topic beta2", result)
+        self.assertIn("Topic alpha29", result)
+        self.assertNotIn("Topic alpha0]", result)
+
+    def test_large_budget_lists_everything(self):
+        result = render_tiered_agents_md_section("Dev", self._domain_areas(), token_budget=100_000)
+        self.assertEqual(result.count("| [Topic"), 33)
+
+    def test_area_manifest_lists_all_topics_most_read_first(self):
+        area = self._domain_areas()[0]
+        result = render_area_manifest(area)
+        self.assertTrue(result.startswith("# alpha Topics"))
+        self.assertEqual(result.count("| [Topic"), 30)
+        self.assertLess(result.index("Topic alpha29]"), result.index("Topic alpha0]"))
+
+
+class TestRenderContextPack(unittest.TestCase):
+    """Tests for render_context_pack."""
+
+    def test_layout(self):
+        area = {
+            "name": "Testing",
+            "dirname": "testing",
+            "overview": [("What This Covers", "Test strategy.")],
+            "topics": [{
+                "name": "Flaky Tests",
+                "path": "docs/testing/flaky-tests.md",
+                "one_liner": "Retry once.",
+                "sections": [("Key Guidance", "Quarantine.")],
+            }],
+        }
+        result = render_context_pack(area, source_hash="abc123")
+        header, body = result.split("\n", 1)
+        self.assertEqual(header, f"<!-- dewey:context-pack area=testing source=abc123 tokens={estimate_tokens(body)} -->")
+        self.assertTrue(body.startswith("# Testing -- Context Pack\n\n## What This Covers\nTest strategy.\n"))
+        self.assertIn("## Flaky Tests\nFull topic: `docs/testing/flaky-tests.md`\nQuick reference: Retry once.\n", body)
+        self.assertTrue(body.endswith("### Key Guidance\nQuarantine.\n"))
+
+
 @patch("templates.date")
 class TestRenderIndexMd(unittest.TestCase):
     """Tests for render_index_md."""
@@ -954,6 +1032,26 @@ class TestRenderHooksJson(unittest.TestCase):
         self.assertIn("/path/to/kb", command)
 
 
+class TestPlaceholderSets(unittest.TestCase):
+    """PLACEHOLDER_SETS must list every placeholder the knowledge-file templates emit."""
+
+    # Informational comments that are correct to leave in place.
+    _INFORMATIONAL = {"<!-- No topics yet. Use the create-topic skill to add one. -->"}
+
+    def test_every_template_placeholder_is_catalogued(self):
+        catalogued = {p for group in PLACEHOLDER_SETS.values() for p in group}
+        rendered = "\n".join([
+            render_overview_md("Area", "core", []),
+            render_topic_md("Topic", "core"),
+            render_topic_ref_md("Topic", "core"),
+            render_proposal_md("Topic", "core", "agent", "why"),
+        ])
+        for comment in set(re.findall(r"<!--.*?-->", rendered)):
+            if comment in self._INFORMATIONAL:
+                continue
+            self.assertIn(comment, catalogued)
+
+
 class TestReturnTypes(unittest.TestCase):
     """All render functions must return strings."""
 
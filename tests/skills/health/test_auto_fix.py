@@ -6,7 +6,7 @@ import unittest
 from datetime import date
 from pathlib import Path
 
-from auto_fix import fix_missing_cross_links, fix_missing_sections
+from auto_fix import fix_missing_cross_links, fix_missing_sections, fix_orphan_links, fix_see_also_links
 
 
 def _write(path: Path, text: str) -> Path:
@@ -188,6 +188,88 @@ class TestFixMissingCrossLinks(unittest.TestCase):
         self.assertEqual(f.read_text(), original)
 
 
+# ------------------------------------------------------------------
+# fix_orphan_links
+# ------------------------------------------------------------------
+class TestFixOrphanLinks(unittest.TestCase):
+    """Tests for fix_orphan_links."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.knowledge_base = self.tmpdir / "docs"
+        self.orphan = _write(self.knowledge_base / "sales" / "auction-rules.md", _working_fm() + "\n# Rules\n")
+        self.target = _write(
+            self.knowledge_base / "ads" / "bidding.md",
+            _working_fm() + "\n# Bidding\n\n## Go Deeper\n- [Ref](bidding.ref.md)\n",
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _issue(self, candidates):
+        return {"file": str(self.orphan), "message": "Orphaned file", "severity": "warn", "candidates": candidates}
+
+    def test_links_from_top_candidate(self):
+        actions = fix_orphan_links(self.tmpdir, [self._issue([
+            {"file": "ads/bidding.md", "score": 0.4}, {"file": "ads/other.md", "score": 0.2},
+        ])])
+        self.assertEqual(actions[0]["file"], str(self.target))
+        self.assertEqual(actions[0]["action"], "inserted_see_also")
+        self.assertIn(
+            "## Go Deeper\n- [Auction Rules](../sales/auction-rules.md) -- related topic\n- [Ref]",
+            self.target.read_text(),
+        )
+
+    def test_candidate_without_go_deeper_gets_see_also(self):
+        self.target.write_text(_working_fm() + "\n# Bidding\n")
+        actions = fix_orphan_links(self.tmpdir, [self._issue([{"file": "ads/bidding.md", "score": 0.4}])])
+        self.assertEqual(len(actions), 1)
+        self.assertEqual(
+            self.target.read_text(),
+            _working_fm() + "\n# Bidding\n\n## See Also\n- [Auction Rules](../sales/auction-rules.md) -- related topic\n",
+        )
+
+    def test_no_candidates_no_op(self):
+        self.assertEqual(fix_orphan_links(self.tmpdir, [self._issue([])]), [])
+
+
+class TestFixSeeAlsoLinks(unittest.TestCase):
+    """Tests for fix_see_also_links."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.knowledge_base = self.tmpdir / "docs"
+        self.source = _write(self.knowledge_base / "ads" / "bidding.md", _working_fm() + "\n# Bidding\n")
+        _write(self.knowledge_base / "sales" / "auction-rules.md", _working_fm() + "\n# Rules\n")
+        _write(self.knowledge_base / "sales" / "pricing.md", _working_fm() + "\n# Pricing\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _suggest(self, *others):
+        return [{"file": "ads/bidding.md", "suggestions": [{"file": o, "score": 0.3} for o in others]}]
+
+    def test_creates_see_also_section(self):
+        actions = fix_see_also_links(self.tmpdir, self._suggest("sales/auction-rules.md"))
+        self.assertEqual(actions[0]["file"], str(self.source))
+        self.assertEqual(actions[0]["action"], "inserted_see_also")
+        self.assertTrue(self.source.read_text().endswith(
+            "# Bidding\n\n## See Also\n- [Auction Rules](../sales/auction-rules.md) -- related topic\n"
+        ))
+
+    def test_adds_to_existing_section(self):
+        fix_see_also_links(self.tmpdir, self._suggest("sales/auction-rules.md", "sales/pricing.md"))
+        text = self.source.read_text()
+        self.assertEqual(text.count("## See Also"), 1)
+        self.assertIn("(../sales/pricing.md) -- related topic\n- [Auction Rules](../sales/auction-rules.md)", text)
+
+    def test_existing_link_skipped(self):
+        fix_see_also_links(self.tmpdir, self._suggest("sales/auction-rules.md"))
+        before = self.source.read_text()
+        self.assertEqual(fix_see_also_links(self.tmpdir, self._suggest("sales/auction-rules.md")), [])
+        self.assertEqual(self.source.read_text(), before)
+
+
 # ------------------------------------------------------------------
 # fix_curation_plan_checkmarks
 # ------------------------------------------------------------------
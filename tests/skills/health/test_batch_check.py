@@ -0,0 +1,142 @@
+"""Tests for skills.health.scripts.batch_check — multi-knowledge-base runner."""
+
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from batch_check import aggregate_reports, check_root, expand_roots, run_batch
+from check_knowledge_base import run_health_check
+from config import write_config
+from history import read_history
+
+
+def _knowledge_base(root: Path, knowledge_dir: str = "docs", topics: int = 1) -> Path:
+    """Helper — a small knowledge base with *topics* incomplete topic files."""
+    if knowledge_dir != "docs":
+        write_config(root, knowledge_dir)
+    area = root / knowledge_dir / "area"
+    area.mkdir(parents=True)
+    for i in range(topics):
+        (area / f"topic-{i}.md").write_text("---\ndepth: working\n---\n\n# Topic\n")
+    return root
+
+
+class TestExpandRoots(unittest.TestCase):
+    """Tests for expand_roots."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        for name in ("kb-a", "kb-b"):
+            (self.tmpdir / name).mkdir()
+        (self.tmpdir / "notes.txt").write_text("")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_glob_matches_directories_only(self):
+        roots = expand_roots([], [str(self.tmpdir / "*")])
+        self.assertEqual([r.name for r in roots], ["kb-a", "kb-b"])
+
+    def test_duplicates_dropped_in_input_order(self):
+        roots = expand_roots([str(self.tmpdir / "kb-b"), str(self.tmpdir / "kb-b" / ".")], [str(self.tmpdir / "kb-*")])
+        self.assertEqual([r.name for r in roots], ["kb-b", "kb-a"])
+
+
+class TestRunBatch(unittest.TestCase):
+    """Tests for run_batch and check_root."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.roots = [
+            _knowledge_base(self.tmpdir / "small"),
+            _knowledge_base(self.tmpdir / "custom", knowledge_dir="kb", topics=3),
+            _knowledge_base(self.tmpdir / "medium", topics=2),
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_pool_reports_match_single_root_runs(self):
+        batch = run_batch(self.roots, workers=2, tier1=True)
+        self.assertEqual([r["root"] for r in batch["reports"]], [str(r) for r in self.roots])
+        for root, report in zip(self.roots, batch["reports"]):
+            expected = run_health_check(root, _persist_history=False)
+            self.assertEqual(
+                sorted(i["fingerprint"] for i in report["tier1"]["issues"]),
+                sorted(i["fingerprint"] for i in expected["issues"]),
+            )
+
+    def test_each_root_uses_its_knowledge_dir_and_history(self):
+        batch = run_batch(self.roots, workers=2, tier1=True, tier2=True)
+        self.assertEqual(batch["reports"][1]["tier1"]["summary"]["total_files"], 3)
+        for root in self.roots:
+            history = read_history(root)
+            self.assertEqual(len(history), 1)
+            self.assertIsNotNone(history[0]["tier2"])
+
+    def test_aggregate_sums_roots(self):
+        batch = run_batch(self.roots, workers=1, tier1=True, tier2=True, recommendations=True)
+        aggregate = batch["aggregate"]
+        self.assertEqual(aggregate["roots"], 3)
+        self.assertEqual(aggregate["tier1"]["total_files"], 6)
+        self.assertEqual(aggregate["tier2"]["total_files_scanned"], 6)
+        self.assertEqual(aggregate["recommendations"]["roots_skipped"], 3)
+        self.assertEqual(
+            aggregate["tier1"]["fail_count"],
+            sum(r["tier1"]["summary"]["fail_count"] for r in batch["reports"]),
+        )
+
+    def test_combined_run_keeps_tier1_options(self):
+        with patch("check_knowledge_base.run_health_check", wraps=run_health_check) as tier1:
+            report = check_root(
+                self.roots[0], tier1=True, tier2=True,
+                tier1_options={"check_links": True, "diff": False, "cache_shingles": True},
+            )
+        self.assertIn("tier1", report)
+        self.assertTrue(tier1.call_args.kwargs["check_links"])
+        self.assertTrue(tier1.call_args.kwargs["cache_shingles"])
+
+    def test_tier2_only(self):
+        report = check_root(self.roots[0], tier1=False, tier2=True, tier2_options={"use_memo": False})
+        self.assertEqual(sorted(report), ["root", "tier2"])
+
+    def test_failing_root_reported_not_raised(self):
+        with patch("batch_check.run_health_check", side_effect=RuntimeError("boom")):
+            report = check_root(self.roots[0])
+        self.assertEqual(report, {"root": str(self.roots[0]), "error": "RuntimeError: boom"})
+        self.assertEqual(aggregate_reports([report])["roots_failed"], 1)
+
+    def test_empty_batch(self):
+        self.assertEqual(run_batch([])["aggregate"], {"roots": 0, "roots_failed": 0})
+
+
+
+class TestCli(unittest.TestCase):
+    """Argument validation in batch_check.py."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        _knowledge_base(self.tmpdir / "kb")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_rejects_non_positive_token_budget(self):
+        script = Path(__file__).resolve().parents[3] / "dewey" / "skills" / "health" / "scripts" / "batch_check.py"
+        for budget in ("0", "-5"):
+            with self.subTest(budget=budget):
+                result = subprocess.run(
+                    [sys.executable, str(script), "--knowledge-base-root", str(self.tmpdir / "kb"),
+                     "--tier2", "--token-budget", budget],
+                    capture_output=True, text=True, timeout=10,
+                )
+                self.assertEqual(result.returncode, 2)
+                self.assertIn("--token-budget must be a positive", result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
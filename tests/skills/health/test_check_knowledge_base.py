@@ -1,13 +1,24 @@
 """Tests for skills.health.scripts.check_knowledge_base — health check runner."""
 
+import io
 import json
 import shutil
 import tempfile
 import unittest
 from datetime import date
 from pathlib import Path
+from unittest.mock import patch
 
-from check_knowledge_base import run_health_check, run_tier2_prescreening, run_combined_report
+from check_knowledge_base import (
+    run_combined_report,
+    run_health_check,
+    run_tier2_prescreening,
+    stream_combined_report,
+    stream_health_check,
+    stream_recommendations,
+    stream_tier2_prescreening,
+)
+from history import read_history
 
 
 def _write(path: Path, text: str) -> Path:
@@ -441,9 +452,7 @@ class TestHistoryIntegration(unittest.TestCase):
         area.mkdir()
         _write(area / "overview.md", _valid_md("overview"))
         run_health_check(self.tmpdir)
-        log = self.tmpdir / ".dewey" / "history" / "health-log.jsonl"
-        self.assertTrue(log.exists())
-        entry = json.loads(log.read_text().strip())
+        (entry,) = read_history(self.tmpdir)
         self.assertIn("tier1", entry)
         self.assertIsNone(entry["tier2"])
 
@@ -453,9 +462,7 @@ class TestHistoryIntegration(unittest.TestCase):
         area.mkdir()
         _write(area / "overview.md", _valid_md("overview"))
         run_combined_report(self.tmpdir)
-        log = self.tmpdir / ".dewey" / "history" / "health-log.jsonl"
-        self.assertTrue(log.exists())
-        entry = json.loads(log.read_text().strip())
+        (entry,) = read_history(self.tmpdir)
         self.assertIn("tier1", entry)
         self.assertIsNotNone(entry["tier2"])
 
@@ -465,9 +472,7 @@ class TestHistoryIntegration(unittest.TestCase):
         area.mkdir()
         _write(area / "overview.md", _valid_md("overview"))
         run_tier2_prescreening(self.tmpdir)
-        log = self.tmpdir / ".dewey" / "history" / "health-log.jsonl"
-        self.assertTrue(log.exists())
-        entry = json.loads(log.read_text().strip())
+        (entry,) = read_history(self.tmpdir)
         self.assertIsNone(entry["tier1"])
         self.assertIn("tier2", entry)
 
@@ -568,8 +573,7 @@ class TestInventoryIntegration(unittest.TestCase):
         _write(area / "topic.ref.md", _valid_md("reference"))
         run_health_check(self.tmpdir)
 
-        log = self.tmpdir / ".dewey" / "history" / "health-log.jsonl"
-        entry = json.loads(log.read_text().strip())
+        (entry,) = read_history(self.tmpdir)
         self.assertIn("file_list", entry)
         self.assertEqual(len(entry["file_list"]), 3)
         self.assertTrue(all("area/" in f for f in entry["file_list"]))
@@ -603,8 +607,7 @@ class TestInventoryIntegration(unittest.TestCase):
         _write(area / "overview.md", _valid_md("overview"))
         run_combined_report(self.tmpdir)
 
-        log = self.tmpdir / ".dewey" / "history" / "health-log.jsonl"
-        entry = json.loads(log.read_text().strip())
+        (entry,) = read_history(self.tmpdir)
         self.assertIn("file_list", entry)
 
 
@@ -756,6 +759,43 @@ class TestAutoFixIntegration(unittest.TestCase):
         # Stubs should be present
         self.assertIn("## Why This Matters", topic.read_text())
 
+    def test_fix_links_orphan_from_similar_topic(self):
+        """An orphan with a similar topic gets linked from that topic's Go Deeper."""
+        self._make_incomplete_kb()
+        _write(
+            self.knowledge_base / "other" / "orphan.md",
+            _valid_md("working", extra_body="Topic guidance principles pitfalls.\n", stem="orphan"),
+        )
+        dry = run_health_check(self.tmpdir, dry_run=True, _persist_history=False)
+        self.assertIn("would_insert_see_also", [f["action"] for f in dry["fixes"]])
+
+        result = run_health_check(self.tmpdir, fix=True, _persist_history=False)
+        linked = [f for f in result["fixes"] if f["action"] == "inserted_see_also"]
+        self.assertIn("Linked orphan orphan.md", linked[0]["detail"])
+        self.assertIn("(../other/orphan.md)", Path(linked[0]["file"]).read_text())
+
+    def test_fix_applies_see_also_suggestions(self):
+        """Related topics in other areas are cross-linked under a created See Also section."""
+        self._make_incomplete_kb()
+        body = "Bidding auctions reserve prices and second price rules.\n"
+        first = _write(self.knowledge_base / "ads" / "bidding.md", _valid_md("working", extra_body=body, stem="bidding"))
+        _write(self.knowledge_base / "sales" / "auctions.md", _valid_md("working", extra_body=body, stem="auctions"))
+        _write(self.knowledge_base / "ads" / "overview.md", "# Ads\n- [Bidding](bidding.md)\n")
+        _write(self.knowledge_base / "sales" / "overview.md", "# Sales\n- [Auctions](auctions.md)\n")
+        original = first.read_text()
+
+        dry = run_health_check(self.tmpdir, dry_run=True, _persist_history=False)
+        self.assertIn(
+            (str(first), "would_insert_see_also"), [(f["file"], f["action"]) for f in dry["fixes"]],
+        )
+        self.assertEqual(first.read_text(), original)
+
+        result = run_health_check(self.tmpdir, fix=True, _persist_history=False)
+        self.assertIn(
+            (str(first), "inserted_see_also"), [(f["file"], f["action"]) for f in result["fixes"]],
+        )
+        self.assertIn("## See Also\n- [Auctions](../sales/auctions.md) -- related topic", first.read_text())
+
     def test_no_fix_flag_no_fixes_key(self):
         """Without fix/dry_run, result has no 'fixes' key."""
         self._make_incomplete_kb()
@@ -1022,5 +1062,318 @@ class TestSourceAuthorityIntegration(unittest.TestCase):
         self.assertTrue(len(authority_items) > 0)
 
 
+class TestTier2ExcerptsIntegration(unittest.TestCase):
+    """Verify --excerpts attaches section text to prescreening output."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.knowledge_base = self.tmpdir / "docs"
+        self.knowledge_base.mkdir()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_excerpts_resolve_for_every_ref(self):
+        """Every excerpt_ref on a queue item resolves in the excerpts map."""
+        area = self.knowledge_base / "area"
+        _write(area / "topic.md", _valid_md("working"))
+        result = run_tier2_prescreening(self.tmpdir, excerpts=True, _persist_history=False)
+        self.assertIn("excerpts", result)
+        refs = 0
+        for item in result["queue"]:
+            for ref in item["excerpt_refs"]:
+                self.assertIn(ref, result["excerpts"][item["file"]])
+                refs += 1
+        self.assertGreater(refs, 0)
+
+    def test_excerpts_off_by_default(self):
+        """Without excerpts=True the report shape is unchanged."""
+        _write(self.knowledge_base / "area" / "topic.md", _valid_md("working"))
+        result = run_tier2_prescreening(self.tmpdir, _persist_history=False)
+        self.assertNotIn("excerpts", result)
+
+
+class TestIssueDiffIntegration(unittest.TestCase):
+    """Verify --diff reports only issues that changed since the last snapshot."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.knowledge_base = self.tmpdir / "docs"
+        self.knowledge_base.mkdir()
+        _write(self.knowledge_base / "area" / "topic.md", _valid_md("working"))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_issues_carry_fingerprints(self):
+        result = run_health_check(self.tmpdir, _persist_history=False)
+        for issue in result["issues"]:
+            self.assertIn("validator", issue)
+            self.assertEqual(len(issue["fingerprint"]), 16)
+
+    def test_unchanged_tree_has_empty_diff(self):
+        run_health_check(self.tmpdir)
+        result = run_health_check(self.tmpdir, diff=True)
+        self.assertNotIn("issues", result)
+        self.assertEqual(result["diff"]["new"], [])
+        self.assertEqual(result["diff"]["resolved"], [])
+        self.assertIsNotNone(result["diff"]["baseline"])
+
+    def test_new_and_resolved_issues(self):
+        first = run_health_check(self.tmpdir)
+        (self.knowledge_base / "area" / "topic.md").unlink()
+        _write(self.knowledge_base / "area" / "other.md", "no frontmatter\n")
+        result = run_health_check(self.tmpdir, diff=True)
+        new_files = {i["file"] for i in result["diff"]["new"]}
+        self.assertIn(str(self.knowledge_base / "area" / "other.md"), new_files)
+        self.assertEqual(result["summary"]["new_count"], len(result["diff"]["new"]))
+        before = {i["fingerprint"] for i in first["issues"]}
+        for resolved in result["diff"]["resolved"]:
+            self.assertIn(resolved["fingerprint"], before)
+
+    def test_combined_report_diff(self):
+        run_combined_report(self.tmpdir)
+        result = run_combined_report(self.tmpdir, diff=True)
+        self.assertEqual(result["tier1"]["diff"]["new"], [])
+
+
+class TestNdjsonStreaming(unittest.TestCase):
+    """Verify the NDJSON stream carries the same records as the JSON report."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.knowledge_base = self.tmpdir / "docs"
+        self.knowledge_base.mkdir()
+        _write(self.knowledge_base / "area" / "topic.md", _valid_md("working"))
+        _write(self.knowledge_base / "area" / "bare.md", "# Bare\n\nNo frontmatter.\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _records(self, fn, *args, **kwargs):
+        out = io.StringIO()
+        fn(self.tmpdir, out, *args, **kwargs)
+        return [json.loads(line) for line in out.getvalue().splitlines()]
+
+    def test_health_check_stream_matches_report(self):
+        expected = run_health_check(self.tmpdir, _persist_history=False)
+        records = self._records(stream_health_check)
+        issues = [r for r in records if r.pop("record") == "issue"]
+        self.assertEqual(issues, expected["issues"])
+        self.assertEqual(records[-1]["report"], "tier1")
+        self.assertEqual(records[-1]["fail_count"], expected["summary"]["fail_count"])
+
+    def test_tier2_stream_matches_report(self):
+        expected = run_tier2_prescreening(self.tmpdir, _persist_history=False, excerpts=True)
+        records = self._records(stream_tier2_prescreening, excerpts=True)
+        items = [r for r in records if r["record"] == "queue_item"]
+        self.assertEqual([{k: v for k, v in r.items() if k != "record"} for r in items], expected["queue"])
+        excerpt_files = {r["file"] for r in records if r["record"] == "excerpts"}
+        self.assertEqual(excerpt_files, set(expected["excerpts"]))
+        self.assertEqual(records[-1]["record"], "summary")
+        self.assertEqual(records[-1]["trigger_counts"], expected["summary"]["trigger_counts"])
+
+    def test_tier2_stream_emits_batches_before_summary(self):
+        records = self._records(stream_tier2_prescreening, token_budget=100000)
+        kinds = [r["record"] for r in records]
+        self.assertIn("batch", kinds)
+        self.assertEqual(kinds[-1], "summary")
+        self.assertEqual(records[-1]["batch_count"], kinds.count("batch"))
+
+    def test_stream_persists_history_for_diff(self):
+        self._records(stream_health_check)
+        records = self._records(stream_health_check, diff=True)
+        self.assertEqual([r["record"] for r in records], ["summary"])
+        self.assertEqual(records[0]["new_count"], 0)
+
+    def test_combined_stream_has_two_summaries(self):
+        records = self._records(stream_combined_report)
+        summaries = [r["report"] for r in records if r["record"] == "summary"]
+        self.assertEqual(summaries, ["tier1", "tier2"])
+        self.assertEqual(len(read_history(self.tmpdir)), 1)
+
+    def test_recommendations_skipped_summary(self):
+        records = self._records(stream_recommendations)
+        self.assertEqual(len(records), 1)
+        self.assertIn("skipped", records[0])
+
+
+class TestTimeBudget(unittest.TestCase):
+    """Verify budget_ms schedules, skips and reports validators."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.knowledge_base = self.tmpdir / "docs"
+        self.knowledge_base.mkdir()
+        _write(self.knowledge_base / "area" / "topic.md", _valid_md("working"))
+        _write(self.knowledge_base / "area" / "bare.md", "# Bare\n\nNo frontmatter.\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_generous_budget_runs_everything(self):
+        expected = run_health_check(self.tmpdir, _persist_history=False)
+        result = run_health_check(self.tmpdir, budget_ms=60000)
+        self.assertEqual(result["schedule"]["skipped"], [])
+        self.assertEqual(result["schedule"]["budget_ms"], 60000)
+        self.assertEqual(
+            sorted(i["fingerprint"] for i in result["issues"]),
+            sorted(i["fingerprint"] for i in expected["issues"]),
+        )
+
+    def test_zero_budget_runs_only_high_signal_validators(self):
+        result = run_health_check(self.tmpdir, budget_ms=0)
+        self.assertIn("check_readability", result["schedule"]["skipped"])
+        self.assertIn("check_duplicate_content", result["schedule"]["skipped"])
+        self.assertTrue(result["issues"])
+        self.assertLessEqual(
+            {i["validator"] for i in result["issues"]},
+            {"check_frontmatter", "check_source_urls", "check_cross_references"},
+        )
+        self.assertEqual(read_history(self.tmpdir), [])
+
+    def test_unbudgeted_report_has_no_schedule_but_records_timings(self):
+        result = run_health_check(self.tmpdir)
+        self.assertNotIn("schedule", result)
+        timings = json.loads((self.tmpdir / ".dewey" / "health" / "timings.json").read_text())
+        self.assertIn("check_frontmatter", timings["validators"])
+
+    def test_skipped_validators_not_reported_resolved(self):
+        run_health_check(self.tmpdir)
+        result = run_health_check(self.tmpdir, budget_ms=0, diff=True)
+        self.assertEqual(result["diff"]["new"], [])
+        self.assertEqual(result["diff"]["resolved"], [])
+
+    def test_stream_summary_carries_schedule(self):
+        run_health_check(self.tmpdir)
+        out = io.StringIO()
+        summary = stream_health_check(self.tmpdir, out, diff=True, budget_ms=0)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([r["record"] for r in records], ["summary"])
+        self.assertEqual(summary["schedule"]["skipped"], records[0]["schedule"]["skipped"])
+        self.assertEqual(len(read_history(self.tmpdir)), 1)
+
+
+
+class TestValidatorSelection(unittest.TestCase):
+    """Verify only/skip narrow the run and the inputs it reads."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.knowledge_base = self.tmpdir / "docs"
+        self.knowledge_base.mkdir()
+        _write(self.knowledge_base / "area" / "topic.md", _valid_md("working"))
+        _write(self.knowledge_base / "area" / "bare.md", "# Bare\n\nNo frontmatter.\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_only_by_name(self):
+        result = run_health_check(self.tmpdir, only=("check_frontmatter",))
+        self.assertEqual({i["validator"] for i in result["issues"]}, {"check_frontmatter"})
+        self.assertEqual(result["selection"]["validators"], ["check_frontmatter"])
+        self.assertIn("check_link_graph", result["selection"]["deselected"])
+
+    def test_skip_by_scope(self):
+        full = run_health_check(self.tmpdir, _persist_history=False)
+        result = run_health_check(self.tmpdir, skip=("cross-file", "structural"))
+        self.assertEqual(
+            sorted(i["fingerprint"] for i in result["issues"]),
+            sorted(i["fingerprint"] for i in full["issues"] if i["validator"] in result["selection"]["validators"]),
+        )
+        self.assertNotIn("check_duplicate_content", result["selection"]["validators"])
+
+    def test_only_by_cost_class(self):
+        result = run_health_check(self.tmpdir, only=("expensive",))
+        self.assertEqual(result["selection"]["validators"], ["check_link_graph", "check_duplicate_content"])
+
+    def test_frontmatter_only_audit_reads_no_bodies(self):
+        original = Path.read_text
+
+        def read_text(path, *args, **kwargs):
+            if path.suffix == ".md":
+                raise AssertionError(f"whole file read: {path}")
+            return original(path, *args, **kwargs)
+
+        with patch.object(Path, "read_text", read_text):
+            result = run_health_check(
+                self.tmpdir, _persist_history=False, only=("check_freshness", "check_source_urls"),
+            )
+        self.assertEqual(result["selection"]["validators"], ["check_source_urls", "check_freshness"])
+
+    def test_selective_run_records_no_snapshot_or_resolved(self):
+        run_health_check(self.tmpdir)
+        result = run_health_check(self.tmpdir, only=("check_freshness",), diff=True)
+        self.assertEqual(result["diff"]["resolved"], [])
+        self.assertEqual(len(read_history(self.tmpdir)), 1)
+
+    def test_tier2_selection(self):
+        result = run_tier2_prescreening(self.tmpdir, only=("trigger_depth_accuracy",))
+        self.assertEqual({i["trigger"] for i in result["queue"]}, {"depth_accuracy"})
+        self.assertEqual(result["selection"]["triggers"], ["trigger_depth_accuracy"])
+        self.assertEqual(read_history(self.tmpdir), [])
+
+    def test_stream_summary_carries_selection(self):
+        out = io.StringIO()
+        summary = stream_health_check(self.tmpdir, out, skip=("check_readability",))
+        self.assertNotIn("check_readability", summary["selection"]["validators"])
+        self.assertEqual(read_history(self.tmpdir), [])
+
+
+
+_CONTENT_VALIDATORS = {
+    "check_frontmatter", "check_size_bounds", "check_cross_references", "check_heading_hierarchy",
+    "check_readability", "check_section_completeness",
+}
+
+
+class TestFileSizeLimit(unittest.TestCase):
+    """Verify files over health_max_file_bytes are failed, not read."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.knowledge_base = self.tmpdir / "docs"
+        _write(self.knowledge_base / "area" / "topic.md", _valid_md("working"))
+        self.huge = _write(
+            self.knowledge_base / "area" / "export.md", _valid_md("working") + "[" * 20_000 + "\n" + "word\n" * 20_000,
+        )
+        _write(self.tmpdir / ".dewey" / "config.json", json.dumps({"health_max_file_bytes": 50_000}))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_oversized_file_fails_without_being_read(self):
+        original = Path.read_text
+
+        def read_text(path, *args, **kwargs):
+            if path.name == "export.md":
+                raise AssertionError("oversized file read")
+            return original(path, *args, **kwargs)
+
+        with patch.object(Path, "read_text", read_text):
+            result = run_health_check(self.tmpdir, _persist_history=False)
+        huge_issues = {i["validator"]: i for i in result["issues"] if i["file"] == str(self.huge)}
+        self.assertEqual(huge_issues["check_file_size"]["severity"], "fail")
+        # Only checks that need no content (structure, inbound links) report on it
+        self.assertFalse(set(huge_issues) & _CONTENT_VALIDATORS)
+
+    def test_budgeted_run_also_skips_oversized_file(self):
+        result = run_health_check(self.tmpdir, _persist_history=False, budget_ms=60_000)
+        validators = {i["validator"] for i in result["issues"] if i["file"] == str(self.huge)}
+        self.assertIn("check_file_size", validators)
+        self.assertFalse(validators & _CONTENT_VALIDATORS)
+
+    def test_tier2_skips_oversized_file(self):
+        result = run_tier2_prescreening(self.tmpdir)
+        self.assertNotIn(str(self.huge), {item["file"] for item in result["queue"]})
+
+    def test_zero_disables_limit(self):
+        _write(self.tmpdir / ".dewey" / "config.json", json.dumps({"health_max_file_bytes": 0}))
+        result = run_health_check(self.tmpdir, _persist_history=False)
+        validators = {i["validator"] for i in result["issues"] if i["file"] == str(self.huge)}
+        self.assertNotIn("check_file_size", validators)
+        self.assertIn("check_size_bounds", validators)
+
+
 if __name__ == "__main__":
     unittest.main()
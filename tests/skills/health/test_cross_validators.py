@@ -8,12 +8,15 @@ from pathlib import Path
 
 from cross_validators import (
     check_curation_plan_sync,
+    _jaccard,
+    _word_shingles,
     check_duplicate_content,
     check_link_graph,
     check_manifest_sync,
     check_naming_conventions,
     check_proposal_integrity,
 )
+from scaffold import rebuild_manifest, scaffold_knowledge_base
 from templates import MARKER_BEGIN, MARKER_END
 
 
@@ -208,6 +211,57 @@ class TestCheckManifestSync(unittest.TestCase):
         self.assertEqual(agents_issues, [])
 
 
+class TestCheckManifestSyncTiered(unittest.TestCase):
+    """check_manifest_sync on the tiered layout from scaffold --rebuild-manifest."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        scaffold_knowledge_base(self.tmpdir, "Dev", domain_areas=["Testing"])
+        self.area = self.tmpdir / "docs" / "testing"
+        for i in range(15):
+            _write(self.area / f"topic-{i}.md", _valid_fm() + f"\n# Topic {i}\n")
+        rebuild_manifest(self.tmpdir, 350)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _messages(self) -> list[str]:
+        return [i["message"] for i in check_manifest_sync(self.tmpdir, knowledge_dir_name="docs")]
+
+    def test_rebuilt_tiered_manifest_is_in_sync(self):
+        agents = (self.tmpdir / "AGENTS.md").read_text()
+        self.assertNotIn("[Topic 9]", agents)  # budget keeps it out of AGENTS.md
+        self.assertEqual(self._messages(), [])
+
+    def test_topic_missing_from_area_manifest(self):
+        _write(self.area / "new-topic.md", _valid_fm() + "\n# New\n")
+        self.assertEqual(self._messages(), ["Topic not listed in docs/_manifests/testing.md: docs/testing/new-topic.md"])
+
+    def test_area_manifest_references_deleted_topic(self):
+        (self.area / "topic-9.md").unlink()
+        self.assertEqual(self._messages(), ["Area manifest references nonexistent file: docs/testing/topic-9.md"])
+
+    def test_missing_area_manifest_link(self):
+        (self.tmpdir / "docs" / "_manifests" / "testing.md").unlink()
+        messages = self._messages()
+        self.assertIn(
+            "AGENTS.md links to missing area manifest: docs/_manifests/testing.md — run scaffold --rebuild-manifest",
+            messages,
+        )
+        self.assertTrue(any(m.startswith("Topic not listed in AGENTS.md") for m in messages))
+
+    def test_stale_area_manifest(self):
+        _write(self.tmpdir / "docs" / "_manifests" / "removed.md", "# removed Topics\n")
+        self.assertEqual(self._messages(), ["Area manifest for an area not on disk: removed"])
+
+    def test_over_budget(self):
+        config = self.tmpdir / ".dewey" / "config.json"
+        config.write_text('{"knowledge_dir": "docs", "manifest_token_budget": 50}')
+        messages = self._messages()
+        self.assertEqual(len(messages), 1)
+        self.assertIn("over its 50-token budget", messages[0])
+
+
 # ------------------------------------------------------------------
 # TestCheckCurationPlanSync
 # ------------------------------------------------------------------
@@ -495,6 +549,19 @@ class TestCheckLinkGraph(unittest.TestCase):
         msgs = [i["message"] for i in issues]
         self.assertTrue(any("orphan" in m.lower() for m in msgs))
 
+    def test_orphan_carries_ranked_candidates(self):
+        """Orphaned working topic -> similar topics ranked as link sources."""
+        _write(self.knowledge_base / "ads" / "overview.md", _valid_fm("overview") + "\n# Ads\n\n[B](bidding.md)\n")
+        _write(self.knowledge_base / "ads" / "bidding.md", _valid_fm("working") + "\n# Bidding\n\nAuction bidding budget.\n")
+        _write(self.knowledge_base / "sales" / "overview.md", _valid_fm("overview") + "\n# Sales\n\n[C](crm.md)\n")
+        _write(self.knowledge_base / "sales" / "crm.md", _valid_fm("working") + "\n# CRM\n\nPipeline contacts.\n")
+        _write(self.knowledge_base / "sales" / "auctions.md", _valid_fm("working") + "\n# Auctions\n\nAuction bidding rules.\n")
+
+        issues = check_link_graph(self.tmpdir, knowledge_dir_name="docs")
+        orphan = next(i for i in issues if i["message"].startswith("Orphaned"))
+        self.assertTrue(orphan["file"].endswith("auctions.md"))
+        self.assertEqual([c["file"] for c in orphan["candidates"]], ["ads/bidding.md"])
+
     def test_overview_not_flagged_as_orphan(self):
         """overview.md is an entry point — should not be flagged as orphan."""
         area = self.knowledge_base / "area-one"
@@ -650,6 +717,38 @@ class TestCheckDuplicateContent(unittest.TestCase):
         issues = check_duplicate_content(self.tmpdir, knowledge_dir_name="docs")
         self.assertEqual(issues, [])
 
+    def test_shingles_are_sorted_unique_uint64(self):
+        """Shingles are a sorted array('Q') with one entry per distinct window."""
+        shingles = _word_shingles("a b c d e a b c d e a b c d e")
+        self.assertEqual(shingles.typecode, "Q")
+        self.assertEqual(list(shingles), sorted(set(shingles)))
+        self.assertEqual(len(shingles), 5)
+        self.assertEqual(len(_word_shingles("too few words")), 0)
+
+    def test_merge_jaccard_matches_set_jaccard(self):
+        """Merge-walk Jaccard equals the set definition."""
+        a = _word_shingles("the quick brown fox jumps over the lazy dog near the river bank")
+        b = _word_shingles("the quick brown fox jumps over the sleepy cat near the river bank")
+        sa, sb = set(a), set(b)
+        self.assertAlmostEqual(_jaccard(a, b), len(sa & sb) / len(sa | sb))
+        self.assertEqual(_jaccard(a, a), 1.0)
+
+    def test_cached_shingles_persist_and_prune(self):
+        """cache_shingles stores one array per body and prunes stale ones."""
+        area = self.knowledge_base / "area-one"
+        area.mkdir()
+        _write(area / "overview.md", _valid_fm("overview") + "\n# Area\n\nOne two three four five six seven.\n")
+        _write(area / "topic.md", _valid_fm("working") + "\n# Topic\n\nEight nine ten eleven twelve thirteen.\n")
+        first = check_duplicate_content(self.tmpdir, knowledge_dir_name="docs", cache_shingles=True)
+        cache_dir = self.tmpdir / ".dewey" / "health" / "shingles"
+        self.assertEqual(len(list(cache_dir.glob("*.bin"))), 2)
+        self.assertEqual(
+            check_duplicate_content(self.tmpdir, knowledge_dir_name="docs", cache_shingles=True), first,
+        )
+        _write(area / "topic.md", _valid_fm("working") + "\n# Topic\n\nFourteen fifteen sixteen seventeen eighteen.\n")
+        check_duplicate_content(self.tmpdir, knowledge_dir_name="docs", cache_shingles=True)
+        self.assertEqual(len(list(cache_dir.glob("*.bin"))), 2)
+
 
 # ------------------------------------------------------------------
 # TestCheckNamingConventions
@@ -1,12 +1,20 @@
 """Tests for skills.health.scripts.history — health score history tracking."""
 
 import json
+import os
 import shutil
 import tempfile
 import unittest
 from pathlib import Path
 
-from history import record_snapshot, read_history
+from history import (
+    diff_issues,
+    issue_fingerprint,
+    issue_index,
+    read_history,
+    read_last_issue_index,
+    record_snapshot,
+)
 
 
 def _tier1_summary(fail_count=0, warn_count=0, total_files=5):
@@ -39,18 +47,17 @@ class TestRecordSnapshot(unittest.TestCase):
     # test_creates_log_file
     # ------------------------------------------------------------------
     def test_creates_log_file(self):
-        """First snapshot creates health-log.jsonl."""
-        log_path = record_snapshot(self.tmpdir, _tier1_summary())
+        """First snapshot creates this writer's shard of health-log.jsonl."""
+        log_path = record_snapshot(self.tmpdir, _tier1_summary(), writer="session-1")
         self.assertTrue(log_path.exists())
-        self.assertEqual(log_path.name, "health-log.jsonl")
+        self.assertEqual(log_path, self.tmpdir / ".dewey" / "history" / "health-log.d" / "session-1.jsonl")
 
     # ------------------------------------------------------------------
     # test_appends_valid_json_line
     # ------------------------------------------------------------------
     def test_appends_valid_json_line(self):
         """Entry has timestamp, tier1, tier2 keys."""
-        record_snapshot(self.tmpdir, _tier1_summary())
-        log_path = self.tmpdir / ".dewey" / "history" / "health-log.jsonl"
+        log_path = record_snapshot(self.tmpdir, _tier1_summary())
         line = log_path.read_text().strip()
         entry = json.loads(line)
         self.assertIn("timestamp", entry)
@@ -63,8 +70,7 @@ class TestRecordSnapshot(unittest.TestCase):
     def test_multiple_snapshots_append(self):
         """Multiple calls append, not overwrite."""
         record_snapshot(self.tmpdir, _tier1_summary(fail_count=1))
-        record_snapshot(self.tmpdir, _tier1_summary(fail_count=0))
-        log_path = self.tmpdir / ".dewey" / "history" / "health-log.jsonl"
+        log_path = record_snapshot(self.tmpdir, _tier1_summary(fail_count=0))
         lines = [l for l in log_path.read_text().splitlines() if l.strip()]
         self.assertEqual(len(lines), 2)
         first = json.loads(lines[0])
@@ -83,8 +89,7 @@ class TestRecordSnapshot(unittest.TestCase):
             files_with_triggers=2,
             total_files_scanned=10,
         )
-        record_snapshot(self.tmpdir, t1, tier2_summary=t2)
-        log_path = self.tmpdir / ".dewey" / "history" / "health-log.jsonl"
+        log_path = record_snapshot(self.tmpdir, t1, tier2_summary=t2)
         entry = json.loads(log_path.read_text().strip())
         self.assertEqual(entry["tier1"], t1)
         self.assertEqual(entry["tier2"], t2)
@@ -104,8 +109,7 @@ class TestRecordSnapshot(unittest.TestCase):
     # ------------------------------------------------------------------
     def test_tier2_summary_optional(self):
         """tier2_summary=None stores null."""
-        record_snapshot(self.tmpdir, _tier1_summary())
-        log_path = self.tmpdir / ".dewey" / "history" / "health-log.jsonl"
+        log_path = record_snapshot(self.tmpdir, _tier1_summary())
         entry = json.loads(log_path.read_text().strip())
         self.assertIsNone(entry["tier2"])
 
@@ -182,6 +186,37 @@ class TestReadHistory(unittest.TestCase):
         self.assertIn("tier1", entry)
         self.assertIn("tier2", entry)
 
+    # ------------------------------------------------------------------
+    # test_shards_merged_by_timestamp
+    # ------------------------------------------------------------------
+    def test_shards_merged_by_timestamp(self):
+        """Snapshots from concurrent writers come back in timestamp order."""
+        log_dir = self.tmpdir / ".dewey" / "history"
+        (log_dir / "health-log.d").mkdir(parents=True)
+        for writer, stamps in (("a", ("01", "03")), ("b", ("02", "04"))):
+            (log_dir / "health-log.d" / f"{writer}.jsonl").write_text("".join(
+                json.dumps({"timestamp": f"2026-01-{day}T00:00:00", "tier1": {"writer": writer}}) + "\n"
+                for day in stamps
+            ))
+        history = read_history(self.tmpdir)
+        self.assertEqual([e["tier1"]["writer"] for e in history], ["a", "b", "a", "b"])
+        self.assertEqual(read_last_issue_index(self.tmpdir), None)
+
+    # ------------------------------------------------------------------
+    # test_idle_shards_compacted
+    # ------------------------------------------------------------------
+    def test_idle_shards_compacted(self):
+        """Idle shards are folded into health-log.jsonl on read."""
+        shard = record_snapshot(self.tmpdir, _tier1_summary(fail_count=1), writer="old")
+        stamp = shard.stat().st_mtime - 3600
+        os.utime(shard, (stamp, stamp))
+        record_snapshot(self.tmpdir, _tier1_summary(fail_count=2), writer="new")
+
+        history = read_history(self.tmpdir)
+        self.assertEqual([e["tier1"]["fail_count"] for e in history], [1, 2])
+        self.assertFalse(shard.exists())
+        self.assertTrue((self.tmpdir / ".dewey" / "history" / "health-log.jsonl").exists())
+
 
 class TestFileListInSnapshots(unittest.TestCase):
     """Tests for file_list field in history snapshots."""
@@ -195,15 +230,13 @@ class TestFileListInSnapshots(unittest.TestCase):
     def test_snapshot_includes_file_list(self):
         """file_list is stored in the snapshot entry."""
         files = ["area/overview.md", "area/topic.md"]
-        record_snapshot(self.tmpdir, _tier1_summary(), file_list=files)
-        log_path = self.tmpdir / ".dewey" / "history" / "health-log.jsonl"
+        log_path = record_snapshot(self.tmpdir, _tier1_summary(), file_list=files)
         entry = json.loads(log_path.read_text().strip())
         self.assertEqual(entry["file_list"], files)
 
     def test_file_list_defaults_to_empty(self):
         """file_list defaults to empty list when not provided."""
-        record_snapshot(self.tmpdir, _tier1_summary())
-        log_path = self.tmpdir / ".dewey" / "history" / "health-log.jsonl"
+        log_path = record_snapshot(self.tmpdir, _tier1_summary())
         entry = json.loads(log_path.read_text().strip())
         self.assertEqual(entry["file_list"], [])
 
@@ -215,5 +248,60 @@ class TestFileListInSnapshots(unittest.TestCase):
         self.assertEqual(history[0]["file_list"], files)
 
 
+class TestIssueFingerprints(unittest.TestCase):
+    """Tests for issue fingerprints and snapshot diffing."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _issue(self, message, file="docs/a.md", validator="check_size_bounds"):
+        issue = {"file": str(self.tmpdir / file), "message": message, "severity": "warn"}
+        issue["validator"] = validator
+        issue["fingerprint"] = issue_fingerprint(validator, issue, self.tmpdir)
+        return issue
+
+    def test_fingerprint_ignores_numbers_and_whitespace(self):
+        a = self._issue("Body has 120 words,  below 300")
+        b = self._issue("Body has 95 words, below 300")
+        self.assertEqual(a["fingerprint"], b["fingerprint"])
+
+    def test_fingerprint_distinguishes_validator_and_file(self):
+        a = self._issue("msg")
+        self.assertNotEqual(a["fingerprint"], self._issue("msg", validator="check_readability")["fingerprint"])
+        self.assertNotEqual(a["fingerprint"], self._issue("msg", file="docs/b.md")["fingerprint"])
+
+    def test_fingerprint_relative_to_root(self):
+        issue = {"file": str(self.tmpdir / "docs/a.md"), "message": "m"}
+        moved = {"file": "/elsewhere/docs/a.md", "message": "m"}
+        self.assertEqual(
+            issue_fingerprint("v", issue, self.tmpdir),
+            issue_fingerprint("v", moved, Path("/elsewhere")),
+        )
+
+    def test_no_baseline_all_new(self):
+        issues = [self._issue("one"), self._issue("two")]
+        delta = diff_issues(issues, read_last_issue_index(self.tmpdir))
+        self.assertIsNone(delta["baseline"])
+        self.assertEqual(len(delta["new"]), 2)
+        self.assertEqual(delta["resolved"], [])
+
+    def test_diff_reports_new_and_resolved(self):
+        kept, gone, added = self._issue("kept"), self._issue("gone"), self._issue("added")
+        record_snapshot(self.tmpdir, _tier1_summary(), issues=issue_index([kept, gone]))
+        delta = diff_issues([kept, added], read_last_issue_index(self.tmpdir))
+        self.assertEqual([i["message"] for i in delta["new"]], ["added"])
+        self.assertEqual([r["fingerprint"] for r in delta["resolved"]], [gone["fingerprint"]])
+        self.assertEqual(delta["resolved"][0]["validator"], "check_size_bounds")
+
+    def test_baseline_skips_snapshots_without_issues(self):
+        record_snapshot(self.tmpdir, _tier1_summary(), issues=issue_index([self._issue("x")]))
+        record_snapshot(self.tmpdir, None, _tier2_summary())
+        baseline = read_last_issue_index(self.tmpdir)
+        self.assertEqual(len(baseline["issues"]), 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,36 @@
+"""Tests for skills.health.scripts.literal_scan — single-pass multi-literal scanning."""
+
+import unittest
+
+from literal_scan import find_literals, scan_literals
+
+
+class TestScanLiterals(unittest.TestCase):
+    """Tests for scan_literals and find_literals."""
+
+    def test_positions_in_text_order(self):
+        text = "a <!-- x --> b <!-- y --> c <!-- x -->"
+        self.assertEqual(
+            scan_literals(text, ["<!-- x -->", "<!-- y -->"]),
+            [(2, "<!-- x -->"), (15, "<!-- y -->"), (28, "<!-- x -->")],
+        )
+
+    def test_longest_literal_wins_at_same_offset(self):
+        text = "<!-- dewey:provenance {} -->"
+        matches = scan_literals(text, ["<!--", "<!-- dewey:provenance"])
+        self.assertEqual(matches, [(0, "<!-- dewey:provenance")])
+
+    def test_special_characters_are_literal(self):
+        self.assertEqual(find_literals("cost is $5 (approx.)", ["$5 (approx.)", "a.b"]), {"$5 (approx.)"})
+
+    def test_empty_catalog(self):
+        self.assertEqual(scan_literals("anything", []), [])
+
+    def test_find_matches_in_operator(self):
+        literals = ["alpha", "beta", "gamma"]
+        text = "the beta release and the gamma ray"
+        self.assertEqual(find_literals(text, literals), {lit for lit in literals if lit in text})
+
+
+if __name__ == "__main__":
+    unittest.main()
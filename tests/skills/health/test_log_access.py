@@ -8,6 +8,7 @@ import unittest
 from pathlib import Path
 
 from log_access import log_if_knowledge_file
+from shard_log import read_records
 
 
 class TestLogIfKnowledgeFile(unittest.TestCase):
@@ -29,8 +30,7 @@ class TestLogIfKnowledgeFile(unittest.TestCase):
         logged = log_if_knowledge_file(self.tmpdir, str(topic))
         self.assertTrue(logged)
         log = self.tmpdir / ".dewey" / "utilization" / "log.jsonl"
-        self.assertTrue(log.exists())
-        entry = json.loads(log.read_text().strip())
+        (entry,) = read_records(log)
         self.assertIn("docs/area/topic.md", entry["file"])
 
     def test_ignores_file_outside_knowledge_dir(self):
@@ -40,7 +40,7 @@ class TestLogIfKnowledgeFile(unittest.TestCase):
         logged = log_if_knowledge_file(self.tmpdir, str(other))
         self.assertFalse(logged)
         log = self.tmpdir / ".dewey" / "utilization" / "log.jsonl"
-        self.assertFalse(log.exists())
+        self.assertEqual(read_records(log), [])
 
     def test_ignores_proposals(self):
         """Files under _proposals/ should not be logged."""
@@ -65,7 +65,7 @@ class TestLogIfKnowledgeFile(unittest.TestCase):
         topic.write_text("content")
         log_if_knowledge_file(self.tmpdir, str(topic))
         log = self.tmpdir / ".dewey" / "utilization" / "log.jsonl"
-        entry = json.loads(log.read_text().strip())
+        (entry,) = read_records(log)
         self.assertEqual(entry["context"], "hook")
 
     def test_stores_relative_path(self):
@@ -75,7 +75,7 @@ class TestLogIfKnowledgeFile(unittest.TestCase):
         topic.write_text("content")
         log_if_knowledge_file(self.tmpdir, str(topic))
         log = self.tmpdir / ".dewey" / "utilization" / "log.jsonl"
-        entry = json.loads(log.read_text().strip())
+        (entry,) = read_records(log)
         self.assertFalse(entry["file"].startswith("/"))
 
     def test_custom_knowledge_dir(self):
@@ -91,6 +91,20 @@ class TestLogIfKnowledgeFile(unittest.TestCase):
         logged = log_if_knowledge_file(self.tmpdir, str(topic))
         self.assertTrue(logged)
 
+    def test_repeat_reads_collapse_per_config(self):
+        """Repeat reads within the session window add no log lines unless the window is 0."""
+        topic = self.knowledge_base_dir / "area" / "topic.md"
+        topic.parent.mkdir(parents=True)
+        topic.write_text("content")
+        log = self.tmpdir / ".dewey" / "utilization" / "log.jsonl"
+        for _ in range(3):
+            log_if_knowledge_file(self.tmpdir, str(topic))
+        self.assertEqual(len(read_records(log)), 1)
+
+        (self.tmpdir / ".dewey" / "config.json").write_text('{"utilization_session_window_seconds": 0}')
+        log_if_knowledge_file(self.tmpdir, str(topic))
+        self.assertEqual(len(read_records(log)), 2)
+
     def test_nonexistent_file_no_error(self):
         """A nonexistent file path should return False without error."""
         logged = log_if_knowledge_file(self.tmpdir, "/nonexistent/path.md")
@@ -129,14 +143,23 @@ class TestHookEntryPoint(unittest.TestCase):
         result = self._run_hook({"file_path": str(topic)})
         self.assertEqual(result.returncode, 0)
         log = self.tmpdir / ".dewey" / "utilization" / "log.jsonl"
-        self.assertTrue(log.exists())
+        self.assertEqual(len(read_records(log)), 1)
+
+    def test_session_id_names_the_shard(self):
+        """Each agent session logs to its own shard."""
+        topic = self.knowledge_base_dir / "area" / "topic.md"
+        topic.parent.mkdir(parents=True)
+        topic.write_text("content")
+        self._run_hook({"session_id": "abc-123", "file_path": str(topic)})
+        shard = self.tmpdir / ".dewey" / "utilization" / "log.d" / "abc-123.jsonl"
+        self.assertEqual(json.loads(shard.read_text())["file"], "docs/area/topic.md")
 
     def test_ignores_non_knowledge_file(self):
         """Hook should silently ignore non-knowledge files."""
         result = self._run_hook({"file_path": str(self.tmpdir / "README.md")})
         self.assertEqual(result.returncode, 0)
         log = self.tmpdir / ".dewey" / "utilization" / "log.jsonl"
-        self.assertFalse(log.exists())
+        self.assertEqual(read_records(log), [])
 
     def test_handles_missing_file_path(self):
         """Hook should handle missing file_path in input without error."""
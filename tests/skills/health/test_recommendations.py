@@ -281,6 +281,35 @@ class TestStaleHighUse(unittest.TestCase):
         stale_files = {r["file"] for r in stale}
         self.assertIn("docs/area/stale.md", stale_files)
 
+    def test_reads_outside_window_do_not_count(self):
+        """Heavy reads of a stale file last year are not high-use by default."""
+        now = datetime.now()
+        last_year = (now - timedelta(days=300)).isoformat(timespec="seconds")
+        entries = (
+            [_log_entry("docs/area/overview.md", now.isoformat(timespec="seconds")) for _ in range(5)]
+            + [_log_entry("docs/area/fresh.md", now.isoformat(timespec="seconds")) for _ in range(3)]
+            + [_log_entry("docs/area/stale.md", last_year) for _ in range(20)]
+        )
+        _write_utilization_log(self.tmpdir, entries)
+
+        def stale_files(**kwargs):
+            result = generate_recommendations(self.tmpdir, min_reads=0, min_days=0, **kwargs)
+            return {r["file"] for r in result["recommendations"] if r["recommendation"] == "stale_high_use"}
+
+        self.assertNotIn("docs/area/stale.md", stale_files())
+        self.assertIn("docs/area/stale.md", stale_files(window_days=None))
+        result = generate_recommendations(self.tmpdir, min_reads=0, min_days=0)
+        self.assertEqual(result["summary"]["window_days"], 90)
+        self.assertEqual(result["summary"]["areas"]["area"]["count"], 28)
+        self.assertNotIn(
+            "docs/area/stale.md",
+            {r["file"] for r in result["recommendations"] if r["recommendation"] == "never_referenced"},
+        )
+
+    def test_unknown_window_rejected(self):
+        with self.assertRaises(ValueError):
+            generate_recommendations(self.tmpdir, window_days=14)
+
     def test_stale_low_read_file_not_stale_high_use(self):
         """Stale file with below-median reads does not get stale_high_use."""
         now = datetime.now().isoformat(timespec="seconds")
@@ -0,0 +1,209 @@
+"""Tests for skills.health.scripts.report_cache — indexed last-report cache."""
+
+import io
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from check_knowledge_base import (
+    run_combined_report,
+    run_health_check,
+    run_tier2_prescreening,
+    stream_health_check,
+)
+from report_cache import SectionWriter, query_report, save_section
+
+_SCRIPT = Path(__file__).resolve().parents[3] / "dewey" / "skills" / "health" / "scripts" / "report_cache.py"
+
+
+def _write(path: Path, text: str) -> Path:
+    """Helper — write *text* to *path*, creating parents as needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def _issue(root: Path, rel: str, validator: str, severity: str = "warn") -> dict:
+    return {"file": str(root / "docs" / rel), "message": f"{validator} on {rel}", "severity": severity,
+            "validator": validator, "fingerprint": f"{validator}:{rel}"}
+
+
+_THIN_WORKING = (
+    "---\n"
+    "sources:\n"
+    "  - https://example.com/doc\n"
+    "last_validated: 2020-01-01\n"
+    "relevance: core\n"
+    "depth: working\n"
+    "---\n"
+    "\n"
+    "# Topic\n"
+    "\n"
+    "## In Practice\n"
+    "Just some text.\n"
+)
+
+
+class TestQueryReport(unittest.TestCase):
+    """Filtering a cached section by its field index."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        issues = [
+            _issue(self.tmpdir, "api/auth.md", "check_freshness", "fail"),
+            _issue(self.tmpdir, "api/auth.md", "check_section_completeness"),
+            _issue(self.tmpdir, "api/errors.md", "check_freshness"),
+            _issue(self.tmpdir, "ops/deploy.md", "check_freshness", "fail"),
+        ]
+        save_section(self.tmpdir, "tier1", issues, {"total_files": 3, "fail_count": 2})
+        save_section(self.tmpdir, "tier2", [
+            {"file": str(self.tmpdir / "docs" / "api" / "auth.md"), "trigger": "why_quality", "reason": "thin"},
+            {"file": str(self.tmpdir / "docs" / "ops" / "deploy.md"), "trigger": "source_drift", "reason": "old"},
+        ], {"total_files_scanned": 3})
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_unfiltered_returns_every_section(self):
+        report = query_report(self.tmpdir)
+        self.assertEqual(set(report), {"tier1", "tier2"})
+        self.assertEqual(report["tier1"]["count"], 4)
+        self.assertEqual(report["tier1"]["summary"], {"total_files": 3, "fail_count": 2})
+        self.assertIn("timestamp", report["tier2"])
+
+    def test_filters_intersect(self):
+        report = query_report(self.tmpdir, area=["api"], validator=["check_freshness"])
+        self.assertEqual([i["file"] for i in report["tier1"]["issues"]], [
+            str(self.tmpdir / "docs" / "api" / "auth.md"), str(self.tmpdir / "docs" / "api" / "errors.md"),
+        ])
+        self.assertEqual(report["tier1"]["total"], 4)
+
+    def test_values_of_one_filter_are_alternatives(self):
+        report = query_report(self.tmpdir, sections=["tier1"], area=["api", "ops"], severity=["fail"])
+        self.assertEqual(report["tier1"]["count"], 2)
+
+    def test_file_glob(self):
+        report = query_report(self.tmpdir, file_glob=["api/auth*"])
+        self.assertEqual(report["tier1"]["count"], 2)
+        self.assertEqual([i["trigger"] for i in report["tier2"]["queue"]], ["why_quality"])
+
+    def test_field_a_section_lacks_excludes_it(self):
+        self.assertEqual(set(query_report(self.tmpdir, severity=["fail"])), {"tier1"})
+        report = query_report(self.tmpdir, trigger=["source_drift"])
+        self.assertEqual(set(report), {"tier2"})
+        self.assertEqual(report["tier2"]["count"], 1)
+
+    def test_no_cache(self):
+        empty = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, empty)
+        self.assertEqual(query_report(empty), {})
+
+    def test_unknown_section_raises(self):
+        with self.assertRaises(ValueError):
+            query_report(self.tmpdir, sections=["tier3"])
+
+
+class TestSectionWriter(unittest.TestCase):
+    """A section is replaced only on commit."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        save_section(self.tmpdir, "tier1", [_issue(self.tmpdir, "api/auth.md", "check_freshness")], {"n": 1})
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_uncommitted_writer_keeps_previous_section(self):
+        with SectionWriter(self.tmpdir, "tier1") as writer:
+            writer.add(_issue(self.tmpdir, "ops/deploy.md", "check_freshness"))
+        report = query_report(self.tmpdir)
+        self.assertEqual(report["tier1"]["summary"], {"n": 1})
+        self.assertEqual(report["tier1"]["issues"][0]["fingerprint"], "check_freshness:api/auth.md")
+        self.assertEqual(list((self.tmpdir / ".dewey" / "health" / "last-report").glob("*.tmp")), [])
+
+    def test_commit_replaces_section(self):
+        with SectionWriter(self.tmpdir, "tier1") as writer:
+            writer.commit({"n": 0})
+        self.assertEqual(query_report(self.tmpdir)["tier1"]["count"], 0)
+
+
+class TestRunnerCaching(unittest.TestCase):
+    """Health runs cache what they produce; queries need no re-run."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        _write(self.tmpdir / "docs" / "api" / "auth.md", _THIN_WORKING)
+        _write(self.tmpdir / "docs" / "ops" / "deploy.md", _THIN_WORKING)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_tier1_issues_cached_and_queried_without_rerun(self):
+        result = run_health_check(self.tmpdir)
+        expected = [i for i in result["issues"] if "/api/" in i["file"]]
+        with patch("check_knowledge_base._iter_tier1_issues") as rerun:
+            report = query_report(self.tmpdir, area=["api"])
+        rerun.assert_not_called()
+        self.assertTrue(expected)
+        self.assertEqual(report["tier1"]["issues"], expected)
+        self.assertEqual(report["tier1"]["summary"], result["summary"])
+
+    def test_tier2_run_keeps_cached_tier1(self):
+        run_health_check(self.tmpdir)
+        run_tier2_prescreening(self.tmpdir, use_memo=False)
+        self.assertEqual(set(query_report(self.tmpdir)), {"tier1", "tier2"})
+
+    def test_selective_run_not_cached(self):
+        run_health_check(self.tmpdir, only=("check_freshness",))
+        self.assertEqual(query_report(self.tmpdir), {})
+
+    def test_diff_run_caches_full_issues(self):
+        first = run_health_check(self.tmpdir)
+        run_health_check(self.tmpdir, diff=True)
+        self.assertEqual(query_report(self.tmpdir)["tier1"]["issues"], first["issues"])
+
+    def test_stream_caches_same_records(self):
+        result = run_combined_report(self.tmpdir, use_memo=False)
+        cached = query_report(self.tmpdir)
+        self.assertEqual(cached["tier2"]["queue"], result["tier2"]["queue"])
+        stream_health_check(self.tmpdir, io.StringIO(), diff=True)
+        self.assertEqual(query_report(self.tmpdir)["tier1"]["issues"], result["tier1"]["issues"])
+
+
+class TestQueryCli(unittest.TestCase):
+    """report_cache.py prints the filtered report as JSON."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _run(self, *args: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, str(_SCRIPT), "--knowledge-base-root", str(self.tmpdir), *args],
+            capture_output=True, text=True,
+        )
+
+    def test_filters_from_command_line(self):
+        save_section(self.tmpdir, "tier1", [
+            _issue(self.tmpdir, "api/auth.md", "check_freshness"),
+            _issue(self.tmpdir, "ops/deploy.md", "check_freshness"),
+        ], {})
+        proc = self._run("--area", "ops", "--validator", "check_freshness")
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        self.assertEqual(json.loads(proc.stdout)["tier1"]["count"], 1)
+
+    def test_missing_cache_exits_nonzero(self):
+        proc = self._run("--area", "api")
+        self.assertEqual(proc.returncode, 1)
+        self.assertIn("No cached health report", proc.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
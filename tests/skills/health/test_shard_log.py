@@ -0,0 +1,123 @@
+"""Tests for skills.health.scripts.shard_log — per-writer JSONL shards."""
+
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import shard_log
+from shard_log import append_record, compact_shards, read_records, shard_dir, writer_id
+
+
+def _append_many(log_path: str, writer: str, count: int) -> None:
+    for i in range(count):
+        append_record(Path(log_path), {"writer": writer, "i": i, "pad": "x" * 2000}, writer="shared")
+
+
+class TestAppendRecord(unittest.TestCase):
+    """Tests for append_record and read_records."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.log = self.tmpdir / ".dewey" / "utilization" / "log.jsonl"
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_writers_get_their_own_shard(self):
+        one = append_record(self.log, {"n": 1}, writer="one")
+        two = append_record(self.log, {"n": 2}, writer="two")
+        self.assertEqual((one.parent, one.name, two.name), (shard_dir(self.log), "one.jsonl", "two.jsonl"))
+        self.assertFalse(self.log.exists())
+        self.assertEqual(sorted(r["n"] for r in read_records(self.log)), [1, 2])
+
+    def test_main_log_read_first_and_partial_lines_skipped(self):
+        self.log.parent.mkdir(parents=True)
+        self.log.write_text(json.dumps({"n": 0}) + "\nnot json\n")
+        shard = append_record(self.log, {"n": 1}, writer="one")
+        with shard.open("a") as fh:
+            fh.write('{"n": 2')
+        self.assertEqual([r["n"] for r in read_records(self.log)], [0, 1])
+
+    def test_writer_id_is_filesystem_safe(self):
+        self.assertEqual(writer_id("../a b/c"), ".._a_b_c")
+        with patch.dict(os.environ, {"DEWEY_LOG_WRITER": "ci-job"}):
+            self.assertEqual(writer_id(), "ci-job")
+
+    def test_oversized_record_written_under_lock(self):
+        with patch.object(shard_log, "MAX_RECORD_BYTES", 16), \
+                patch.object(shard_log, "locked", wraps=shard_log.locked) as spy:
+            append_record(self.log, {"n": 1}, writer="one")
+            append_record(self.log, {"pad": "x" * 32}, writer="one")
+        self.assertEqual(spy.call_count, 1)
+        self.assertEqual(len(read_records(self.log)), 2)
+
+    def test_concurrent_processes_never_interleave(self):
+        ctx = multiprocessing.get_context("spawn" if os.name == "nt" else "fork")
+        procs = [ctx.Process(target=_append_many, args=(str(self.log), f"p{n}", 100)) for n in range(4)]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join(30)
+        lines = (shard_dir(self.log) / "shared.jsonl").read_text().splitlines()
+        records = [json.loads(line) for line in lines]
+        self.assertEqual(len(records), 400)
+        for n in range(4):
+            self.assertEqual([r["i"] for r in records if r["writer"] == f"p{n}"], list(range(100)))
+
+
+class TestCompactShards(unittest.TestCase):
+    """Tests for compact_shards."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.log = self.tmpdir / "log.jsonl"
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _age(self, path: Path, seconds: float) -> None:
+        stamp = path.stat().st_mtime - seconds
+        os.utime(path, (stamp, stamp))
+
+    def test_only_idle_shards_compacted(self):
+        idle = append_record(self.log, {"n": 1}, writer="idle")
+        with idle.open("a") as fh:
+            fh.write('{"n": 9')
+        active = append_record(self.log, {"n": 2}, writer="active")
+        self._age(idle, shard_log.COMPACT_IDLE_SECONDS + 1)
+        seen = []
+
+        compacted = compact_shards(self.log, on_compact=lambda shard, data: seen.append((shard.name, data)))
+        self.assertEqual(compacted, [idle])
+        # The torn tail is kept, newline-terminated, and skipped by readers
+        self.assertEqual(seen, [("idle.jsonl", b'{"n": 1}\n{"n": 9\n')])
+        self.assertFalse(idle.exists())
+        self.assertTrue(active.exists())
+        self.assertEqual(self.log.read_text(), '{"n": 1}\n{"n": 9\n')
+        self.assertEqual([r["n"] for r in read_records(self.log)], [1, 2])
+
+    def test_record_written_during_compaction_kept(self):
+        idle = append_record(self.log, {"n": 1}, writer="idle")
+        self._age(idle, shard_log.COMPACT_IDLE_SECONDS + 1)
+        # The writer wakes up while its shard is being compacted
+        compact_shards(self.log, on_compact=lambda shard, data: append_record(self.log, {"n": 2}, writer="idle"))
+        self.assertEqual(read_records(idle), [{"n": 2}])
+        self.assertEqual([r["n"] for r in read_records(self.log)], [1, 2])
+
+    def test_interrupted_compaction_finished(self):
+        idle = append_record(self.log, {"n": 1}, writer="idle")
+        os.replace(idle, idle.with_name("idle.jsonl.compacting"))
+        append_record(self.log, {"n": 2}, writer="idle")
+        self.assertEqual(compact_shards(self.log), [idle])
+        self.assertEqual(self.log.read_text(), '{"n": 1}\n')
+        self.assertEqual(list(shard_dir(self.log).iterdir()), [idle])
+        self.assertEqual([r["n"] for r in read_records(self.log)], [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""Tests for skills.health.scripts.similarity — TF-IDF topic similarity."""
+
+import json
+import shutil
+import tempfile
+import unittest
+from collections import Counter
+from pathlib import Path
+from unittest.mock import patch
+
+import similarity
+from similarity import SimilarityIndex, load_similarity_index, suggest_see_also, tokenize
+
+
+def _write(path: Path, text: str) -> Path:
+    """Helper — write *text* to *path*, creating parents as needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def _topic(title: str, prose: str) -> str:
+    return f"---\ndepth: working\n---\n\n# {title}\n\n{prose}\n"
+
+
+class TestTokenize(unittest.TestCase):
+    """Tests for tokenize."""
+
+    def test_drops_frontmatter_code_links_and_stopwords(self):
+        text = (
+            "---\nsources:\n  - https://example.com/frontmatter\n---\n\n"
+            "# Bidding\n\nThe bidding [strategy](strategy-notes.md) matters https://example.com/url\n\n"
+            "```\ncodeword\n```\n"
+        )
+        self.assertEqual(tokenize(text), Counter({"bidding": 2, "strategy": 1, "matters": 1}))
+
+
+class TestSimilarityIndex(unittest.TestCase):
+    """Tests for SimilarityIndex."""
+
+    def setUp(self):
+        self.index = SimilarityIndex({
+            "a/bidding.md": Counter({"bidding": 3, "auction": 2, "budget": 1}),
+            "b/auctions.md": Counter({"auction": 3, "bidding": 1, "reserve": 1}),
+            "c/recipes.md": Counter({"flour": 2, "oven": 1}),
+            "d/baking.md": Counter({"flour": 1, "oven": 2, "yeast": 1}),
+            "e/misc.md": Counter({"weather": 1}),
+        })
+
+    def test_nearest_first(self):
+        neighbours = self.index.neighbours("a/bidding.md", k=2)
+        self.assertEqual([key for key, _ in neighbours], ["b/auctions.md"])
+        self.assertGreater(neighbours[0][1], 0.3)
+
+    def test_exclude_and_unrelated(self):
+        self.assertEqual(self.index.neighbours("a/bidding.md", exclude={"b/auctions.md"}), [])
+        self.assertEqual(self.index.neighbours("e/misc.md"), [])
+
+    def test_update_and_remove(self):
+        self.index.update("f/ovens.md", Counter({"oven": 3, "yeast": 2}))
+        self.assertEqual(self.index.neighbours("f/ovens.md", k=1)[0][0], "d/baking.md")
+        self.index.remove("d/baking.md")
+        self.assertNotIn("d/baking.md", self.index)
+        self.assertEqual(self.index.neighbours("f/ovens.md", k=1)[0][0], "c/recipes.md")
+
+    def test_common_terms_not_indexed(self):
+        index = SimilarityIndex({f"x/{i}.md": Counter({"everywhere": 1, f"own{i}": 1}) for i in range(6)})
+        self.assertEqual(index.neighbours("x/0.md"), [])
+
+
+class TestLoadAndSuggest(unittest.TestCase):
+    """Tests for load_similarity_index and suggest_see_also."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        docs = self.tmpdir / "docs"
+        _write(docs / "ads" / "overview.md", _topic("Ads", "bidding auction overview"))
+        _write(docs / "ads" / "bidding.md", _topic("Bidding", "Bidding strategy for auction budget pacing."))
+        _write(docs / "ads" / "bidding.ref.md", _topic("Ref", "bidding auction budget pacing"))
+        _write(docs / "ads" / "creative.md", _topic("Creative", "Banner creative design and copywriting."))
+        _write(docs / "sales" / "auctions.md", _topic("Auctions", "Auction bidding and budget pacing rules."))
+        _write(docs / "kitchen" / "baking.md", _topic("Baking", "Flour, oven temperature and yeast."))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_indexes_working_topics_only(self):
+        index = load_similarity_index(self.tmpdir)
+        self.assertEqual(len(index), 4)
+        self.assertNotIn("ads/overview.md", index)
+        self.assertNotIn("ads/bidding.ref.md", index)
+
+    def test_cache_reused_until_content_changes(self):
+        load_similarity_index(self.tmpdir)
+        cache = self.tmpdir / ".dewey" / "health" / "similarity.json"
+        self.assertEqual(len(json.loads(cache.read_text())["docs"]), 4)
+
+        with patch.object(similarity, "tokenize", wraps=tokenize) as spy:
+            load_similarity_index(self.tmpdir)
+            self.assertEqual(spy.call_count, 0)
+            _write(self.tmpdir / "docs" / "kitchen" / "baking.md", _topic("Baking", "Sourdough starter."))
+            (self.tmpdir / "docs" / "ads" / "creative.md").unlink()
+            load_similarity_index(self.tmpdir)
+            self.assertEqual(spy.call_count, 1)
+        self.assertEqual(
+            sorted(json.loads(cache.read_text())["docs"]),
+            ["ads/bidding.md", "kitchen/baking.md", "sales/auctions.md"],
+        )
+
+    def test_suggestions_cross_areas_and_skip_existing_links(self):
+        suggestions = {s["file"]: s["suggestions"] for s in suggest_see_also(self.tmpdir)}
+        self.assertEqual([s["file"] for s in suggestions["ads/bidding.md"]], ["sales/auctions.md"])
+        self.assertEqual([s["file"] for s in suggestions["sales/auctions.md"]], ["ads/bidding.md"])
+        self.assertNotIn("kitchen/baking.md", suggestions)
+
+        _write(
+            self.tmpdir / "docs" / "ads" / "bidding.md",
+            _topic("Bidding", "Bidding strategy for auction budget pacing. [Auctions](../sales/auctions.md)"),
+        )
+        suggestions = {s["file"] for s in suggest_see_also(self.tmpdir)}
+        self.assertNotIn("ads/bidding.md", suggestions)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+"""Tests for skills.health.scripts.source_registry — knowledge-base-wide source registry."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from source_registry import (
+    canonicalize_url,
+    classify_domain,
+    frontmatter_source_entries,
+    load_registry,
+    lookup_source,
+    record_source_check,
+    source_diversity_report,
+    update_registry,
+    url_domain,
+)
+
+
+def _topic(path: Path, *sources: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = "\n".join(f"  - {s}" for s in sources)
+    path.write_text(f"---\nsources:\n{lines}\ndepth: working\n---\n\n# Topic\n")
+    return path
+
+
+class TestUrlHelpers(unittest.TestCase):
+    """Tests for canonicalize_url, url_domain, classify_domain and entry parsing."""
+
+    def test_spellings_canonicalize_together(self):
+        variants = [
+            "https://docs.python.org/3/library/",
+            "http://www.docs.python.org/3/library",
+            "https://DOCS.python.org:443/3/library/#array",
+            "https://docs.python.org/3/library/?utm_source=x",
+        ]
+        self.assertEqual({canonicalize_url(v) for v in variants}, {"https://docs.python.org/3/library"})
+
+    def test_meaningful_query_kept_and_sorted(self):
+        self.assertEqual(
+            canonicalize_url("https://example.com/search?q=b&a=1"),
+            "https://example.com/search?a=1&q=b",
+        )
+
+    def test_nondefault_port_kept(self):
+        self.assertEqual(canonicalize_url("http://example.com:8080/x"), "https://example.com:8080/x")
+
+    def test_malformed_port_left_as_written(self):
+        self.assertEqual(canonicalize_url(" https://example.com:80a/stats "), "https://example.com:80a/stats")
+        self.assertEqual(url_domain("https://[example.com/stats"), "")
+
+    def test_url_domain(self):
+        self.assertEqual(url_domain("https://WWW.Example.com/a"), "example.com")
+
+    def test_classify_domain(self):
+        self.assertEqual(classify_domain("w3.org"), "authoritative")
+        self.assertEqual(classify_domain("cs.stanford.edu"), "authoritative")
+        self.assertEqual(classify_domain("medium.com"), "community")
+        self.assertEqual(classify_domain("example.com"), "other")
+
+    def test_entries_handle_structured_and_placeholders(self):
+        fm = {"sources": ["url: https://a.com", "<!-- Add primary source URL -->", "ftp://b"]}
+        self.assertEqual(frontmatter_source_entries(fm), ["https://a.com", "ftp://b"])
+        self.assertEqual(frontmatter_source_entries({"sources": "x"}), [])
+
+
+class TestRegistry(unittest.TestCase):
+    """Tests for update_registry and lookups."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.a = _topic(self.tmpdir / "docs" / "area" / "a.md", "https://w3.org/spec/", "https://medium.com/x")
+        self.b = _topic(self.tmpdir / "docs" / "area" / "b.md", "http://www.w3.org/spec")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_maps_canonical_url_to_citing_files(self):
+        registry = update_registry(self.tmpdir, [self.a, self.b])
+        entry = registry["sources"]["https://w3.org/spec"]
+        self.assertEqual(entry["files"], ["docs/area/a.md", "docs/area/b.md"])
+        self.assertEqual(entry["domain"], "w3.org")
+        self.assertEqual(entry["authority"], "authoritative")
+
+    def test_lookup_any_spelling(self):
+        update_registry(self.tmpdir, [self.a, self.b])
+        self.assertEqual(len(lookup_source(self.tmpdir, "https://www.w3.org/spec/#intro")["files"]), 2)
+        self.assertIsNone(lookup_source(self.tmpdir, "https://unknown.example/"))
+
+    def test_unchanged_files_not_reparsed(self):
+        update_registry(self.tmpdir, [self.a, self.b])
+        registry_path = self.tmpdir / ".dewey" / "sources" / "registry.json"
+        before = registry_path.stat().st_mtime_ns
+        os.utime(registry_path, ns=(before - 10**9, before - 10**9))
+        update_registry(self.tmpdir, [self.a, self.b])
+        self.assertEqual(registry_path.stat().st_mtime_ns, before - 10**9)
+
+    def test_removed_file_and_source_drop_out(self):
+        update_registry(self.tmpdir, [self.a, self.b])
+        registry = update_registry(self.tmpdir, [self.b])
+        self.assertNotIn("https://medium.com/x", registry["sources"])
+        self.assertEqual(registry["sources"]["https://w3.org/spec"]["files"], ["docs/area/b.md"])
+
+    def test_edited_file_picked_up(self):
+        update_registry(self.tmpdir, [self.a, self.b])
+        _topic(self.b, "https://example.com/new-source")
+        registry = update_registry(self.tmpdir, [self.a, self.b])
+        self.assertIn("https://example.com/new-source", registry["sources"])
+        self.assertEqual(registry["sources"]["https://w3.org/spec"]["files"], ["docs/area/a.md"])
+
+    def test_last_check_survives_update(self):
+        update_registry(self.tmpdir, [self.a, self.b])
+        record_source_check(self.tmpdir, [{"url": "https://w3.org/spec", "status": 200}])
+        _topic(self.b, "https://w3.org/spec", "https://example.com/other")
+        registry = update_registry(self.tmpdir, [self.a, self.b])
+        self.assertEqual(registry["sources"]["https://w3.org/spec"]["last_check"]["status"], 200)
+
+    def test_diversity_report(self):
+        report = source_diversity_report(update_registry(self.tmpdir, [self.a, self.b]))
+        self.assertEqual(report["total_sources"], 2)
+        self.assertEqual(report["by_authority"], {"authoritative": 1, "community": 1})
+        self.assertEqual(report["shared_sources"][0]["url"], "https://w3.org/spec/")
+
+    def test_malformed_url_does_not_abort_update(self):
+        bad = _topic(self.tmpdir / "docs" / "area" / "c.md", "https://example.com:80a/stats")
+        registry = update_registry(self.tmpdir, [self.a, self.b, bad])
+        self.assertEqual(registry["sources"]["https://example.com:80a/stats"]["files"], ["docs/area/c.md"])
+        self.assertIn("https://w3.org/spec", registry["sources"])
+
+    def test_corrupt_registry_treated_as_empty(self):
+        path = self.tmpdir / ".dewey" / "sources" / "registry.json"
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+        self.assertEqual(load_registry(self.tmpdir), {"files": {}, "sources": {}})
+        self.assertEqual(len(update_registry(self.tmpdir, [self.a])["sources"]), 2)
+        json.loads(path.read_text())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+"""Tests for skills.health.scripts.source_snapshots — offline source snapshot store."""
+
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+
+from source_snapshots import (
+    _normalize_text,
+    fetch_source,
+    read_source_snapshot,
+    read_source_text,
+    refresh_sources,
+    source_drift_status,
+)
+from tier2_triggers import trigger_source_drift
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Serves ``server.pages[path]`` with an ETag; honours If-None-Match."""
+
+    def do_GET(self):
+        self.server.requests.append(dict(self.headers))
+        body = self.server.pages.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        etag = f'"{hash(body) & 0xFFFFFFFF:x}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        payload = body.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", "Mon, 02 Feb 2026 00:00:00 GMT")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _SnapshotTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.server = HTTPServer(("127.0.0.1", 0), _StandInHandler)
+        self.server.pages = {"/doc": "<html><body><p>Hello   world</p></body></html>"}
+        self.server.requests = []
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/doc"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.tmpdir)
+
+
+class TestNormalizeText(unittest.TestCase):
+    """Tests for _normalize_text."""
+
+    def test_strips_markup_and_whitespace(self):
+        raw = "<p>Hello&nbsp;<b>world</b></p>\n<script>var x = 1;</script><!-- c -->"
+        self.assertEqual(_normalize_text(raw), "Hello world")
+
+    def test_markup_only_change_same_text(self):
+        self.assertEqual(
+            _normalize_text("<div>Same text</div>"),
+            _normalize_text("<section class='x'>Same   text</section>"),
+        )
+
+
+class TestFetchSource(_SnapshotTestCase):
+    """Tests for fetch_source against a local HTTP stand-in."""
+
+    def test_first_fetch_stores_snapshot(self):
+        result = fetch_source(self.tmpdir, self.url)
+        self.assertEqual(result["status"], 200)
+        self.assertFalse(result["changed"])
+        snap = read_source_snapshot(self.tmpdir, self.url)
+        self.assertEqual(snap["fingerprint"], result["fingerprint"])
+        self.assertIsNotNone(snap["etag"])
+        self.assertEqual(read_source_text(self.tmpdir, self.url), "Hello world")
+
+    def test_refetch_is_conditional(self):
+        fetch_source(self.tmpdir, self.url)
+        result = fetch_source(self.tmpdir, self.url)
+        self.assertEqual(result["status"], 304)
+        self.assertFalse(result["changed"])
+        self.assertIn("If-None-Match", self.server.requests[-1])
+        self.assertIn("If-Modified-Since", self.server.requests[-1])
+
+    def test_content_change_detected(self):
+        first = fetch_source(self.tmpdir, self.url)
+        self.server.pages["/doc"] = "<p>Hello brave new world</p>"
+        second = fetch_source(self.tmpdir, self.url)
+        self.assertEqual(second["status"], 200)
+        self.assertTrue(second["changed"])
+        self.assertNotEqual(first["fingerprint"], second["fingerprint"])
+        self.assertIsNotNone(read_source_snapshot(self.tmpdir, self.url)["changed"])
+
+    def test_http_error_keeps_previous_fingerprint(self):
+        first = fetch_source(self.tmpdir, self.url)
+        del self.server.pages["/doc"]
+        result = fetch_source(self.tmpdir, self.url)
+        self.assertEqual(result["status"], 404)
+        self.assertEqual(result["fingerprint"], first["fingerprint"])
+
+    def test_refresh_dedupes_urls(self):
+        results = refresh_sources(self.tmpdir, [self.url, self.url])
+        self.assertEqual(len(results), 1)
+        self.assertEqual(len(self.server.requests), 1)
+
+
+class TestSourceDriftStatus(unittest.TestCase):
+    """Tests for source_drift_status."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.url = "https://example.com/doc"
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _snap(self, first_fetched, changed=None):
+        from source_snapshots import _snapshot_key
+        d = self.tmpdir / ".dewey" / "sources"
+        d.mkdir(parents=True, exist_ok=True)
+        (d / f"{_snapshot_key(self.url)}.json").write_text(json.dumps({
+            "url": self.url,
+            "fingerprint": "abc",
+            "first_fetched": first_fetched,
+            "changed": changed,
+        }))
+
+    def test_no_snapshot_unknown(self):
+        self.assertEqual(source_drift_status(self.tmpdir, self.url, "2026-01-01"), "unknown")
+
+    def test_baseline_before_validation_stable(self):
+        self._snap("2025-12-01T00:00:00")
+        self.assertEqual(source_drift_status(self.tmpdir, self.url, "2026-01-01"), "stable")
+
+    def test_change_after_validation(self):
+        self._snap("2025-12-01T00:00:00", changed="2026-02-01T00:00:00")
+        self.assertEqual(source_drift_status(self.tmpdir, self.url, "2026-01-01"), "changed")
+
+    def test_baseline_after_validation_unknown(self):
+        self._snap("2026-02-01T00:00:00")
+        self.assertEqual(source_drift_status(self.tmpdir, self.url, "2026-01-01"), "unknown")
+
+
+class TestDriftTriggerWithSnapshots(_SnapshotTestCase):
+    """trigger_source_drift consults snapshots when knowledge_base_root is given."""
+
+    def _topic(self, last_validated):
+        path = self.tmpdir / "docs" / "area" / "topic.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            f"---\nsources:\n  - {self.url}\nlast_validated: {last_validated}\n"
+            f"relevance: core\ndepth: working\n---\n\n# Topic\n"
+        )
+        return path
+
+    def _backdate_first_fetch(self, days):
+        from source_snapshots import _snapshot_key
+        meta_path = self.tmpdir / ".dewey" / "sources" / f"{_snapshot_key(self.url)}.json"
+        meta = json.loads(meta_path.read_text())
+        meta["first_fetched"] = (date.today() - timedelta(days=days)).isoformat() + "T00:00:00"
+        meta_path.write_text(json.dumps(meta))
+
+    def test_old_file_with_stable_sources_not_queued(self):
+        old = (date.today() - timedelta(days=200)).isoformat()
+        f = self._topic(old)
+        fetch_source(self.tmpdir, self.url)
+        self._backdate_first_fetch(300)
+        fetch_source(self.tmpdir, self.url)
+        self.assertEqual(trigger_source_drift(f, knowledge_base_root=self.tmpdir), [])
+        # Without the snapshot store, age alone still triggers
+        self.assertEqual(len(trigger_source_drift(f)), 1)
+
+    def test_fresh_file_with_changed_source_queued(self):
+        f = self._topic((date.today() - timedelta(days=5)).isoformat())
+        fetch_source(self.tmpdir, self.url)
+        self._backdate_first_fetch(30)
+        self.server.pages["/doc"] = "<p>Updated guidance</p>"
+        fetch_source(self.tmpdir, self.url)
+        results = trigger_source_drift(f, knowledge_base_root=self.tmpdir)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["context"]["changed_sources"], [self.url])
+
+    def test_unknown_baseline_falls_back_to_age(self):
+        old = (date.today() - timedelta(days=200)).isoformat()
+        f = self._topic(old)
+        fetch_source(self.tmpdir, self.url)
+        results = trigger_source_drift(f, knowledge_base_root=self.tmpdir)
+        self.assertEqual(len(results), 1)
+        self.assertIn("200 days old", results[0]["reason"])
+
+
+if __name__ == "__main__":
+    unittest.main()
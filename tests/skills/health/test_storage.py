@@ -0,0 +1,292 @@
+"""Tests for skills.health.scripts.storage — read-only storage backends."""
+
+import shutil
+import subprocess
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from datetime import date
+from pathlib import Path, PurePosixPath
+
+from check_knowledge_base import run_health_check, run_tier2_prescreening
+from storage import (
+    GitStorage,
+    KBPath,
+    MemoryStorage,
+    Storage,
+    TarStorage,
+    ZipStorage,
+    git_reader,
+    is_writable,
+    open_knowledge_base,
+)
+
+
+def _valid_md(depth: str = "working", stem: str = "topic") -> str:
+    """Helper — a small markdown document with frontmatter for *depth*."""
+    bodies = {
+        "working": (
+            "# Topic\n\n## Why This Matters\nWhy.\n\n## In Practice\nHow.\n\n"
+            "## Key Guidance\nPrinciples.\n\n## Watch Out For\nPitfalls.\n\n"
+            f"## Go Deeper\n- [{stem} Reference]({stem}.ref.md)\n- [External](https://example.com/r)\n"
+        ),
+        "overview": "# Overview\n\n## What This Covers\nScope.\n\n## How It's Organized\nStructure.\n",
+        "reference": f"# Reference\n\nLookup.\n\n**See also:** [{stem}]({stem}.md)\n",
+    }
+    return (
+        f"---\nsources:\n  - https://example.com/doc\nlast_validated: {date.today().isoformat()}\n"
+        f"relevance: core\ndepth: {depth}\n---\n\n{bodies[depth]}\n"
+    )
+
+
+def _memory_tree() -> KBPath:
+    return KBPath(MemoryStorage({
+        "AGENTS.md": "# Agents\n",
+        "docs/area/overview.md": "# Overview\n",
+        "docs/area/topic.md": "# Topic\n",
+        "docs/area/topic.ref.md": b"# Ref\n",
+    }))
+
+
+class TestStorageBase(unittest.TestCase):
+    """Storage is abstract; a backend must implement every lookup."""
+
+    def test_incomplete_backend_fails_at_instantiation(self):
+        class ReadOnly(Storage):
+            def read_bytes(self, path):
+                return b""
+
+        with self.assertRaises(TypeError):
+            ReadOnly()
+
+
+class TestMemoryStorage(unittest.TestCase):
+    """Tests for KBPath over a MemoryStorage tree."""
+
+    def setUp(self):
+        self.root = _memory_tree()
+
+    def test_read_and_existence(self):
+        topic = self.root / "docs" / "area" / "topic.md"
+        self.assertEqual(topic.read_text(), "# Topic\n")
+        self.assertTrue(topic.is_file())
+        self.assertTrue((self.root / "docs").is_dir())
+        self.assertFalse((self.root / "docs" / "missing.md").exists())
+        with self.assertRaises(FileNotFoundError):
+            (self.root / "docs" / "missing.md").read_text()
+
+    def test_open_reads_lines(self):
+        topic = self.root / "docs" / "area" / "topic.md"
+        with topic.open() as fh:
+            self.assertEqual(list(fh), ["# Topic\n"])
+        with topic.open("rb") as fh:
+            self.assertEqual(fh.read(), b"# Topic\n")
+        with self.assertRaises(ValueError):
+            topic.open("w")
+
+    def test_stat_reports_size(self):
+        self.assertEqual((self.root / "docs" / "area" / "topic.md").stat().st_size, len(b"# Topic\n"))
+
+    def test_iterdir_glob_rglob(self):
+        area = self.root / "docs" / "area"
+        self.assertEqual([p.name for p in area.iterdir()], ["overview.md", "topic.md", "topic.ref.md"])
+        self.assertEqual([p.name for p in self.root.glob("*.md")], ["AGENTS.md"])
+        self.assertEqual(len(list(self.root.rglob("*.md"))), 4)
+        self.assertEqual(list((self.root / "AGENTS.md").rglob("*")), [])
+
+    def test_pure_path_operations(self):
+        ref = self.root / "docs/area/topic.ref.md"
+        self.assertEqual(ref.stem, "topic.ref")
+        self.assertEqual(ref.suffix, ".md")
+        self.assertEqual(ref.parent, self.root / "docs" / "area")
+        self.assertEqual(ref.parts, ("docs", "area", "topic.ref.md"))
+        self.assertEqual(ref.relative_to(self.root / "docs"), PurePosixPath("area/topic.ref.md"))
+        self.assertEqual((ref.parent / ".." / "area" / "topic.md").resolve(), self.root / "docs/area/topic.md")
+        self.assertEqual(str(ref), ":memory:/docs/area/topic.ref.md")
+        with self.assertRaises(ValueError):
+            ref.relative_to(self.root / "other")
+
+    def test_not_writable(self):
+        self.assertFalse(is_writable(self.root))
+        self.assertTrue(is_writable(Path(".")))
+
+
+class TestArchives(unittest.TestCase):
+    """Tests for ZipStorage, TarStorage and open_knowledge_base."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.kb = self.tmpdir / "kb-1.0"
+        area = self.kb / "docs" / "area"
+        area.mkdir(parents=True)
+        (self.kb / "AGENTS.md").write_text("# Agents\n")
+        (area / "overview.md").write_text(_valid_md(depth="overview"))
+        (area / "topic.md").write_text(_valid_md(stem="topic"))
+        (area / "topic.ref.md").write_text(_valid_md(depth="reference", stem="topic"))
+        (area / "broken.md").write_text("---\ndepth: working\n---\n\n# Broken\n\nSee [gone](gone.md).\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _zip(self, wrapped: bool = True) -> Path:
+        archive = self.tmpdir / "kb.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            for path in sorted(self.kb.rglob("*")):
+                base = self.tmpdir if wrapped else self.kb
+                zf.write(path, str(path.relative_to(base)))
+        return archive
+
+    def _tar(self) -> Path:
+        archive = self.tmpdir / "kb.tar.gz"
+        with tarfile.open(archive, "w:gz") as tf:
+            tf.add(self.kb, arcname="kb-1.0")
+        return archive
+
+    def test_zip_descends_into_single_top_level_dir(self):
+        root = open_knowledge_base(self._zip())
+        self.assertIsInstance(root.storage, ZipStorage)
+        self.assertTrue((root / "docs" / "area" / "topic.md").is_file())
+
+    def test_zip_without_wrapper_dir(self):
+        root = open_knowledge_base(self._zip(wrapped=False))
+        self.assertEqual(sorted(p.name for p in root.iterdir()), ["AGENTS.md", "docs"])
+
+    def test_tar_reads_members(self):
+        root = open_knowledge_base(self._tar())
+        self.assertIsInstance(root.storage, TarStorage)
+        self.assertEqual((root / "AGENTS.md").read_text(), "# Agents\n")
+
+    def test_member_sizes_without_reading(self):
+        for archive in (self._zip(), self._tar()):
+            root = open_knowledge_base(archive)
+            with self.subTest(archive=archive.name):
+                self.assertEqual((root / "AGENTS.md").stat().st_size, len(b"# Agents\n"))
+
+    def test_directory_stays_a_path(self):
+        self.assertEqual(open_knowledge_base(self.kb), self.kb)
+
+    def _fingerprints(self, report: dict) -> list:
+        return sorted((i["validator"], i["fingerprint"]) for i in report["issues"])
+
+    def test_health_check_on_archive_matches_directory(self):
+        expected = run_health_check(self.kb, _persist_history=False)
+        self.assertTrue(expected["issues"])
+        for archive in (self._zip(), self._tar()):
+            actual = run_health_check(open_knowledge_base(archive))
+            self.assertEqual(self._fingerprints(actual), self._fingerprints(expected))
+            self.assertEqual(actual["summary"], expected["summary"])
+
+    def test_tier2_on_archive_matches_directory(self):
+        def triggers(report, root):
+            return sorted(
+                (str(PurePosixPath(item["file"][len(str(root)) + 1:])), item["trigger"])
+                for item in report["queue"]
+            )
+
+        expected = run_tier2_prescreening(self.kb, _persist_history=False, use_memo=False)
+        root = open_knowledge_base(self._zip())
+        actual = run_tier2_prescreening(root, use_memo=False)
+        self.assertEqual(triggers(actual, root), triggers(expected, self.kb))
+
+    def test_archive_run_writes_nothing(self):
+        archive = self._zip()
+        run_health_check(open_knowledge_base(archive))
+        run_tier2_prescreening(open_knowledge_base(archive))
+        self.assertEqual(sorted(p.name for p in self.tmpdir.iterdir()), ["kb-1.0", "kb.zip"])
+        self.assertFalse((self.kb / ".dewey").exists())
+
+
+class TestGitStorage(unittest.TestCase):
+    """Tests for GitStorage and open_knowledge_base(rev=...)."""
+
+    def setUp(self):
+        self.repo = Path(tempfile.mkdtemp()).resolve()
+        self.kb = self.repo / "kb"
+        self._git("init", "-q")
+        area = self.kb / "docs" / "area"
+        area.mkdir(parents=True)
+        (self.kb / "AGENTS.md").write_text("# Agents\n")
+        (area / "overview.md").write_text(_valid_md(depth="overview"))
+        (area / "topic.md").write_text(_valid_md(stem="topic"))
+        (area / "topic.ref.md").write_text(_valid_md(depth="reference", stem="topic"))
+        self.first = self._commit("first")
+        (area / "broken.md").write_text("---\ndepth: working\n---\n\n# Broken\n\nSee [gone](gone.md).\n")
+        (area / "topic.md").write_text(_valid_md(stem="topic") + "\nEdited.\n")
+        self.second = self._commit("second")
+
+    def tearDown(self):
+        shutil.rmtree(self.repo)
+
+    def _git(self, *args: str) -> str:
+        return subprocess.run(
+            ["git", "-C", str(self.repo), "-c", "user.name=t", "-c", "user.email=t@t", *args],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+
+    def _commit(self, message: str) -> str:
+        self._git("add", "-A")
+        self._git("commit", "-q", "-m", message)
+        return self._git("rev-parse", "HEAD")
+
+    def test_reads_each_revision(self):
+        old = open_knowledge_base(self.kb, rev=self.first)
+        new = open_knowledge_base(self.kb, rev="HEAD")
+        self.assertEqual(old.storage.commit, self.first)
+        self.assertEqual(new.storage.commit, self.second)
+        self.assertFalse((old / "docs/area/broken.md").exists())
+        self.assertTrue((new / "docs/area/broken.md").is_file())
+        self.assertTrue((new / "docs/area/topic.md").read_text().endswith("Edited.\n"))
+        self.assertNotIn("Edited.", (old / "docs/area/topic.md").read_text())
+        self.assertEqual(str(old / "AGENTS.md"), f"{self.first[:12]}/kb/AGENTS.md")
+
+    def test_directory_queries(self):
+        root = open_knowledge_base(self.kb, rev="HEAD")
+        self.assertEqual([p.name for p in root.iterdir()], ["AGENTS.md", "docs"])
+        self.assertTrue((root / "docs").is_dir())
+        self.assertFalse((root / "AGENTS.md" / "x").exists())
+        self.assertEqual(len(list(root.rglob("*.md"))), 5)
+        with self.assertRaises(IsADirectoryError):
+            (root / "docs").read_bytes()
+
+    def test_stat_reports_blob_size(self):
+        root = open_knowledge_base(self.kb, rev="HEAD")
+        topic = root / "docs/area/topic.md"
+        self.assertEqual(topic.stat().st_size, len(topic.read_bytes()))
+        with self.assertRaises(FileNotFoundError):
+            (root / "docs/missing.md").stat()
+
+    def test_revisions_share_one_cat_file_process(self):
+        reader = git_reader(self.repo)
+        pid = reader._proc.pid
+        for rev in (self.first, self.second, "HEAD~1"):
+            root = open_knowledge_base(self.kb, rev=rev)
+            self.assertIs(root.storage.reader, reader)
+            (root / "docs/area/topic.md").read_text()
+        self.assertEqual(reader._proc.pid, pid)
+        self.assertIsNone(reader._proc.poll())
+
+    def test_unknown_revision(self):
+        with self.assertRaises(FileNotFoundError):
+            GitStorage(git_reader(self.repo), "no-such-branch")
+
+    def test_missing_knowledge_base_at_revision(self):
+        (self.repo / "later").mkdir()
+        with self.assertRaises(FileNotFoundError):
+            open_knowledge_base(self.repo / "later", rev=self.first)
+
+    def test_health_check_at_revision_matches_checkout(self):
+        actual = run_health_check(open_knowledge_base(self.kb, rev="HEAD"))
+        old = run_health_check(open_knowledge_base(self.kb, rev=self.first))
+        self.assertFalse((self.kb / ".dewey").exists())
+        self.assertLess(old["summary"]["fail_count"], actual["summary"]["fail_count"])
+
+        expected = run_health_check(self.kb, _persist_history=False)
+        self.assertEqual(
+            sorted(i["fingerprint"] for i in actual["issues"]),
+            sorted(i["fingerprint"] for i in expected["issues"]),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
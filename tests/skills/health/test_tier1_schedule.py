@@ -0,0 +1,75 @@
+"""Tests for skills.health.scripts.tier1_schedule — budgeted validator ordering."""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from tier1_schedule import estimate_ms, load_timings, plan_order, record_timings
+
+
+class TestTimings(unittest.TestCase):
+    """Tests for load_timings and record_timings."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_missing_file_is_empty(self):
+        self.assertEqual(load_timings(self.tmpdir), {})
+
+    def test_first_run_stores_ms_per_file(self):
+        record_timings(self.tmpdir, {"check_readability": 40.0}, 10)
+        self.assertEqual(load_timings(self.tmpdir), {"check_readability": 4.0})
+
+    def test_later_runs_are_averaged(self):
+        record_timings(self.tmpdir, {"check_readability": 10.0}, 1)
+        record_timings(self.tmpdir, {"check_readability": 20.0}, 1)
+        self.assertAlmostEqual(load_timings(self.tmpdir)["check_readability"], 13.0)
+
+    def test_small_change_not_rewritten(self):
+        self.assertTrue(record_timings(self.tmpdir, {"check_readability": 10.0}, 1))
+        path = self.tmpdir / ".dewey" / "health" / "timings.json"
+        before = path.stat().st_mtime_ns
+        self.assertFalse(record_timings(self.tmpdir, {"check_readability": 10.5}, 1))
+        self.assertEqual(path.stat().st_mtime_ns, before)
+        self.assertEqual(load_timings(self.tmpdir), {"check_readability": 10.0})
+        self.assertTrue(record_timings(self.tmpdir, {"check_frontmatter": 1.0}, 1))
+        self.assertEqual(list(path.parent.glob("*.tmp")), [])
+
+    def test_other_validators_kept(self):
+        record_timings(self.tmpdir, {"check_frontmatter": 1.0}, 1)
+        record_timings(self.tmpdir, {"check_readability": 2.0}, 1)
+        self.assertEqual(sorted(load_timings(self.tmpdir)), ["check_frontmatter", "check_readability"])
+
+    def test_corrupt_file_is_empty(self):
+        path = self.tmpdir / ".dewey" / "health" / "timings.json"
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+        self.assertEqual(load_timings(self.tmpdir), {})
+        path.write_text(json.dumps({"validators": {"check_x": {"ms_per_file": "slow"}}}))
+        self.assertEqual(load_timings(self.tmpdir), {})
+
+
+class TestPlanOrder(unittest.TestCase):
+    """Tests for estimate_ms and plan_order."""
+
+    def test_priors_used_without_timings(self):
+        self.assertGreater(estimate_ms("check_duplicate_content", 10, {}), estimate_ms("check_freshness", 10, {}))
+
+    def test_recorded_timings_override_priors(self):
+        self.assertEqual(estimate_ms("check_duplicate_content", 10, {"check_duplicate_content": 0.01}), 0.1)
+
+    def test_high_signal_first_then_cheapest(self):
+        timings = {"check_readability": 5.0, "check_freshness": 0.1, "check_frontmatter": 50.0}
+        order = plan_order(
+            ["check_readability", "check_frontmatter", "check_freshness", "check_cross_references"], 10, timings,
+        )
+        self.assertEqual(order, ["check_frontmatter", "check_cross_references", "check_freshness", "check_readability"])
+
+
+if __name__ == "__main__":
+    unittest.main()
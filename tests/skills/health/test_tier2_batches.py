@@ -0,0 +1,156 @@
+"""Tests for skills.health.scripts.tier2_batches — token-budgeted Tier 2 batching."""
+
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+
+from tier2_batches import (
+    _ITEM_OVERHEAD_TOKENS,
+    estimate_tokens,
+    group_queue_by_file,
+    schedule_review_batches,
+)
+
+
+def _write(path: Path, text: str) -> Path:
+    """Helper — write *text* to *path*, creating parents as needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def _working(last_validated: str, why_words: int = 10, practice_words: int = 10) -> str:
+    return (
+        f"---\nsources:\n  - https://example.com\nlast_validated: {last_validated}\n"
+        f"relevance: core\ndepth: working\n---\n\n# Topic\n\n"
+        f"## Why This Matters\n{'why ' * why_words}\n\n"
+        f"## In Practice\n{'practice ' * practice_words}\n"
+    )
+
+
+def _item(path: Path, trigger: str) -> dict:
+    return {"file": str(path), "trigger": trigger, "reason": "r", "context": {}}
+
+
+class TestGroupQueueByFile(unittest.TestCase):
+    """Tests for group_queue_by_file."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_groups_items_per_file(self):
+        a = _write(self.tmpdir / "a.md", _working(date.today().isoformat()))
+        b = _write(self.tmpdir / "b.md", _working(date.today().isoformat()))
+        queue = [_item(a, "why_quality"), _item(b, "why_quality"), _item(a, "concrete_examples")]
+        groups = group_queue_by_file(queue)
+        self.assertEqual([g["file"] for g in groups], [str(a), str(b)])
+        self.assertEqual(len(groups[0]["items"]), 2)
+
+    def test_section_trigger_cheaper_than_whole_file(self):
+        a = _write(self.tmpdir / "a.md", _working(date.today().isoformat(), why_words=5, practice_words=500))
+        groups = group_queue_by_file([_item(a, "why_quality"), _item(a, "depth_accuracy")])
+        why, depth = groups[0]["items"]
+        self.assertLess(why["token_estimate"], depth["token_estimate"])
+        self.assertEqual(depth["token_estimate"], groups[0]["file_tokens"] + _ITEM_OVERHEAD_TOKENS)
+
+    def test_group_loads_file_once(self):
+        a = _write(self.tmpdir / "a.md", _working(date.today().isoformat()))
+        queue = [_item(a, t) for t in ("source_drift", "depth_accuracy", "why_quality")]
+        group = group_queue_by_file(queue)[0]
+        self.assertEqual(group["token_estimate"], group["file_tokens"] + 3 * _ITEM_OVERHEAD_TOKENS)
+        self.assertLess(group["token_estimate"], sum(i["token_estimate"] for i in group["items"]))
+
+    def test_estimate_tokens(self):
+        self.assertEqual(estimate_tokens("abcd" * 10), 10)
+
+
+class TestScheduleReviewBatches(unittest.TestCase):
+    """Tests for schedule_review_batches."""
+
+    def _group(self, name, tokens, age=0, severity=1):
+        return {"file": name, "items": [], "token_estimate": tokens, "age_days": age, "severity": severity}
+
+    def test_respects_budget(self):
+        groups = [self._group(f"f{i}", 400) for i in range(5)]
+        batches = schedule_review_batches(groups, token_budget=1000)
+        self.assertEqual(len(batches), 3)
+        for batch in batches:
+            self.assertLessEqual(batch["token_estimate"], 1000)
+        self.assertEqual([b["batch"] for b in batches], [1, 2, 3])
+
+    def test_priority_order(self):
+        groups = [
+            self._group("cold", 100, age=0, severity=1),
+            self._group("hot", 100, age=0, severity=1),
+            self._group("stale", 100, age=180, severity=1),
+        ]
+        batches = schedule_review_batches(groups, token_budget=100, read_counts={"hot": 50})
+        self.assertEqual([b["files"][0]["file"] for b in batches], ["hot", "stale", "cold"])
+
+    def test_oversized_group_gets_own_batch(self):
+        groups = [self._group("big", 5000), self._group("small", 100)]
+        batches = schedule_review_batches(groups, token_budget=1000)
+        big = [b for b in batches if b["files"][0]["file"] == "big"][0]
+        self.assertTrue(big["over_budget"])
+        self.assertEqual(len(big["files"]), 1)
+
+    def test_first_fit_fills_earlier_batch(self):
+        groups = [
+            self._group("a", 700, severity=3),
+            self._group("b", 700, severity=2),
+            self._group("c", 300, severity=1),
+        ]
+        batches = schedule_review_batches(groups, token_budget=1000)
+        self.assertEqual([g["file"] for g in batches[0]["files"]], ["a", "c"])
+
+
+class TestPrescreeningBatches(unittest.TestCase):
+    """run_tier2_prescreening emits batches when a token budget is given."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_batches_cover_queue(self):
+        from check_knowledge_base import run_tier2_prescreening
+
+        old = (date.today() - timedelta(days=200)).isoformat()
+        for name in ("one", "two", "three"):
+            _write(self.tmpdir / "docs" / "area" / f"{name}.md", _working(old))
+        result = run_tier2_prescreening(self.tmpdir, token_budget=2000, _persist_history=False)
+        self.assertIn("batches", result)
+        batched = [i for b in result["batches"] for g in b["files"] for i in g["items"]]
+        self.assertEqual(len(batched), len(result["queue"]))
+        self.assertEqual(result["summary"]["batch_count"], len(result["batches"]))
+
+    def test_no_budget_no_batches(self):
+        from check_knowledge_base import run_tier2_prescreening
+
+        _write(self.tmpdir / "docs" / "area" / "one.md", _working("2020-01-01"))
+        result = run_tier2_prescreening(self.tmpdir, _persist_history=False)
+        self.assertNotIn("batches", result)
+
+    def test_cli_rejects_non_positive_budget(self):
+        script = Path(__file__).resolve().parents[3] / "dewey" / "skills" / "health" / "scripts" / "check_knowledge_base.py"
+        for budget in ("0", "-5"):
+            with self.subTest(budget=budget):
+                result = subprocess.run(
+                    [sys.executable, str(script), "--knowledge-base-root", str(self.tmpdir),
+                     "--tier2", "--token-budget", budget],
+                    capture_output=True, text=True, timeout=10,
+                )
+                self.assertEqual(result.returncode, 2)
+                self.assertIn("--token-budget must be a positive", result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
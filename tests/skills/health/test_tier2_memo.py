@@ -0,0 +1,180 @@
+"""Tests for skills.health.scripts.tier2_memo — Tier 2 assessment memo."""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from check_knowledge_base import run_tier2_prescreening
+from tier2_memo import (
+    assessment_hash,
+    filter_assessed,
+    read_assessments,
+    record_assessment,
+)
+
+
+def _write(path: Path, text: str) -> Path:
+    """Helper — write *text* to *path*, creating parents as needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+_THIN_WORKING = (
+    "---\n"
+    "sources:\n"
+    "  - https://example.com/doc\n"
+    "last_validated: 2020-01-01\n"
+    "relevance: core\n"
+    "depth: working\n"
+    "---\n"
+    "\n"
+    "# Topic\n"
+    "\n"
+    "## In Practice\n"
+    "Just some text.\n"
+)
+
+
+class TestRecordAssessment(unittest.TestCase):
+    """Tests for record_assessment / read_assessments."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.topic = _write(self.tmpdir / "docs" / "area" / "topic.md", _THIN_WORKING)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_appends_jsonl_entry(self):
+        path = record_assessment(self.tmpdir, self.topic, "why_quality", "ok", "fine", writer="ci-1")
+        self.assertEqual(path, self.tmpdir / ".dewey" / "health" / "tier2-assessments.d" / "ci-1.jsonl")
+        entry = json.loads(path.read_text().strip())
+        self.assertEqual(entry["trigger"], "why_quality")
+        self.assertEqual(entry["verdict"], "ok")
+        self.assertEqual(entry["hash"], assessment_hash(self.tmpdir, self.topic, "why_quality"))
+
+    def test_latest_entry_wins(self):
+        record_assessment(self.tmpdir, self.topic, "why_quality", "flag")
+        record_assessment(self.tmpdir, self.topic, "why_quality", "ok")
+        memo = read_assessments(self.tmpdir)
+        self.assertEqual(len(memo), 1)
+        self.assertEqual(next(iter(memo.values()))["verdict"], "ok")
+
+    def test_writers_merged_latest_timestamp_wins(self):
+        late = record_assessment(self.tmpdir, self.topic, "why_quality", "ok", writer="agent-a")
+        record_assessment(self.tmpdir, self.topic, "why_quality", "flag", writer="agent-b")
+        entry = json.loads(late.read_text())
+        entry["timestamp"] = "2999-01-01T00:00:00"
+        late.write_text(json.dumps(entry) + "\n")
+        memo = read_assessments(self.tmpdir)
+        self.assertEqual(next(iter(memo.values()))["verdict"], "ok")
+
+    def test_incomplete_records_skipped(self):
+        shard = record_assessment(self.tmpdir, self.topic, "why_quality", "ok", writer="agent-a")
+        with shard.open("a") as fh:
+            fh.write(json.dumps({"trigger": "concrete_examples", "verdict": "ok"}) + "\n")
+            fh.write(json.dumps({"hash": "abc", "verdict": "ok", "timestamp": "2026-01-01T00:00:00"}) + "\n")
+        memo = read_assessments(self.tmpdir)
+        self.assertEqual([trigger for _, trigger in memo], ["why_quality"])
+
+    def test_unsharded_memo_still_read(self):
+        memo_path = self.tmpdir / ".dewey" / "health" / "tier2-assessments.jsonl"
+        memo_path.parent.mkdir(parents=True)
+        memo_path.write_text(json.dumps({
+            "hash": assessment_hash(self.tmpdir, self.topic, "why_quality"), "trigger": "why_quality",
+            "file": str(self.topic), "verdict": "flag", "note": "", "timestamp": "2026-01-01T00:00:00",
+        }) + "\n")
+        self.assertEqual(len(read_assessments(self.tmpdir)), 1)
+
+    def test_rejects_unknown_verdict(self):
+        with self.assertRaises(ValueError):
+            record_assessment(self.tmpdir, self.topic, "why_quality", "maybe")
+
+
+class TestFilterAssessed(unittest.TestCase):
+    """Tests for filter_assessed."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.topic = _write(self.tmpdir / "docs" / "area" / "topic.md", _THIN_WORKING)
+        self.queue = [
+            {"file": str(self.topic), "trigger": "why_quality", "reason": "", "context": {}},
+            {"file": str(self.topic), "trigger": "concrete_examples", "reason": "", "context": {}},
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_no_memo_keeps_everything(self):
+        pending, suppressed = filter_assessed(self.tmpdir, self.queue)
+        self.assertEqual(len(pending), 2)
+        self.assertEqual(suppressed, [])
+
+    def test_suppresses_assessed_trigger_only(self):
+        record_assessment(self.tmpdir, self.topic, "why_quality", "ok")
+        pending, suppressed = filter_assessed(self.tmpdir, self.queue)
+        self.assertEqual([i["trigger"] for i in pending], ["concrete_examples"])
+        self.assertEqual(suppressed[0]["memo"]["verdict"], "ok")
+
+    def test_content_change_requeues(self):
+        record_assessment(self.tmpdir, self.topic, "why_quality", "ok")
+        self.topic.write_text(_THIN_WORKING + "\nMore text.\n")
+        pending, suppressed = filter_assessed(self.tmpdir, self.queue)
+        self.assertEqual(len(pending), 2)
+        self.assertEqual(suppressed, [])
+
+    def test_ttl_expires_assessment(self):
+        memo_path = record_assessment(self.tmpdir, self.topic, "why_quality", "ok")
+        entry = json.loads(memo_path.read_text())
+        entry["timestamp"] = "2020-01-01T00:00:00"
+        memo_path.write_text(json.dumps(entry) + "\n")
+        pending, _ = filter_assessed(self.tmpdir, self.queue, ttl_days=30)
+        self.assertEqual(len(pending), 2)
+        pending, _ = filter_assessed(self.tmpdir, self.queue)
+        self.assertEqual(len(pending), 1)
+
+    def test_source_drift_hash_tracks_source_fingerprint(self):
+        from source_snapshots import _snapshot_key
+
+        before = assessment_hash(self.tmpdir, self.topic, "source_drift")
+        snap_dir = self.tmpdir / ".dewey" / "sources"
+        snap_dir.mkdir(parents=True)
+        (snap_dir / f"{_snapshot_key('https://example.com/doc')}.json").write_text(
+            json.dumps({"fingerprint": "new"})
+        )
+        self.assertNotEqual(before, assessment_hash(self.tmpdir, self.topic, "source_drift"))
+        self.assertEqual(
+            assessment_hash(self.tmpdir, self.topic, "why_quality"),
+            assessment_hash(self.tmpdir, self.topic, "why_quality"),
+        )
+
+
+class TestPrescreeningUsesMemo(unittest.TestCase):
+    """run_tier2_prescreening drops memoized items unless told otherwise."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.topic = _write(self.tmpdir / "docs" / "area" / "topic.md", _THIN_WORKING)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_memoized_trigger_suppressed(self):
+        before = run_tier2_prescreening(self.tmpdir, _persist_history=False)
+        self.assertIn("why_quality", before["summary"]["trigger_counts"])
+        record_assessment(self.tmpdir, self.topic, "why_quality", "flag")
+
+        after = run_tier2_prescreening(self.tmpdir, _persist_history=False)
+        self.assertNotIn("why_quality", after["summary"]["trigger_counts"])
+        self.assertEqual(after["summary"]["suppressed_by_memo"], 1)
+        self.assertEqual(len(after["queue"]), len(before["queue"]) - 1)
+
+        ignored = run_tier2_prescreening(self.tmpdir, _persist_history=False, use_memo=False)
+        self.assertEqual(len(ignored["queue"]), len(before["queue"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,9 @@ from pathlib import Path
 from typing import Optional
 
 from tier2_triggers import (
+    BODY_EXCERPT,
+    attach_excerpts,
+    extract_excerpts,
     trigger_citation_quality,
     trigger_concrete_examples,
     trigger_depth_accuracy,
@@ -668,5 +671,101 @@ class TestTriggerRecommendationCoverage(unittest.TestCase):
         self.assertEqual(results[0]["context"]["total_recommendations"], 3)
 
 
+# ======================================================================
+# TestExcerpts
+# ======================================================================
+
+
+class TestExcerpts(unittest.TestCase):
+    """Tests for extract_excerpts and attach_excerpts."""
+
+    _BODY = (
+        "# Topic\n"
+        "\n"
+        "## Why This Matters\n"
+        "Because it matters.\n"
+        "\n"
+        "## In Practice\n"
+        "Step one.\n"
+        "Step two.\n"
+        "\n"
+        "## Key Guidance\n"
+        "- Rec\n"
+    )
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.file = _write(self.tmpdir / "topic.md", _fm() + self._BODY)
+        self.fm_lines = _fm().count("\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _item(self, trigger):
+        return {"file": str(self.file), "trigger": trigger, "reason": "", "context": {}}
+
+    def test_section_text_and_line_range(self):
+        excerpts = extract_excerpts(self.file, ("In Practice",))
+        excerpt = excerpts["In Practice"]
+        self.assertEqual(excerpt["text"], "Step one.\nStep two.")
+        start = self.fm_lines + 7
+        self.assertEqual(excerpt["lines"], [start, start + 1])
+        lines = self.file.read_text().split("\n")
+        self.assertEqual(lines[start - 1], "Step one.")
+        self.assertFalse(excerpt["truncated"])
+
+    def test_missing_section_omitted(self):
+        self.assertEqual(extract_excerpts(self.file, ("Watch Out For",)), {})
+
+    def test_cap_truncates_at_line_boundary(self):
+        excerpt = extract_excerpts(self.file, ("In Practice",), max_chars=12)["In Practice"]
+        self.assertEqual(excerpt["text"], "Step one.")
+        self.assertTrue(excerpt["truncated"])
+
+    def test_over_long_line_marks_truncated(self):
+        long_line = "word " * 40
+        self.file.write_text(_fm() + "# Topic\n\n## Why This Matters\n" + long_line + "\n")
+        excerpt = extract_excerpts(self.file, ("Why This Matters",), max_chars=50)["Why This Matters"]
+        self.assertEqual(excerpt["text"], long_line[:50])
+        self.assertTrue(excerpt["truncated"])
+
+        self.file.write_text(_fm() + long_line + "\n")
+        self.assertTrue(extract_excerpts(self.file, None, max_chars=50)[BODY_EXCERPT]["truncated"])
+
+    def test_body_excerpt_skips_frontmatter(self):
+        excerpt = extract_excerpts(self.file, None)[BODY_EXCERPT]
+        self.assertTrue(excerpt["text"].startswith("# Topic"))
+        self.assertNotIn("last_validated", excerpt["text"])
+
+    def test_attach_dedupes_per_file(self):
+        queue = [self._item("source_primacy"), self._item("citation_quality"), self._item("why_quality")]
+        excerpts = attach_excerpts(queue)
+        self.assertEqual(set(excerpts[str(self.file)]), {"Key Guidance", "Why This Matters"})
+        self.assertEqual(queue[0]["excerpt_refs"], ["Key Guidance"])
+        self.assertEqual(queue[1]["excerpt_refs"], ["Key Guidance"])
+        self.assertEqual(queue[2]["excerpt_refs"], ["Why This Matters"])
+
+    def test_body_trigger_covers_sections(self):
+        queue = [self._item("why_quality"), self._item("depth_accuracy"), self._item("source_authority")]
+        excerpts = attach_excerpts(queue)
+        self.assertEqual(list(excerpts[str(self.file)]), [BODY_EXCERPT])
+        self.assertEqual(queue[0]["excerpt_refs"], [BODY_EXCERPT])
+        self.assertEqual(queue[2]["excerpt_refs"], [])
+
+    def test_truncated_body_does_not_stand_in_for_sections(self):
+        queue = [self._item("depth_accuracy"), self._item("why_quality"), self._item("source_primacy")]
+        excerpts = attach_excerpts(queue, max_chars=20)[str(self.file)]
+        self.assertTrue(excerpts[BODY_EXCERPT]["truncated"])
+        self.assertEqual(queue[0]["excerpt_refs"], [BODY_EXCERPT])
+        self.assertEqual(queue[1]["excerpt_refs"], ["Why This Matters"])
+        self.assertEqual(queue[2]["excerpt_refs"], ["Key Guidance"])
+        self.assertEqual(excerpts["Key Guidance"]["text"], "- Rec")
+
+    def test_source_drift_needs_no_excerpt(self):
+        queue = [self._item("source_drift")]
+        self.assertEqual(attach_excerpts(queue), {})
+        self.assertEqual(queue[0]["excerpt_refs"], [])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,12 +1,17 @@
 """Tests for skills.health.scripts.utilization — topic reference tracking."""
 
 import json
+import os
 import shutil
 import tempfile
 import unittest
+from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
-from utilization import read_utilization, record_reference
+import utilization
+from shard_log import read_records
+from utilization import read_rollup, read_utilization, record_reference, record_session_reference
 
 
 class TestRecordReference(unittest.TestCase):
@@ -22,18 +27,17 @@ class TestRecordReference(unittest.TestCase):
     # test_creates_log_file
     # ------------------------------------------------------------------
     def test_creates_log_file(self):
-        """First reference creates log.jsonl."""
-        log_path = record_reference(self.tmpdir, "topic/foo.md")
+        """First reference creates this writer's shard of log.jsonl."""
+        log_path = record_reference(self.tmpdir, "topic/foo.md", writer="session-1")
         self.assertTrue(log_path.exists())
-        self.assertEqual(log_path.name, "log.jsonl")
+        self.assertEqual(log_path, self.tmpdir / ".dewey" / "utilization" / "log.d" / "session-1.jsonl")
 
     # ------------------------------------------------------------------
     # test_appends_valid_json_line
     # ------------------------------------------------------------------
     def test_appends_valid_json_line(self):
         """Entry has file, timestamp, context keys."""
-        record_reference(self.tmpdir, "topic/foo.md")
-        log_path = self.tmpdir / ".dewey" / "utilization" / "log.jsonl"
+        log_path = record_reference(self.tmpdir, "topic/foo.md")
         line = log_path.read_text().strip()
         entry = json.loads(line)
         self.assertIn("file", entry)
@@ -45,8 +49,7 @@ class TestRecordReference(unittest.TestCase):
     # ------------------------------------------------------------------
     def test_default_context_is_user(self):
         """Default context is 'user'."""
-        record_reference(self.tmpdir, "topic/foo.md")
-        log_path = self.tmpdir / ".dewey" / "utilization" / "log.jsonl"
+        log_path = record_reference(self.tmpdir, "topic/foo.md")
         entry = json.loads(log_path.read_text().strip())
         self.assertEqual(entry["context"], "user")
 
@@ -55,8 +58,7 @@ class TestRecordReference(unittest.TestCase):
     # ------------------------------------------------------------------
     def test_custom_context(self):
         """Custom context like 'audit' is recorded."""
-        record_reference(self.tmpdir, "topic/foo.md", context="audit")
-        log_path = self.tmpdir / ".dewey" / "utilization" / "log.jsonl"
+        log_path = record_reference(self.tmpdir, "topic/foo.md", context="audit")
         entry = json.loads(log_path.read_text().strip())
         self.assertEqual(entry["context"], "audit")
 
@@ -66,8 +68,7 @@ class TestRecordReference(unittest.TestCase):
     def test_multiple_references_append(self):
         """Multiple calls append, not overwrite."""
         record_reference(self.tmpdir, "topic/foo.md")
-        record_reference(self.tmpdir, "topic/bar.md", context="audit")
-        log_path = self.tmpdir / ".dewey" / "utilization" / "log.jsonl"
+        log_path = record_reference(self.tmpdir, "topic/bar.md", context="audit")
         lines = [l for l in log_path.read_text().splitlines() if l.strip()]
         self.assertEqual(len(lines), 2)
         first = json.loads(lines[0])
@@ -167,5 +168,235 @@ class TestReadUtilization(unittest.TestCase):
         )
 
 
+class TestReadRollup(unittest.TestCase):
+    """Tests for read_rollup — windowed, decayed and incrementally maintained."""
+
+    NOW = datetime(2026, 6, 30, 12, 0, 0)
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.log = self.tmpdir / ".dewey" / "utilization" / "log.jsonl"
+        self.log.parent.mkdir(parents=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _append(self, file_path: str, days_ago: float, times: int = 1) -> None:
+        ts = (self.NOW - timedelta(days=days_ago)).isoformat(timespec="seconds")
+        line = json.dumps({"file": file_path, "timestamp": ts, "context": "hook"})
+        with self.log.open("a") as fh:
+            fh.write((line + "\n") * times)
+
+    def test_window_counts(self):
+        self._append("docs/a/x.md", 1, times=2)
+        self._append("docs/a/x.md", 20)
+        self._append("docs/a/x.md", 60)
+        self._append("docs/a/x.md", 400)
+        stats = read_rollup(self.tmpdir, now=self.NOW)["files"]["docs/a/x.md"]
+        self.assertEqual(
+            (stats["count"], stats["reads_7d"], stats["reads_30d"], stats["reads_90d"]), (5, 2, 3, 4),
+        )
+        self.assertEqual(stats["last_referenced"], (self.NOW - timedelta(days=1)).isoformat(timespec="seconds"))
+
+    def test_decayed_reads_halve_per_half_life(self):
+        self._append("docs/a/x.md", 0, times=4)
+        self._append("docs/a/old.md", utilization.DECAY_HALF_LIFE_DAYS, times=4)
+        files = read_rollup(self.tmpdir, now=self.NOW)["files"]
+        self.assertAlmostEqual(files["docs/a/x.md"]["decayed_reads"], 4.0)
+        self.assertAlmostEqual(files["docs/a/old.md"]["decayed_reads"], 2.0)
+        later = read_rollup(self.tmpdir, now=self.NOW + timedelta(days=utilization.DECAY_HALF_LIFE_DAYS))
+        self.assertAlmostEqual(later["files"]["docs/a/x.md"]["decayed_reads"], 2.0)
+
+    def test_area_totals(self):
+        self._append("docs/a/x.md", 1, times=2)
+        self._append("docs/a/y.md", 10)
+        self._append("docs/b/z.md", 1)
+        self._append("AGENTS.md", 1)
+        areas = read_rollup(self.tmpdir, now=self.NOW)["areas"]
+        self.assertEqual(sorted(areas), ["a", "b"])
+        self.assertEqual((areas["a"]["count"], areas["a"]["reads_7d"]), (3, 2))
+
+    def test_only_new_lines_are_folded(self):
+        self._append("docs/a/x.md", 1, times=3)
+        read_rollup(self.tmpdir, now=self.NOW)
+        line = json.dumps({"file": "docs/a/x.md", "timestamp": self.NOW.isoformat(), "context": "hook"})
+        with self.log.open("a") as fh:
+            fh.write(line[:10])
+        with patch.object(utilization, "_fold_event", wraps=utilization._fold_event) as spy:
+            self.assertEqual(read_rollup(self.tmpdir, now=self.NOW)["files"]["docs/a/x.md"]["count"], 3)
+            self.assertEqual(spy.call_count, 0)
+            with self.log.open("a") as fh:
+                fh.write(line[10:] + "\n")
+            self.assertEqual(read_rollup(self.tmpdir, now=self.NOW)["files"]["docs/a/x.md"]["count"], 4)
+            self.assertEqual(spy.call_count, 1)
+
+    def test_replaced_log_is_reread(self):
+        self._append("docs/a/x.md", 1, times=3)
+        read_rollup(self.tmpdir, now=self.NOW)
+        self.log.write_text("")
+        self._append("docs/a/y.md", 1, times=5)
+        files = read_rollup(self.tmpdir, now=self.NOW)["files"]
+        self.assertEqual(sorted(files), ["docs/a/y.md"])
+        self.assertEqual(files["docs/a/y.md"]["count"], 5)
+
+    def test_old_days_pruned_totals_kept(self):
+        self._append("docs/a/x.md", 200, times=2)
+        read_rollup(self.tmpdir, now=self.NOW)
+        state = json.loads((self.log.parent / "rollup.json").read_text())
+        self.assertEqual(state["files"]["docs/a/x.md"]["days"], {})
+        self.assertEqual(read_utilization(self.tmpdir)["docs/a/x.md"]["count"], 2)
+
+    def test_malformed_lines_skipped(self):
+        self.log.write_text("not json\n" + json.dumps({"file": "docs/a/x.md"}) + "\n")
+        self._append("docs/a/x.md", 1)
+        self.assertEqual(read_rollup(self.tmpdir, now=self.NOW)["files"]["docs/a/x.md"]["count"], 1)
+
+    def test_shards_merged_and_followed_incrementally(self):
+        self._append("docs/a/x.md", 1)
+        record_reference(self.tmpdir, "docs/a/x.md", writer="one")
+        record_reference(self.tmpdir, "docs/a/x.md", writer="two")
+        self.assertEqual(read_rollup(self.tmpdir, now=self.NOW)["files"]["docs/a/x.md"]["count"], 3)
+        record_reference(self.tmpdir, "docs/a/x.md", writer="two")
+        with patch.object(utilization, "_fold_event", wraps=utilization._fold_event) as spy:
+            self.assertEqual(read_rollup(self.tmpdir, now=self.NOW)["files"]["docs/a/x.md"]["count"], 4)
+            self.assertEqual(spy.call_count, 1)
+
+    def test_idle_shards_compacted_without_double_counting(self):
+        self._append("docs/a/x.md", 1)
+        shard = record_reference(self.tmpdir, "docs/a/x.md", writer="one")
+        read_rollup(self.tmpdir, now=self.NOW)
+        record_reference(self.tmpdir, "docs/a/y.md", writer="one")
+        idle = shard.stat().st_mtime - 3600
+        os.utime(shard, (idle, idle))
+
+        files = read_rollup(self.tmpdir, now=self.NOW)["files"]
+        self.assertFalse(shard.exists())
+        self.assertEqual(len(read_records(self.log)), 3)
+        self.assertEqual((files["docs/a/x.md"]["count"], files["docs/a/y.md"]["count"]), (2, 1))
+        files = read_rollup(self.tmpdir, now=self.NOW)["files"]
+        self.assertEqual((files["docs/a/x.md"]["count"], files["docs/a/y.md"]["count"]), (2, 1))
+
+    def test_removed_shard_triggers_reread(self):
+        shard = record_reference(self.tmpdir, "docs/a/x.md", writer="one")
+        record_reference(self.tmpdir, "docs/a/y.md", writer="two")
+        read_rollup(self.tmpdir, now=self.NOW)
+        shard.unlink()
+        self.assertEqual(sorted(read_rollup(self.tmpdir, now=self.NOW)["files"]), ["docs/a/y.md"])
+
+
+class TestRecordSessionReference(unittest.TestCase):
+    """Tests for record_session_reference — session-window collapsing."""
+
+    NOW = datetime(2026, 6, 30, 12, 0, 0)
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.log = self.tmpdir / ".dewey" / "utilization" / "log.jsonl"
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _read(self, file_path: str, seconds: float, **kwargs) -> None:
+        record_session_reference(self.tmpdir, file_path, now=self.NOW + timedelta(seconds=seconds), **kwargs)
+
+    def _lines(self) -> list[dict]:
+        return read_records(self.log)
+
+    def test_repeats_collapse_but_counts_stay_exact(self):
+        for second in range(0, 50, 5):
+            self._read("docs/a/x.md", second)
+        self.assertEqual(len(self._lines()), 1)
+        stats = read_rollup(self.tmpdir, now=self.NOW)["files"]["docs/a/x.md"]
+        self.assertEqual(stats["count"], 10)
+        self.assertEqual(stats["last_referenced"], (self.NOW + timedelta(seconds=45)).isoformat())
+
+    def test_expired_session_flushed_as_counted_entry(self):
+        for second in (0, 10, 20):
+            self._read("docs/a/x.md", second)
+        self._read("docs/a/y.md", 120)
+        lines = self._lines()
+        self.assertEqual([(line["file"], line.get("count", 1)) for line in lines],
+                         [("docs/a/x.md", 1), ("docs/a/y.md", 1), ("docs/a/x.md", 2)])
+        self.assertEqual(read_utilization(self.tmpdir)["docs/a/x.md"]["count"], 3)
+
+    def test_same_file_after_window_starts_new_session(self):
+        self._read("docs/a/x.md", 0)
+        self._read("docs/a/x.md", 30)
+        self._read("docs/a/x.md", 90)
+        self.assertEqual([line.get("count", 1) for line in self._lines()], [1, 1, 1])
+        self.assertEqual(read_utilization(self.tmpdir)["docs/a/x.md"]["count"], 3)
+
+    def test_sessions_are_per_writer(self):
+        for second in (0, 10, 20):
+            self._read("docs/a/x.md", second, writer="agent-1")
+        self._read("docs/a/x.md", 25, writer="agent-2")
+        self._read("docs/a/x.md", 30, writer="agent-1")
+        # Each session's first read is logged; agent-2 does not flush agent-1
+        self.assertEqual([(line["file"], line.get("count", 1)) for line in self._lines()],
+                         [("docs/a/x.md", 1), ("docs/a/x.md", 1)])
+        self.assertEqual(read_utilization(self.tmpdir)["docs/a/x.md"]["count"], 5)
+        sessions = self.log.parent / "sessions.d"
+        self.assertEqual(sorted(p.name for p in sessions.glob("*.json")), ["agent-1.json", "agent-2.json"])
+
+    def test_idle_writer_flushed_by_rollup(self):
+        for second in (0, 10, 20):
+            self._read("docs/a/x.md", second, writer="agent-1")
+        state = self.log.parent / "sessions.d" / "agent-1.json"
+        idle = state.stat().st_mtime - 3600
+        os.utime(state, (idle, idle))
+        self.assertEqual(read_utilization(self.tmpdir)["docs/a/x.md"]["count"], 3)
+        self.assertFalse(state.exists())
+        shard = self.log.parent / "log.d" / "agent-1.jsonl"
+        self.assertEqual([line.get("count", 1) for line in read_records(shard)], [1, 2])
+        self.assertEqual(read_utilization(self.tmpdir)["docs/a/x.md"]["count"], 3)
+
+    def test_window_close_never_double_counted(self):
+        for second in (0, 10, 20):
+            self._read("docs/a/x.md", second, writer="agent-1")
+        seen = []
+        append = utilization.append_record
+
+        def append_then_read(*args, **kwargs):
+            path = append(*args, **kwargs)
+            seen.append(read_utilization(self.tmpdir)["docs/a/x.md"]["count"])
+            return path
+
+        # The window closes: the repeat entry is logged, then the new read
+        with patch.object(utilization, "append_record", side_effect=append_then_read):
+            self._read("docs/a/x.md", 90, writer="agent-1")
+        self.assertEqual(seen, [3, 4])
+        self.assertEqual(read_utilization(self.tmpdir)["docs/a/x.md"]["count"], 4)
+
+    def test_malformed_session_dropped(self):
+        sessions = self.log.parent / "sessions.d"
+        sessions.mkdir(parents=True)
+        (sessions / "agent-1.json").write_text(json.dumps({
+            "docs/a/x.md": {"start": self.NOW.isoformat(), "count": 3},
+            "docs/a/y.md": {"start": "never", "first": None, "last": None, "count": 0, "context": "hook"},
+        }))
+        self.assertNotIn("docs/a/x.md", read_utilization(self.tmpdir))
+        self._read("docs/a/x.md", 5, writer="agent-1")
+        self._read("docs/a/x.md", 10, writer="agent-1")
+        self.assertEqual(read_utilization(self.tmpdir)["docs/a/x.md"]["count"], 2)
+
+    def test_no_shared_lock_taken(self):
+        with patch.object(utilization, "locked", wraps=utilization.locked) as spy:
+            self._read("docs/a/x.md", 0, writer="agent-1")
+            self._read("docs/a/x.md", 5, writer="agent-1")
+        self.assertEqual({call.kwargs.get("lock_file") for call in spy.call_args_list}, {"agent-1.lock"})
+
+    def test_zero_window_logs_every_read(self):
+        for second in range(3):
+            self._read("docs/a/x.md", second, window_seconds=0)
+        self.assertEqual(len(self._lines()), 3)
+
+    def test_hot_files_sampled_with_weight(self):
+        kept = iter([0.0, 0.9] * 20)
+        for second in range(41):
+            self._read("docs/a/x.md", second, sample_every=2, rng=lambda: next(kept))
+        # 1 logged + 20 unsampled repeats + 10 sampled-in reads weighted 2
+        self.assertEqual(read_utilization(self.tmpdir)["docs/a/x.md"]["count"], 41)
+
+
 if __name__ == "__main__":
     unittest.main()
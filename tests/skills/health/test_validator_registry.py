@@ -0,0 +1,121 @@
+"""Tests for skills.health.scripts.validator_registry — lazy validator metadata."""
+
+import inspect
+import unittest
+from pathlib import Path
+
+from validator_registry import (
+    COST_CLASSES,
+    SCOPES,
+    TRIGGERS,
+    VALIDATORS,
+    bind,
+    load,
+    reads_content,
+    required_inputs,
+    select,
+    select_validators,
+    tier1_validators,
+    tier2_triggers,
+    unknown_selectors,
+)
+
+_INPUTS = {
+    "size", "frontmatter", "body", "stripped_body", "shingles", "link_graph",
+    "tree", "history", "agents_md", "curation_plan", "network",
+}
+
+
+class TestRegistryEntries(unittest.TestCase):
+    """Every entry is well-formed and names a real function."""
+
+    def test_metadata_uses_known_values(self):
+        for name, spec in {**VALIDATORS, **TRIGGERS}.items():
+            with self.subTest(name=name):
+                self.assertIn(spec["scope"], SCOPES)
+                self.assertIn(spec["cost"], COST_CLASSES)
+                self.assertTrue(spec["inputs"])
+                self.assertLessEqual(set(spec["inputs"]), _INPUTS)
+
+    def test_load_returns_named_function(self):
+        for name in [*VALIDATORS, *TRIGGERS]:
+            with self.subTest(name=name):
+                fn = load(name)
+                self.assertEqual(fn.__name__, name)
+                self.assertEqual(fn.__module__, (VALIDATORS.get(name) or TRIGGERS[name])["module"])
+
+    def test_bound_arguments_match_signatures(self):
+        context = {
+            "knowledge_base_root": Path("."), "knowledge_dir_name": "docs",
+            "file_list": [], "cache_shingles": False,
+        }
+        for name in [*VALIDATORS, *TRIGGERS]:
+            spec = VALIDATORS.get(name) or TRIGGERS[name]
+            args, kwargs = bind(name, context)
+            if spec["scope"] == "per-file":
+                args = (Path("topic.md"), *args)
+            with self.subTest(name=name):
+                inspect.signature(load(name)).bind(*args, **kwargs)
+
+    def test_unknown_name_raises(self):
+        with self.assertRaises(KeyError):
+            load("check_nothing")
+
+
+class TestSelection(unittest.TestCase):
+    """Default selections and run order."""
+
+    def test_network_validators_are_opt_in(self):
+        self.assertNotIn("check_source_accessibility", tier1_validators())
+        self.assertIn("check_source_accessibility", tier1_validators(include_network=True))
+
+    def test_per_file_validators_run_first(self):
+        scopes = [VALIDATORS[name]["scope"] for name in tier1_validators()]
+        first_whole_tree = scopes.index("structural")
+        self.assertNotIn("per-file", scopes[first_whole_tree:])
+
+    def test_triggers_in_declared_order(self):
+        self.assertEqual(tier2_triggers(), list(TRIGGERS))
+        self.assertEqual(tier2_triggers()[0], "trigger_source_drift")
+
+
+class TestSelectors(unittest.TestCase):
+    """only / skip selectors by name, scope and cost class."""
+
+    def test_select_by_name_scope_and_cost(self):
+        self.assertEqual(select_validators(only=("check_freshness",)), ["check_freshness"])
+        self.assertEqual(
+            select_validators(only=("structural",)),
+            ["check_coverage", "check_index_sync", "check_inventory_regression"],
+        )
+        self.assertEqual(select_validators(only=("expensive",)), ["check_link_graph", "check_duplicate_content"])
+
+    def test_skip_applies_after_only(self):
+        names = select_validators(only=("cross-file",), skip=("expensive", "check_manifest_sync"))
+        self.assertEqual(names, ["check_curation_plan_sync", "check_proposal_integrity", "check_naming_conventions"])
+
+    def test_network_needs_explicit_selection(self):
+        self.assertNotIn("check_source_accessibility", select_validators(only=("per-file",)))
+        self.assertEqual(select_validators(only=("network",)), ["check_source_accessibility"])
+        self.assertEqual(
+            select_validators(only=("check_source_accessibility",)), ["check_source_accessibility"],
+        )
+
+    def test_select_triggers(self):
+        self.assertEqual(select(tier2_triggers(), only=("trigger_why_quality",)), ["trigger_why_quality"])
+        self.assertEqual(select(tier2_triggers(), only=("check_frontmatter",)), [])
+
+    def test_unknown_selectors(self):
+        self.assertEqual(unknown_selectors(["cheap", "check_frontmatter", "frontmatter"]), ["frontmatter"])
+
+    def test_required_inputs(self):
+        self.assertEqual(required_inputs(["check_freshness", "check_source_urls"]), {"frontmatter"})
+        self.assertIn("shingles", required_inputs(["check_duplicate_content"]))
+
+    def test_only_size_check_skips_content(self):
+        self.assertFalse(reads_content("check_file_size"))
+        self.assertTrue(reads_content("check_frontmatter"))
+
+
+if __name__ == "__main__":
+    unittest.main()
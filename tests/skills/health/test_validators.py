@@ -2,15 +2,19 @@
 
 import shutil
 import tempfile
+import time
 import unittest
 import unittest.mock
 from datetime import date, timedelta
 from pathlib import Path
 
 from validators import (
+    _LINK_RE,
+    _strip_markdown_formatting,
     check_citation_grounding,
     check_coverage,
     check_cross_references,
+    check_file_size,
     check_freshness,
     check_frontmatter,
     check_go_deeper_links,
@@ -26,6 +30,8 @@ from validators import (
     check_source_diversity,
     check_source_urls,
     parse_frontmatter,
+    shared_reads,
+    size_limit,
 )
 
 
@@ -105,6 +111,96 @@ class TestParseFrontmatter(unittest.TestCase):
         fm = parse_frontmatter(f)
         self.assertEqual(fm, {})
 
+    def test_stops_reading_at_closing_delimiter(self):
+        f = _write(self.tmpdir / "a.md", "---\ndepth: working\n---\n" + "body line\n" * 1000)
+        with unittest.mock.patch.object(Path, "read_text", side_effect=AssertionError("whole file read")):
+            self.assertEqual(parse_frontmatter(f), {"depth": "working"})
+
+    def test_delimiters_later_in_file_still_parsed(self):
+        f = _write(self.tmpdir / "a.md", "Intro\n---\ndepth: overview\n---\nBody\n")
+        self.assertEqual(parse_frontmatter(f), {"depth": "overview"})
+
+
+class TestSharedReads(unittest.TestCase):
+    """Validators inside shared_reads read each file once."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.file = _write(self.tmpdir / "a.md", VALID_FRONTMATTER.format(today=date.today().isoformat()) + "# Title\n\n## In Practice\nText.\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_body_validators_share_one_read(self):
+        with unittest.mock.patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as read_text:
+            with shared_reads():
+                check_frontmatter(self.file)
+                check_section_ordering(self.file)
+                check_heading_hierarchy(self.file)
+        self.assertEqual(read_text.call_count, 1)
+
+    def test_frontmatter_only_never_reads_whole_file(self):
+        with unittest.mock.patch.object(Path, "read_text", side_effect=AssertionError("whole file read")):
+            with shared_reads(body=False):
+                self.assertEqual(check_frontmatter(self.file), [])
+                self.assertEqual(check_source_urls(self.file), [])
+
+    def test_nothing_shared_after_block(self):
+        with shared_reads():
+            check_frontmatter(self.file)
+        self.file.write_text("# No frontmatter\n")
+        self.assertEqual(parse_frontmatter(self.file), {})
+
+
+class TestSizeLimit(unittest.TestCase):
+    """Oversized files and pathological markup stay cheap."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.today = date.today().isoformat()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_check_file_size(self):
+        f = _write(self.tmpdir / "a.md", "x" * 200)
+        self.assertEqual(check_file_size(f), [])
+        with size_limit(100):
+            issues = check_file_size(f)
+        self.assertEqual(len(issues), 1)
+        self.assertEqual(issues[0]["severity"], "fail")
+        self.assertIn("200 bytes", issues[0]["message"])
+        with size_limit(None):
+            self.assertEqual(check_file_size(f), [])
+
+    def test_unterminated_frontmatter_stops_at_limit(self):
+        f = _write(self.tmpdir / "a.md", "---\ndepth: working\n" + "note: x\n" * 100 + "---\n")
+        self.assertEqual(parse_frontmatter(f)["depth"], "working")
+        with size_limit(100):
+            self.assertEqual(parse_frontmatter(f), {})
+
+    def test_line_checks_stream_the_file(self):
+        text = VALID_FRONTMATTER.format(today=self.today) + "# Title\n\n### Skipped\n" + "line\n" * 500
+        f = _write(self.tmpdir / "a.md", text)
+        with unittest.mock.patch.object(Path, "read_text", side_effect=AssertionError("whole file read")):
+            size_msgs = [i["message"] for i in check_size_bounds(f)]
+            hierarchy_msgs = [i["message"] for i in check_heading_hierarchy(f)]
+        self.assertTrue(any("expected at most 400" in m for m in size_msgs))
+        self.assertEqual(hierarchy_msgs, ["Skipped heading level: H1 to H3"])
+
+    def test_pathological_markup_is_linear(self):
+        text = "[" * 50_000 + "[a](" * 20_000 + "x _a_b " * 20_000
+        start = time.perf_counter()
+        _LINK_RE.findall(text)
+        _strip_markdown_formatting(text)
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+    def test_link_targets_allow_balanced_parentheses(self):
+        self.assertEqual(
+            _LINK_RE.findall("[Foo](https://en.wikipedia.org/wiki/Foo_(bar)) and [b](b.md#x)"),
+            [("Foo", "https://en.wikipedia.org/wiki/Foo_(bar)"), ("b", "b.md#x")],
+        )
+
 
 # ------------------------------------------------------------------
 # check_frontmatter